@@ -1,10 +1,14 @@
 """Claude AI extractor for restaurant content analysis."""
 
 import logging
-import requests
 import json
 from typing import Dict, List, Any, Optional
 
+from ..common.http_transport import get_shared_transport
+from .content_reducer import ContentReducer
+from .llm_cache import get_shared_llm_cache
+from .streaming import FieldCallback, FieldStream, replay_fields, stream_anthropic
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,12 +24,18 @@ class ClaudeExtractor:
         self.api_key = api_key or ""
         self.base_url = "https://api.anthropic.com/v1/messages"
         self.default_model = "claude-3-opus-20240229"
+        self.transport = get_shared_transport()
+        self.llm_cache = get_shared_llm_cache()
+        self.content_reducer = ContentReducer()
 
     def extract(
         self,
         content: str,
         industry: str = "Restaurant",
         model: Optional[str] = None,
+        stream: bool = False,
+        on_field: Optional[FieldCallback] = None,
+        required_fields: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """Extract information using Claude AI.
 
@@ -33,6 +43,9 @@ class ClaudeExtractor:
             content: Content to analyze
             industry: Industry context
             model: Claude model to use
+            stream: Stream the completion and report fields as they arrive
+            on_field: Called with each completed JSON field when streaming
+            required_fields: Stop streaming once these fields have arrived
 
         Returns:
             Extraction results
@@ -45,7 +58,9 @@ class ClaudeExtractor:
         prompt = self._build_restaurant_prompt(content, industry)
 
         try:
-            response = self._call_claude_api(prompt, model)
+            response = self._call_claude_api(
+                prompt, model, stream=stream, on_field=on_field, required_fields=required_fields
+            )
             return self._process_claude_response(response)
         except Exception as e:
             logger.error(f"Claude API call failed: {str(e)}")
@@ -53,11 +68,14 @@ class ClaudeExtractor:
 
     def _build_restaurant_prompt(self, content: str, industry: str) -> str:
         """Build prompt for restaurant content extraction."""
+        reduced_content = self.content_reducer.reduce_for_prompt(
+            content, ["menu", "restaurant info", "cuisine"], max_tokens=1500
+        )
         return f"""
         Analyze this {industry.lower()} website content and extract structured information:
 
         Content:
-        {content[:3000]}
+        {reduced_content}
 
         Please extract and return a JSON object with:
         1. menu_items: Array of menu items with names, descriptions, prices if available
@@ -70,8 +88,28 @@ class ClaudeExtractor:
         Respond with only valid JSON.
         """
 
-    def _call_claude_api(self, prompt: str, model: str) -> Dict[str, Any]:
-        """Call Claude API with the prompt."""
+    def _call_claude_api(
+        self,
+        prompt: str,
+        model: str,
+        stream: bool = False,
+        on_field: Optional[FieldCallback] = None,
+        required_fields: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Call Claude API with the prompt, reusing cached responses."""
+        if stream:
+            return self._stream_claude_api(prompt, model, on_field, required_fields)
+        response, _ = self.llm_cache.get_or_compute(
+            "claude",
+            model,
+            prompt,
+            lambda: self._post_claude_request(prompt, model),
+            params={"max_tokens": 2000},
+        )
+        return response
+
+    def _build_request(self, prompt: str, model: str) -> tuple:
+        """Build headers and payload for a Messages API request."""
         headers = {
             "Content-Type": "application/json",
             "x-api-key": self.api_key,
@@ -83,8 +121,13 @@ class ClaudeExtractor:
             "max_tokens": 2000,
             "messages": [{"role": "user", "content": prompt}],
         }
+        return headers, payload
+
+    def _post_claude_request(self, prompt: str, model: str) -> Dict[str, Any]:
+        """Send the prompt to the Claude API."""
+        headers, payload = self._build_request(prompt, model)
 
-        response = requests.post(
+        response = self.transport.post(
             self.base_url, headers=headers, json=payload, timeout=30
         )
 
@@ -95,6 +138,64 @@ class ClaudeExtractor:
 
         return response.json()
 
+    def _stream_claude_api(
+        self,
+        prompt: str,
+        model: str,
+        on_field: Optional[FieldCallback] = None,
+        required_fields: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Stream a Claude completion, reporting JSON fields as they arrive.
+
+        Responses cut short once ``required_fields`` arrived are rebuilt from
+        the received fields and are not cached, since they are partial.
+
+        Returns:
+            Response in the same shape as a non-streamed Messages API call
+        """
+        cached = self.llm_cache.get("claude", model, prompt, params={"max_tokens": 2000})
+        if cached is not None:
+            replay_fields(cached["content"][0]["text"], on_field)
+            return cached
+
+        headers, payload = self._build_request(prompt, model)
+        payload["stream"] = True
+        response = self.transport.post(
+            self.base_url, headers=headers, json=payload, timeout=30, stream=True
+        )
+        try:
+            if response.status_code != 200:
+                raise Exception(
+                    f"Claude API error: {response.status_code} - {response.text}"
+                )
+            result = stream_anthropic(
+                response.iter_lines(decode_unicode=True),
+                FieldStream(on_field, required_fields),
+            )
+        finally:
+            response.close()
+
+        message = {
+            "model": model,
+            "content": [{"type": "text", "text": result.json_text.strip()}],
+            "stop_reason": "cancelled" if result.cancelled else "end_turn",
+            "usage": {
+                "input_tokens": result.prompt_tokens,
+                "output_tokens": result.completion_tokens,
+            },
+        }
+        if not result.cancelled:
+            self.llm_cache.put(
+                "claude",
+                model,
+                prompt,
+                message,
+                params={"max_tokens": 2000},
+                prompt_tokens=result.prompt_tokens,
+                completion_tokens=result.completion_tokens,
+            )
+        return message
+
     def _process_claude_response(
         self, response: Dict[str, Any]
     ) -> Dict[str, Any]:
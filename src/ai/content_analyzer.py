@@ -1,15 +1,17 @@
 """AI-powered content analyzer for advanced restaurant data extraction."""
 
 import logging
-from typing import Dict, List, Any, Optional, Union
-import hashlib
+from typing import Callable, Dict, List, Any, Optional, Tuple, Union
 import json
-from datetime import datetime, timedelta
+from datetime import datetime
 import requests
 import base64
 import os
 
 from src.ai.llm_extractor import LLMExtractor
+from src.ai.llm_cache import TokenUsage, get_shared_llm_cache
+from src.ai.request_scheduler import AIRequestScheduler, get_shared_request_scheduler
+from src.ai.streaming import FieldCallback, FieldStream, replay_fields, stream_openai
 from src.ai.confidence_scorer import ConfidenceScorer
 from src.ai.claude_extractor import ClaudeExtractor
 from src.ai.ollama_extractor import OllamaExtractor
@@ -21,23 +23,37 @@ from src.ai.traditional_fallback_extractor import TraditionalFallbackExtractor
 
 logger = logging.getLogger(__name__)
 
+# Top-level fields of the enhanced analysis JSON; streaming stops once all arrive
+ANALYSIS_FIELDS = ["menu_enhancements", "restaurant_characteristics", "customer_amenities"]
+
 
 class AIContentAnalyzer:
     """Analyzes restaurant content using AI for enhanced extraction."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        request_scheduler: Optional[AIRequestScheduler] = None,
+    ):
         """Initialize AI Content Analyzer.
 
         Args:
             api_key: OpenAI API key (optional, will use env var if not provided)
+            request_scheduler: Concurrency and rate limits for batch analysis;
+                defaults to the process-wide scheduler
         """
         # Store for backward compatibility
         self.api_key = api_key
         
         self.llm_extractor = LLMExtractor(api_key=api_key)
         self.confidence_scorer = ConfidenceScorer()
-        self._cache = {}
-        self._cache_ttl = timedelta(minutes=15)
+        self.llm_cache = get_shared_llm_cache()
+        self.request_scheduler = request_scheduler or get_shared_request_scheduler()
+        # Receives (field, value) as streamed analysis fields arrive
+        self.field_callback: Optional[FieldCallback] = None
+        # Builds the field callback for one page from its URL in
+        # batch_analyze; takes precedence over field_callback there
+        self.page_field_callback: Optional[Callable[[str], FieldCallback]] = None
         self.config = {
             "extraction_prompts": {},
             "confidence_weights": {"llm": 0.8, "traditional": 0.2},
@@ -62,6 +78,7 @@ class AIContentAnalyzer:
             "multimodal_enabled": False,
             "pattern_learning_enabled": False,
             "dynamic_prompts_enabled": False,
+            "streaming_enabled": False,
         }
 
         # Initialize additional extractors
@@ -106,6 +123,7 @@ class AIContentAnalyzer:
         analysis_type: str,
         monitor_performance: bool = False,
         custom_questions: List[str] = None,
+        on_field: Optional[FieldCallback] = None,
     ) -> Dict[str, Any]:
         """Analyze content for nutritional and other insights.
 
@@ -115,23 +133,60 @@ class AIContentAnalyzer:
             analysis_type: Type of analysis (e.g., "nutritional")
             monitor_performance: Whether to track performance metrics
             custom_questions: Optional list of custom questions to include in analysis
+            on_field: Receives streamed fields of this analysis; defaults to field_callback
 
         Returns:
             Analysis results with nutritional context
         """
         try:
-            # Check cache
-            cache_key = self._get_cache_key(content, menu_items, analysis_type)
-            cached_result = self._get_from_cache(cache_key)
-            if cached_result:
-                return cached_result
-
             start_time = datetime.now() if monitor_performance else None
 
             if analysis_type == "nutritional":
                 # Pass the AI config for model selection
                 ai_config = getattr(self, '_current_ai_config', {})
-                result = self._analyze_nutritional_content(content, menu_items, custom_questions, ai_config)
+                provider = self.config.get("default_provider", "openai")
+                answered_by = {}
+
+                def analyze() -> Dict[str, Any]:
+                    # Entries record what the completions behind them cost,
+                    # so later hits count towards tokens and dollars saved
+                    with self.llm_cache.track_usage() as spent:
+                        analysis, answered_by["provider"] = self._run_nutritional_analysis(
+                            content, menu_items, custom_questions, ai_config, on_field
+                        )
+                    answered_by["usage"] = spent.as_usage()
+                    return analysis
+
+                # Only model answers from the configured provider are stored
+                # under its key; answers from a fallback provider go under
+                # that provider's key below
+                result, from_cache = self.llm_cache.get_or_compute(
+                    *self._analysis_cache_key(
+                        content, menu_items, analysis_type, custom_questions, provider
+                    ),
+                    analyze,
+                    usage=lambda analysis: answered_by["usage"],
+                    cacheable=lambda analysis: (
+                        answered_by.get("provider") == provider
+                        and self._is_cacheable_analysis(analysis)
+                    ),
+                )
+                used_provider = answered_by.get("provider")
+                if (
+                    not from_cache
+                    and used_provider not in (None, provider)
+                    and self._is_cacheable_analysis(result)
+                ):
+                    prompt_tokens, completion_tokens, cost = answered_by["usage"]
+                    self.llm_cache.put(
+                        *self._analysis_cache_key(
+                            content, menu_items, analysis_type, custom_questions, used_provider
+                        ),
+                        result,
+                        prompt_tokens=prompt_tokens,
+                        completion_tokens=completion_tokens,
+                        cost=cost,
+                    )
             else:
                 result = {"error": f"Unknown analysis type: {analysis_type}"}
 
@@ -143,8 +198,6 @@ class AIContentAnalyzer:
                     "memory_usage": "Not implemented",  # Placeholder
                 }
 
-            # Cache result
-            self._add_to_cache(cache_key, result)
             return result
 
         except Exception as e:
@@ -157,12 +210,25 @@ class AIContentAnalyzer:
             }
 
     def _analyze_nutritional_content(
-        self, content: str, menu_items: List[Dict[str, Any]], custom_questions: List[str] = None, ai_config: Dict[str, Any] = None
+        self, content: str, menu_items: List[Dict[str, Any]], custom_questions: List[str] = None, ai_config: Dict[str, Any] = None,
+        on_field: Optional[FieldCallback] = None,
     ) -> Dict[str, Any]:
         """Analyze nutritional content of menu items."""
+        return self._run_nutritional_analysis(content, menu_items, custom_questions, ai_config, on_field)[0]
+
+    def _run_nutritional_analysis(
+        self, content: str, menu_items: List[Dict[str, Any]], custom_questions: List[str] = None, ai_config: Dict[str, Any] = None,
+        on_field: Optional[FieldCallback] = None,
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """Analyze nutritional content of menu items.
+
+        Returns:
+            Tuple of (analysis, provider that answered), where the provider is
+            None if no model produced the analysis
+        """
         print(f"DEBUG: _analyze_nutritional_content called with custom_questions: {custom_questions}")
         if not menu_items:
-            return {"nutritional_context": [], "dietary_restrictions": {}}
+            return {"nutritional_context": [], "dietary_restrictions": {}}, None
 
         # Check which provider to use
         provider = self.config.get("default_provider", "openai")
@@ -172,7 +238,8 @@ class AIContentAnalyzer:
             self.config["providers"]["custom"]["enabled"] and 
             self.config["providers"]["custom"]["api_key"]):
             try:
-                return self.extract_with_custom(content, menu_items, "nutritional", custom_questions)
+                result = self.extract_with_custom(content, menu_items, "nutritional", custom_questions)
+                return result, result.get("provider_used")
             except Exception as e:
                 logger.error(f"Custom provider failed, falling back to OpenAI: {e}")
                 provider = "openai"
@@ -182,7 +249,8 @@ class AIContentAnalyzer:
               self.config["providers"]["claude"]["enabled"] and 
               self.config["providers"]["claude"]["api_key"]):
             try:
-                return self.extract_with_claude(content, provider, custom_questions)
+                result = self.extract_with_claude(content, provider, custom_questions, on_field)
+                return result, result.get("provider_used")
             except Exception as e:
                 logger.error(f"Claude provider failed, falling back to OpenAI: {e}")
                 provider = "openai"
@@ -191,7 +259,8 @@ class AIContentAnalyzer:
         elif (provider == "ollama" and 
               self.config["providers"]["ollama"]["enabled"]):
             try:
-                return self.extract_with_ollama(content, custom_questions)
+                result = self.extract_with_ollama(content, custom_questions, on_field)
+                return result, result.get("provider_used")
             except Exception as e:
                 logger.error(f"Ollama provider failed, falling back to OpenAI: {e}")
                 provider = "openai"
@@ -236,7 +305,9 @@ class AIContentAnalyzer:
             # Get the model name from AI config (passed from UI)
             model_name = (ai_config or {}).get('model', 'gpt-3.5-turbo')
             print(f"DEBUG: Using model: {model_name}")
-            llm_result = self._call_openai_direct(prompt, model_name)
+            llm_result = self._call_openai_direct(
+                prompt, model_name, required_fields=ANALYSIS_FIELDS + ["custom_questions"], on_field=on_field
+            )
         else:
             print("DEBUG: Using standard LLMExtractor")
             # Extract categories from industry_config for LLMExtractor
@@ -249,7 +320,7 @@ class AIContentAnalyzer:
             )
 
         # Process LLM result into expected format
-        return self._process_nutritional_result(llm_result, menu_items, custom_questions)
+        return self._process_nutritional_result(llm_result, menu_items, custom_questions), "openai"
 
     def _process_nutritional_result(
         self, llm_result: Dict[str, Any], menu_items: List[Dict[str, Any]], custom_questions: List[str] = None
@@ -257,9 +328,11 @@ class AIContentAnalyzer:
         """Process LLM result into enhanced RAG context format."""
         print(f"DEBUG: _process_nutritional_result called with llm_result keys: {list(llm_result.keys()) if llm_result else 'None'}")
         
-        # Helper function to create default structure with custom_questions preserved
+        # Helper function to create default structure with custom_questions preserved;
+        # it is marked as a fallback so it is never cached as a model answer
         def create_default_structure(preserve_custom_questions=None):
             default = {
+                "fallback": True,
                 "menu_enhancements": [
                     {
                         "item_name": item.get("name", "Unknown"),
@@ -355,6 +428,7 @@ class AIContentAnalyzer:
                                         # Check if there were custom_questions in the original content
                                         custom_questions = content.get("custom_questions", None)
                                         fallback = create_default_structure(custom_questions)
+                                        fallback.pop("fallback")
                                         fallback["restaurant_characteristics"]["analysis"] = content.get("analysis", str(content))
                                         return fallback
                                 else:
@@ -363,6 +437,7 @@ class AIContentAnalyzer:
                                     # Check if there were custom_questions in the original content
                                     custom_questions = content.get("custom_questions", None)
                                     fallback = create_default_structure(custom_questions)
+                                    fallback.pop("fallback")
                                     fallback["restaurant_characteristics"]["analysis"] = content.get("analysis", str(content))
                                     return fallback
             
@@ -627,57 +702,228 @@ class AIContentAnalyzer:
         return min(max(confidence, 0.0), 1.0)
 
     def batch_analyze(
-        self, pages: List[Dict[str, Any]]
+        self, pages: List[Dict[str, Any]], custom_questions: List[str] = None
     ) -> List[Dict[str, Any]]:
-        """Batch analyze multiple pages."""
-        results = []
-        for page in pages:
-            result = self.analyze_content(
+        """Batch analyze multiple pages.
+
+        With the OpenAI provider and custom questions, where a single page is
+        analyzed with the enhanced prompt, pages that need an LLM call send
+        that same prompt packed several to a request, concurrently within the
+        scheduler's rate limits; pages whose packed answer is missing fall
+        back to ``analyze_content``. Otherwise ``analyze_content`` runs
+        concurrently per page.
+
+        Args:
+            pages: Dicts with "content", "menu_items" and "url"
+            custom_questions: Optional custom questions asked for every page
+
+        Returns:
+            One analysis result per page, in order, each with its "url"
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(pages)
+        pending = []
+
+        provider = self.config.get("default_provider", "openai")
+        if provider == "openai" and self.api_key and custom_questions:
+            for index, page in enumerate(pages):
+                if not page.get("menu_items"):
+                    continue
+                cached = self.llm_cache.get(*self._analysis_cache_key(
+                    page.get("content", ""), page.get("menu_items", []), "nutritional", custom_questions
+                ))
+                if cached is not None:
+                    results[index] = cached
+                else:
+                    pending.append(index)
+
+        if pending:
+            self._batch_openai_analysis(pages, pending, results, custom_questions)
+
+        def analyze_page(index: int) -> Dict[str, Any]:
+            page = pages[index]
+            if page.get("menu_items"):
+                # Pages analyzed on their own call the provider too, so they
+                # wait for the same rate and token limits as packed requests
+                self.request_scheduler.throttle(self._build_enhanced_prompt(
+                    page.get("content", ""), page.get("menu_items", []), custom_questions
+                ))
+            return self.analyze_content(
                 content=page.get("content", ""),
                 menu_items=page.get("menu_items", []),
                 analysis_type="nutritional",
+                custom_questions=custom_questions,
+                on_field=self._field_callback_for(page.get("url", "")),
             )
+
+        remaining = [index for index, result in enumerate(results) if result is None]
+        for index, result in zip(remaining, self.request_scheduler.map(remaining, analyze_page)):
+            results[index] = result
+
+        for page, result in zip(pages, results):
             result["url"] = page.get("url", "")
-            results.append(result)
         return results
 
+    def _batch_openai_analysis(
+        self,
+        pages: List[Dict[str, Any]],
+        indices: List[int],
+        results: List[Optional[Dict[str, Any]]],
+        custom_questions: List[str] = None,
+    ) -> None:
+        """Analyze pages through packed OpenAI requests, filling ``results`` in place."""
+        model = (getattr(self, '_current_ai_config', None) or {}).get('model', 'gpt-3.5-turbo')
+        # The prompt analyze_content sends for a single page
+        prompts = [
+            self._build_enhanced_prompt(
+                pages[index].get("content", ""), pages[index].get("menu_items", []), custom_questions
+            )
+            for index in indices
+        ]
+
+        streaming = self.config.get("streaming_enabled", False)
+        required_fields = ANALYSIS_FIELDS + (["custom_questions"] if custom_questions else [])
+        callbacks = {
+            prompt: self._field_callback_for(pages[index].get("url", ""))
+            for index, prompt in zip(indices, prompts)
+        }
+        streamed = set()
+        spent_by_request: Dict[str, TokenUsage] = {}
+
+        def complete(prompt: str) -> str:
+            if not streaming or prompt not in callbacks:
+                return self._openai_completion(prompt, model)
+            # A prompt sent on its own streams its fields under its page's URL
+            streamed.add(prompt)
+            return self._openai_completion(
+                prompt, model, stream=True, required_fields=required_fields,
+                on_field=callbacks[prompt],
+            )
+
+        def call(prompt: str) -> str:
+            with self.llm_cache.track_usage() as spent:
+                answer = complete(prompt)
+            spent_by_request[prompt] = spent
+            return answer
+
+        answers = self.request_scheduler.run(prompts, call)
+
+        for index, prompt, answer in zip(indices, prompts, answers):
+            if answer is None:
+                # Left for the per-page fallback
+                continue
+            page = pages[index]
+            if streaming and prompt not in streamed:
+                # Answers split out of a packed response arrive all at once
+                replay_fields(answer, callbacks[prompt])
+            result = self._process_nutritional_result(
+                self._parse_llm_json(answer), page.get("menu_items", []), custom_questions
+            )
+            if self._is_cacheable_analysis(result):
+                prompt_tokens, completion_tokens, cost = self._page_usage(
+                    prompt, prompts, spent_by_request
+                ).as_usage()
+                self.llm_cache.put(
+                    *self._analysis_cache_key(
+                        page.get("content", ""), page.get("menu_items", []), "nutritional",
+                        custom_questions, "openai",
+                    ),
+                    result,
+                    prompt_tokens=prompt_tokens,
+                    completion_tokens=completion_tokens,
+                    cost=cost,
+                )
+            results[index] = result
+
+    @staticmethod
+    def _page_usage(
+        prompt: str, prompts: List[str], spent_by_request: Dict[str, TokenUsage]
+    ) -> TokenUsage:
+        """Get a page's share of the usage of the requests that carried its prompt.
+
+        A request packing several prompts is split evenly between them.
+        """
+        usage = TokenUsage()
+        for request, spent in spent_by_request.items():
+            if request == prompt:
+                share = 1
+            elif prompt.strip() in request:
+                share = sum(1 for other in prompts if other.strip() in request)
+            else:
+                continue
+            usage.prompt_tokens += spent.prompt_tokens // share
+            usage.completion_tokens += spent.completion_tokens // share
+            usage.cost += spent.cost / share
+        return usage
+
+    def _field_callback_for(self, url: str) -> Optional[FieldCallback]:
+        """Get the field callback for a page, built from its URL when page_field_callback is set."""
+        if self.page_field_callback is not None:
+            return self.page_field_callback(url)
+        return self.field_callback
+
     def update_configuration(self, custom_config: Dict[str, Any]) -> None:
         """Update analyzer configuration."""
         self.config.update(custom_config)
 
-    def _get_cache_key(
-        self, content: str, menu_items: List, analysis_type: str
-    ) -> str:
-        """Generate cache key for content."""
-        data = f"{content[:1000]}{str(menu_items)}{analysis_type}"
-        return hashlib.md5(data.encode()).hexdigest()
-
-    def _get_from_cache(self, key: str) -> Optional[Dict[str, Any]]:
-        """Get result from cache if valid."""
-        if key in self._cache:
-            cached_data = self._cache[key]
-            if datetime.now() - cached_data["timestamp"] < self._cache_ttl:
-                return cached_data["result"]
-            else:
-                del self._cache[key]
-        return None
+    def _analysis_cache_key(
+        self,
+        content: str,
+        menu_items: List,
+        analysis_type: str,
+        custom_questions: Optional[List[str]] = None,
+        provider: Optional[str] = None,
+    ) -> tuple:
+        """Get the (provider, model, prompt) the LLM cache stores an analysis under.
+
+        The prompt serializes every analysis input so any change to content,
+        menu items or questions is a different entry. ``provider`` is the
+        provider that answered, defaulting to the configured one.
+        """
+        ai_config = getattr(self, '_current_ai_config', None) or {}
+        prompt = json.dumps(
+            {
+                "content": content,
+                "menu_items": menu_items,
+                "analysis_type": analysis_type,
+                "custom_questions": custom_questions or [],
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return (
+            f"analyzer:{provider or self.config.get('default_provider', 'openai')}",
+            ai_config.get("model", ""),
+            prompt,
+        )
+
+    @staticmethod
+    def _is_cacheable_analysis(analysis: Dict[str, Any]) -> bool:
+        """Check that an analysis result is model output, not an error or fallback."""
+        return (
+            "error" not in analysis
+            and analysis.get("status") != "error"
+            and not analysis.get("fallback")
+        )
 
-    def _add_to_cache(self, key: str, result: Dict[str, Any]) -> None:
-        """Add result to cache."""
-        self._cache[key] = {"result": result, "timestamp": datetime.now()}
+    def get_cache_statistics(self) -> Dict[str, Any]:
+        """Get hit rate, tokens saved and dollars saved from the LLM cache."""
+        return self.llm_cache.get_statistics()
 
     # =================================================================
     # OPTIONAL ADVANCED AI FEATURES
     # =================================================================
 
     def extract_with_claude(
-        self, content: str, provider: str = "claude", custom_questions: List[str] = None
+        self, content: str, provider: str = "claude", custom_questions: List[str] = None,
+        on_field: Optional[FieldCallback] = None,
     ) -> Dict[str, Any]:
-        """Extract content using Claude AI."""
+        """Extract content using Claude AI, streaming when ``streaming_enabled`` is configured."""
         if not self.claude_extractor:
             self.claude_extractor = ClaudeExtractor(
                 api_key=self.config["providers"]["claude"]["api_key"]
             )
+        stream = self.config.get("streaming_enabled", False)
+        on_field = on_field or self.field_callback
 
         try:
             # Use enhanced prompt if custom questions are present
@@ -691,6 +937,8 @@ class AIContentAnalyzer:
                     model=self.config["providers"]["claude"].get(
                         "model", "claude-3-opus-20240229"
                     ),
+                    stream=stream,
+                    on_field=on_field,
                 )
                 # Add custom questions note
                 result["custom_questions_note"] = "Custom questions not yet implemented for Claude provider"
@@ -701,6 +949,8 @@ class AIContentAnalyzer:
                     model=self.config["providers"]["claude"].get(
                         "model", "claude-3-opus-20240229"
                     ),
+                    stream=stream,
+                    on_field=on_field,
                 )
             result["provider_used"] = "claude"
             return result
@@ -710,22 +960,26 @@ class AIContentAnalyzer:
                 return self._fallback_to_openai(content)
             raise
 
-    def extract_with_ollama(self, content: str, custom_questions: List[str] = None) -> Dict[str, Any]:
-        """Extract content using Ollama local LLM."""
+    def extract_with_ollama(
+        self, content: str, custom_questions: List[str] = None, on_field: Optional[FieldCallback] = None
+    ) -> Dict[str, Any]:
+        """Extract content using Ollama local LLM, streaming when ``streaming_enabled`` is configured."""
         if not self.ollama_extractor:
             self.ollama_extractor = OllamaExtractor(
                 endpoint=self.config["providers"]["ollama"]["endpoint"]
             )
+        stream = self.config.get("streaming_enabled", False)
+        on_field = on_field or self.field_callback
 
         # Use enhanced prompt if custom questions are present
         if custom_questions and len(custom_questions) > 0:
             prompt = self._build_enhanced_prompt(content, [], custom_questions)
             # TODO: Implement direct Ollama API call with custom prompt
             # For now, fall back to traditional extraction
-            result = self.ollama_extractor.extract(content=content)
+            result = self.ollama_extractor.extract(content=content, stream=stream, on_field=on_field)
             result["custom_questions_note"] = "Custom questions not yet implemented for Ollama provider"
         else:
-            result = self.ollama_extractor.extract(content=content)
+            result = self.ollama_extractor.extract(content=content, stream=stream, on_field=on_field)
         
         result["provider_used"] = "ollama"
         result["external_calls"] = 0
@@ -840,9 +1094,11 @@ class AIContentAnalyzer:
     def _fallback_to_openai(self, content: str) -> Dict[str, Any]:
         """Fallback to OpenAI when other providers fail."""
         logger.info("Falling back to OpenAI due to primary provider failure")
-        return self.analyze_content(
+        result = self.analyze_content(
             content=content, menu_items=[], analysis_type="nutritional"
         )
+        result["fallback"] = True
+        return result
 
     def _build_enhanced_prompt(self, content: str, menu_items: List[Dict[str, Any]], custom_questions: List[str] = None) -> str:
         """Build enhanced prompt with custom questions for any provider."""
@@ -920,55 +1176,161 @@ Please answer these specific questions if information is available in the conten
         """
         return prompt
 
-    def _call_openai_direct(self, prompt: str, model: str = "gpt-3.5-turbo") -> Dict[str, Any]:
-        """Call OpenAI API directly with custom prompt for custom questions."""
+    def _call_openai_direct(
+        self,
+        prompt: str,
+        model: str = "gpt-3.5-turbo",
+        required_fields: Optional[List[str]] = None,
+        on_field: Optional[FieldCallback] = None,
+    ) -> Dict[str, Any]:
+        """Call OpenAI API directly with custom prompt for custom questions.
+
+        When ``streaming_enabled`` is configured the completion is streamed,
+        ``on_field`` (or ``field_callback``) hears about each field as it
+        arrives, and the stream is closed as soon as ``required_fields`` are
+        all present.
+        """
         try:
-            # Import OpenAI
-            from openai import OpenAI
-            
             # Use the API key passed to AIContentAnalyzer constructor
             # This should always be available since we validate it in the scraping handler
-            api_key = self.api_key
-            if not api_key:
+            if not self.api_key:
                 logger.error("No OpenAI API key available for custom questions - AIContentAnalyzer was not properly initialized")
                 return {"error": "No API key available"}
             
-            # Create OpenAI client
-            client = OpenAI(api_key=api_key)
-            
-            print(f"DEBUG: Calling OpenAI with custom prompt: {prompt[:200]}...")
-            
-            # Make the API call with higher token limit for comprehensive analysis
-            response = client.chat.completions.create(
-                model=model,  # Use the model specified in UI settings
-                messages=[
-                    {"role": "system", "content": "You are an expert restaurant data analyzer."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=4096,  # Increased from 1500 to allow comprehensive analysis
-                temperature=0.3
+            result_text = self._openai_completion(
+                prompt,
+                model,
+                stream=self.config.get("streaming_enabled", False),
+                required_fields=required_fields,
+                on_field=on_field,
             )
-            
-            # Extract the response content
-            result_text = response.choices[0].message.content
             print(f"DEBUG: OpenAI response: {result_text[:200]}...")
-            
-            # Try to parse as JSON
-            try:
-                result_json = json.loads(result_text)
-                return result_json
-            except json.JSONDecodeError:
-                # If not valid JSON, wrap in extractions format
-                return {
-                    "extractions": [
-                        {
-                            "category": "AI Analysis",
-                            "confidence": 0.8,
-                            "extracted_data": {"analysis": result_text}
-                        }
-                    ]
-                }
+            return self._parse_llm_json(result_text)
                 
         except Exception as e:
             logger.error(f"Direct OpenAI call failed: {e}")
             return {"error": str(e)}
+
+    def _openai_request(self, prompt: str, model: str) -> Dict[str, Any]:
+        """Build chat completion arguments for an analysis prompt."""
+        return {
+            "model": model,  # Use the model specified in UI settings
+            "messages": [
+                {"role": "system", "content": "You are an expert restaurant data analyzer."},
+                {"role": "user", "content": prompt}
+            ],
+            "max_tokens": 4096,  # Increased from 1500 to allow comprehensive analysis
+            "temperature": 0.3,
+        }
+
+    def _openai_completion(
+        self,
+        prompt: str,
+        model: str = "gpt-3.5-turbo",
+        stream: bool = False,
+        required_fields: Optional[List[str]] = None,
+        on_field: Optional[FieldCallback] = None,
+    ) -> str:
+        """Get the text of an OpenAI chat completion, reusing cached responses.
+
+        With ``stream`` the completion is streamed and ``on_field``, or
+        ``field_callback`` if not given, receives each field as it arrives.
+        """
+        if stream:
+            return self._stream_openai_completion(prompt, model, required_fields, on_field)
+
+        # Import OpenAI
+        from openai import OpenAI
+        
+        def call_openai() -> Dict[str, Any]:
+            # Create OpenAI client
+            client = OpenAI(api_key=self.api_key)
+            
+            print(f"DEBUG: Calling OpenAI with custom prompt: {prompt[:200]}...")
+            
+            response = client.chat.completions.create(**self._openai_request(prompt, model))
+            usage = getattr(response, "usage", None)
+            return {
+                "content": response.choices[0].message.content,
+                "usage": {
+                    "prompt_tokens": getattr(usage, "prompt_tokens", 0),
+                    "completion_tokens": getattr(usage, "completion_tokens", 0),
+                },
+            }
+        
+        response, _ = self.llm_cache.get_or_compute(
+            "openai",
+            model,
+            prompt,
+            call_openai,
+            params={"max_tokens": 4096, "temperature": 0.3},
+        )
+        return response["content"]
+
+    def _stream_openai_completion(
+        self,
+        prompt: str,
+        model: str,
+        required_fields: Optional[List[str]] = None,
+        on_field: Optional[FieldCallback] = None,
+    ) -> str:
+        """Stream an OpenAI chat completion, reporting JSON fields as they arrive.
+
+        Completions cut short once ``required_fields`` arrived are rebuilt
+        from the received fields and are not cached.
+        """
+        from openai import OpenAI
+
+        on_field = on_field or self.field_callback
+        params = {"max_tokens": 4096, "temperature": 0.3}
+        cached = self.llm_cache.get("openai", model, prompt, params=params)
+        if cached is not None:
+            replay_fields(cached["content"], on_field)
+            return cached["content"]
+
+        client = OpenAI(api_key=self.api_key)
+        chunks = client.chat.completions.create(
+            **self._openai_request(prompt, model),
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+        try:
+            result = stream_openai(chunks, FieldStream(on_field, required_fields))
+        finally:
+            close = getattr(chunks, "close", None)
+            if close:
+                close()
+
+        if not result.cancelled:
+            self.llm_cache.put(
+                "openai",
+                model,
+                prompt,
+                {
+                    "content": result.text,
+                    "usage": {
+                        "prompt_tokens": result.prompt_tokens,
+                        "completion_tokens": result.completion_tokens,
+                    },
+                },
+                params=params,
+                prompt_tokens=result.prompt_tokens,
+                completion_tokens=result.completion_tokens,
+            )
+        return result.json_text
+
+    def _parse_llm_json(self, result_text: str) -> Dict[str, Any]:
+        """Parse model output as JSON, wrapping plain text in extractions format."""
+        try:
+            return json.loads(result_text)
+        except json.JSONDecodeError:
+            # If not valid JSON, wrap in extractions format
+            return {
+                "extractions": [
+                    {
+                        "category": "AI Analysis",
+                        "confidence": 0.8,
+                        "extracted_data": {"analysis": result_text}
+                    }
+                ]
+            }
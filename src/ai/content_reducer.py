@@ -0,0 +1,343 @@
+"""Reduce HTML to compact, structure-annotated text before LLM extraction."""
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+from bs4 import BeautifulSoup, NavigableString, Tag
+
+
+# Rough chars-per-token ratio for English text with GPT/Claude tokenizers
+CHARS_PER_TOKEN = 4
+
+REMOVED_TAGS = [
+    "script", "style", "noscript", "template", "svg", "canvas",
+    "iframe", "nav", "footer", "form", "button", "select", "head",
+]
+HEADING_TAGS = {"h1", "h2", "h3", "h4", "h5", "h6"}
+BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "body", "dd", "div", "dl",
+    "dt", "figcaption", "figure", "header", "html", "main", "ol", "p", "pre",
+    "section", "table", "tbody", "thead", "tfoot", "ul", "br", "hr",
+}
+
+PRICE_PATTERN = re.compile(r"[$€£]\s?\d+(?:[.,]\d{2})?|\b\d+\.\d{2}\b")
+
+# Words that signal a block is relevant to an extraction category
+CATEGORY_KEYWORDS: Dict[str, List[str]] = {
+    "menu": [
+        "menu", "appetizer", "starter", "entree", "entrée", "main", "dessert",
+        "salad", "soup", "sandwich", "burger", "pizza", "pasta", "drink",
+        "wine", "beer", "cocktail", "special", "served", "price",
+    ],
+    "contact": ["phone", "call", "email", "contact", "tel", "reservation", "reserve"],
+    "hours": [
+        "hours", "open", "closed", "monday", "tuesday", "wednesday", "thursday",
+        "friday", "saturday", "sunday", "daily", "am", "pm", "brunch", "lunch", "dinner",
+    ],
+    "location": ["address", "street", "st", "ave", "avenue", "road", "suite", "located", "directions"],
+    "ambiance": ["atmosphere", "ambiance", "cozy", "patio", "decor", "view", "outdoor", "seating"],
+    "cuisine": ["cuisine", "italian", "mexican", "thai", "french", "japanese", "indian", "chinese"],
+}
+
+_WORD_PATTERN = re.compile(r"[a-zà-ÿ]+")
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate how many tokens a text costs.
+
+    Args:
+        text: Text sent to a model
+
+    Returns:
+        Approximate token count
+    """
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+@dataclass
+class ContentBlock:
+    """One line of reduced content."""
+
+    kind: str  # "heading", "item", "price" or "text"
+    text: str
+    level: int = 0
+
+    def render(self) -> str:
+        """Render the block with its structure annotation."""
+        if self.kind == "heading":
+            return "#" * max(1, self.level) + " " + self.text
+        if self.kind == "item":
+            return "- " + self.text
+        return self.text
+
+
+@dataclass
+class ReducedContent:
+    """Compact text produced from a page, with token accounting."""
+
+    blocks: List[ContentBlock] = field(default_factory=list)
+    original_tokens: int = 0
+    duplicates_removed: int = 0
+
+    @property
+    def text(self) -> str:
+        """Full reduced text."""
+        return "\n".join(block.render() for block in self.blocks)
+
+    @property
+    def reduced_tokens(self) -> int:
+        """Estimated tokens of the reduced text."""
+        return estimate_tokens(self.text)
+
+    @property
+    def reduction_ratio(self) -> float:
+        """Fraction of the original tokens removed."""
+        if not self.original_tokens:
+            return 0.0
+        return 1.0 - self.reduced_tokens / self.original_tokens
+
+    def get_statistics(self) -> Dict[str, float]:
+        """Get token counts before and after reduction."""
+        return {
+            "original_tokens": self.original_tokens,
+            "reduced_tokens": self.reduced_tokens,
+            "reduction_ratio": self.reduction_ratio,
+            "blocks": len(self.blocks),
+            "duplicates_removed": self.duplicates_removed,
+        }
+
+
+class ContentReducer:
+    """Strip boilerplate from pages and pick the chunks worth sending to an LLM.
+
+    Scripts, styles, navigation and footers are dropped; headings, list items
+    and price lines are kept and annotated (``#`` for headings, ``-`` for
+    items) so the model still sees the page structure. Repeated blocks such
+    as duplicated menus or "Order online" buttons are emitted once. A line is
+    only a duplicate of an earlier one under the same heading, so items that
+    share a price or description keep their own copy.
+    """
+
+    def __init__(self, max_chunk_tokens: int = 2000):
+        """Initialize content reducer.
+
+        Args:
+            max_chunk_tokens: Token budget of one chunk
+
+        Raises:
+            ValueError: If max_chunk_tokens is not positive
+        """
+        if max_chunk_tokens <= 0:
+            raise ValueError("max_chunk_tokens must be positive")
+        self.max_chunk_tokens = max_chunk_tokens
+
+    def reduce(self, content: str) -> ReducedContent:
+        """Reduce HTML or plain text to annotated blocks.
+
+        Args:
+            content: Raw HTML or text
+
+        Returns:
+            ReducedContent with deduplicated blocks and token counts
+        """
+        reduced = ReducedContent(original_tokens=estimate_tokens(content or ""))
+        if not content or not content.strip():
+            return reduced
+
+        if "<" in content and ">" in content:
+            lines = self._html_lines(content)
+        else:
+            lines = [(None, 0, line, None) for line in content.splitlines()]
+
+        seen = set()
+        for kind, level, line, section in lines:
+            text = " ".join(line.split())
+            if not text:
+                continue
+            fingerprint = (section, text.lower())
+            if fingerprint in seen:
+                reduced.duplicates_removed += 1
+                continue
+            seen.add(fingerprint)
+
+            if kind is None:
+                kind = "price" if PRICE_PATTERN.search(text) else "text"
+            elif kind == "text" and PRICE_PATTERN.search(text):
+                kind = "price"
+            reduced.blocks.append(ContentBlock(kind, text, level))
+
+        return reduced
+
+    def _html_lines(self, html: str) -> List[tuple]:
+        """Walk the DOM and emit (kind, level, text, section) lines.
+
+        ``section`` is the text of the heading the line falls under. A heading
+        covers the rest of its container, so leaving the container restores
+        the enclosing section.
+        """
+        soup = BeautifulSoup(html, "html.parser")
+        for tag in soup.find_all(REMOVED_TAGS):
+            tag.decompose()
+        for tag in soup.find_all(attrs={"role": "navigation"}):
+            tag.decompose()
+
+        lines: List[tuple] = []
+        buffer: List[str] = []
+        section: List[Optional[str]] = [None]
+
+        def emit(kind: str, level: int, text: str) -> None:
+            lines.append((kind, level, text, section[0]))
+
+        def flush() -> None:
+            if buffer:
+                emit("text", 0, " ".join(buffer))
+                buffer.clear()
+
+        def walk(node: Tag) -> None:
+            for child in node.children:
+                if isinstance(child, NavigableString):
+                    if type(child) is NavigableString:
+                        buffer.append(str(child))
+                    continue
+                if not isinstance(child, Tag):
+                    continue
+                name = child.name
+                if name in HEADING_TAGS:
+                    flush()
+                    heading = child.get_text(" ")
+                    emit("heading", int(name[1]), heading)
+                    section[0] = " ".join(heading.split()).lower()
+                elif name in ("li", "dt", "dd"):
+                    flush()
+                    emit("item", 0, child.get_text(" "))
+                elif name == "tr":
+                    flush()
+                    cells = [cell.get_text(" ").strip() for cell in child.find_all(["td", "th"])]
+                    emit("item", 0, " | ".join(cell for cell in cells if cell))
+                elif name in BLOCK_TAGS:
+                    flush()
+                    enclosing = section[0]
+                    walk(child)
+                    flush()
+                    section[0] = enclosing
+                else:
+                    walk(child)
+
+        walk(soup)
+        flush()
+        return lines
+
+    def chunk(self, reduced: ReducedContent, max_tokens: Optional[int] = None) -> List[str]:
+        """Pack blocks into chunks that respect section boundaries.
+
+        Chunks break before headings when possible, and a chunk that starts in
+        the middle of a section repeats that section's heading for context.
+
+        Args:
+            reduced: Reduced content
+            max_tokens: Token budget per chunk (defaults to max_chunk_tokens)
+
+        Returns:
+            List of chunk texts in page order
+        """
+        budget = max_tokens or self.max_chunk_tokens
+        chunks: List[str] = []
+        current: List[str] = []
+        current_tokens = 0
+        heading: Optional[str] = None
+
+        for block in reduced.blocks:
+            line = block.render()
+            line_tokens = estimate_tokens(line) + 1
+            starts_section = block.kind == "heading"
+            over_budget = current_tokens + line_tokens > budget
+            # Prefer to start a new chunk at a heading once the current one is well filled
+            if current and (over_budget or (starts_section and current_tokens > budget // 2)):
+                chunks.append("\n".join(current))
+                current, current_tokens = [], 0
+                if heading and not starts_section:
+                    current.append(heading)
+                    current_tokens = estimate_tokens(heading) + 1
+            if starts_section:
+                heading = line
+            if line_tokens > budget:
+                line = line[: budget * CHARS_PER_TOKEN]
+                line_tokens = budget
+            current.append(line)
+            current_tokens += line_tokens
+
+        if current:
+            chunks.append("\n".join(current))
+        return chunks
+
+    def select_chunks(
+        self,
+        reduced: ReducedContent,
+        categories: Optional[Sequence[str]] = None,
+        max_chunks: Optional[int] = None,
+        max_tokens: Optional[int] = None,
+    ) -> List[str]:
+        """Get the chunks most relevant to the requested categories.
+
+        Args:
+            reduced: Reduced content
+            categories: Extraction categories, e.g. ["Menu Items", "Hours"]
+            max_chunks: Maximum chunks to return, or None for all
+            max_tokens: Token budget per chunk (defaults to max_chunk_tokens)
+
+        Returns:
+            Selected chunks in page order
+        """
+        chunks = self.chunk(reduced, max_tokens)
+        if max_chunks is None or len(chunks) <= max_chunks:
+            return chunks
+
+        keywords = self._keywords_for(categories)
+        ranked = sorted(
+            range(len(chunks)),
+            key=lambda index: (-self._score(chunks[index], keywords), index),
+        )
+        return [chunks[index] for index in sorted(ranked[:max_chunks])]
+
+    def reduce_for_prompt(
+        self,
+        content: str,
+        categories: Optional[Sequence[str]] = None,
+        max_tokens: int = 1000,
+    ) -> str:
+        """Reduce content and keep the most relevant text within a token budget.
+
+        Args:
+            content: Raw HTML or text
+            categories: Extraction categories used to rank chunks
+            max_tokens: Token budget for the returned text
+
+        Returns:
+            Reduced text ready to embed in a prompt
+        """
+        reduced = self.reduce(content)
+        if reduced.reduced_tokens <= max_tokens:
+            return reduced.text
+        return self.select_chunks(reduced, categories, max_chunks=1, max_tokens=max_tokens)[0]
+
+    @staticmethod
+    def _keywords_for(categories: Optional[Sequence[str]]) -> set:
+        """Expand category names into relevance keywords."""
+        keywords = set()
+        for category in categories or CATEGORY_KEYWORDS:
+            words = _WORD_PATTERN.findall(str(category).lower())
+            keywords.update(words)
+            for name, related in CATEGORY_KEYWORDS.items():
+                if name in words or any(word.rstrip("s") == name for word in words):
+                    keywords.update(related)
+        return keywords
+
+    @staticmethod
+    def _score(chunk: str, keywords: set) -> float:
+        """Score a chunk by keyword and price density."""
+        words = _WORD_PATTERN.findall(chunk.lower())
+        if not words:
+            return 0.0
+        hits = sum(1 for word in words if word in keywords)
+        hits += 2 * len(PRICE_PATTERN.findall(chunk)) if "menu" in keywords else 0
+        return hits / len(words) ** 0.5
@@ -2,10 +2,12 @@
 
 import logging
 from typing import Dict, Any, Optional, List
-import requests
 import json
 from datetime import datetime
 
+from ..common.http_transport import get_shared_transport
+from .llm_cache import get_shared_llm_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,6 +26,8 @@ class CustomExtractor:
         self.base_url = base_url.rstrip('/')
         self.model_name = model_name
         self.timeout = 30
+        self.transport = get_shared_transport()
+        self.llm_cache = get_shared_llm_cache()
         
         # Ensure base_url ends with the correct path
         if not self.base_url.endswith('/v1'):
@@ -221,16 +225,23 @@ class CustomExtractor:
             "temperature": 0.3
         }
         
-        response = requests.post(
-            f"{self.base_url}/chat/completions",
-            headers=headers,
-            json=data,
-            timeout=self.timeout
-        )
-        
-        response.raise_for_status()
+        def post() -> Dict[str, Any]:
+            response = self.transport.post(
+                f"{self.base_url}/chat/completions",
+                headers=headers,
+                json=data,
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            return response.json()
         
-        result = response.json()
+        result, _ = self.llm_cache.get_or_compute(
+            f"custom:{self.base_url}",
+            self.model_name,
+            prompt,
+            post,
+            params={"max_tokens": 1000, "temperature": 0.3}
+        )
         return result['choices'][0]['message']['content']
     
     def _parse_nutritional_response(self, response: str) -> Dict[str, Any]:
@@ -0,0 +1,484 @@
+"""Persistent content-addressed cache of LLM responses shared by all providers."""
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# USD per 1K tokens as (prompt, completion), matched by longest model prefix
+MODEL_PRICING: Dict[str, Tuple[float, float]] = {
+    "gpt-3.5-turbo": (0.0005, 0.0015),
+    "gpt-4": (0.03, 0.06),
+    "gpt-4-turbo": (0.01, 0.03),
+    "gpt-4-vision-preview": (0.01, 0.03),
+    "gpt-4o": (0.005, 0.015),
+    "gpt-4o-mini": (0.00015, 0.0006),
+    "claude-3-haiku": (0.00025, 0.00125),
+    "claude-3-sonnet": (0.003, 0.015),
+    "claude-3-5-sonnet": (0.003, 0.015),
+    "claude-3-opus": (0.015, 0.075),
+}
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".rag_scraper", "llm_cache.sqlite3")
+CACHE_PATH_ENV = "RAG_SCRAPER_LLM_CACHE"
+
+
+def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    """Estimate the price of a call from its token counts.
+
+    Args:
+        model: Model name, e.g. "gpt-3.5-turbo" or "claude-3-opus-20240229"
+        prompt_tokens: Tokens sent
+        completion_tokens: Tokens generated
+
+    Returns:
+        Cost in USD, or 0.0 for models without a known price (e.g. local models)
+    """
+    prefixes = [prefix for prefix in MODEL_PRICING if (model or "").startswith(prefix)]
+    if not prefixes:
+        return 0.0
+    prompt_price, completion_price = MODEL_PRICING[max(prefixes, key=len)]
+    return (prompt_tokens * prompt_price + completion_tokens * completion_price) / 1000
+
+
+def usage_from_response(data: Any) -> Tuple[int, int]:
+    """Read prompt and completion token counts from a raw provider response.
+
+    Understands OpenAI (``usage.prompt_tokens``), Anthropic
+    (``usage.input_tokens``) and Ollama (``prompt_eval_count``) payloads.
+
+    Args:
+        data: Decoded JSON response
+
+    Returns:
+        Tuple of (prompt_tokens, completion_tokens), zeros when unknown
+    """
+    if not isinstance(data, dict):
+        return 0, 0
+    usage = data.get("usage")
+    if isinstance(usage, dict):
+        prompt = usage.get("prompt_tokens", usage.get("input_tokens", 0))
+        completion = usage.get("completion_tokens", usage.get("output_tokens", 0))
+    else:
+        prompt = data.get("prompt_eval_count", 0)
+        completion = data.get("eval_count", 0)
+    try:
+        return int(prompt or 0), int(completion or 0)
+    except (TypeError, ValueError):
+        return 0, 0
+
+
+@dataclass
+class TokenUsage:
+    """Tokens and estimated cost behind a set of responses."""
+
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cost: float = 0.0
+
+    def as_usage(self) -> Tuple[int, int, float]:
+        """Get the (prompt_tokens, completion_tokens, cost) a cache entry records."""
+        return self.prompt_tokens, self.completion_tokens, self.cost
+
+
+class LLMResponseCache:
+    """Size- and TTL-bounded SQLite cache of LLM responses.
+
+    Entries are keyed by a SHA-256 of provider, model, the full prompt and any
+    request parameters that change the answer, so identical calls from any
+    extractor share one entry. Values must be JSON serializable. When the
+    cache exceeds ``max_entries`` or ``max_size_bytes`` the least recently used
+    entries are evicted. Concurrent misses for the same key are collapsed so
+    only one caller pays for the API request.
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        ttl: Optional[float] = 7 * 24 * 3600,
+        max_entries: int = 10000,
+        max_size_bytes: int = 100 * 1024 * 1024,
+    ):
+        """Initialize LLM response cache.
+
+        Args:
+            path: SQLite database file, or ":memory:" for a per-process cache
+            ttl: Seconds an entry stays valid, or None to never expire
+            max_entries: Maximum number of stored responses
+            max_size_bytes: Maximum total size of stored responses
+
+        Raises:
+            ValueError: If ttl, max_entries or max_size_bytes is invalid
+        """
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        if max_size_bytes <= 0:
+            raise ValueError("max_size_bytes must be positive")
+
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_size_bytes = max_size_bytes
+
+        self._in_flight: Dict[str, threading.Event] = {}
+        self._usage_trackers = threading.local()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.tokens_saved = 0
+        self.dollars_saved = 0.0
+        self.lock = threading.Lock()
+
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            "key TEXT PRIMARY KEY, provider TEXT, model TEXT, value TEXT, "
+            "prompt_tokens INTEGER, completion_tokens INTEGER, cost REAL, "
+            "size INTEGER, created_at REAL, last_access REAL)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS llm_cache_last_access ON llm_cache (last_access)"
+        )
+        self._db.commit()
+
+        with self.lock:
+            self._purge_expired()
+            self.entry_count, self.total_size = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache"
+            ).fetchone()
+
+    @staticmethod
+    def make_key(
+        provider: str, model: str, prompt: str, params: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Get the content address of a request.
+
+        Args:
+            provider: Provider name, e.g. "openai", "claude", "ollama"
+            model: Model name
+            prompt: Full prompt text
+            params: Other request parameters that change the response
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        digest = hashlib.sha256()
+        for part in (provider, model, json.dumps(params or {}, sort_keys=True), prompt):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get(
+        self, provider: str, model: str, prompt: str, params: Optional[Dict[str, Any]] = None
+    ) -> Optional[Any]:
+        """Get a cached response, counting a hit or miss.
+
+        Args:
+            provider: Provider name
+            model: Model name
+            prompt: Full prompt text
+            params: Other request parameters that change the response
+
+        Returns:
+            The stored value, or None if it is not cached
+        """
+        key = self.make_key(provider, model, prompt, params)
+        with self.lock:
+            found, value = self._lookup(key)
+            if found:
+                return value
+            self.misses += 1
+            return None
+
+    def put(
+        self,
+        provider: str,
+        model: str,
+        prompt: str,
+        value: Any,
+        params: Optional[Dict[str, Any]] = None,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        cost: Optional[float] = None,
+    ) -> bool:
+        """Store a response.
+
+        Args:
+            provider: Provider name
+            model: Model name
+            prompt: Full prompt text
+            value: JSON-serializable response
+            params: Other request parameters that change the response
+            prompt_tokens: Tokens the original call consumed as input
+            completion_tokens: Tokens the original call generated
+            cost: Price of the original call, estimated from the model if None
+
+        Returns:
+            True if stored, False if the value could not be serialized
+        """
+        key = self.make_key(provider, model, prompt, params)
+        with self.lock:
+            return self._store(
+                key, provider, model, value, prompt_tokens, completion_tokens, cost
+            )
+
+    def get_or_compute(
+        self,
+        provider: str,
+        model: str,
+        prompt: str,
+        compute: Callable[[], Any],
+        params: Optional[Dict[str, Any]] = None,
+        usage: Callable[[Any], Tuple[int, int]] = usage_from_response,
+        cacheable: Optional[Callable[[Any], bool]] = None,
+    ) -> Tuple[Any, bool]:
+        """Get a cached response or make the call once and store its result.
+
+        Concurrent callers asking for the same key wait for the first caller's
+        result instead of issuing duplicate API requests.
+
+        Args:
+            provider: Provider name
+            model: Model name
+            prompt: Full prompt text
+            compute: Function making the API call
+            params: Other request parameters that change the response
+            usage: Function reading (prompt_tokens, completion_tokens) from a
+                result, optionally followed by the cost when it is known
+            cacheable: Predicate deciding whether a result may be stored
+
+        Returns:
+            Tuple of (response, True if it came from the cache)
+        """
+        key = self.make_key(provider, model, prompt, params)
+        while True:
+            with self.lock:
+                found, value = self._lookup(key)
+                if found:
+                    return value, True
+                in_flight = self._in_flight.get(key)
+                if in_flight is None:
+                    self._in_flight[key] = threading.Event()
+                    self.misses += 1
+                    break
+            in_flight.wait()
+
+        try:
+            value = compute()
+            if cacheable is None or cacheable(value):
+                counts = usage(value)
+                cost = counts[2] if len(counts) > 2 else None
+                with self.lock:
+                    self._store(key, provider, model, value, counts[0], counts[1], cost)
+            return value, False
+        finally:
+            with self.lock:
+                self._in_flight.pop(key).set()
+
+    @contextmanager
+    def track_usage(self) -> Iterator[TokenUsage]:
+        """Total the tokens and cost behind responses read or stored on this thread.
+
+        Lets a caller caching a result derived from LLM calls record what
+        those calls cost, whether they were made or served from the cache.
+
+        Yields:
+            TokenUsage updated as responses are read or stored
+        """
+        usage = TokenUsage()
+        trackers = self._usage_trackers.__dict__.setdefault("active", [])
+        trackers.append(usage)
+        try:
+            yield usage
+        finally:
+            trackers.remove(usage)
+
+    def _track(self, prompt_tokens: int, completion_tokens: int, cost: float) -> None:
+        """Add a response's usage to this thread's trackers."""
+        for usage in getattr(self._usage_trackers, "active", ()):
+            usage.prompt_tokens += prompt_tokens
+            usage.completion_tokens += completion_tokens
+            usage.cost += cost
+
+    def _lookup(self, key: str) -> Tuple[bool, Any]:
+        """Read an entry and record a hit; caller holds the lock."""
+        row = self._db.execute(
+            "SELECT value, prompt_tokens, completion_tokens, cost, size, created_at "
+            "FROM llm_cache WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return False, None
+
+        value, prompt_tokens, completion_tokens, cost, size, created_at = row
+        now = time.time()
+        if self.ttl is not None and now - created_at >= self.ttl:
+            self._delete(key, size)
+            self._db.commit()
+            return False, None
+
+        self._db.execute("UPDATE llm_cache SET last_access = ? WHERE key = ?", (now, key))
+        self._db.commit()
+        self.hits += 1
+        self.tokens_saved += prompt_tokens + completion_tokens
+        self.dollars_saved += cost
+        self._track(prompt_tokens, completion_tokens, cost)
+        return True, json.loads(value)
+
+    def _store(
+        self,
+        key: str,
+        provider: str,
+        model: str,
+        value: Any,
+        prompt_tokens: int,
+        completion_tokens: int,
+        cost: Optional[float] = None,
+    ) -> bool:
+        """Write an entry and evict until the cache fits; caller holds the lock."""
+        try:
+            encoded = json.dumps(value)
+        except (TypeError, ValueError):
+            logger.debug(f"Skipping uncacheable {provider} response")
+            return False
+
+        size = len(encoded.encode("utf-8"))
+        existing = self._db.execute(
+            "SELECT size FROM llm_cache WHERE key = ?", (key,)
+        ).fetchone()
+        if existing is not None:
+            self._delete(key, existing[0])
+
+        now = time.time()
+        if cost is None:
+            cost = estimate_cost(model, prompt_tokens, completion_tokens)
+        self._db.execute(
+            "INSERT INTO llm_cache VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                key, provider, model, encoded, prompt_tokens, completion_tokens,
+                cost, size, now, now,
+            ),
+        )
+        self._track(prompt_tokens, completion_tokens, cost)
+        self.entry_count += 1
+        self.total_size += size
+
+        while self.entry_count > 1 and (
+            self.entry_count > self.max_entries or self.total_size > self.max_size_bytes
+        ):
+            oldest_key, oldest_size = self._db.execute(
+                "SELECT key, size FROM llm_cache ORDER BY last_access LIMIT 1"
+            ).fetchone()
+            self._delete(oldest_key, oldest_size)
+            self.evictions += 1
+
+        self._db.commit()
+        return True
+
+    def _delete(self, key: str, size: int) -> None:
+        """Delete an entry; caller holds the lock and commits."""
+        self._db.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+        self.entry_count -= 1
+        self.total_size -= size
+
+    def _purge_expired(self) -> None:
+        """Drop entries past their TTL; caller holds the lock."""
+        if self.ttl is not None:
+            self._db.execute(
+                "DELETE FROM llm_cache WHERE created_at <= ?", (time.time() - self.ttl,)
+            )
+            self._db.commit()
+
+    def __len__(self) -> int:
+        """Get number of cached responses."""
+        with self.lock:
+            return self.entry_count
+
+    def clear(self) -> None:
+        """Remove every entry and reset counters."""
+        with self.lock:
+            self._db.execute("DELETE FROM llm_cache")
+            self._db.commit()
+            self.entry_count = 0
+            self.total_size = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.tokens_saved = 0
+            self.dollars_saved = 0.0
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self.lock:
+            self._db.close()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with entry count, size, hits, misses, hit rate,
+            evictions, tokens saved and estimated dollars saved
+        """
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": self.entry_count,
+                "size_bytes": self.total_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "tokens_saved": self.tokens_saved,
+                "dollars_saved": round(self.dollars_saved, 6),
+            }
+
+
+_shared_llm_cache: Optional[LLMResponseCache] = None
+_shared_llm_cache_lock = threading.Lock()
+
+
+def get_shared_llm_cache() -> LLMResponseCache:
+    """Get the process-wide LLM response cache, creating it on first use.
+
+    The database lives at ``$RAG_SCRAPER_LLM_CACHE`` or
+    ``~/.rag_scraper/llm_cache.sqlite3``; if it cannot be opened an in-memory
+    cache is used instead.
+    """
+    global _shared_llm_cache
+    with _shared_llm_cache_lock:
+        if _shared_llm_cache is None:
+            path = os.environ.get(CACHE_PATH_ENV) or DEFAULT_CACHE_PATH
+            try:
+                _shared_llm_cache = LLMResponseCache(path)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"Could not open LLM cache at {path}, using memory: {e}")
+                _shared_llm_cache = LLMResponseCache()
+        return _shared_llm_cache
+
+
+def configure_shared_llm_cache(**kwargs) -> LLMResponseCache:
+    """Replace the process-wide LLM response cache with a newly configured one.
+
+    Args:
+        **kwargs: Arguments passed to LLMResponseCache
+
+    Returns:
+        The new shared cache
+    """
+    global _shared_llm_cache
+    with _shared_llm_cache_lock:
+        _shared_llm_cache = LLMResponseCache(**kwargs)
+        return _shared_llm_cache
@@ -11,13 +11,15 @@ This refactored version addresses the brittleness issues by:
 import json
 import logging
 import time
-import hashlib
 from typing import Dict, List, Optional, Any, Union, Protocol
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from datetime import datetime
 import threading
 from collections import defaultdict
 
+from .content_reducer import ContentReducer
+from .llm_cache import LLMResponseCache, get_shared_llm_cache, usage_from_response
+
 logger = logging.getLogger(__name__)
 
 try:
@@ -121,47 +123,64 @@ class CachingLLMService:
     """
     LLM service decorator that adds caching functionality.
     
-    This separates caching concerns from API interaction.
+    This separates caching concerns from API interaction. Successful results
+    are stored in the shared persistent LLM response cache, keyed by provider,
+    model and the full prompt.
     """
     
-    def __init__(self, llm_service: LLMServiceProtocol, enable_cache: bool = True):
-        """Initialize with injectable LLM service."""
+    def __init__(self,
+                 llm_service: LLMServiceProtocol,
+                 enable_cache: bool = True,
+                 llm_cache: Optional[LLMResponseCache] = None,
+                 provider: str = "openai"):
+        """Initialize with injectable LLM service.
+        
+        Args:
+            llm_service: Service making the API calls
+            enable_cache: Whether to cache results
+            llm_cache: Response cache (defaults to the process-wide cache)
+            provider: Provider name used in cache keys
+        """
         self.llm_service = llm_service
         self.enable_cache = enable_cache
-        self._cache = {} if enable_cache else None
-        self._cache_lock = threading.RLock() if enable_cache else None
+        self.provider = provider
+        self.model = getattr(llm_service, "model", "")
+        self._cache = (llm_cache or get_shared_llm_cache()) if enable_cache else None
     
     def extract_content(self, prompt: str) -> ExtractionResult:
         """Extract content with caching support."""
         if not self.enable_cache:
             return self.llm_service.extract_content(prompt)
         
-        # Generate cache key
-        cache_key = hashlib.md5(prompt.encode('utf-8')).hexdigest()
+        def call() -> Dict[str, Any]:
+            result = asdict(self.llm_service.extract_content(prompt))
+            result["cache_hit"] = False
+            return result
         
-        # Check cache
-        with self._cache_lock:
-            if cache_key in self._cache:
-                cached_result = self._cache[cache_key]
-                cached_result.cache_hit = True
-                return cached_result
+        value, hit = self._cache.get_or_compute(
+            self.provider,
+            self.model,
+            prompt,
+            call,
+            usage=lambda result: usage_from_response({"usage": result["token_usage"] or {}}),
+            cacheable=lambda result: result["success"],
+        )
         
-        # Not in cache, get from service
-        result = self.llm_service.extract_content(prompt)
-        
-        # Store in cache if successful
-        if result.success and self._cache is not None:
-            with self._cache_lock:
-                self._cache[cache_key] = result
-        
-        result.cache_hit = False
+        result = ExtractionResult(**value)
+        if hit:
+            # No tokens were spent; savings are reported by the cache
+            result.cache_hit = True
+            result.token_usage = None
         return result
     
     def clear_cache(self):
         """Clear the cache."""
         if self._cache is not None:
-            with self._cache_lock:
-                self._cache.clear()
+            self._cache.clear()
+    
+    def get_cache_statistics(self) -> Optional[Dict[str, Any]]:
+        """Get hit rate, tokens saved and dollars saved from the response cache."""
+        return self._cache.get_statistics() if self._cache is not None else None
 
 
 class StatisticsTracker:
@@ -242,16 +261,28 @@ class PromptBuilder:
     Separate prompt building service.
     
     This makes prompt generation testable without LLM dependencies.
+    Content is reduced to structure-annotated text and the most relevant
+    part within ``max_content_tokens`` is sent, instead of the first
+    characters of raw HTML.
     """
     
-    def __init__(self, industry: str = "restaurant", categories: Optional[List[str]] = None):
+    def __init__(self,
+                 industry: str = "restaurant",
+                 categories: Optional[List[str]] = None,
+                 max_content_tokens: int = 1500,
+                 content_reducer: Optional[ContentReducer] = None):
         """Initialize prompt builder."""
         self.industry = industry
         self.categories = categories or ["menu", "contact", "hours", "location"]
+        self.max_content_tokens = max_content_tokens
+        self.content_reducer = content_reducer or ContentReducer()
     
     def build_extraction_prompt(self, content: str, custom_instructions: str = "") -> str:
         """Build extraction prompt for given content."""
         categories_str = ", ".join(self.categories)
+        reduced_content = self.content_reducer.reduce_for_prompt(
+            content, self.categories, self.max_content_tokens
+        )
         
         prompt = f"""
 Extract structured information from the following {self.industry} website content.
@@ -261,7 +292,7 @@ Focus on these categories: {categories_str}
 {custom_instructions}
 
 Content to analyze:
-{content[:2000]}  # Limit content length
+{reduced_content}
 
 Return the results in this JSON format:
 {{
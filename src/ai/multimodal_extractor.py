@@ -1,13 +1,16 @@
 """Multi-modal content extractor for images and text analysis."""
 
 import logging
-import requests
 import base64
+import hashlib
 import json
 from typing import Dict, List, Any, Optional
 from urllib.parse import urlparse
 import os
 
+from ..common.http_transport import get_shared_transport
+from .llm_cache import get_shared_llm_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,6 +25,8 @@ class MultiModalExtractor:
         """
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         self.vision_model = "gpt-4-vision-preview"
+        self.transport = get_shared_transport()
+        self.llm_cache = get_shared_llm_cache()
 
     def analyze_images(
         self, content: str, image_urls: List[str]
@@ -109,10 +114,23 @@ class MultiModalExtractor:
             return {}
 
     def _call_vision_api(self, image_data: str, prompt: str) -> Dict[str, Any]:
-        """Call OpenAI Vision API."""
+        """Call OpenAI Vision API, reusing cached responses."""
         if not self.api_key:
             raise ValueError("OpenAI API key required for vision analysis")
 
+        image_hash = hashlib.sha256(image_data.encode("utf-8")).hexdigest()
+        response, _ = self.llm_cache.get_or_compute(
+            "openai",
+            self.vision_model,
+            prompt,
+            lambda: self._post_vision_request(image_data, prompt),
+            params={"image_sha256": image_hash, "max_tokens": 500},
+        )
+        return response
+
+    def _post_vision_request(self, image_data: str, prompt: str) -> Dict[str, Any]:
+        """Send an image and prompt to the OpenAI Vision API."""
+
         headers = {
             "Content-Type": "application/json",
             "Authorization": f"Bearer {self.api_key}",
@@ -137,7 +155,7 @@ class MultiModalExtractor:
             "max_tokens": 500,
         }
 
-        response = requests.post(
+        response = self.transport.post(
             "https://api.openai.com/v1/chat/completions",
             headers=headers,
             json=payload,
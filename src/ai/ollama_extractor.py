@@ -1,10 +1,14 @@
 """Ollama local LLM extractor for restaurant content analysis."""
 
 import logging
-import requests
 import json
 from typing import Dict, List, Any, Optional
 
+from ..common.http_transport import get_shared_transport
+from .content_reducer import ContentReducer
+from .llm_cache import get_shared_llm_cache
+from .streaming import FieldCallback, FieldStream, replay_fields, stream_ollama
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,15 +23,26 @@ class OllamaExtractor:
         """
         self.endpoint = endpoint.rstrip("/")
         self.default_model = "llama2"
+        self.transport = get_shared_transport()
+        self.llm_cache = get_shared_llm_cache()
+        self.content_reducer = ContentReducer()
 
     def extract(
-        self, content: str, model: Optional[str] = None
+        self,
+        content: str,
+        model: Optional[str] = None,
+        stream: bool = False,
+        on_field: Optional[FieldCallback] = None,
+        required_fields: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """Extract information using Ollama local LLM.
 
         Args:
             content: Content to analyze
             model: Model to use (defaults to llama2)
+            stream: Stream the completion and report JSON fields as they arrive
+            on_field: Called with each completed JSON field when streaming
+            required_fields: Stop streaming once these fields have arrived
 
         Returns:
             Extraction results
@@ -39,7 +54,9 @@ class OllamaExtractor:
             self._check_ollama_status()
 
             prompt = self._build_extraction_prompt(content)
-            response = self._call_ollama_api(prompt, model)
+            response = self._call_ollama_api(
+                prompt, model, stream=stream, on_field=on_field, required_fields=required_fields
+            )
 
             return self._process_ollama_response(response)
 
@@ -50,13 +67,16 @@ class OllamaExtractor:
     def _check_ollama_status(self) -> bool:
         """Check if Ollama service is running."""
         try:
-            response = requests.get(f"{self.endpoint}/api/tags", timeout=5)
+            response = self.transport.get(f"{self.endpoint}/api/tags", timeout=5)
             return response.status_code == 200
         except Exception:
             raise Exception("Ollama service not available")
 
     def _build_extraction_prompt(self, content: str) -> str:
         """Build prompt for local LLM extraction."""
+        reduced_content = self.content_reducer.reduce_for_prompt(
+            content, ["menu", "contact", "cuisine"], max_tokens=1000
+        )
         return f"""
         Extract restaurant information from this content. Focus on:
         - Menu items and prices
@@ -64,29 +84,102 @@ class OllamaExtractor:
         - Contact information
         - Special features
 
-        Content: {content[:2000]}
+        Content: {reduced_content}
 
         Respond with structured information in a clear format.
         """
 
-    def _call_ollama_api(self, prompt: str, model: str) -> Dict[str, Any]:
-        """Call Ollama API."""
-        url = f"{self.endpoint}/api/generate"
-
-        payload = {
+    def _call_ollama_api(
+        self,
+        prompt: str,
+        model: str,
+        stream: bool = False,
+        on_field: Optional[FieldCallback] = None,
+        required_fields: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Call Ollama API, reusing cached responses."""
+        if stream:
+            return self._stream_ollama_api(prompt, model, on_field, required_fields)
+        response, _ = self.llm_cache.get_or_compute(
+            "ollama",
+            model,
+            prompt,
+            lambda: self._post_ollama_request(prompt, model),
+            params={"endpoint": self.endpoint},
+        )
+        return response
+
+    def _build_payload(self, prompt: str, model: str, stream: bool = False) -> Dict[str, Any]:
+        """Build the generate endpoint payload."""
+        return {
             "model": model,
             "prompt": prompt,
-            "stream": False,
+            "stream": stream,
             "options": {"temperature": 0.1, "top_p": 0.9},
         }
 
-        response = requests.post(url, json=payload, timeout=60)
+    def _post_ollama_request(self, prompt: str, model: str) -> Dict[str, Any]:
+        """Send the prompt to the Ollama generate endpoint."""
+        url = f"{self.endpoint}/api/generate"
+
+        response = self.transport.post(url, json=self._build_payload(prompt, model), timeout=60)
 
         if response.status_code != 200:
             raise Exception(f"Ollama API error: {response.status_code}")
 
         return response.json()
 
+    def _stream_ollama_api(
+        self,
+        prompt: str,
+        model: str,
+        on_field: Optional[FieldCallback] = None,
+        required_fields: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Stream an Ollama completion, reporting JSON fields as they arrive.
+
+        Fields are only reported when the model answers in JSON; free-text
+        answers still stream but cannot be cut short. Cancelled responses
+        are not cached.
+
+        Returns:
+            Response in the same shape as a non-streamed generate call
+        """
+        cached = self.llm_cache.get("ollama", model, prompt, params={"endpoint": self.endpoint})
+        if cached is not None:
+            replay_fields(cached.get("response", ""), on_field)
+            return cached
+
+        url = f"{self.endpoint}/api/generate"
+        response = self.transport.post(
+            url, json=self._build_payload(prompt, model, stream=True), timeout=60, stream=True
+        )
+        try:
+            if response.status_code != 200:
+                raise Exception(f"Ollama API error: {response.status_code}")
+            result = stream_ollama(response.iter_lines(), FieldStream(on_field, required_fields))
+        finally:
+            response.close()
+
+        generated = {
+            "model": model,
+            "response": result.text,
+            "done": not result.cancelled,
+            "prompt_eval_count": result.prompt_tokens,
+            "eval_count": result.completion_tokens,
+        }
+        if not result.cancelled:
+            self.llm_cache.put(
+                "ollama",
+                model,
+                prompt,
+                generated,
+                params={"endpoint": self.endpoint},
+                prompt_tokens=result.prompt_tokens,
+                completion_tokens=result.completion_tokens,
+            )
+        return generated
+
     def _process_ollama_response(
         self, response: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -0,0 +1,279 @@
+"""Concurrent, rate-limited scheduling of LLM requests with multi-page packing."""
+import json
+import logging
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from src.scraper.rate_limiter import TokenBucket
+
+from .content_reducer import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+
+_TASK_TEMPLATE = "=== TASK {index} ===\n{prompt}\n=== END TASK {index} ==="
+_CODE_FENCE = re.compile(r"^```(?:json)?\s*|\s*```$")
+
+
+def pack_prompts(prompts: Sequence[str]) -> str:
+    """Combine independent prompts into one request with per-task delimiters.
+
+    Args:
+        prompts: Single-page prompts
+
+    Returns:
+        Prompt asking for one JSON object holding every task's answer
+    """
+    tasks = "\n\n".join(
+        _TASK_TEMPLATE.format(index=index, prompt=prompt.strip())
+        for index, prompt in enumerate(prompts, 1)
+    )
+    return (
+        f"You will receive {len(prompts)} independent tasks, each between "
+        "'=== TASK n ===' and '=== END TASK n ===' markers. Answer every task "
+        "on its own, using only that task's content.\n"
+        'Respond with only a JSON object of the form {"results": {"1": <answer to '
+        'task 1>, "2": <answer to task 2>, ...}} where each answer is the JSON the '
+        "task asks for.\n\n" + tasks
+    )
+
+
+def split_packed_response(text: str, count: int) -> List[Optional[str]]:
+    """Split a packed response back into per-task answers.
+
+    Args:
+        text: Model output for a prompt built by pack_prompts
+        count: Number of packed tasks
+
+    Returns:
+        One JSON-encoded answer per task, None where an answer is missing
+    """
+    try:
+        results = json.loads(_CODE_FENCE.sub("", text.strip()))["results"]
+    except (ValueError, TypeError, KeyError, AttributeError):
+        return [None] * count
+
+    if isinstance(results, list):
+        results = {str(index): answer for index, answer in enumerate(results, 1)}
+    if not isinstance(results, dict):
+        return [None] * count
+
+    answers: List[Optional[str]] = []
+    for index in range(1, count + 1):
+        answer = results.get(str(index))
+        if answer is None:
+            answers.append(None)
+        else:
+            answers.append(answer if isinstance(answer, str) else json.dumps(answer))
+    return answers
+
+
+class AIRequestScheduler:
+    """Run LLM prompts concurrently within provider rate and token limits.
+
+    Small prompts are packed several to a request with :func:`pack_prompts`
+    and the answers split back out; prompts whose packed answer is missing or
+    unparseable are retried on their own, so a bad batch never loses a page.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 4,
+        requests_per_minute: float = 60.0,
+        tokens_per_minute: float = 90000.0,
+        max_batch_tokens: int = 3000,
+        max_prompts_per_batch: int = 5,
+        expected_output_tokens: int = 800,
+    ):
+        """Initialize request scheduler.
+
+        Args:
+            max_concurrency: Provider calls allowed in flight at once
+            requests_per_minute: Provider request limit
+            tokens_per_minute: Provider token limit (prompt plus expected output)
+            max_batch_tokens: Largest packed prompt, in estimated tokens
+            max_prompts_per_batch: Most prompts packed into one request; 1 disables packing
+            expected_output_tokens: Output tokens budgeted per prompt for rate limiting
+
+        Raises:
+            ValueError: If any limit is not positive
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if requests_per_minute <= 0 or tokens_per_minute <= 0:
+            raise ValueError("Rate limits must be positive")
+        if max_batch_tokens <= 0 or max_prompts_per_batch < 1:
+            raise ValueError("Batch limits must be positive")
+
+        self.max_concurrency = max_concurrency
+        self.max_batch_tokens = max_batch_tokens
+        self.max_prompts_per_batch = max_prompts_per_batch
+        self.expected_output_tokens = expected_output_tokens
+        self.request_bucket = TokenBucket(60.0 / requests_per_minute, max(1.0, requests_per_minute / 60.0))
+        self.token_bucket = TokenBucket(60.0 / tokens_per_minute, tokens_per_minute)
+
+        self.requests_sent = 0
+        self.batched_requests = 0
+        self.fallback_requests = 0
+        self.failed_requests = 0
+        self.total_wait_time = 0.0
+        self.lock = threading.Lock()
+
+    def pack(self, prompts: Sequence[str]) -> List[List[int]]:
+        """Group prompt indices into requests that fit the batch limits.
+
+        Args:
+            prompts: Prompts to send
+
+        Returns:
+            Groups of indices into ``prompts``, in order
+        """
+        groups: List[List[int]] = []
+        current: List[int] = []
+        current_tokens = 0
+        for index, prompt in enumerate(prompts):
+            tokens = estimate_tokens(prompt)
+            if current and (
+                current_tokens + tokens > self.max_batch_tokens
+                or len(current) >= self.max_prompts_per_batch
+            ):
+                groups.append(current)
+                current, current_tokens = [], 0
+            current.append(index)
+            current_tokens += tokens
+        if current:
+            groups.append(current)
+        return groups
+
+    def throttle(self, prompt: str, answers: int = 1) -> float:
+        """Wait until the provider limits allow sending a prompt.
+
+        Args:
+            prompt: Prompt about to be sent
+            answers: Number of answers the prompt asks for
+
+        Returns:
+            float: Seconds waited
+        """
+        tokens = estimate_tokens(prompt) + answers * self.expected_output_tokens
+        with self.lock:
+            now = time.time()
+            wait_time = max(
+                self.request_bucket.reserve(now),
+                self.token_bucket.reserve(now, tokens),
+            )
+            self.total_wait_time += wait_time
+        if wait_time > 0:
+            time.sleep(wait_time)
+        return wait_time
+
+    def map(self, items: Sequence[Any], func: Callable[[Any], Any]) -> List[Any]:
+        """Apply a function to items with at most ``max_concurrency`` in flight.
+
+        Args:
+            items: Work items
+            func: Function called once per item
+
+        Returns:
+            Results in item order
+        """
+        if len(items) <= 1 or self.max_concurrency == 1:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(items))) as executor:
+            return list(executor.map(func, items))
+
+    def run(self, prompts: Sequence[str], call: Callable[[str], str]) -> List[Optional[str]]:
+        """Send prompts, packing small ones together, and return each answer.
+
+        Args:
+            prompts: Single-page prompts
+            call: Function sending one prompt to the provider and returning its text
+
+        Returns:
+            One answer per prompt, None where the call failed
+        """
+        answers: List[Optional[str]] = [None] * len(prompts)
+
+        def send(prompt: str, count: int) -> Optional[str]:
+            self.throttle(prompt, count)
+            with self.lock:
+                self.requests_sent += 1
+            try:
+                return call(prompt)
+            except Exception as e:
+                logger.warning(f"LLM request failed: {e}")
+                with self.lock:
+                    self.failed_requests += 1
+                return None
+
+        def run_group(group: List[int]) -> None:
+            if len(group) > 1:
+                with self.lock:
+                    self.batched_requests += 1
+                text = send(pack_prompts([prompts[index] for index in group]), len(group))
+                parts = split_packed_response(text or "", len(group))
+                for index, part in zip(group, parts):
+                    answers[index] = part
+                missing = [index for index in group if answers[index] is None]
+                if not missing:
+                    return
+                with self.lock:
+                    self.fallback_requests += len(missing)
+                group = missing
+
+            for index in group:
+                answers[index] = send(prompts[index], 1)
+
+        self.map(self.pack(prompts), run_group)
+        return answers
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get scheduling statistics.
+
+        Returns:
+            Dictionary with request, batch, fallback and wait counters
+        """
+        with self.lock:
+            return {
+                "requests_sent": self.requests_sent,
+                "batched_requests": self.batched_requests,
+                "fallback_requests": self.fallback_requests,
+                "failed_requests": self.failed_requests,
+                "total_wait_time": self.total_wait_time,
+                "max_concurrency": self.max_concurrency,
+            }
+
+
+_shared_request_scheduler: Optional[AIRequestScheduler] = None
+_shared_request_scheduler_lock = threading.Lock()
+
+
+def get_shared_request_scheduler() -> AIRequestScheduler:
+    """Get the process-wide request scheduler, creating it on first use.
+
+    Provider rate limits apply to the whole process, so every analyzer
+    shares one scheduler and concurrent scrapes queue behind each other.
+    """
+    global _shared_request_scheduler
+    with _shared_request_scheduler_lock:
+        if _shared_request_scheduler is None:
+            _shared_request_scheduler = AIRequestScheduler()
+        return _shared_request_scheduler
+
+
+def configure_shared_request_scheduler(**kwargs) -> AIRequestScheduler:
+    """Replace the process-wide request scheduler with a newly configured one.
+
+    Args:
+        **kwargs: Arguments for AIRequestScheduler
+
+    Returns:
+        The new shared scheduler
+    """
+    global _shared_request_scheduler
+    with _shared_request_scheduler_lock:
+        _shared_request_scheduler = AIRequestScheduler(**kwargs)
+        return _shared_request_scheduler
@@ -0,0 +1,382 @@
+"""Streaming LLM responses with incremental JSON field extraction."""
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# Called with a field path ("cuisine_type", "menu_items[2]") and its parsed value
+FieldCallback = Callable[[str, Any], None]
+
+_OPENERS = {"{": "}", "[": "]"}
+
+
+class IncrementalJSONParser:
+    """Parse a JSON object as it streams in and report fields as they complete.
+
+    Top-level fields are reported once their value is complete, and elements
+    of top-level arrays are reported as ``name[i]`` as soon as each one
+    closes, so a long ``menu_items`` list surfaces item by item. Text before
+    the opening brace, such as a code fence or a short preamble, is skipped.
+    """
+
+    def __init__(self):
+        """Initialize incremental JSON parser."""
+        self.text = ""
+        self.fields: Dict[str, Any] = {}
+        self.complete = False
+
+        self._pos = 0
+        self._root_start: Optional[int] = None
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._key: Optional[str] = None
+        self._value_start: Optional[int] = None
+        self._item_start: Optional[int] = None
+        self._item_index = 0
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """Add streamed text and get the fields it completed.
+
+        Args:
+            chunk: Next piece of model output
+
+        Returns:
+            List of (path, value) pairs completed by this chunk, in order
+        """
+        self.text += chunk
+        events: List[Tuple[str, Any]] = []
+        text = self.text
+
+        while self._pos < len(text) and not self.complete:
+            pos = self._pos
+            char = text[pos]
+            self._pos += 1
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    self._string_closed(pos, events)
+                continue
+
+            if self._root_start is None:
+                if char == "{":
+                    self._root_start = pos
+                    self._stack.append("{")
+                continue
+
+            depth = len(self._stack)
+            if char == '"':
+                self._in_string = True
+                self._string_start = pos
+            elif char in _OPENERS:
+                if depth == 1 and char == "[" and self._value_start is not None:
+                    self._item_start = pos + 1
+                    self._item_index = 0
+                self._stack.append(char)
+            elif char in "}]":
+                self._stack.pop()
+                if depth == 1:
+                    self._finish_field(pos, events)
+                    self.complete = True
+                elif depth == 2:
+                    if self._in_top_level_array(char):
+                        self._finish_item(pos, events)
+                    self._finish_field(pos + 1, events)
+                elif depth == 3 and self._stack[-1] == "[" and self._item_start is not None:
+                    self._finish_item(pos + 1, events)
+            elif char == ",":
+                if depth == 1:
+                    self._finish_field(pos, events)
+                elif depth == 2 and self._stack[-1] == "[":
+                    self._finish_item(pos, events)
+                    self._item_start = pos + 1
+            elif char == ":" and depth == 1 and self._key is not None:
+                self._value_start = pos + 1
+
+        return events
+
+    def result(self) -> Optional[Dict[str, Any]]:
+        """Get the whole object once it has been fully received.
+
+        Returns:
+            Parsed root object, or None while it is incomplete or invalid
+        """
+        if not self.complete:
+            return None
+        try:
+            return json.loads(self.text[self._root_start:self._pos])
+        except ValueError:
+            return None
+
+    def _in_top_level_array(self, closing: str) -> bool:
+        """Whether a bracket at depth 2 closes the array value of a field."""
+        return closing == "]" and self._item_start is not None
+
+    def _string_closed(self, pos: int, events: List[Tuple[str, Any]]) -> None:
+        """Handle the end of a string: a key, or a complete string value."""
+        if len(self._stack) != 1:
+            return
+        literal = self.text[self._string_start:pos + 1]
+        if self._value_start is None:
+            try:
+                self._key = json.loads(literal)
+            except ValueError:
+                self._key = None
+        else:
+            self._finish_field(pos + 1, events)
+
+    def _finish_field(self, end: int, events: List[Tuple[str, Any]]) -> None:
+        """Emit the current top-level field if its value is complete."""
+        if self._key is None or self._value_start is None:
+            return
+        value_text = self.text[self._value_start:end].strip()
+        key = self._key
+        self._key = None
+        self._value_start = None
+        self._item_start = None
+        if not value_text:
+            return
+        try:
+            value = json.loads(value_text)
+        except ValueError:
+            logger.debug(f"Skipping unparseable streamed field {key!r}")
+            return
+        self.fields[key] = value
+        events.append((key, value))
+
+    def _finish_item(self, end: int, events: List[Tuple[str, Any]]) -> None:
+        """Emit the current element of a top-level array if it is non-empty."""
+        if self._item_start is None or self._key is None:
+            return
+        item_text = self.text[self._item_start:end].strip()
+        self._item_start = None
+        if not item_text:
+            return
+        try:
+            value = json.loads(item_text)
+        except ValueError:
+            return
+        events.append((f"{self._key}[{self._item_index}]", value))
+        self._item_index += 1
+
+
+@dataclass
+class StreamResult:
+    """Outcome of a streamed completion."""
+
+    text: str
+    fields: Dict[str, Any] = field(default_factory=dict)
+    complete: bool = False
+    cancelled: bool = False
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+
+    @property
+    def json_text(self) -> str:
+        """Text safe to parse as JSON, rebuilt from the fields when cut short."""
+        if self.cancelled:
+            return json.dumps(self.fields)
+        return self.text
+
+
+class FieldStream:
+    """Collect streamed text, report completed fields and decide when to stop.
+
+    The provider helpers below feed text deltas in as they arrive. Once every
+    field in ``required_fields`` has been received the stream asks to stop,
+    so the caller can close the connection instead of paying for the rest of
+    the completion.
+    """
+
+    def __init__(
+        self,
+        on_field: Optional[FieldCallback] = None,
+        required_fields: Optional[Sequence[str]] = None,
+    ):
+        """Initialize field stream.
+
+        Args:
+            on_field: Called for every completed field or top-level array item
+            required_fields: Fields after which the rest of the response is not needed
+        """
+        self.on_field = on_field
+        self.required_fields = list(required_fields or [])
+        self.parser = IncrementalJSONParser()
+        self.cancelled = False
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+
+    @property
+    def satisfied(self) -> bool:
+        """Whether every required field has been received."""
+        return bool(self.required_fields) and all(
+            name in self.parser.fields for name in self.required_fields
+        )
+
+    def feed(self, text: str) -> bool:
+        """Add a text delta.
+
+        Args:
+            text: Next piece of model output
+
+        Returns:
+            bool: True when the required fields are in and the caller should
+            stop reading the stream
+        """
+        if not text:
+            return False
+        for path, value in self.parser.feed(text):
+            if self.on_field:
+                try:
+                    self.on_field(path, value)
+                except Exception as e:
+                    logger.warning(f"Field callback failed for {path}: {e}")
+        if self.satisfied and not self.parser.complete:
+            self.cancelled = True
+            return True
+        return False
+
+    def result(self) -> StreamResult:
+        """Get the streamed text, fields and token usage."""
+        return StreamResult(
+            text=self.parser.text,
+            fields=dict(self.parser.fields),
+            complete=self.parser.complete,
+            cancelled=self.cancelled,
+            prompt_tokens=self.prompt_tokens,
+            completion_tokens=self.completion_tokens,
+        )
+
+
+def replay_fields(text: str, on_field: Optional[FieldCallback]) -> None:
+    """Report the fields of an already complete response, e.g. a cache hit.
+
+    Args:
+        text: Full model output
+        on_field: Field callback, or None to do nothing
+    """
+    if on_field:
+        FieldStream(on_field).feed(text)
+
+
+def _sse_payloads(lines: Iterable[Any]) -> Iterable[Dict[str, Any]]:
+    """Decode the JSON payloads of ``data:`` lines in a server-sent event stream."""
+    for line in lines:
+        if isinstance(line, bytes):
+            line = line.decode("utf-8", errors="replace")
+        if not line or not line.startswith("data:"):
+            continue
+        data = line[5:].strip()
+        if not data or data == "[DONE]":
+            continue
+        try:
+            yield json.loads(data)
+        except ValueError:
+            continue
+
+
+def stream_anthropic(lines: Iterable[Any], stream: FieldStream) -> StreamResult:
+    """Consume an Anthropic Messages API event stream.
+
+    Args:
+        lines: Lines of the HTTP response body
+        stream: Field stream receiving the text deltas
+
+    Returns:
+        StreamResult for the consumed events
+    """
+    for event in _sse_payloads(lines):
+        event_type = event.get("type")
+        if event_type == "message_start":
+            usage = event.get("message", {}).get("usage", {})
+            stream.prompt_tokens = usage.get("input_tokens", 0)
+        elif event_type == "message_delta":
+            stream.completion_tokens = event.get("usage", {}).get("output_tokens", 0)
+        elif event_type == "content_block_delta":
+            if stream.feed(event.get("delta", {}).get("text", "")):
+                break
+        elif event_type == "error":
+            raise Exception(f"Claude API stream error: {event.get('error')}")
+    return stream.result()
+
+
+def stream_ollama(lines: Iterable[Any], stream: FieldStream) -> StreamResult:
+    """Consume an Ollama ``/api/generate`` newline-delimited JSON stream.
+
+    Args:
+        lines: Lines of the HTTP response body
+        stream: Field stream receiving the text deltas
+
+    Returns:
+        StreamResult for the consumed lines
+    """
+    for line in lines:
+        if isinstance(line, bytes):
+            line = line.decode("utf-8", errors="replace")
+        if not line:
+            continue
+        try:
+            event = json.loads(line)
+        except ValueError:
+            continue
+        if event.get("done"):
+            stream.prompt_tokens = event.get("prompt_eval_count", 0)
+            stream.completion_tokens = event.get("eval_count", 0)
+        if stream.feed(event.get("response", "")) or event.get("done"):
+            break
+    return stream.result()
+
+
+def stream_openai(chunks: Iterable[Any], stream: FieldStream) -> StreamResult:
+    """Consume an OpenAI chat completion stream from the client library.
+
+    Args:
+        chunks: Chunks yielded by ``chat.completions.create(stream=True)``
+        stream: Field stream receiving the text deltas
+
+    Returns:
+        StreamResult for the consumed chunks
+    """
+    for chunk in chunks:
+        usage = getattr(chunk, "usage", None)
+        if usage is not None:
+            stream.prompt_tokens = getattr(usage, "prompt_tokens", 0) or 0
+            stream.completion_tokens = getattr(usage, "completion_tokens", 0) or 0
+        choices = getattr(chunk, "choices", None) or []
+        if not choices:
+            continue
+        if stream.feed(getattr(choices[0].delta, "content", None) or ""):
+            break
+    return stream.result()
+
+
+def progress_field_callback(monitor: Any, url: str) -> FieldCallback:
+    """Build a field callback that reports top-level fields to a progress monitor.
+
+    Array items are not reported individually to keep the event list short.
+
+    Args:
+        monitor: Progress monitor with ``add_completion_event``
+        url: URL or label the analysis belongs to
+
+    Returns:
+        Field callback
+    """
+    def report(path: str, value: Any) -> None:
+        if "[" in path:
+            return
+        details = {"field": path}
+        if isinstance(value, list):
+            details["items"] = len(value)
+        monitor.add_completion_event("ai_field_received", url, details)
+
+    return report
@@ -0,0 +1,250 @@
+"""Shared pooled HTTP transport with keep-alive and compression."""
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional, Callable
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_ACCEPT_ENCODING
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+@dataclass
+class TransportStatistics:
+    """Statistics for connection pooling and reuse."""
+
+    total_requests: int = 0
+    connections_opened: int = 0
+    compressed_responses: int = 0
+    bytes_received: int = 0
+    failed_requests: int = 0
+    requests_per_host: Dict[str, int] = field(default_factory=dict)
+    connections_per_host: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def connections_reused(self) -> int:
+        """Number of requests served over an already-open connection."""
+        return max(0, self.total_requests - self.connections_opened)
+
+    @property
+    def handshakes_saved(self) -> int:
+        """Number of TCP/TLS handshakes avoided through keep-alive."""
+        return self.connections_reused
+
+    @property
+    def reuse_rate(self) -> float:
+        """Get fraction of requests that reused a pooled connection."""
+        return (
+            self.connections_reused / self.total_requests
+            if self.total_requests > 0
+            else 0.0
+        )
+
+    def to_json(self) -> Dict[str, Any]:
+        """Convert to JSON format."""
+        return {
+            "total_requests": self.total_requests,
+            "connections_opened": self.connections_opened,
+            "connections_reused": self.connections_reused,
+            "handshakes_saved": self.handshakes_saved,
+            "reuse_rate": self.reuse_rate,
+            "compressed_responses": self.compressed_responses,
+            "bytes_received": self.bytes_received,
+            "failed_requests": self.failed_requests,
+            "requests_per_host": dict(self.requests_per_host),
+            "connections_per_host": dict(self.connections_per_host),
+        }
+
+
+def _counting_pool_class(base_class, on_new_connection: Callable[[str], None]):
+    """Create a connection pool class that reports every new connection."""
+
+    class CountingConnectionPool(base_class):
+        def _new_conn(self):
+            on_new_connection(self.host)
+            return super()._new_conn()
+
+    return CountingConnectionPool
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTP adapter whose per-host pools report connection creation."""
+
+    def __init__(self, on_new_connection: Callable[[str], None], **kwargs):
+        """Initialize adapter.
+
+        Args:
+            on_new_connection: Callback invoked with the host for each new connection
+            **kwargs: Pool options passed to HTTPAdapter
+        """
+        self._on_new_connection = on_new_connection
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        """Initialize pool manager with counting connection pools."""
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _counting_pool_class(HTTPConnectionPool, self._on_new_connection),
+            "https": _counting_pool_class(HTTPSConnectionPool, self._on_new_connection),
+        }
+
+
+class PooledHttpTransport:
+    """HTTP transport with per-host keep-alive connection pools."""
+
+    def __init__(
+        self,
+        pool_connections: int = 20,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        enable_compression: bool = True,
+        keep_alive: bool = True,
+    ):
+        """Initialize pooled transport.
+
+        Args:
+            pool_connections: Number of per-host pools to keep open
+            pool_maxsize: Maximum connections kept alive per host
+            pool_block: Whether to block when a host pool is exhausted
+            enable_compression: Whether to request compressed responses
+            keep_alive: Whether to keep connections open between requests
+        """
+        if pool_connections <= 0:
+            raise ValueError("pool_connections must be positive")
+        if pool_maxsize <= 0:
+            raise ValueError("pool_maxsize must be positive")
+
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.enable_compression = enable_compression
+        self.keep_alive = keep_alive
+
+        self.statistics = TransportStatistics()
+        self.lock = threading.Lock()
+        self.session = self._build_session()
+
+    def _build_session(self) -> requests.Session:
+        """Build a session with pooled adapters mounted."""
+        session = requests.Session()
+        adapter = PooledHTTPAdapter(
+            self._record_connection,
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        session.headers["Accept-Encoding"] = (
+            DEFAULT_ACCEPT_ENCODING if self.enable_compression else "identity"
+        )
+        session.headers["Connection"] = "keep-alive" if self.keep_alive else "close"
+        return session
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request over the pooled session.
+
+        Args:
+            method: HTTP method
+            url: URL to request
+            **kwargs: Arguments passed to requests.Session.request
+
+        Returns:
+            Response object
+        """
+        try:
+            response = self.session.request(method, url, **kwargs)
+        except Exception:
+            with self.lock:
+                self.statistics.failed_requests += 1
+            raise
+
+        self._record_response(url, response)
+        return response
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Send a GET request."""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """Send a POST request."""
+        return self.request("POST", url, **kwargs)
+
+    def head(self, url: str, **kwargs) -> requests.Response:
+        """Send a HEAD request."""
+        kwargs.setdefault("allow_redirects", False)
+        return self.request("HEAD", url, **kwargs)
+
+    def _record_connection(self, host: str) -> None:
+        """Record a newly opened connection."""
+        with self.lock:
+            self.statistics.connections_opened += 1
+            per_host = self.statistics.connections_per_host
+            per_host[host] = per_host.get(host, 0) + 1
+
+    def _record_response(self, url: str, response: requests.Response) -> None:
+        """Record statistics for a completed request."""
+        host = urlparse(url).hostname or ""
+        encoding = response.headers.get("Content-Encoding", "") if response.headers else ""
+        content_length = response.headers.get("Content-Length") if response.headers else None
+
+        with self.lock:
+            self.statistics.total_requests += 1
+            per_host = self.statistics.requests_per_host
+            per_host[host] = per_host.get(host, 0) + 1
+            if encoding and encoding != "identity":
+                self.statistics.compressed_responses += 1
+            if content_length and str(content_length).isdigit():
+                self.statistics.bytes_received += int(content_length)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get transport statistics.
+
+        Returns:
+            Dictionary with request, connection and reuse counts
+        """
+        with self.lock:
+            return self.statistics.to_json()
+
+    def reset_statistics(self) -> None:
+        """Reset transport statistics."""
+        with self.lock:
+            self.statistics = TransportStatistics()
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self.session.close()
+
+
+_shared_transport: Optional[PooledHttpTransport] = None
+_shared_transport_lock = threading.Lock()
+
+
+def get_shared_transport() -> PooledHttpTransport:
+    """Get the process-wide pooled transport, creating it on first use."""
+    global _shared_transport
+    with _shared_transport_lock:
+        if _shared_transport is None:
+            _shared_transport = PooledHttpTransport()
+        return _shared_transport
+
+
+def configure_shared_transport(**kwargs) -> PooledHttpTransport:
+    """Replace the process-wide transport with a newly configured one.
+
+    Args:
+        **kwargs: Arguments passed to PooledHttpTransport
+
+    Returns:
+        The new shared transport
+    """
+    global _shared_transport
+    with _shared_transport_lock:
+        previous = _shared_transport
+        _shared_transport = PooledHttpTransport(**kwargs)
+
+    if previous is not None:
+        previous.close()
+    return _shared_transport
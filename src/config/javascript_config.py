@@ -1,6 +1,7 @@
 """JavaScript rendering configuration."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import List, Optional
 
 
 @dataclass
@@ -14,6 +15,12 @@ class JavaScriptConfig:
     enable_browser_automation: bool = False  # Enable Playwright browser automation
     browser_type: str = "chromium"  # 'chromium', 'firefox', 'webkit'
     headless_browser: bool = True
+    browser_pool_size: int = 2  # Browser contexts kept open for reuse
+    pages_per_context: int = 20  # Renders before a context's page is replaced
+    render_profile: str = "full"  # 'full' waits for network idle, 'lean' blocks assets and exits early
+    readiness_selectors: List[str] = field(default_factory=list)  # Empty uses built-in selectors
+    readiness_timeout: int = 5  # Seconds to wait for a readiness selector in lean mode
+    render_decision_cache_path: Optional[str] = None  # Per-domain render decisions; None uses ~/.rag_scraper, ':memory:' disables persisting
     
     def __post_init__(self):
         """Validate JavaScript configuration options."""
@@ -25,6 +32,18 @@ class JavaScriptConfig:
         
         if self.browser_type not in ['chromium', 'firefox', 'webkit']:
             raise ValueError("browser_type must be 'chromium', 'firefox', or 'webkit'")
+        
+        if self.browser_pool_size < 1:
+            raise ValueError("browser_pool_size must be at least 1")
+        
+        if self.pages_per_context < 1:
+            raise ValueError("pages_per_context must be at least 1")
+
+        if self.render_profile not in ['full', 'lean']:
+            raise ValueError("render_profile must be 'full' or 'lean'")
+        
+        if self.readiness_timeout <= 0:
+            raise ValueError("readiness_timeout must be positive")
     
     def is_browser_automation_enabled(self) -> bool:
         """Check if browser automation should be used."""
@@ -35,7 +54,12 @@ class JavaScriptConfig:
         return {
             "headless": self.headless_browser,
             "timeout": self.javascript_timeout * 1000,  # Convert to milliseconds
-            "browser_type": self.browser_type
+            "browser_type": self.browser_type,
+            "browser_pool_size": self.browser_pool_size,
+            "pages_per_context": self.pages_per_context,
+            "render_profile": self.render_profile,
+            "readiness_selectors": list(self.readiness_selectors),
+            "readiness_timeout": self.readiness_timeout
         }
     
     def should_handle_popups(self) -> bool:
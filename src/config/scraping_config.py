@@ -57,6 +57,18 @@ class ScrapingConfig:
     enable_browser_automation: bool = False  # Enable Playwright browser automation
     browser_type: str = "chromium"  # 'chromium', 'firefox', 'webkit'
     headless_browser: bool = True
+    browser_pool_size: int = 2  # Browser contexts kept open for reuse
+    pages_per_context: int = 20  # Renders before a context's page is replaced
+    render_profile: str = "full"  # 'full' waits for network idle, 'lean' blocks assets and exits early
+    readiness_selectors: List[str] = field(default_factory=list)  # Empty uses built-in selectors
+    readiness_timeout: int = 5  # Seconds to wait for a readiness selector in lean mode
+    render_decision_cache_path: Optional[str] = None  # Per-domain render decisions; None uses ~/.rag_scraper, ':memory:' disables persisting
+
+    # HTTP response cache configuration
+    response_cache_dir: Optional[str] = None  # Directory for cached responses; None disables caching
+    response_cache_max_mb: int = 200  # Cache size before least recently used entries are evicted
+    response_cache_default_ttl: Optional[float] = None  # Seconds responses without max-age stay fresh; None revalidates
+    offline_replay: bool = False  # Serve pages only from the response cache
     
     # Schema type configuration
     schema_type: str = "Restaurant"  # 'Restaurant' or 'RestW'
@@ -183,6 +195,9 @@ class ScrapingConfig:
         # Validate JavaScript configuration
         self._validate_javascript_config()
 
+        # Validate response cache configuration
+        self._validate_response_cache_config()
+
     def get_all_selected_fields(self) -> List[str]:
         """Get all fields to extract (default + selected optional)."""
         return self.default_fields + self.selected_optional_fields
@@ -231,6 +246,16 @@ class ScrapingConfig:
             "enable_browser_automation": self.enable_browser_automation,
             "browser_type": self.browser_type,
             "headless_browser": self.headless_browser,
+            "browser_pool_size": self.browser_pool_size,
+            "pages_per_context": self.pages_per_context,
+            "render_profile": self.render_profile,
+            "readiness_selectors": self.readiness_selectors,
+            "readiness_timeout": self.readiness_timeout,
+            "render_decision_cache_path": self.render_decision_cache_path,
+            "response_cache_dir": self.response_cache_dir,
+            "response_cache_max_mb": self.response_cache_max_mb,
+            "response_cache_default_ttl": self.response_cache_default_ttl,
+            "offline_replay": self.offline_replay,
             "schema_type": self.schema_type,
             "enable_restw_schema": self.enable_restw_schema,
             "force_batch_processing": self.force_batch_processing,
@@ -432,3 +457,26 @@ class ScrapingConfig:
 
         if self.browser_type not in ['chromium', 'firefox', 'webkit']:
             raise ValueError("browser_type must be 'chromium', 'firefox', or 'webkit'")
+
+        if self.browser_pool_size < 1:
+            raise ValueError("browser_pool_size must be at least 1")
+
+        if self.pages_per_context < 1:
+            raise ValueError("pages_per_context must be at least 1")
+
+        if self.render_profile not in ['full', 'lean']:
+            raise ValueError("render_profile must be 'full' or 'lean'")
+
+        if self.readiness_timeout <= 0:
+            raise ValueError("readiness_timeout must be positive")
+
+    def _validate_response_cache_config(self) -> None:
+        """Validate HTTP response cache options."""
+        if self.response_cache_max_mb <= 0:
+            raise ValueError("response_cache_max_mb must be positive")
+
+        if self.response_cache_default_ttl is not None and self.response_cache_default_ttl < 0:
+            raise ValueError("response_cache_default_ttl cannot be negative")
+
+        if self.offline_replay and not self.response_cache_dir:
+            raise ValueError("offline_replay requires response_cache_dir")
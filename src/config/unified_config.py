@@ -63,7 +63,13 @@ class UnifiedScrapingConfig:
             popup_handling_strategy=legacy_config.popup_handling_strategy,
             enable_browser_automation=legacy_config.enable_browser_automation,
             browser_type=legacy_config.browser_type,
-            headless_browser=legacy_config.headless_browser
+            headless_browser=legacy_config.headless_browser,
+            browser_pool_size=legacy_config.browser_pool_size,
+            pages_per_context=legacy_config.pages_per_context,
+            render_profile=legacy_config.render_profile,
+            readiness_selectors=list(legacy_config.readiness_selectors),
+            readiness_timeout=legacy_config.readiness_timeout,
+            render_decision_cache_path=legacy_config.render_decision_cache_path
         )
         
         # Extract multi-page configuration
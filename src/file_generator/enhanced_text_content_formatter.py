@@ -11,7 +11,8 @@ from src.file_generator.semantic_chunker import SemanticChunker
 class EnhancedTextContentFormatter:
     """Formatter class for generating enhanced text content with hierarchical structure and RAG optimization."""
 
-    def __init__(self, chunk_size_words: int = 500, chunk_overlap_words: int = 50, max_cross_references: int = 10):
+    def __init__(self, chunk_size_words: int = 500, chunk_overlap_words: int = 50, max_cross_references: int = 10,
+                 chunk_tokenizer: Optional[str] = None):
         """Initialize the content formatter."""
         self.chunk_size_words = chunk_size_words
         self.chunk_overlap_words = chunk_overlap_words
@@ -19,6 +20,7 @@ class EnhancedTextContentFormatter:
         self.semantic_chunker = SemanticChunker(
             chunk_size_words=chunk_size_words,
             overlap_words=chunk_overlap_words,
+            tokenizer=chunk_tokenizer,
         )
 
     def generate_hierarchical_content(
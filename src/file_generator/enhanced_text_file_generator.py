@@ -30,6 +30,7 @@ class EnhancedTextFileConfig(BaseGeneratorConfig):
     context_preservation: bool = True
     chunk_size_words: int = 500
     chunk_overlap_words: int = 50
+    chunk_tokenizer: Optional[str] = None  # None sizes chunks in model tokens; "words" ignores model limits
     max_cross_references: int = 10
 
     def validate(self) -> None:
@@ -68,6 +69,7 @@ class EnhancedTextFileConfig(BaseGeneratorConfig):
             "context_preservation": self.context_preservation,
             "chunk_size_words": self.chunk_size_words,
             "chunk_overlap_words": self.chunk_overlap_words,
+            "chunk_tokenizer": self.chunk_tokenizer,
             "max_cross_references": self.max_cross_references,
         }
 
@@ -89,11 +91,13 @@ class EnhancedTextFileGenerator(BaseFileGenerator):
         self.semantic_chunker = SemanticChunker(
             chunk_size_words=config.chunk_size_words,
             overlap_words=config.chunk_overlap_words,
+            tokenizer=config.chunk_tokenizer,
         )
         self.content_formatter = EnhancedTextContentFormatter(
             chunk_size_words=config.chunk_size_words,
             chunk_overlap_words=config.chunk_overlap_words,
             max_cross_references=config.max_cross_references,
+            chunk_tokenizer=config.chunk_tokenizer,
         )
         
         # Initialize orchestrator with dependencies
@@ -1,60 +1,39 @@
 """Semantic chunking functionality for restaurant content."""
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from src.scraper.multi_strategy_scraper import RestaurantData
+from src.semantic.token_chunking import MODEL_TOKENIZER, ChunkSpan, TokenChunker
 
 
 class SemanticChunker:
     """Handles semantic chunking of restaurant content."""
 
-    def __init__(self, chunk_size_words: int = 500, overlap_words: int = 50):
-        """Initialize semantic chunker."""
+    def __init__(self, chunk_size_words: int = 500, overlap_words: int = 50,
+                 tokenizer: Optional[Any] = None):
+        """Initialize semantic chunker.
+
+        Args:
+            chunk_size_words: Chunk budget, in tokens of the tokenizer
+            overlap_words: Tokens repeated from the end of the previous chunk
+            tokenizer: Tokenizer name or instance; model tokens by default, since
+                "words" does not keep chunks within a model's token limit
+        """
         self.chunk_size_words = chunk_size_words
         self.overlap_words = overlap_words
+        self.token_chunker = TokenChunker(
+            chunk_size_words, overlap_words, tokenizer=tokenizer or MODEL_TOKENIZER
+        )
+
+    def chunk_spans(self, content: str) -> List[ChunkSpan]:
+        """Get chunk offsets into content without copying the chunk text."""
+        return self.token_chunker.chunk(content)
 
     def chunk_by_semantic_boundaries(self, content: str) -> List[str]:
         """Chunk content by semantic boundaries."""
-        # Split content into sections based on double newlines
-        sections = content.split("\n\n")
-
-        chunks = []
-        current_chunk = []
-        current_word_count = 0
-
-        for section in sections:
-            section_words = len(section.split())
-
-            # If adding this section would exceed chunk size, finalize current chunk
-            if (
-                current_word_count + section_words > self.chunk_size_words
-                and current_chunk
-            ):
-                chunk_content = "\n\n".join(current_chunk)
-                chunks.append(f"CHUNK_START\n{chunk_content}\nCHUNK_END")
-
-                # Start new chunk with overlap from previous chunk
-                if self.overlap_words > 0 and current_chunk:
-                    overlap_text = current_chunk[-1]
-                    overlap_word_count = len(overlap_text.split())
-                    if overlap_word_count <= self.overlap_words:
-                        current_chunk = [overlap_text]
-                        current_word_count = overlap_word_count
-                    else:
-                        current_chunk = []
-                        current_word_count = 0
-                else:
-                    current_chunk = []
-                    current_word_count = 0
-
-            current_chunk.append(section)
-            current_word_count += section_words
-
-        # Add final chunk if there's remaining content
-        if current_chunk:
-            chunk_content = "\n\n".join(current_chunk)
-            chunks.append(f"CHUNK_START\n{chunk_content}\nCHUNK_END")
-
-        return chunks
+        return [
+            f"CHUNK_START\n{span.text(content)}\nCHUNK_END"
+            for span in self.chunk_spans(content)
+        ]
 
     def create_contextual_chunks(
         self,
@@ -0,0 +1,255 @@
+"""Parallel PDF text extraction across a process pool."""
+
+import logging
+from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from io import BytesIO
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Type
+
+# Try to import PDF processing libraries
+try:
+    import pymupdf  # Also known as fitz
+except ImportError:
+    pymupdf = None
+
+try:
+    import pdfplumber
+except ImportError:
+    pdfplumber = None
+
+
+logger = logging.getLogger(__name__)
+
+# Methods tried per page, fastest first; later ones only see pages the earlier ones left empty
+DEFAULT_METHODS = ('pymupdf', 'pdfplumber', 'ocr')
+
+
+@dataclass
+class PageText:
+    """Text extracted from one PDF page."""
+    page_number: int
+    text: str
+    method: Optional[str] = None
+
+
+def count_pages(file_path: str) -> int:
+    """Count the pages of a PDF without extracting anything.
+
+    Args:
+        file_path: Path to PDF file
+
+    Returns:
+        Page count, or 0 if no PDF library can open the file
+    """
+    try:
+        if pymupdf is not None:
+            with pymupdf.open(file_path) as doc:
+                return doc.page_count
+        if pdfplumber is not None:
+            with pdfplumber.open(file_path) as pdf:
+                return len(pdf.pages)
+    except Exception as e:
+        logger.debug(f"Could not count pages of {file_path}: {e}")
+    return 0
+
+
+def _ocr_page(page, dpi: int) -> str:
+    """Render a PyMuPDF page and run Tesseract on it."""
+    import pytesseract
+    from PIL import Image
+
+    image = Image.open(BytesIO(page.get_pixmap(dpi=dpi).tobytes("png")))
+    return pytesseract.image_to_string(image)
+
+
+def _extract_page_range(file_path: str, start: int, stop: int,
+                        methods: Sequence[str], min_page_chars: int,
+                        ocr_dpi: int) -> List[PageText]:
+    """Extract pages [start, stop) of a PDF; runs inside a worker process.
+
+    Each page goes through ``methods`` in order and stops at the first one
+    that yields at least ``min_page_chars`` characters, so only text-less
+    pages pay for pdfplumber or OCR.
+    """
+    doc = pymupdf.open(file_path) if pymupdf is not None else None
+    plumber = None
+    pages = []
+    try:
+        for page_number in range(start, stop):
+            text, used = "", None
+            for method in methods:
+                try:
+                    if method == 'pymupdf' and doc is not None:
+                        candidate = doc[page_number].get_text()
+                    elif method == 'pdfplumber' and pdfplumber is not None:
+                        plumber = plumber or pdfplumber.open(file_path)
+                        candidate = plumber.pages[page_number].extract_text() or ""
+                    elif method == 'ocr' and doc is not None:
+                        candidate = _ocr_page(doc[page_number], ocr_dpi)
+                    else:
+                        continue
+                except Exception as e:
+                    logger.debug(f"{method} failed on page {page_number + 1} of {file_path}: {e}")
+                    continue
+                if len(candidate.strip()) >= len(text.strip()):
+                    text, used = candidate, method
+                if len(text.strip()) >= min_page_chars:
+                    break
+            pages.append(PageText(page_number, text, used))
+    finally:
+        if plumber is not None:
+            plumber.close()
+        if doc is not None:
+            doc.close()
+    return pages
+
+
+class ParallelPDFExtractor:
+    """Extract PDF text page range by page range on a process pool.
+
+    Text extraction and OCR are CPU-bound and hold the GIL, so large PDFs
+    are split into ranges of ``pages_per_task`` pages that run in separate
+    processes. Pages are merged back in order and progress is reported as
+    each range finishes.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, pages_per_task: int = 4,
+                 min_page_chars: int = 20, methods: Sequence[str] = DEFAULT_METHODS,
+                 ocr_dpi: int = 150, executor_class: Type[Executor] = ProcessPoolExecutor):
+        """Initialize parallel extractor.
+
+        Args:
+            max_workers: Worker processes (defaults to the CPU count)
+            pages_per_task: Pages handled by one task
+            min_page_chars: Characters a page needs before later methods are skipped
+            methods: Extraction methods tried per page, in order
+            ocr_dpi: Resolution pages are rendered at for OCR
+            executor_class: Executor used for tasks
+
+        Raises:
+            ValueError: If pages_per_task or max_workers is not positive
+        """
+        if pages_per_task < 1:
+            raise ValueError("pages_per_task must be at least 1")
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.max_workers = max_workers
+        self.pages_per_task = pages_per_task
+        self.min_page_chars = min_page_chars
+        self.methods = tuple(methods)
+        self.ocr_dpi = ocr_dpi
+        self.executor_class = executor_class
+
+    def extract_pages(self, file_path: str,
+                      progress_callback: Optional[Callable] = None,
+                      methods: Optional[Sequence[str]] = None) -> List[PageText]:
+        """Extract every page of one PDF.
+
+        Args:
+            file_path: Path to PDF file
+            progress_callback: Optional callback taking (percentage, message)
+            methods: Extraction methods tried per page, overriding ``self.methods``
+
+        Returns:
+            Pages in document order
+        """
+        return self.extract_pages_batch([file_path], progress_callback, methods)[0]
+
+    def extract_pages_batch(self, file_paths: Sequence[str],
+                            progress_callback: Optional[Callable] = None,
+                            methods: Optional[Sequence[str]] = None) -> List[List[PageText]]:
+        """Extract several PDFs, sharing one pool across all their pages.
+
+        Args:
+            file_paths: Paths to PDF files
+            progress_callback: Optional callback taking (percentage, message)
+            methods: Extraction methods tried per page, overriding ``self.methods``
+
+        Returns:
+            Pages in document order for each file; empty for unreadable files
+        """
+        methods = tuple(methods) if methods is not None else self.methods
+        tasks: List[Tuple[int, int, int]] = []
+        for file_index, file_path in enumerate(file_paths):
+            page_count = count_pages(file_path)
+            for start in range(0, page_count, self.pages_per_task):
+                tasks.append((file_index, start, min(start + self.pages_per_task, page_count)))
+
+        results: Dict[Tuple[int, int], List[PageText]] = {}
+        total_pages = sum(stop - start for _, start, stop in tasks)
+        done_pages = 0
+
+        def record(task: Tuple[int, int, int], pages: List[PageText]) -> None:
+            nonlocal done_pages
+            file_index, start, stop = task
+            results[(file_index, start)] = pages
+            done_pages += stop - start
+            if progress_callback:
+                progress_callback(
+                    done_pages * 100 // max(total_pages, 1),
+                    f"Extracted {done_pages}/{total_pages} pages"
+                )
+
+        if len(tasks) <= 1 or self.max_workers == 1:
+            for task in tasks:
+                record(task, self._run_task(file_paths, task, methods))
+        else:
+            self._run_pool(file_paths, tasks, record, methods)
+
+        return [
+            [page for (index, start) in sorted(results) if index == file_index
+             for page in results[(index, start)]]
+            for file_index in range(len(file_paths))
+        ]
+
+    def _run_task(self, file_paths: Sequence[str], task: Tuple[int, int, int],
+                  methods: Sequence[str]) -> List[PageText]:
+        """Run one page range in the calling process."""
+        file_index, start, stop = task
+        return _extract_page_range(
+            file_paths[file_index], start, stop, methods, self.min_page_chars, self.ocr_dpi
+        )
+
+    def _run_pool(self, file_paths: Sequence[str], tasks: List[Tuple[int, int, int]],
+                  record: Callable, methods: Sequence[str]) -> None:
+        """Run page ranges on the executor, falling back to in-process work."""
+        workers = min(self.max_workers or len(tasks), len(tasks))
+        try:
+            executor = self.executor_class(max_workers=workers)
+        except (OSError, NotImplementedError) as e:
+            # Some sandboxes forbid creating processes
+            logger.warning(f"Process pool unavailable, extracting in-process: {e}")
+            for task in tasks:
+                record(task, self._run_task(file_paths, task, methods))
+            return
+
+        with executor:
+            futures = {
+                executor.submit(
+                    _extract_page_range, file_paths[file_index], start, stop,
+                    methods, self.min_page_chars, self.ocr_dpi
+                ): (file_index, start, stop)
+                for file_index, start, stop in tasks
+            }
+            for future in as_completed(futures):
+                task = futures[future]
+                try:
+                    pages = future.result()
+                except Exception as e:
+                    file_index, start, stop = task
+                    logger.error(f"Pages {start + 1}-{stop} of {file_paths[file_index]} failed: {e}")
+                    pages = [PageText(number, "") for number in range(start, stop)]
+                record(task, pages)
+
+
+def summarize_methods(pages: Sequence[PageText]) -> Dict[str, int]:
+    """Count how many pages each extraction method produced.
+
+    Args:
+        pages: Extracted pages
+
+    Returns:
+        Mapping of method name to page count
+    """
+    return dict(Counter(page.method for page in pages if page.method))
@@ -1,6 +1,7 @@
 """PDF text extraction with multiple fallback methods."""
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional, Callable
 from dataclasses import dataclass, field
 
@@ -15,6 +16,8 @@ try:
 except ImportError:
     pdfplumber = None
 
+from .parallel_pdf_extractor import ParallelPDFExtractor, PageText, count_pages, summarize_methods
+
 
 @dataclass
 class ExtractionResult:
@@ -56,8 +59,13 @@ class ExtractionResult:
 class OCRProcessor:
     """OCR processor for scanned PDFs using real Tesseract integration."""
     
-    def __init__(self):
-        """Initialize OCR processor with Tesseract."""
+    def __init__(self, max_workers: Optional[int] = None):
+        """Initialize OCR processor with Tesseract.
+        
+        Args:
+            max_workers: Pages OCR'd at once; defaults to the thread pool's default
+        """
+        self.max_workers = max_workers
         # Try to import pytesseract for real OCR functionality
         try:
             import pytesseract
@@ -114,22 +122,12 @@ class OCRProcessor:
         
         try:
             # Convert PDF pages to images and run OCR
-            extracted_text_pages = []
-            
             if pymupdf:
                 doc = pymupdf.open(file_path)
-                for page_num in range(doc.page_count):
-                    page = doc[page_num]
-                    
-                    # Convert page to image
-                    pix = page.get_pixmap()
-                    img_data = pix.tobytes("png")
-                    
-                    # Run OCR on the image
-                    page_text = self.extract_text_from_image(img_data)
-                    extracted_text_pages.append(page_text)
-                
-                doc.close()
+                try:
+                    extracted_text_pages = self._ocr_pages(doc)
+                finally:
+                    doc.close()
                 
                 # Combine all pages
                 full_text = "\n\n".join(extracted_text_pages)
@@ -140,23 +138,62 @@ class OCRProcessor:
         except Exception as e:
             return f"OCR extraction from PDF failed: {e}"
 
+    def extract_text_from_pages(self, file_path: str, page_numbers: List[int]) -> List[str]:
+        """OCR selected pages of a PDF.
+        
+        Args:
+            file_path: Path to PDF file
+            page_numbers: Zero-based pages to OCR
+            
+        Returns:
+            Text per requested page, in the order given; empty strings when
+            Tesseract or PyMuPDF is unavailable
+        """
+        if not self.tesseract_available or not pymupdf or not page_numbers:
+            return [""] * len(page_numbers)
+        
+        doc = pymupdf.open(file_path)
+        try:
+            return self._ocr_pages(doc[number] for number in page_numbers)
+        finally:
+            doc.close()
+
+    def _ocr_pages(self, pages) -> List[str]:
+        """Render PyMuPDF pages and OCR the images, in page order.
+        
+        Pages are rendered in order; Tesseract runs as a subprocess per
+        image, so the OCR calls overlap on a thread pool.
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(self.extract_text_from_image, page.get_pixmap().tobytes("png"))
+                for page in pages
+            ]
+            return [future.result() for future in futures]
+
 
 class PDFTextExtractor:
     """PDF text extractor with multiple fallback methods."""
     
     def __init__(self, ocr_processor: Optional[OCRProcessor] = None,
                  fallback_libraries: List[str] = None,
-                 enable_table_extraction: bool = True):
+                 enable_table_extraction: bool = True,
+                 parallel_extractor: Optional[ParallelPDFExtractor] = None,
+                 parallel_min_pages: int = 8):
         """Initialize PDF text extractor.
         
         Args:
             ocr_processor: OCR processor for scanned PDFs
             fallback_libraries: List of libraries to try in order
             enable_table_extraction: Whether to extract tables
+            parallel_extractor: Process-pool extractor used for large PDFs
+            parallel_min_pages: Page count from which plain text extraction runs in parallel
         """
         self.ocr_processor = ocr_processor or OCRProcessor()
         self.fallback_libraries = fallback_libraries or ['pymupdf', 'pdfplumber']
         self.enable_table_extraction = enable_table_extraction
+        self.parallel_extractor = parallel_extractor or ParallelPDFExtractor()
+        self.parallel_min_pages = parallel_min_pages
     
     def extract_text(self, file_path: str, method: str = None, 
                     extract_tables: bool = False, include_coordinates: bool = False,
@@ -179,6 +216,11 @@ class PDFTextExtractor:
             progress_callback(0, "Starting text extraction")
         
         try:
+            # Large PDFs go to the process pool; text-less pages are OCR'd here afterwards
+            if (method is None and not extract_tables and not include_coordinates
+                    and count_pages(file_path) >= self.parallel_min_pages):
+                return self._extract_in_parallel(file_path, start_time, progress_callback)
+            
             # Check if it's a scanned PDF that needs OCR
             if self.ocr_processor.is_scanned_pdf(file_path):
                 if progress_callback:
@@ -254,6 +296,63 @@ class PDFTextExtractor:
                 processing_time=processing_time
             )
     
+    def _extract_in_parallel(self, file_path: str, start_time: float,
+                             progress_callback: Optional[Callable] = None) -> ExtractionResult:
+        """Extract text with the process-pool extractor."""
+        pages = self.parallel_extractor.extract_pages(
+            file_path, progress_callback, methods=self.fallback_libraries
+        )
+        return self._result_from_pages(self._ocr_empty_pages(file_path, pages), start_time)
+
+    def _ocr_empty_pages(self, file_path: str, pages: List[PageText]) -> List[PageText]:
+        """Run the OCR processor on pages the text libraries left (nearly) empty.
+        
+        Workers only run ``fallback_libraries``, so scanned pages are OCR'd
+        with this extractor's OCR processor and its settings.
+        """
+        empty = [
+            page for page in pages
+            if len(page.text.strip()) < self.parallel_extractor.min_page_chars
+        ]
+        if not empty or not self.ocr_processor.tesseract_available:
+            return pages
+        
+        texts = self.ocr_processor.extract_text_from_pages(
+            file_path, [page.page_number for page in empty]
+        )
+        ocr_pages = {
+            page.page_number: PageText(page.page_number, text, 'ocr')
+            for page, text in zip(empty, texts)
+            if len(text.strip()) > len(page.text.strip())
+        }
+        return [ocr_pages.get(page.page_number, page) for page in pages]
+    
+    def _result_from_pages(self, pages: List, start_time: float) -> ExtractionResult:
+        """Build an extraction result from pages merged in order."""
+        page_methods = summarize_methods(pages)
+        if not pages or not any(page.text.strip() for page in pages):
+            return ExtractionResult(
+                success=False,
+                page_count=len(pages),
+                error_message="No text could be extracted from any page",
+                processing_time=time.time() - start_time
+            )
+        
+        return ExtractionResult(
+            success=True,
+            text="\n\n".join(page.text for page in pages),
+            method_used="+".join(page_methods) or None,
+            page_count=len(pages),
+            metadata={
+                'page_methods': page_methods,
+                'escalated_pages': [
+                    page.page_number + 1 for page in pages if page.method not in (None, 'pymupdf')
+                ],
+                'parallel': True
+            },
+            processing_time=time.time() - start_time
+        )
+    
     def _extract_with_pymupdf(self, file_path: str, extract_tables: bool,
                              include_coordinates: bool, start_time: float,
                              progress_callback: Optional[Callable] = None) -> ExtractionResult:
@@ -454,17 +553,37 @@ class PDFTextExtractor:
         
         return text
     
-    def extract_text_batch(self, file_paths: List[str]) -> List[ExtractionResult]:
+    def extract_text_batch(self, file_paths: List[str],
+                           progress_callback: Optional[Callable] = None) -> List[ExtractionResult]:
         """Extract text from multiple PDF files.
         
+        Large files share one process pool so their pages are extracted
+        concurrently; small files are extracted in-process.
+        
         Args:
             file_paths: List of PDF file paths
+            progress_callback: Optional progress callback for the large files
             
         Returns:
             List of ExtractionResult objects
         """
-        results = []
-        for file_path in file_paths:
-            result = self.extract_text(file_path)
-            results.append(result)
+        start_time = time.time()
+        large = [
+            index for index, file_path in enumerate(file_paths)
+            if count_pages(file_path) >= self.parallel_min_pages
+        ]
+        
+        results: List[Optional[ExtractionResult]] = [None] * len(file_paths)
+        if large:
+            page_lists = self.parallel_extractor.extract_pages_batch(
+                [file_paths[index] for index in large], progress_callback,
+                methods=self.fallback_libraries
+            )
+            for index, pages in zip(large, page_lists):
+                pages = self._ocr_empty_pages(file_paths[index], pages)
+                results[index] = self._result_from_pages(pages, start_time)
+        
+        for index, file_path in enumerate(file_paths):
+            if results[index] is None:
+                results[index] = self.extract_text(file_path)
         return results
\ No newline at end of file
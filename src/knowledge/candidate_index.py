@@ -0,0 +1,235 @@
+"""Candidate indexes for fast fuzzy lookup of terms in a fixed vocabulary."""
+import hashlib
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+# Try to import a C-accelerated edit distance, preferring rapidfuzz
+try:
+    from rapidfuzz.distance import Levenshtein as _levenshtein_backend
+    DISTANCE_BACKEND = "rapidfuzz"
+except ImportError:
+    try:
+        import Levenshtein as _levenshtein_backend
+        DISTANCE_BACKEND = "python-Levenshtein"
+    except ImportError:
+        _levenshtein_backend = None
+        DISTANCE_BACKEND = "python"
+
+
+def levenshtein_distance(s1: str, s2: str) -> int:
+    """Calculate the Levenshtein edit distance between two strings.
+
+    Args:
+        s1: First string
+        s2: Second string
+
+    Returns:
+        Minimum number of insertions, deletions and substitutions
+    """
+    if _levenshtein_backend is not None:
+        return _levenshtein_backend.distance(s1, s2)
+
+    # Bit-parallel algorithm (Myers/Hyyro): one column of the edit distance
+    # matrix is kept as vertical delta bits of a Python integer
+    if not s1:
+        return len(s2)
+    if not s2:
+        return len(s1)
+
+    match_masks: Dict[str, int] = {}
+    for i, char in enumerate(s1):
+        match_masks[char] = match_masks.get(char, 0) | (1 << i)
+    full = (1 << len(s1)) - 1
+    last = 1 << (len(s1) - 1)
+
+    positive, negative, distance = full, 0, len(s1)
+    for char in s2:
+        equal = match_masks.get(char, 0)
+        vertical = equal | negative
+        horizontal = (((equal & positive) + positive) ^ positive) | equal
+        plus = negative | ~(horizontal | positive)
+        minus = positive & horizontal
+        if plus & last:
+            distance += 1
+        elif minus & last:
+            distance -= 1
+        plus = (plus << 1) | 1
+        minus <<= 1
+        positive = (minus | ~(vertical | plus)) & full
+        negative = plus & vertical & full
+    return distance
+
+
+class BKTree:
+    """Burkhard-Keller tree for finding terms within an edit distance.
+
+    Each child edge is labelled with its distance to the parent term, so by
+    the triangle inequality a search only descends into edges within the
+    search radius of the query's distance to the parent.
+    """
+
+    def __init__(self, distance: Callable[[str, str], int] = levenshtein_distance):
+        """Initialize empty tree.
+
+        Args:
+            distance: Metric used to compare terms
+        """
+        self._distance = distance
+        self._root: Optional[Tuple[str, Dict[int, tuple]]] = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Number of distinct terms in the tree."""
+        return self._size
+
+    def add(self, term: str) -> None:
+        """Add a term; duplicates are ignored."""
+        if self._root is None:
+            self._root = (term, {})
+            self._size = 1
+            return
+
+        node = self._root
+        while True:
+            distance = self._distance(term, node[0])
+            if distance == 0:
+                return
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = (term, {})
+                self._size += 1
+                return
+            node = child
+
+    def search(self, term: str, radius: int) -> List[Tuple[int, str]]:
+        """Find every term within a distance of the query.
+
+        Args:
+            term: Query term
+            radius: Maximum distance
+
+        Returns:
+            List of (distance, term) tuples
+        """
+        if self._root is None:
+            return []
+
+        results = []
+        stack = [self._root]
+        while stack:
+            node_term, children = stack.pop()
+            distance = self._distance(term, node_term)
+            if distance <= radius:
+                results.append((distance, node_term))
+            for edge, child in children.items():
+                if distance - radius <= edge <= distance + radius:
+                    stack.append(child)
+        return results
+
+
+class CandidateIndex:
+    """Index a candidate list once for repeated fuzzy lookups.
+
+    Candidates are indexed case-insensitively three ways: a hash map for
+    exact hits, a trigram inverted index for substring lookups and a
+    BK-tree for edit-distance lookups. Lookups return lowercased terms;
+    ``positions`` maps them back to the original candidates in list order.
+    """
+
+    def __init__(self, candidates: Iterable[str]):
+        """Build indexes over the candidates.
+
+        Args:
+            candidates: Candidate strings
+        """
+        self.candidates = list(candidates)
+        self._positions: Dict[str, List[int]] = defaultdict(list)
+        for position, candidate in enumerate(self.candidates):
+            self._positions[candidate.lower()].append(position)
+        self._positions = dict(self._positions)
+
+        self._lengths = {len(term) for term in self._positions}
+        self._trigrams: Dict[str, Set[str]] = defaultdict(set)
+        self._bktree = BKTree()
+        for term in self._positions:
+            for trigram in _trigrams(term):
+                self._trigrams[trigram].add(term)
+            self._bktree.add(term)
+
+        self.fingerprint = hashlib.md5(
+            "\0".join(self.candidates).encode("utf-8", "surrogatepass")
+        ).hexdigest()
+
+    def __len__(self) -> int:
+        """Number of candidates, including duplicates."""
+        return len(self.candidates)
+
+    def __repr__(self) -> str:
+        """Describe the index without listing its candidates."""
+        return f"CandidateIndex({len(self.candidates)} candidates, {self.fingerprint})"
+
+    @property
+    def terms(self) -> List[str]:
+        """Distinct lowercased candidates in first-seen order."""
+        return list(self._positions)
+
+    def positions(self, term: str) -> List[int]:
+        """Get the positions of the candidates equal to a lowercased term."""
+        return self._positions.get(term, [])
+
+    def exact(self, query: str) -> Optional[str]:
+        """Get the first candidate equal to the query ignoring case."""
+        positions = self._positions.get(query.lower())
+        return self.candidates[positions[0]] if positions else None
+
+    def containing(self, query: str) -> Set[str]:
+        """Get the terms that contain the query ignoring case."""
+        query = query.lower()
+        grams = _trigrams(query)
+        if not grams:
+            return {term for term in self._positions if query in term}
+
+        postings = sorted((self._trigrams.get(gram, set()) for gram in grams), key=len)
+        shortlist = set(postings[0])
+        for posting in postings[1:]:
+            if not shortlist:
+                break
+            shortlist &= posting
+        return {term for term in shortlist if query in term}
+
+    def contained_in(self, query: str) -> Set[str]:
+        """Get the terms that occur within the query ignoring case."""
+        query = query.lower()
+        found = set()
+        for length in self._lengths:
+            for start in range(len(query) - length + 1):
+                piece = query[start:start + length]
+                if piece in self._positions:
+                    found.add(piece)
+        return found
+
+    def within_distance(self, query: str, radius: int) -> List[Tuple[int, str]]:
+        """Get the terms within an edit distance of the query ignoring case.
+
+        Args:
+            query: Query string
+            radius: Maximum Levenshtein distance
+
+        Returns:
+            List of (distance, term) tuples
+        """
+        return self._bktree.search(query.lower(), radius)
+
+    def get_statistics(self) -> Dict[str, int]:
+        """Get index sizes."""
+        return {
+            "candidates": len(self.candidates),
+            "distinct_terms": len(self._positions),
+            "trigrams": len(self._trigrams),
+            "bktree_terms": len(self._bktree),
+        }
+
+
+def _trigrams(text: str) -> Set[str]:
+    """Get the set of 3-character substrings of a string."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
@@ -6,6 +6,10 @@ from difflib import SequenceMatcher
 import logging
 
 from .database_query_optimizer import get_query_optimizer
+from .candidate_index import CandidateIndex, levenshtein_distance
+
+# Candidate indexes kept per matcher, keyed by candidate list
+MAX_CACHED_INDEXES = 32
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +40,7 @@ class FuzzyMatcher:
         # Initialize optimized cache and statistics
         self._query_optimizer = get_query_optimizer()
         self.cache = {} if enable_cache else None  # Backward compatibility
+        self._indexes: Dict[tuple, CandidateIndex] = {}
         self.stats = {
             "total_searches": 0,
             "exact_matches": 0,
@@ -43,35 +48,74 @@ class FuzzyMatcher:
             "no_matches": 0
         } if track_stats else None
     
-    @property
-    def _find_match_cached(self):
-        """Cached version of find_match method."""
-        if self.enable_cache:
-            return self._query_optimizer.cached_query()(self._find_match_impl)
-        else:
-            return self._find_match_impl
+    def build_index(self, candidates: Union[List[str], CandidateIndex]) -> CandidateIndex:
+        """Get the lookup index for a candidate list, building it on first use.
+        
+        Args:
+            candidates: List of candidate strings, or an index built earlier
+            
+        Returns:
+            Candidate index shared by later lookups against the same list
+        """
+        if isinstance(candidates, CandidateIndex):
+            return candidates
+        
+        key = tuple(candidates)
+        index = self._indexes.get(key)
+        if index is None:
+            if len(self._indexes) >= MAX_CACHED_INDEXES:
+                self._indexes.pop(next(iter(self._indexes)))
+            index = CandidateIndex(key)
+            self._indexes[key] = index
+        return index
+    
+    def _shortlist(self, query: str, index: CandidateIndex, threshold: float) -> List[int]:
+        """Get the positions of every candidate that can score at least the threshold.
+        
+        For Levenshtein scoring a candidate reaches the threshold only if it is
+        within the matching edit distance, or contains or is contained in the
+        query (substring bonus). Other algorithms and word-boundary bonuses
+        have no such bound, so every candidate is returned.
+        """
+        bounded = (
+            self.algorithm == "levenshtein"
+            and threshold > 0
+            and not (self.respect_word_boundaries and " " in query)
+        )
+        if not bounded:
+            return list(range(len(index)))
+        
+        # A match within the threshold is at most len(query) / threshold long
+        radius = int((1 - threshold) * len(query) / threshold + 1e-9)
+        terms = {term for _, term in index.within_distance(query, radius)}
+        terms |= index.containing(query)
+        terms |= index.contained_in(query)
+        return sorted(position for term in terms for position in index.positions(term))
     
-    def _find_match_impl(self, query: str, candidates: List[str]) -> Optional[Dict[str, Any]]:
+    def _find_match_impl(self, query: str,
+                         candidates: Union[List[str], CandidateIndex]) -> Optional[Dict[str, Any]]:
         """Implementation of find_match without caching."""
         # Early exit for empty inputs
         if not query or not candidates:
             return None
         
+        index = self.build_index(candidates)
         best_match = None
         best_score = 0.0
         
         # Check for exact match first (case insensitive)
-        for candidate in candidates:
-            if query.lower() == candidate.lower():
-                return {
-                    "matched_term": candidate,
-                    "similarity_score": 1.0,
-                    "match_type": "exact",
-                    "confidence_adjusted": 1.0
-                }
+        exact = index.exact(query)
+        if exact is not None:
+            return {
+                "matched_term": exact,
+                "similarity_score": 1.0,
+                "match_type": "exact",
+                "confidence_adjusted": 1.0
+            }
         
-        # Find best fuzzy match
-        for candidate in candidates:
+        # Find best fuzzy match among candidates that can reach the threshold
+        for position in self._shortlist(query, index, self.similarity_threshold):
+            candidate = index.candidates[position]
             score = self.calculate_similarity(query, candidate)
             
             # Apply word boundary bonus if enabled
@@ -94,12 +138,13 @@ class FuzzyMatcher:
         
         return None
     
-    def find_match(self, query: str, candidates: List[str]) -> Optional[Dict[str, Any]]:
+    def find_match(self, query: str,
+                   candidates: Union[List[str], CandidateIndex]) -> Optional[Dict[str, Any]]:
         """Find the best fuzzy match for a query string with optimized caching.
         
         Args:
             query: String to match
-            candidates: List of candidate strings
+            candidates: List of candidate strings, or an index from build_index
             
         Returns:
             Match result dictionary or None if no match found
@@ -107,13 +152,20 @@ class FuzzyMatcher:
         if self.track_stats:
             self.stats["total_searches"] += 1
         
-        # Use optimized cache
-        result = self._find_match_cached(query, candidates)
+        index = self.build_index(candidates)
         
-        # Update backward-compatible cache and stats
+        # Use optimized cache, keyed by the index fingerprint and matcher settings
         if self.enable_cache:
-            cache_key = f"{query}:{','.join(sorted(candidates))}"
-            self.cache[cache_key] = result
+            cache_key = (f"{self.algorithm}:{self.similarity_threshold}:"
+                         f"{self.respect_word_boundaries}:{self.algorithm_params}:"
+                         f"{index.fingerprint}:{query}")
+            result = self._query_optimizer.cached_query(cache_key)(self._find_match_impl)(
+                query, index
+            )
+            # Update backward-compatible cache
+            self.cache[f"{query}:{index.fingerprint}"] = result
+        else:
+            result = self._find_match_impl(query, index)
         
         # Update statistics
         if self.track_stats:
@@ -141,21 +193,23 @@ class FuzzyMatcher:
                 return False
         return True
     
-    def find_multiple_matches(self, query: str, candidates: List[str], 
-                            max_results: int = 5) -> List[Dict[str, Any]]:
+    def find_multiple_matches(self, query: str, candidates: Union[List[str], CandidateIndex],
+                              max_results: int = 5) -> List[Dict[str, Any]]:
         """Find multiple fuzzy matches above threshold.
         
         Args:
             query: String to match
-            candidates: List of candidate strings
+            candidates: List of candidate strings, or an index from build_index
             max_results: Maximum number of results to return
             
         Returns:
             List of match result dictionaries sorted by similarity
         """
         matches = []
+        index = self.build_index(candidates)
         
-        for candidate in candidates:
+        for position in self._shortlist(query, index, self.similarity_threshold):
+            candidate = index.candidates[position]
             score = self.calculate_similarity(query, candidate)
             if score >= self.similarity_threshold:
                 match_type = "exact" if score == 1.0 else "fuzzy"
@@ -218,32 +272,9 @@ class FuzzyMatcher:
         if len(s2) == 0:
             return 0.0
         
-        # Create matrix
-        matrix = [[0] * (len(s2) + 1) for _ in range(len(s1) + 1)]
-        
-        # Initialize first row and column
-        for i in range(len(s1) + 1):
-            matrix[i][0] = i
-        for j in range(len(s2) + 1):
-            matrix[0][j] = j
-        
-        # Fill matrix
-        for i in range(1, len(s1) + 1):
-            for j in range(1, len(s2) + 1):
-                if s1[i-1] == s2[j-1]:
-                    cost = 0
-                else:
-                    cost = 1
-                
-                matrix[i][j] = min(
-                    matrix[i-1][j] + 1,      # deletion
-                    matrix[i][j-1] + 1,      # insertion
-                    matrix[i-1][j-1] + cost  # substitution
-                )
-        
         # Convert distance to similarity
         max_len = max(len(s1), len(s2))
-        distance = matrix[len(s1)][len(s2)]
+        distance = levenshtein_distance(s1, s2)
         return 1.0 - (distance / max_len)
     
     def _jaro_winkler_similarity(self, s1: str, s2: str) -> float:
@@ -440,19 +471,22 @@ class FuzzyMatcher:
             char_sim = SequenceMatcher(None, meta1, meta2).ratio()
             return char_sim * 0.7
     
-    def suggest_corrections(self, query: str, candidates: List[str]) -> List[Dict[str, Any]]:
+    def suggest_corrections(self, query: str,
+                            candidates: Union[List[str], CandidateIndex]) -> List[Dict[str, Any]]:
         """Suggest spelling corrections for a misspelled term.
         
         Args:
             query: Potentially misspelled term
-            candidates: List of correct terms
+            candidates: List of correct terms, or an index from build_index
             
         Returns:
             List of correction suggestions with confidence scores
         """
         suggestions = []
+        index = self.build_index(candidates)
         
-        for candidate in candidates:
+        for position in self._shortlist(query, index, 0.6):
+            candidate = index.candidates[position]
             score = self.calculate_similarity(query, candidate)
             if score > 0.6:  # Lower threshold for suggestions
                 suggestions.append({
@@ -465,20 +499,22 @@ class FuzzyMatcher:
         suggestions.sort(key=lambda x: x["confidence"], reverse=True)
         return suggestions[:3]  # Return top 3 suggestions
     
-    def find_matches_batch(self, queries: List[str], candidates: List[str]) -> Dict[str, Any]:
+    def find_matches_batch(self, queries: List[str],
+                           candidates: Union[List[str], CandidateIndex]) -> Dict[str, Any]:
         """Process multiple fuzzy match queries in batch.
         
         Args:
             queries: List of query strings
-            candidates: List of candidate strings
+            candidates: List of candidate strings, indexed once for all queries
             
         Returns:
             Dictionary mapping queries to their best matches
         """
         results = {}
+        index = self.build_index(candidates)
         
         for query in queries:
-            match = self.find_match(query, candidates)
+            match = self.find_match(query, index)
             results[query] = match
         
         return results
@@ -488,6 +524,7 @@ class FuzzyMatcher:
         if self.enable_cache:
             self.cache.clear()
             self._query_optimizer.clear_cache()
+        self._indexes.clear()
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get fuzzy matching usage statistics.
@@ -4,9 +4,13 @@ import os
 import time
 import json
 import hashlib
+import sqlite3
 import threading
 import logging
-from typing import Optional, Dict, Any
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, Iterable, Iterator, List
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -14,6 +18,13 @@ from pathlib import Path
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Block size for streamed writes and checksum reads
+CHUNK_SIZE = 1024 * 1024
+
+# One lock per partial download file, shared by every cache manager in the process
+_partial_locks: "weakref.WeakValueDictionary[str, threading.Lock]" = weakref.WeakValueDictionary()
+_partial_locks_guard = threading.Lock()
+
 
 @dataclass
 class CacheEntry:
@@ -46,20 +57,29 @@ class CacheStats:
 
 
 class PDFCacheManager:
-    """Manages PDF caching with expiration policies and storage limits."""
+    """Manages PDF caching with expiration policies and storage limits.
+    
+    Entries are kept in memory in least-recently-used order with a running
+    byte count, so inserts and evictions never rescan the cache directory.
+    Metadata is persisted row by row in a SQLite file next to the PDFs.
+    When the cache fills up, LRU entries are evicted in one batch down to
+    ``low_water_ratio`` of the limit rather than one at a time.
+    """
     
     def __init__(self, cache_dir: str, max_cache_size_mb: int = 100, 
-                 default_expiry_hours: int = 24):
+                 default_expiry_hours: int = 24, low_water_ratio: float = 0.8):
         """Initialize cache manager.
         
         Args:
             cache_dir: Directory for cache storage
             max_cache_size_mb: Maximum cache size in MB
             default_expiry_hours: Default expiry time in hours
+            low_water_ratio: Fraction of the limit eviction brings the cache down to
         """
         self.cache_dir = Path(cache_dir)
         self.max_cache_size_mb = max_cache_size_mb
         self.default_expiry_hours = default_expiry_hours
+        self.low_water_ratio = low_water_ratio
         self.cleanup_on_shutdown = True
         
         # Thread safety
@@ -75,13 +95,21 @@ class PDFCacheManager:
             # Directory exists but we can't write to it
             pass
         
+        # Entry metadata in LRU order (least recently used first) and total bytes
+        self._metadata: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._current_size = 0
+        
         # Metadata storage
         self._metadata_file = self.cache_dir / "cache_metadata.json"
+        self._db_file = self.cache_dir / "cache_metadata.sqlite3"
+        self._db: Optional[sqlite3.Connection] = None
         try:
-            self._metadata = self._load_metadata()
-        except PermissionError:
-            # Can't read metadata due to permissions
-            self._metadata = {}
+            self._db = self._open_metadata_store()
+            self._load_metadata()
+        except (PermissionError, sqlite3.Error) as e:
+            # Can't read or create metadata; keep entries in memory only
+            logger.warning(f"PDF cache metadata unavailable, not persisting: {e}")
+            self._db = None
         
         logger.info(f"Initialized PDFCacheManager with cache_dir={cache_dir}, max_size={max_cache_size_mb}MB")
 
@@ -111,53 +139,102 @@ class PDFCacheManager:
         Returns:
             True if cached successfully
         """
+        return self.cache_pdf_stream(cache_key, [content], expiry_hours, metadata)
+
+    def cache_pdf_stream(self, cache_key: str, chunks: Iterable[bytes],
+                         expiry_hours: int = None,
+                         metadata: Optional[Dict[str, Any]] = None) -> bool:
+        """Cache PDF content arriving in chunks.
+        
+        Chunks are written to a temporary file and hashed as they arrive, so
+        the whole PDF is never held in memory or read back for its checksum.
+        
+        Args:
+            cache_key: Cache key
+            chunks: Iterable of PDF content blocks
+            expiry_hours: Expiry time in hours (uses default if None)
+            metadata: Optional metadata
+            
+        Returns:
+            True if cached successfully
+        """
+        temp_path = self._get_cache_file_path(cache_key).with_suffix(
+            f".tmp{threading.get_ident()}"
+        )
+        try:
+            digest = hashlib.md5()
+            size = 0
+            with open(temp_path, 'wb') as f:
+                for chunk in chunks:
+                    digest.update(chunk)
+                    f.write(chunk)
+                    size += len(chunk)
+            return self.cache_file(
+                cache_key, temp_path, digest.hexdigest(), expiry_hours, metadata
+            ) is not None
+        except Exception as e:
+            logger.error(f"Failed to cache PDF {cache_key}: {e}")
+            return False
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+
+    def cache_file(self, cache_key: str, source_path: Path, checksum: str,
+                   expiry_hours: int = None,
+                   metadata: Optional[Dict[str, Any]] = None) -> Optional[Path]:
+        """Move a fully written PDF file into the cache.
+        
+        Args:
+            cache_key: Cache key
+            source_path: File in the cache directory holding the PDF
+            checksum: MD5 hex digest computed while the file was written
+            expiry_hours: Expiry time in hours (uses default if None)
+            metadata: Optional metadata
+            
+        Returns:
+            Path of the cached PDF, or None if caching failed
+        """
         if expiry_hours is None:
             expiry_hours = self.default_expiry_hours
         
         with self._lock:
             try:
-                # Check cache size and perform eviction if needed
-                self._ensure_cache_space(len(content))
+                size = os.path.getsize(source_path)
                 
-                # Calculate expiry time
-                expiry_time = time.time() + (expiry_hours * 3600)
+                # Replacing an entry frees its space first
+                if cache_key in self._metadata:
+                    self._current_size -= self._metadata.pop(cache_key).get('file_size', 0)
                 
-                # Create checksum
-                checksum = hashlib.md5(content).hexdigest()
+                # Check cache size and perform eviction if needed
+                self._ensure_cache_space(size)
                 
-                # Save content to file
                 cache_file_path = self._get_cache_file_path(cache_key)
-                try:
-                    with open(cache_file_path, 'wb') as f:
-                        f.write(content)
-                except PermissionError:
-                    # Re-raise permission errors so they can be caught by callers
-                    raise
+                os.replace(source_path, cache_file_path)
                 
                 # Update metadata
                 current_time = time.time()
-                entry_metadata = metadata or {}
+                entry_metadata = dict(metadata or {})
                 entry_metadata.update({
                     'cache_time': current_time,
                     'access_time': current_time,  # Initialize access time
-                    'expiry_time': expiry_time,
+                    'expiry_time': current_time + (expiry_hours * 3600),
                     'checksum': checksum,
-                    'file_size': len(content)
+                    'file_size': size
                 })
                 
                 self._metadata[cache_key] = entry_metadata
-                self._save_metadata()
+                self._current_size += size
+                self._persist_entry(cache_key, entry_metadata)
                 
                 # Update statistics
                 self._stats.total_entries = len(self._metadata)
-                self._update_cache_size()
                 
-                logger.debug(f"Cached PDF with key {cache_key}, size {len(content)} bytes")
-                return True
+                logger.debug(f"Cached PDF with key {cache_key}, size {size} bytes")
+                return cache_file_path
                 
             except Exception as e:
                 logger.error(f"Failed to cache PDF {cache_key}: {e}")
-                return False
+                return None
 
     def is_cached(self, cache_key: str) -> bool:
         """Check if PDF is cached.
@@ -170,7 +247,7 @@ class PDFCacheManager:
         """
         with self._lock:
             cache_file_path = self._get_cache_file_path(cache_key)
-            return cache_file_path.exists() and cache_key in self._metadata
+            return cache_key in self._metadata and cache_file_path.exists()
 
     def is_expired(self, cache_key: str) -> bool:
         """Check if cached PDF is expired.
@@ -197,31 +274,46 @@ class PDFCacheManager:
         Returns:
             PDF content or None if not found/expired
         """
-        with self._lock:
-            if not self.is_cached(cache_key):
+        cache_file_path = self.get_cached_path(cache_key)
+        if cache_file_path is None:
+            return None
+        
+        try:
+            with open(cache_file_path, 'rb') as f:
+                return f.read()
+        except Exception as e:
+            logger.error(f"Failed to read cached PDF {cache_key}: {e}")
+            with self._lock:
+                self._stats.cache_hits -= 1
                 self._stats.cache_misses += 1
-                return None
+            return None
+
+    def get_cached_path(self, cache_key: str) -> Optional[Path]:
+        """Get the file holding a cached PDF and mark it recently used.
+        
+        Args:
+            cache_key: Cache key
             
-            if self.is_expired(cache_key):
+        Returns:
+            Path to the cached PDF or None if not found/expired
+        """
+        with self._lock:
+            if not self.is_cached(cache_key) or self.is_expired(cache_key):
                 self._stats.cache_misses += 1
                 return None
             
-            try:
-                cache_file_path = self._get_cache_file_path(cache_key)
-                with open(cache_file_path, 'rb') as f:
-                    content = f.read()
-                
-                # Update access time for LRU
-                self._metadata[cache_key]['access_time'] = time.time()
-                self._save_metadata()
-                
-                self._stats.cache_hits += 1
-                return content
-                
-            except Exception as e:
-                logger.error(f"Failed to read cached PDF {cache_key}: {e}")
-                self._stats.cache_misses += 1
-                return None
+            # Update access time for LRU
+            access_time = time.time()
+            self._metadata[cache_key]['access_time'] = access_time
+            self._metadata.move_to_end(cache_key)
+            if self._db is not None:
+                self._execute(
+                    "UPDATE pdf_cache SET access_time = ? WHERE cache_key = ?",
+                    (access_time, cache_key),
+                )
+            
+            self._stats.cache_hits += 1
+            return self._get_cache_file_path(cache_key)
 
     def get_expiry(self, cache_key: str) -> Optional[float]:
         """Get expiry time for cached PDF.
@@ -256,16 +348,13 @@ class PDFCacheManager:
             Number of entries cleared
         """
         with self._lock:
-            expired_keys = []
             current_time = time.time()
+            expired_keys = [
+                cache_key for cache_key, metadata in self._metadata.items()
+                if current_time > metadata.get('expiry_time', 0)
+            ]
             
-            for cache_key, metadata in self._metadata.items():
-                expiry_time = metadata.get('expiry_time', 0)
-                if current_time > expiry_time:
-                    expired_keys.append(cache_key)
-            
-            for cache_key in expired_keys:
-                self._remove_cache_entry(cache_key)
+            self._remove_cache_entries(expired_keys)
             
             self._stats.expired_entries_cleared += len(expired_keys)
             logger.info(f"Cleared {len(expired_keys)} expired cache entries")
@@ -285,20 +374,18 @@ class PDFCacheManager:
             if not self.is_cached(cache_key):
                 return False
             
+            stored_checksum = self._metadata[cache_key].get('checksum')
+            if not stored_checksum:
+                return False
+            
             try:
-                # Get content and stored checksum
-                cache_file_path = self._get_cache_file_path(cache_key)
-                with open(cache_file_path, 'rb') as f:
-                    content = f.read()
-                
-                stored_checksum = self._metadata[cache_key].get('checksum')
-                if not stored_checksum:
-                    return False
+                # Calculate current checksum block by block
+                digest = hashlib.md5()
+                with open(self._get_cache_file_path(cache_key), 'rb') as f:
+                    for block in iter(lambda: f.read(CHUNK_SIZE), b''):
+                        digest.update(block)
                 
-                # Calculate current checksum
-                current_checksum = hashlib.md5(content).hexdigest()
-                
-                return current_checksum == stored_checksum
+                return digest.hexdigest() == stored_checksum
                 
             except Exception as e:
                 logger.error(f"Failed to validate cache integrity for {cache_key}: {e}")
@@ -311,12 +398,11 @@ class PDFCacheManager:
             CacheStats object
         """
         with self._lock:
-            self._update_cache_size()
             return CacheStats(
                 cache_hits=self._stats.cache_hits,
                 cache_misses=self._stats.cache_misses,
                 total_entries=len(self._metadata),
-                current_size_mb=self._stats.current_size_mb,
+                current_size_mb=self._current_size / (1024 * 1024),
                 evictions_performed=self._stats.evictions_performed,
                 expired_entries_cleared=self._stats.expired_entries_cleared,
                 concurrent_write_conflicts=self._stats.concurrent_write_conflicts
@@ -330,6 +416,37 @@ class PDFCacheManager:
             
             logger.info("PDFCacheManager shutdown complete")
 
+    def get_partial_path(self, cache_key: str) -> Path:
+        """Get the file an in-progress download for a cache key is written to.
+        
+        Args:
+            cache_key: Cache key
+            
+        Returns:
+            Path to the partial download, next to the cached PDFs
+        """
+        return self.cache_dir / f"{cache_key}.pdf.part"
+
+    @contextmanager
+    def partial_lock(self, cache_key: str) -> Iterator[None]:
+        """Hold the lock for a cache key's partial download.
+
+        Concurrent downloads of the same URL would otherwise append to
+        one partial file. The lock is shared by all managers using the
+        same cache directory.
+
+        Args:
+            cache_key: Cache key
+        """
+        path = str(self.get_partial_path(cache_key).resolve())
+        with _partial_locks_guard:
+            lock = _partial_locks.get(path)
+            if lock is None:
+                lock = threading.Lock()
+                _partial_locks[path] = lock
+        with lock:
+            yield
+
     def _get_cache_file_path(self, cache_key: str) -> Path:
         """Get file path for cache key.
         
@@ -342,46 +459,30 @@ class PDFCacheManager:
         return self.cache_dir / f"{cache_key}.pdf"
 
     def _ensure_cache_space(self, new_content_size: int):
-        """Ensure cache has space for new content.
+        """Ensure cache has space for new content; caller holds the lock.
+        
+        Once the new content would push the cache past 95% of its limit,
+        least recently used entries are evicted in one batch until the cache
+        plus the new content fits under the low-water mark.
         
         Args:
             new_content_size: Size of new content in bytes
         """
-        # Calculate current cache size
-        self._update_cache_size()
-        
-        new_size_mb = new_content_size / (1024 * 1024)
-        
-        # Check if adding new content would exceed limit
-        # Use a small buffer to ensure eviction happens even with rounding
-        while (self._stats.current_size_mb + new_size_mb) > (self.max_cache_size_mb * 0.95) and self._metadata:
-            oldest_key = self._find_lru_entry()
-            if oldest_key:
-                self._remove_cache_entry(oldest_key)
-                self._stats.evictions_performed += 1
-                self._update_cache_size()
-            else:
-                break
-
-    def _find_lru_entry(self) -> Optional[str]:
-        """Find least recently used cache entry.
-        
-        Returns:
-            Cache key of LRU entry or None
-        """
-        if not self._metadata:
-            return None
-        
-        oldest_key = None
-        oldest_time = float('inf')
+        max_bytes = self.max_cache_size_mb * 1024 * 1024
+        if self._current_size + new_content_size <= max_bytes * 0.95:
+            return
         
+        target = max_bytes * self.low_water_ratio - new_content_size
+        evicted = []
+        remaining = self._current_size
         for cache_key, metadata in self._metadata.items():
-            access_time = metadata.get('access_time', metadata.get('cache_time', 0))
-            if access_time < oldest_time:
-                oldest_time = access_time
-                oldest_key = cache_key
+            if remaining <= target:
+                break
+            evicted.append(cache_key)
+            remaining -= metadata.get('file_size', 0)
         
-        return oldest_key
+        self._remove_cache_entries(evicted)
+        self._stats.evictions_performed += len(evicted)
 
     def _remove_cache_entry(self, cache_key: str):
         """Remove cache entry.
@@ -389,41 +490,90 @@ class PDFCacheManager:
         Args:
             cache_key: Cache key to remove
         """
-        try:
-            # Remove file
-            cache_file_path = self._get_cache_file_path(cache_key)
-            if cache_file_path.exists():
-                cache_file_path.unlink()
+        with self._lock:
+            self._remove_cache_entries([cache_key])
+
+    def _remove_cache_entries(self, cache_keys: List[str]):
+        """Remove cache entries with one metadata write; caller holds the lock.
+        
+        Args:
+            cache_keys: Cache keys to remove
+        """
+        if not cache_keys:
+            return
+        
+        for cache_key in cache_keys:
+            try:
+                # Remove file
+                cache_file_path = self._get_cache_file_path(cache_key)
+                if cache_file_path.exists():
+                    cache_file_path.unlink()
+            except Exception as e:
+                logger.error(f"Failed to remove cache entry {cache_key}: {e}")
             
             # Remove metadata
-            if cache_key in self._metadata:
-                del self._metadata[cache_key]
-            
-            self._save_metadata()
-            
-        except Exception as e:
-            logger.error(f"Failed to remove cache entry {cache_key}: {e}")
+            metadata = self._metadata.pop(cache_key, None)
+            if metadata is not None:
+                self._current_size -= metadata.get('file_size', 0)
+        
+        if self._db is not None:
+            self._execute(
+                "DELETE FROM pdf_cache WHERE cache_key = ?",
+                [(cache_key,) for cache_key in cache_keys],
+                many=True,
+            )
+        self._stats.total_entries = len(self._metadata)
 
-    def _update_cache_size(self):
-        """Update current cache size statistics."""
-        total_size = 0
+    def _open_metadata_store(self) -> sqlite3.Connection:
+        """Open the SQLite metadata store, creating its table if needed.
         
-        for cache_key in self._metadata:
-            cache_file_path = self._get_cache_file_path(cache_key)
-            if cache_file_path.exists():
-                total_size += cache_file_path.stat().st_size
+        Returns:
+            Database connection
+        """
+        db = sqlite3.connect(str(self._db_file), check_same_thread=False)
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS pdf_cache ("
+            "cache_key TEXT PRIMARY KEY, file_size INTEGER, access_time REAL, metadata TEXT)"
+        )
+        db.commit()
+        return db
+
+    def _load_metadata(self):
+        """Load entries in LRU order, importing a legacy JSON metadata file once."""
+        if self._metadata_file.exists():
+            legacy = self._load_legacy_metadata()
+            for cache_key, metadata in legacy.items():
+                self._persist_entry(cache_key, metadata)
+            self._metadata_file.unlink()
         
-        self._stats.current_size_mb = total_size / (1024 * 1024)
+        rows = self._db.execute(
+            "SELECT cache_key, access_time, metadata FROM pdf_cache ORDER BY access_time"
+        ).fetchall()
+        missing = []
+        for cache_key, access_time, encoded in rows:
+            # Drop entries whose file was removed behind our back
+            if not self._get_cache_file_path(cache_key).exists():
+                missing.append(cache_key)
+                continue
+            metadata = json.loads(encoded)
+            metadata['access_time'] = access_time
+            self._metadata[cache_key] = metadata
+            self._current_size += metadata.get('file_size', 0)
+        
+        if missing:
+            self._execute(
+                "DELETE FROM pdf_cache WHERE cache_key = ?",
+                [(cache_key,) for cache_key in missing],
+                many=True,
+            )
+        self._stats.total_entries = len(self._metadata)
 
-    def _load_metadata(self) -> Dict[str, Any]:
-        """Load cache metadata from file.
+    def _load_legacy_metadata(self) -> Dict[str, Any]:
+        """Load cache metadata from the JSON file used by older versions.
         
         Returns:
             Metadata dictionary
         """
-        if not self._metadata_file.exists():
-            return {}
-        
         try:
             with open(self._metadata_file, 'r') as f:
                 return json.load(f)
@@ -431,12 +581,39 @@ class PDFCacheManager:
             logger.error(f"Failed to load cache metadata: {e}")
             return {}
 
-    def _save_metadata(self):
-        """Save cache metadata to file."""
+    def _persist_entry(self, cache_key: str, metadata: Dict[str, Any]):
+        """Write one entry's metadata row; caller holds the lock.
+        
+        Args:
+            cache_key: Cache key
+            metadata: Entry metadata
+        """
+        if self._db is None:
+            return
+        try:
+            encoded = json.dumps(metadata, default=str)
+        except (TypeError, ValueError) as e:
+            logger.error(f"Failed to encode cache metadata for {cache_key}: {e}")
+            return
+        self._execute(
+            "INSERT OR REPLACE INTO pdf_cache VALUES (?, ?, ?, ?)",
+            (
+                cache_key,
+                metadata.get('file_size', 0),
+                metadata.get('access_time', metadata.get('cache_time', 0)),
+                encoded,
+            ),
+        )
+
+    def _execute(self, sql: str, params, many: bool = False):
+        """Run and commit a metadata statement, logging failures; caller holds the lock."""
         try:
-            with open(self._metadata_file, 'w') as f:
-                json.dump(self._metadata, f, indent=2)
-        except Exception as e:
+            if many:
+                self._db.executemany(sql, params)
+            else:
+                self._db.execute(sql, params)
+            self._db.commit()
+        except sqlite3.Error as e:
             logger.error(f"Failed to save cache metadata: {e}")
 
     def _set_expiry(self, cache_key: str, expiry_time: float):
@@ -449,4 +626,4 @@ class PDFCacheManager:
         with self._lock:
             if cache_key in self._metadata:
                 self._metadata[cache_key]['expiry_time'] = expiry_time
-                self._save_metadata()
\ No newline at end of file
+                self._persist_entry(cache_key, self._metadata[cache_key])
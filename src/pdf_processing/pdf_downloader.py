@@ -1,18 +1,32 @@
 """Secure PDF downloader with authentication and retry mechanisms."""
 
+import json
+import mmap
 import time
 import requests
 import hashlib
 import logging
-from typing import Optional, Dict, Any, List, Callable
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Callable, Tuple, Union
 from dataclasses import dataclass
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import urlparse
 
+from ..common.http_transport import PooledHttpTransport, get_shared_transport
+
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Maximum PDF size: 50MB
+MAX_PDF_SIZE = 50 * 1024 * 1024
+PDF_MAGIC = b'%PDF-'
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+# Bytes between streamed progress messages
+PROGRESS_INTERVAL = 1024 * 1024
+# Client errors that may succeed when retried; other 4xx responses are final
+RETRYABLE_CLIENT_STATUSES = {408, 425, 429}
+
 
 class AuthenticationError(Exception):
     """Raised when PDF download fails due to authentication issues."""
@@ -29,7 +43,7 @@ class DownloadResult:
     """Result of a PDF download operation."""
     url: str
     success: bool
-    content: Optional[bytes] = None
+    content: Optional[Union[bytes, mmap.mmap]] = None
     authenticated: bool = False
     from_cache: bool = False
     download_time: float = 0.0
@@ -40,6 +54,9 @@ class DownloadResult:
     response_time: float = 0.0
     fresh_download: bool = False
     independent: bool = True
+    file_path: Optional[str] = None
+    size_bytes: int = 0
+    resumed: bool = False
     
     def __post_init__(self):
         """Initialize default values for optional fields."""
@@ -51,7 +68,8 @@ class PDFDownloader:
     """Secure PDF downloader with authentication and retry mechanisms."""
     
     def __init__(self, cache_dir: str, max_retries: int = 3, timeout: int = 30, 
-                 auth_config: Optional[Dict[str, str]] = None):
+                 auth_config: Optional[Dict[str, str]] = None,
+                 transport: Optional[PooledHttpTransport] = None):
         """Initialize PDF downloader.
         
         Args:
@@ -59,11 +77,13 @@ class PDFDownloader:
             max_retries: Maximum number of retry attempts
             timeout: Request timeout in seconds
             auth_config: Authentication configuration
+            transport: Pooled HTTP transport (defaults to the shared transport)
         """
         self.cache_dir = cache_dir
         self.max_retries = max_retries
         self.timeout = timeout
         self.auth_config = auth_config or {}
+        self.transport = transport or get_shared_transport()
         
         # Initialize cache manager
         from .pdf_cache_manager import PDFCacheManager
@@ -127,45 +147,9 @@ class PDFDownloader:
             self.cache_manager.clear_expired()
         
         # Download with retries
-        content = None
-        retries_attempted = 0
-        last_error = None
-        
-        for attempt in range(self.max_retries + 1):
-            try:
-                if progress_callback:
-                    if attempt == 0:
-                        progress_callback(f"Downloading PDF: {url}")
-                        progress_callback("Authenticating with server")
-                    else:
-                        progress_callback(f"Retrying download (attempt {attempt + 1})")
-                
-                # Apply exponential backoff for retries
-                if attempt > 0:
-                    delay = self._calculate_backoff_delay(attempt)
-                    time.sleep(delay)
-                    retries_attempted += 1
-                
-                # Download the PDF
-                content = self._download_with_auth(url)
-                break
-                
-            except requests.exceptions.HTTPError as e:
-                # Check if this is an authentication error
-                if hasattr(e, 'response') and e.response and e.response.status_code == 401:
-                    raise AuthenticationError(f"Authentication failed for {url}: {e}")
-                # For mocked tests, check the error message
-                elif '401' in str(e):
-                    raise AuthenticationError(f"Authentication failed for {url}: {e}")
-                last_error = e
-                
-            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
-                last_error = e
-                if attempt == self.max_retries:
-                    raise NetworkError(f"Network error after max retries exceeded: {e}")
-        
-        if content is None:
-            raise NetworkError(f"Download failed after max retries: {last_error}")
+        content, retries_attempted = self._run_with_retries(
+            url, lambda: self._download_with_auth(url), progress_callback
+        )
         
         # Validate file size first (before content type check)
         if not self._validate_file_size(content):
@@ -205,15 +189,123 @@ class PDFDownloader:
             fresh_download=True
         )
 
+    def download_pdf_to_file(self, url: str, progress_callback: Optional[Callable] = None,
+                             memory_map: bool = False) -> DownloadResult:
+        """Download a PDF straight into the cache without holding it in memory.
+        
+        The body is streamed in chunks: the first bytes are checked for the
+        PDF magic number, the size limit is enforced as data arrives, and each
+        chunk is hashed and written to a partial file in the cache directory.
+        Interrupted downloads resume from the partial file with an HTTP Range
+        request, on retry or on a later call.
+        
+        Args:
+            url: URL of the PDF to download
+            progress_callback: Optional callback for progress updates
+            memory_map: Return a read-only memory map of the file as content
+            
+        Returns:
+            DownloadResult with file_path set; content is a memory map the
+            caller must close when memory_map is True, otherwise None
+            
+        Raises:
+            AuthenticationError: If authentication fails
+            NetworkError: If network errors occur after retries
+            ValueError: If content validation fails
+        """
+        start_time = time.time()
+        
+        # Validate URL
+        if not self._validate_url(url):
+            raise ValueError(f"Invalid URL: {url}")
+        
+        # One download per URL at a time; later callers find it in the cache
+        cache_key = self.cache_manager.get_cache_key(url)
+        with self.cache_manager.partial_lock(cache_key):
+            return self._download_to_cache(url, cache_key, start_time, progress_callback, memory_map)
+
+    def _download_to_cache(self, url: str, cache_key: str, start_time: float,
+                           progress_callback: Optional[Callable] = None,
+                           memory_map: bool = False) -> DownloadResult:
+        """Serve a PDF from the cache or stream it in; caller holds the key's partial lock."""
+        cached_path = self.cache_manager.get_cached_path(cache_key)
+        if cached_path is not None:
+            if progress_callback:
+                progress_callback("Retrieving PDF from cache")
+            response_time = time.time() - start_time
+            return DownloadResult(
+                url=url,
+                success=True,
+                content=self._map_file(cached_path) if memory_map else None,
+                authenticated=True,  # Assume cached content was authenticated
+                from_cache=True,
+                download_time=response_time,
+                cache_hit=True,
+                validation_result=True,
+                external_download=False,
+                response_time=response_time,
+                file_path=str(cached_path),
+                size_bytes=cached_path.stat().st_size
+            )
+        
+        partial_path = self.cache_manager.get_partial_path(cache_key)
+        try:
+            (checksum, size, resumed), retries_attempted = self._run_with_retries(
+                url,
+                lambda: self._stream_to_file(url, partial_path, progress_callback),
+                progress_callback
+            )
+            
+            # A truncated body passes every check made while streaming
+            if not self._has_eof_marker(partial_path):
+                raise ValueError("PDF integrity validation failed: missing EOF marker")
+        except ValueError:
+            self._discard_partial(partial_path)
+            raise
+        
+        file_path = self.cache_manager.cache_file(
+            cache_key, partial_path, checksum, expiry_hours=24,
+            metadata={'source_url': url, 'content_type': 'application/pdf'}
+        )
+        self._discard_partial(partial_path)
+        if file_path is None:
+            raise IOError(f"Failed to store downloaded PDF for {url}")
+        
+        if progress_callback:
+            progress_callback("PDF download completed successfully")
+        
+        return DownloadResult(
+            url=url,
+            success=True,
+            content=self._map_file(file_path) if memory_map else None,
+            authenticated=True,
+            from_cache=False,
+            download_time=time.time() - start_time,
+            retry_info={
+                'retries_attempted': retries_attempted,
+                'backoff_strategy': 'exponential'
+            },
+            cache_hit=False,
+            validation_result=True,
+            external_download=True,
+            fresh_download=True,
+            file_path=str(file_path),
+            size_bytes=size,
+            resumed=resumed
+        )
+
     def download_pdfs_concurrent(self, urls: List[str], max_workers: int = 3) -> List[DownloadResult]:
         """Download multiple PDFs concurrently.
         
+        Each PDF is streamed into the cache, so memory use does not grow
+        with the number of workers or the size of the files.
+        
         Args:
             urls: List of PDF URLs to download
             max_workers: Maximum number of concurrent workers
             
         Returns:
-            List of DownloadResult objects
+            List of DownloadResult objects with file_path set
         """
         results = []
         
@@ -245,7 +337,7 @@ class PDFDownloader:
     def _download_single_concurrent(self, url: str) -> DownloadResult:
         """Download a single PDF for concurrent execution."""
         try:
-            return self.download_pdf(url)
+            return self.download_pdf_to_file(url)
         except Exception as e:
             logger.error(f"Download failed for {url}: {e}")
             return DownloadResult(
@@ -254,6 +346,200 @@ class PDFDownloader:
                 authenticated=False
             )
 
+    def _run_with_retries(self, url: str, operation: Callable[[], Any],
+                          progress_callback: Optional[Callable] = None) -> Tuple[Any, int]:
+        """Run a download operation with exponential backoff retries.
+        
+        Args:
+            url: URL being downloaded
+            operation: Function performing one download attempt
+            progress_callback: Optional callback for progress updates
+            
+        Returns:
+            Tuple of the operation result and the number of retries attempted
+            
+        Raises:
+            AuthenticationError: If authentication fails
+            NetworkError: If network errors occur after retries, or the
+                server rejects the request with a non-retryable status
+        """
+        retries_attempted = 0
+        last_error = None
+        
+        for attempt in range(self.max_retries + 1):
+            try:
+                if progress_callback:
+                    if attempt == 0:
+                        progress_callback(f"Downloading PDF: {url}")
+                        progress_callback("Authenticating with server")
+                    else:
+                        progress_callback(f"Retrying download (attempt {attempt + 1})")
+                
+                # Apply exponential backoff for retries
+                if attempt > 0:
+                    delay = self._calculate_backoff_delay(attempt)
+                    time.sleep(delay)
+                    retries_attempted += 1
+                
+                return operation(), retries_attempted
+                
+            except requests.exceptions.HTTPError as e:
+                # An error Response is falsy, so compare against None
+                status = getattr(e.response, 'status_code', None) if e.response is not None else None
+                # Check if this is an authentication error
+                if status == 401:
+                    raise AuthenticationError(f"Authentication failed for {url}: {e}")
+                # For mocked tests, check the error message
+                elif '401' in str(e):
+                    raise AuthenticationError(f"Authentication failed for {url}: {e}")
+                if isinstance(status, int) and 400 <= status < 500 and status not in RETRYABLE_CLIENT_STATUSES:
+                    raise NetworkError(f"Download failed for {url}: {e}")
+                last_error = e
+                
+            except requests.exceptions.RequestException as e:
+                # Connection resets, timeouts and truncated chunked bodies;
+                # streamed downloads resume from the partial file on retry
+                last_error = e
+                if attempt == self.max_retries:
+                    raise NetworkError(f"Network error after max retries exceeded: {e}")
+        
+        raise NetworkError(f"Download failed after max retries: {last_error}")
+
+    def _stream_to_file(self, url: str, partial_path: Path,
+                        progress_callback: Optional[Callable] = None) -> Tuple[str, int, bool]:
+        """Stream one download attempt into a partial file, resuming if possible.
+        
+        Args:
+            url: URL to download
+            partial_path: File receiving the body
+            progress_callback: Optional callback for progress updates
+            
+        Returns:
+            Tuple of MD5 hex digest, total size in bytes and whether the
+            download resumed from earlier bytes
+            
+        Raises:
+            ValueError: If the body is not a PDF or exceeds the size limit
+            requests.exceptions.RequestException: For HTTP and network errors
+        """
+        headers = self._get_auth_headers()
+        offset, validator = self._resume_point(url, partial_path)
+        if offset:
+            headers['Range'] = f'bytes={offset}-'
+            headers['If-Range'] = validator
+        
+        response = self.transport.get(url, headers=headers, timeout=self.timeout, stream=True)
+        try:
+            if response.status_code == 416:
+                # Our partial file no longer matches the resource; start over
+                self._discard_partial(partial_path)
+                raise requests.exceptions.ConnectionError("Range not satisfiable, restarting download")
+            response.raise_for_status()
+            
+            resumed = bool(offset) and response.status_code == 206
+            if not resumed:
+                offset = 0
+                self._save_resume_info(url, partial_path, response)
+            
+            declared = response.headers.get('Content-Length') or response.headers.get('content-length')
+            if declared and str(declared).isdigit() and offset + int(declared) > MAX_PDF_SIZE:
+                raise ValueError("Downloaded file size exceeds limits")
+            
+            digest = hashlib.md5()
+            if resumed:
+                with open(partial_path, 'rb') as f:
+                    for block in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b''):
+                        digest.update(block)
+                if progress_callback:
+                    progress_callback(f"Resuming download at {offset // 1024} KB")
+            
+            size = offset
+            next_report = size + PROGRESS_INTERVAL
+            with open(partial_path, 'ab' if resumed else 'wb') as f:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    if not chunk:
+                        continue
+                    if size < len(PDF_MAGIC):
+                        head = chunk[:len(PDF_MAGIC) - size]
+                        if head != PDF_MAGIC[size:size + len(head)]:
+                            raise ValueError("Invalid content type: Expected PDF but received different format")
+                    size += len(chunk)
+                    if size > MAX_PDF_SIZE:
+                        raise ValueError("Downloaded file size exceeds limits")
+                    digest.update(chunk)
+                    f.write(chunk)
+                    if progress_callback and size >= next_report:
+                        progress_callback(f"Downloaded {size // (1024 * 1024)} MB")
+                        next_report += PROGRESS_INTERVAL
+            
+            if size < len(PDF_MAGIC):
+                raise ValueError("Invalid content type: Expected PDF but received different format")
+            return digest.hexdigest(), size, resumed
+        finally:
+            response.close()
+
+    def _resume_point(self, url: str, partial_path: Path) -> Tuple[int, Optional[str]]:
+        """Get the offset a download can resume from and its If-Range validator.
+        
+        Args:
+            url: URL being downloaded
+            partial_path: Partial download file
+            
+        Returns:
+            Tuple of bytes already on disk (0 to start over) and the ETag or
+            Last-Modified value of the response they came from. Partial
+            files without a validator are never resumed, since the server
+            could not tell us whether the resource changed.
+        """
+        if not partial_path.exists():
+            return 0, None
+        info_path = self._resume_info_path(partial_path)
+        try:
+            with open(info_path, 'r') as f:
+                info = json.load(f)
+        except (OSError, ValueError):
+            return 0, None
+        if info.get('url') != url or not info.get('validator'):
+            return 0, None
+        return partial_path.stat().st_size, info['validator']
+
+    def _save_resume_info(self, url: str, partial_path: Path, response) -> None:
+        """Record what a fresh partial download belongs to."""
+        headers = response.headers or {}
+        validator = headers.get('ETag') or headers.get('Last-Modified')
+        try:
+            with open(self._resume_info_path(partial_path), 'w') as f:
+                json.dump({'url': url, 'validator': validator}, f)
+        except OSError as e:
+            logger.debug(f"Could not save resume info for {url}: {e}")
+
+    @staticmethod
+    def _resume_info_path(partial_path: Path) -> Path:
+        """Get the sidecar file describing a partial download."""
+        return partial_path.with_name(partial_path.name + '.json')
+
+    def _discard_partial(self, partial_path: Path) -> None:
+        """Delete a partial download and its resume info."""
+        for path in (partial_path, self._resume_info_path(partial_path)):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def _has_eof_marker(path: Path) -> bool:
+        """Check the end of a PDF file for the %%EOF marker without reading it all."""
+        with open(path, 'rb') as f:
+            f.seek(0, 2)
+            f.seek(max(0, f.tell() - 1024))
+            return b'%%EOF' in f.read()
+
+    @staticmethod
+    def _map_file(path: Path) -> mmap.mmap:
+        """Memory-map a cached PDF read-only."""
+        with open(path, 'rb') as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
     def _download_with_auth(self, url: str) -> bytes:
         """Download PDF with authentication.
         
@@ -268,14 +554,12 @@ class PDFDownloader:
             requests.exceptions.ConnectionError: For connection errors
             requests.exceptions.Timeout: For timeout errors
         """
-        session = requests.Session()
-        
-        # Configure authentication headers
+        # Authentication headers are sent per request so the pooled
+        # connection can be shared with other clients of the transport
         auth_headers = self._get_auth_headers()
-        session.headers.update(auth_headers)
         
         # Make the request
-        response = session.get(url, timeout=self.timeout)
+        response = self.transport.get(url, headers=auth_headers, timeout=self.timeout)
         response.raise_for_status()
         
         return response.content
@@ -346,9 +630,7 @@ class PDFDownloader:
         if not content:
             return False
         
-        # Maximum file size: 50MB
-        max_size = 50 * 1024 * 1024
-        return len(content) <= max_size
+        return len(content) <= MAX_PDF_SIZE
 
     def _calculate_backoff_delay(self, attempt: int) -> float:
         """Calculate exponential backoff delay.
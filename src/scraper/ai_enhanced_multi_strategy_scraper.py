@@ -10,6 +10,7 @@ import logging
 
 from .multi_strategy_scraper import MultiStrategyScraper, RestaurantData
 from ..ai.llm_extractor import LLMExtractor
+from ..ai.content_reducer import ContentReducer
 from ..ai.confidence_scorer import ConfidenceScorer
 from ..config.scraping_config import ScrapingConfig
 from ..processors.multi_modal_processor import MultiModalProcessor
@@ -310,6 +311,7 @@ class AIEnhancedMultiStrategyScraper(MultiStrategyScraper):
         self.method_tracker = ExtractionMethodTracker()
         self.result_merger = ResultMerger(self.confidence_scorer)
         self.result_cache = {} if getattr(self.config, 'enable_result_caching', False) else None
+        self.content_reducer = ContentReducer()
         self._cache_lock = threading.RLock()
         
         # Performance tracking
@@ -318,6 +320,8 @@ class AIEnhancedMultiStrategyScraper(MultiStrategyScraper):
             "ai_extractions": 0,
             "traditional_extractions": 0,
             "multi_modal_extractions": 0,
+            "llm_tokens_before_reduction": 0,
+            "llm_tokens_after_reduction": 0,
             "errors": []
         }
     
@@ -614,8 +618,14 @@ class AIEnhancedMultiStrategyScraper(MultiStrategyScraper):
         industry_config = config.get("industry_config", {"industry": industry})
         confidence_threshold = config.get("confidence_threshold", 0.6)
         
-        # Handle large content by chunking
-        chunks = self._chunk_content_for_llm(html_content)
+        # Strip boilerplate and send only the most relevant chunks
+        categories = config.get("ai_focus_categories") or [
+            category.get("category", "") if isinstance(category, dict) else category
+            for category in industry_config.get("categories", [])
+        ]
+        chunks = self._chunk_content_for_llm(
+            html_content, categories, config.get("max_llm_chunks", 3)
+        )
         all_extractions = []
         
         for chunk in chunks:
@@ -644,34 +654,15 @@ class AIEnhancedMultiStrategyScraper(MultiStrategyScraper):
         else:
             return {"method": "llm", "data": {}, "success": False, "confidence": 0.0}
     
-    def _chunk_content_for_llm(self, html_content: str, max_chunk_size: int = 8000) -> List[str]:
-        """Chunk large content for LLM processing."""
-        if len(html_content) <= max_chunk_size:
-            return [html_content]
-        
-        # Simple chunking by splitting on major HTML elements
-        chunks = []
-        current_chunk = ""
-        
-        # Split by paragraphs and sections
-        import re
-        sections = re.split(r'(<(?:div|section|article|p)[^>]*>.*?</(?:div|section|article|p)>)', html_content, flags=re.DOTALL)
-        
-        for section in sections:
-            if len(current_chunk) + len(section) > max_chunk_size:
-                if current_chunk:
-                    chunks.append(current_chunk)
-                    current_chunk = section
-                else:
-                    # Section itself is too large, split it further
-                    chunks.append(section[:max_chunk_size])
-            else:
-                current_chunk += section
-        
-        if current_chunk:
-            chunks.append(current_chunk)
-        
-        return chunks if chunks else [html_content]
+    def _chunk_content_for_llm(self, html_content: str,
+                               categories: Optional[List[str]] = None,
+                               max_chunks: Optional[int] = None) -> List[str]:
+        """Reduce content and return the chunks most relevant to the categories."""
+        reduced = self.content_reducer.reduce(html_content)
+        with self._cache_lock:
+            self.extraction_stats["llm_tokens_before_reduction"] += reduced.original_tokens
+            self.extraction_stats["llm_tokens_after_reduction"] += reduced.reduced_tokens
+        return self.content_reducer.select_chunks(reduced, categories, max_chunks=max_chunks)
     
     def _convert_ai_extractions_to_data(self, extractions: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Convert AI extractions to standard data format."""
@@ -847,6 +838,8 @@ class AIEnhancedMultiStrategyScraper(MultiStrategyScraper):
             "ai_extractions": self.extraction_stats["ai_extractions"],
             "traditional_extractions": self.extraction_stats["traditional_extractions"],
             "multi_modal_extractions": self.extraction_stats["multi_modal_extractions"],
+            "llm_tokens_before_reduction": self.extraction_stats["llm_tokens_before_reduction"],
+            "llm_tokens_after_reduction": self.extraction_stats["llm_tokens_after_reduction"],
             "method_usage_count": {method: data["usage_count"] for method, data in method_stats.items()},
             "method_success_rates": {method: data["success_rate"] for method, data in method_stats.items()},
             "average_confidence_by_method": {method: data["average_confidence"] for method, data in method_stats.items()}
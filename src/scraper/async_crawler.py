@@ -0,0 +1,456 @@
+"""Asyncio crawl engine for multi-page restaurant website scraping."""
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from ..common.http_transport import get_shared_transport
+from .ethical_scraper import DEFAULT_USER_AGENT, RETRYABLE_STATUS_CODES
+from .page_queue_manager import PageQueueManager
+from .rate_limiter import TokenBucketRateLimiter, parse_retry_after
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+
+TRAVERSAL_STRATEGIES = ("BFS", "DFS", "priority")
+
+
+@dataclass
+class AsyncResponse:
+    """Response returned by an async HTTP client."""
+
+    url: str
+    status_code: int
+    text: str
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+class AsyncHttpClient(ABC):
+    """Interface for pluggable async HTTP clients used by the crawl engine.
+
+    Clients are closed at the end of every crawl and must be usable again
+    afterwards, since each crawl may run on a new event loop.
+    """
+
+    @abstractmethod
+    async def get(self, url: str, timeout: float = 30) -> AsyncResponse:
+        """Fetch a URL.
+
+        Args:
+            url: URL to fetch
+            timeout: Request timeout in seconds
+
+        Returns:
+            AsyncResponse for the URL
+        """
+
+    async def close(self) -> None:
+        """Release resources held for the current crawl."""
+
+
+class TransportAsyncClient(AsyncHttpClient):
+    """Async client that runs the shared pooled transport in an executor.
+
+    Requests identify themselves with the ethical scraper's User-Agent and
+    are paced by a per-domain TokenBucketRateLimiter, so concurrent fetches
+    to one site still respect its politeness delay. A retryable response
+    with a ``Retry-After`` header holds back the domain and is retried.
+    """
+
+    def __init__(
+        self,
+        transport=None,
+        executor: Optional[Executor] = None,
+        user_agent: str = DEFAULT_USER_AGENT,
+        rate_limiter: Optional[TokenBucketRateLimiter] = None,
+        max_retries: int = 2,
+    ):
+        """Initialize client.
+
+        Args:
+            transport: Transport with a requests-style get(); defaults to the shared transport
+            executor: Executor for blocking requests; defaults to the loop's executor
+            user_agent: User agent sent with every request
+            rate_limiter: Per-domain rate limiter, usually shared with the
+                ethical scraper; defaults to a new TokenBucketRateLimiter
+            max_retries: Retries for responses carrying a Retry-After header
+        """
+        self.transport = transport
+        self.executor = executor
+        self.user_agent = user_agent
+        self.rate_limiter = rate_limiter or TokenBucketRateLimiter()
+        self.max_retries = max_retries
+
+    async def get(self, url: str, timeout: float = 30) -> AsyncResponse:
+        """Fetch a URL through the pooled transport without blocking the loop."""
+        transport = self.transport or get_shared_transport()
+        loop = asyncio.get_running_loop()
+        headers = {"User-Agent": self.user_agent}
+
+        for attempt in range(self.max_retries + 1):
+            # Sleep on the loop rather than in the executor, so waiting for
+            # one domain's slot never ties up a worker thread
+            wait_time = self.rate_limiter.reserve(url)
+            if wait_time > 0:
+                await asyncio.sleep(wait_time)
+
+            response = await loop.run_in_executor(
+                self.executor, lambda: transport.get(url, timeout=timeout, headers=headers)
+            )
+            response_headers = dict(getattr(response, "headers", None) or {})
+            if response.status_code not in RETRYABLE_STATUS_CODES or attempt == self.max_retries:
+                break
+            retry_after = parse_retry_after(response_headers.get("Retry-After"))
+            if retry_after is None:
+                break
+            # The next reserve() waits until the domain is released
+            self.rate_limiter.apply_retry_after(url, retry_after)
+
+        final_url = getattr(response, "url", None)
+        return AsyncResponse(
+            url=final_url if isinstance(final_url, str) else url,
+            status_code=response.status_code,
+            text=response.text,
+            headers=response_headers,
+        )
+
+
+class AiohttpClient(AsyncHttpClient):
+    """Native async client backed by an aiohttp session."""
+
+    def __init__(self, limit_per_host: int = 4, user_agent: str = DEFAULT_USER_AGENT):
+        """Initialize client.
+
+        Args:
+            limit_per_host: Maximum open connections per host
+            user_agent: User agent sent with every request
+
+        Raises:
+            ImportError: If aiohttp is not installed
+        """
+        if not AIOHTTP_AVAILABLE:
+            raise ImportError("aiohttp is required for AiohttpClient")
+        self.limit_per_host = limit_per_host
+        self.user_agent = user_agent
+        self._session = None
+
+    async def get(self, url: str, timeout: float = 30) -> AsyncResponse:
+        """Fetch a URL over the session, opening it on first use."""
+        if self._session is None:
+            connector = aiohttp.TCPConnector(limit_per_host=self.limit_per_host)
+            self._session = aiohttp.ClientSession(
+                connector=connector, headers={"User-Agent": self.user_agent}
+            )
+
+        async with self._session.get(
+            url, timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as response:
+            text = await response.text(errors="replace")
+            return AsyncResponse(
+                url=str(response.url),
+                status_code=response.status,
+                text=text,
+                headers=dict(response.headers),
+            )
+
+    async def close(self) -> None:
+        """Close the session; a new one is opened by the next crawl."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+@dataclass
+class CrawledPage:
+    """Outcome of crawling a single page."""
+
+    url: str
+    depth: int
+    html: Optional[str] = None
+    page_result: Optional[Dict[str, Any]] = None
+    links: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+    fetch_time: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        """Whether the page was fetched and processed."""
+        return self.page_result is not None
+
+
+class AsyncCrawlEngine:
+    """Crawls a website with many requests in flight on one event loop.
+
+    The frontier is a PageQueueManager, so BFS, DFS and priority ordering
+    behave as in the synchronous crawler. Fetches run concurrently up to
+    max_in_flight_per_site, while parsing, classification and extraction
+    run in an executor so they never block the event loop.
+    """
+
+    def __init__(
+        self,
+        page_discovery,
+        page_processor,
+        client: Optional[AsyncHttpClient] = None,
+        max_in_flight_per_site: int = 4,
+        max_depth: int = 2,
+        strategy: str = "BFS",
+        request_timeout: float = 30,
+        executor: Optional[Executor] = None,
+    ):
+        """Initialize crawl engine.
+
+        Args:
+            page_discovery: PageDiscovery for the website being crawled
+            page_processor: PageProcessor used to classify and extract pages
+            client: Async HTTP client; defaults to a pooled transport client
+                sharing the ethical scraper's user agent and rate limiter
+            max_in_flight_per_site: Maximum concurrent requests to the site
+            max_depth: Maximum link depth from the start page
+            strategy: Frontier ordering ("BFS", "DFS" or "priority")
+            request_timeout: Timeout for individual requests in seconds
+            executor: Executor for parsing work; defaults to the loop's executor
+
+        Raises:
+            ValueError: If any configuration value is invalid
+        """
+        if max_in_flight_per_site < 1:
+            raise ValueError("max_in_flight_per_site must be at least 1")
+        if max_depth < 0:
+            raise ValueError("max_depth must be non-negative")
+        if strategy not in TRAVERSAL_STRATEGIES:
+            raise ValueError(
+                f"Invalid strategy: {strategy}. Must be one of {', '.join(TRAVERSAL_STRATEGIES)}"
+            )
+
+        self.page_discovery = page_discovery
+        self.page_processor = page_processor
+        self.client = client or self._default_client()
+        self.max_in_flight_per_site = max_in_flight_per_site
+        self.max_depth = max_depth
+        self.strategy = strategy
+        self.request_timeout = request_timeout
+        self.executor = executor
+
+    @property
+    def max_pages(self) -> int:
+        """Maximum number of pages crawled per site."""
+        return self.page_discovery.max_pages
+
+    def crawl(
+        self, start_url: str, on_page: Optional[Callable[[CrawledPage], None]] = None
+    ) -> List[CrawledPage]:
+        """Crawl a website from synchronous code.
+
+        Args:
+            start_url: Starting URL of the website
+            on_page: Optional callback invoked as each page completes
+
+        Returns:
+            Crawled pages in completion order, starting with the start page
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.crawl_async(start_url, on_page))
+
+        # Called from inside a running loop; crawl on a separate thread's loop
+        with ThreadPoolExecutor(max_workers=1) as runner:
+            return runner.submit(
+                asyncio.run, self.crawl_async(start_url, on_page)
+            ).result()
+
+    async def crawl_async(
+        self, start_url: str, on_page: Optional[Callable[[CrawledPage], None]] = None
+    ) -> List[CrawledPage]:
+        """Crawl a website.
+
+        Args:
+            start_url: Starting URL of the website
+            on_page: Optional callback invoked as each page completes
+
+        Returns:
+            Crawled pages in completion order, starting with the start page
+        """
+        frontier = PageQueueManager(
+            self.max_pages,
+            default_strategy="BFS" if self.strategy == "priority" else self.strategy,
+        )
+        depths: Dict[str, int] = {start_url: 0}
+        self.page_discovery.discovered_pages.add(start_url)
+        frontier.add_pages_to_queue([start_url])
+
+        crawled: List[CrawledPage] = []
+        in_flight: Set[asyncio.Task] = set()
+        scheduled = 0
+
+        try:
+            while True:
+                while (
+                    len(in_flight) < self.max_in_flight_per_site
+                    and scheduled < self.max_pages
+                ):
+                    url = frontier.get_next_page()
+                    if url is None:
+                        break
+                    scheduled += 1
+                    in_flight.add(asyncio.create_task(self._crawl_page(url, depths[url])))
+
+                if not in_flight:
+                    break
+
+                done, in_flight = await asyncio.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    page = task.result()
+                    crawled.append(page)
+                    self._enqueue_links(frontier, depths, page)
+                    if on_page:
+                        on_page(page)
+        finally:
+            for task in in_flight:
+                task.cancel()
+            await self.client.close()
+
+        return crawled
+
+    def _enqueue_links(
+        self, frontier: PageQueueManager, depths: Dict[str, int], page: CrawledPage
+    ) -> None:
+        """Add links found on a crawled page to the frontier.
+
+        Args:
+            frontier: Queue of pages waiting to be crawled
+            depths: Link depth of every URL seen so far
+            page: Page whose links should be followed
+        """
+        new_links = [link for link in page.links if link not in depths]
+        if not new_links:
+            return
+
+        for link in new_links:
+            depths[link] = page.depth + 1
+        self.page_discovery.discovered_pages.update(new_links)
+
+        if self.strategy == "priority":
+            frontier.add_pages_to_queue_with_priority(
+                [(link, self.page_discovery.get_page_priority(link)) for link in new_links]
+            )
+        else:
+            # Discovery order is a set; rank links so DFS/BFS order is stable
+            frontier.add_pages_to_queue(self.page_discovery.prioritize_pages(new_links))
+
+    async def _crawl_page(self, url: str, depth: int) -> CrawledPage:
+        """Fetch, process and discover links on one page.
+
+        Args:
+            url: URL to crawl
+            depth: Link depth of the URL from the start page
+
+        Returns:
+            CrawledPage with the processing result or error
+        """
+        page = CrawledPage(url=url, depth=depth)
+        loop = asyncio.get_running_loop()
+
+        try:
+            if not await loop.run_in_executor(self.executor, self._is_allowed, url):
+                page.error = "Disallowed by robots.txt"
+                return page
+
+            start_time = time.time()
+            page.html = await self._fetch(url)
+            page.fetch_time = time.time() - start_time
+            if not page.html:
+                page.error = "Fetch failed"
+                return page
+
+            page.page_result, page.links = await loop.run_in_executor(
+                self.executor, self._process, url, page.html, depth
+            )
+        except Exception as e:
+            page.error = str(e)
+
+        return page
+
+    async def _fetch(self, url: str) -> Optional[str]:
+        """Fetch HTML for a URL, reusing the crawl's page store when attached.
+
+        Args:
+            url: URL to fetch
+
+        Returns:
+            HTML content or None if the fetch failed
+        """
+        page_store = getattr(self.page_processor, "page_store", None)
+        if page_store is not None:
+            html = page_store.get_html(url)
+            if html is not None:
+                return html
+
+        response = await self.client.get(url, timeout=self.request_timeout)
+        if response.status_code != 200 or not response.text:
+            return None
+
+        if page_store is not None:
+            page_store.put(
+                url,
+                response.text,
+                status_code=response.status_code,
+                headers=response.headers,
+                final_url=response.url,
+            )
+        return response.text
+
+    def _default_client(self) -> AsyncHttpClient:
+        """Build a transport client that paces requests like the ethical scraper."""
+        if not getattr(self.page_processor, "enable_ethical_scraping", False):
+            return TransportAsyncClient()
+        multi_scraper = getattr(self.page_processor, "multi_strategy_scraper", None)
+        ethical_scraper = getattr(multi_scraper, "ethical_scraper", None)
+
+        user_agent = getattr(ethical_scraper, "user_agent", None)
+        rate_limiter = getattr(ethical_scraper, "rate_limiter", None)
+        return TransportAsyncClient(
+            user_agent=user_agent if isinstance(user_agent, str) else DEFAULT_USER_AGENT,
+            rate_limiter=rate_limiter if isinstance(rate_limiter, TokenBucketRateLimiter) else None,
+        )
+
+    def _is_allowed(self, url: str) -> bool:
+        """Check robots.txt for a URL when ethical scraping is enabled."""
+        if not self.page_processor.enable_ethical_scraping:
+            return True
+        ethical_scraper = self.page_processor.multi_strategy_scraper.ethical_scraper
+        if ethical_scraper is None:
+            return True
+        return ethical_scraper.is_allowed_by_robots(url)
+
+    def _process(
+        self, url: str, html: str, depth: int
+    ) -> Tuple[Dict[str, Any], List[str]]:
+        """Process a fetched page and discover the links to follow.
+
+        Args:
+            url: URL of the page
+            html: HTML content of the page
+            depth: Link depth of the page
+
+        Returns:
+            Tuple of the page processing result and relevant links
+        """
+        page_result = self.page_processor.process_html(url, html)
+
+        links: List[str] = []
+        if depth < self.max_depth:
+            document = self.page_processor._get_document(url, html)
+            nav_links = self.page_discovery.discover_navigation_links(document)
+            links = sorted(self.page_discovery.filter_relevant_pages(nav_links))
+
+        return page_result, links
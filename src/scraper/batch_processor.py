@@ -1,13 +1,19 @@
 """Batch processing engine for memory-efficient URL processing."""
 import gc
+import heapq
+import itertools
 import time
 import psutil
-import threading
-from typing import List, Dict, Any, Optional, Callable
+from collections import OrderedDict, deque
+from typing import List, Dict, Any, Optional, Callable, Deque, Set, Tuple
 from dataclasses import dataclass
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from urllib.parse import urlparse
 
 from .multi_strategy_scraper import MultiStrategyScraper, RestaurantData
+from .ethical_scraper import EthicalScraper, RetryDeferred
+from .rate_limiter import TokenBucketRateLimiter
+from .response_cache import ResponseCache
 
 
 @dataclass
@@ -23,6 +29,7 @@ class BatchProgress:
     errors_count: int = 0
     memory_usage_mb: float = 0.0
     start_time: float = 0.0
+    urls_per_second: float = 0.0
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -35,6 +42,7 @@ class BatchProgress:
             "current_operation": self.current_operation,
             "errors_count": self.errors_count,
             "memory_usage_mb": self.memory_usage_mb,
+            "urls_per_second": self.urls_per_second,
             "elapsed_time": time.time() - self.start_time
             if self.start_time > 0
             else 0.0,
@@ -47,12 +55,52 @@ class BatchConfig:
 
     max_concurrent_requests: int = 3
     memory_limit_mb: int = 512
-    chunk_size: int = 10  # Process in chunks to manage memory
+    chunk_size: int = 10  # Check memory after every chunk of completed URLs
     enable_memory_monitoring: bool = True
     gc_frequency: int = 5  # Run garbage collection every N URLs
     timeout_per_url: int = 30
     enable_progressive_saving: bool = True
     save_frequency: int = 20  # Save progress every N URLs
+    per_domain_delay: float = 2.0  # Minimum delay between requests to one domain
+    max_retries: int = 3  # Attempts per URL before it is reported as failed
+    retry_backoff_base: float = 1.0  # First retry delay when no Retry-After is sent
+    max_retry_backoff: float = 60.0
+    response_cache_dir: Optional[str] = None  # Directory for cached responses; None disables caching
+    response_cache_max_mb: int = 200
+    response_cache_default_ttl: Optional[float] = None  # Seconds responses without max-age stay fresh
+    offline_replay: bool = False  # Serve pages only from the response cache
+
+
+class DeferredRetryQueue:
+    """URLs waiting for a Retry-After or backoff window to pass."""
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int, str]] = []
+        self._counter = itertools.count()
+
+    def push(self, url: str, wake_time: float) -> None:
+        """Schedule a URL to become ready again at wake_time."""
+        heapq.heappush(self._heap, (wake_time, next(self._counter), url))
+
+    def pop_due(self, now: float) -> List[str]:
+        """Remove and return URLs whose wake-up time has passed, earliest first."""
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            due.append(heapq.heappop(self._heap)[2])
+        return due
+
+    def time_until_next(self, now: float) -> Optional[float]:
+        """Get seconds until the next URL wakes up, or None if the queue is empty."""
+        if not self._heap:
+            return None
+        return max(0.0, self._heap[0][0] - now)
+
+    def clear(self) -> None:
+        """Drop all scheduled retries."""
+        self._heap.clear()
+
+    def __len__(self) -> int:
+        return len(self._heap)
 
 
 class MemoryMonitor:
@@ -88,76 +136,78 @@ class MemoryMonitor:
 
 
 class BatchProcessor:
-    """Memory-efficient batch processor for restaurant scraping."""
+    """Memory-efficient batch processor for restaurant scraping.
+
+    Up to ``max_concurrent_requests`` URLs are scraped at once. Only one
+    request per domain is in flight at a time and the shared per-domain rate
+    limiter keeps ``per_domain_delay`` between requests to the same domain,
+    so different restaurants are scraped in parallel while each site still
+    sees polite sequential traffic.
+
+    Throttled or failed fetches are not retried inline: the URL goes into a
+    DeferredRetryQueue with a wake-up time and workers move on to other
+    ready URLs until it is due.
+    """
 
     def __init__(self, config: BatchConfig = None):
         """Initialize batch processor."""
         self.config = config or BatchConfig()
-        self.scraper = MultiStrategyScraper(enable_ethical_scraping=True)
+        if self.config.max_concurrent_requests < 1:
+            raise ValueError("max_concurrent_requests must be at least 1")
+
+        self.rate_limiter = TokenBucketRateLimiter(
+            default_delay=self.config.per_domain_delay
+        )
+        ethical_scraper = EthicalScraper(
+            delay=self.config.per_domain_delay,
+            timeout=self.config.timeout_per_url,
+            rate_limiter=self.rate_limiter,
+            defer_retries=True,
+            response_cache=ResponseCache.from_config(self.config),
+        )
+        self.scraper = MultiStrategyScraper(
+            enable_ethical_scraping=True, ethical_scraper=ethical_scraper
+        )
         self.memory_monitor = MemoryMonitor(self.config.memory_limit_mb)
         self.progress = BatchProgress()
         self._stop_requested = False
+        self._urls_started = 0
+        self._retry_attempts: Dict[str, int] = {}
 
     def process_batch(
-        self, urls: List[str], progress_callback: Optional[Callable] = None
+        self,
+        urls: List[str],
+        progress_callback: Optional[Callable] = None,
+        incremental_file_handler=None,
     ) -> Dict[str, Any]:
-        """Process a batch of URLs with memory management."""
+        """Process a batch of URLs concurrently with memory management.
+
+        Args:
+            urls: URLs to scrape
+            progress_callback: Optional callback for progress updates
+            incremental_file_handler: Optional IncrementalFileHandler that is
+                given each extraction as soon as it completes
+
+        Returns:
+            Dictionary with extractions, failed URLs, errors, the number of
+            URLs processed and the processing time
+        """
         self.progress = BatchProgress(urls_total=len(urls), start_time=time.time())
+        self._urls_started = 0
+        self._retry_attempts = {}
 
         if progress_callback:
             progress_callback("Initializing batch processing...", 0)
 
-        successful_extractions = []
-        failed_urls = []
-        errors = []
+        results = {"successful": [], "failed": [], "errors": []}
 
         try:
-            # Process URLs in chunks to manage memory
-            chunk_size = min(self.config.chunk_size, len(urls))
-
-            for chunk_start in range(0, len(urls), chunk_size):
-                if self._stop_requested:
-                    break
-
-                chunk_end = min(chunk_start + chunk_size, len(urls))
-                chunk_urls = urls[chunk_start:chunk_end]
-
-                if progress_callback:
-                    progress_callback(
-                        f"Processing chunk {chunk_start//chunk_size + 1} "
-                        f"({chunk_start + 1}-{chunk_end} of {len(urls)})",
-                        int((chunk_start / len(urls)) * 100),
-                    )
-
-                # Process chunk with memory monitoring
-                chunk_results = self._process_chunk(
-                    chunk_urls, chunk_start, progress_callback
-                )
-
-                successful_extractions.extend(chunk_results["successful"])
-                failed_urls.extend(chunk_results["failed"])
-                errors.extend(chunk_results["errors"])
-
-                # Update progress
-                self.progress.urls_completed = chunk_end
-                self.progress.progress_percentage = (chunk_end / len(urls)) * 100
-
-                # Memory management between chunks
-                if self.config.enable_memory_monitoring:
-                    self.memory_monitor.force_gc_if_needed()
-
-                # Progressive saving if enabled
-                if (
-                    self.config.enable_progressive_saving
-                    and chunk_end % self.config.save_frequency == 0
-                ):
-                    if progress_callback:
-                        progress_callback(
-                            f"Saving progress... ({chunk_end} URLs processed)", None
-                        )
+            self._process_concurrently(
+                urls, results, progress_callback, incremental_file_handler
+            )
 
         except Exception as e:
-            errors.append(f"Batch processing error: {str(e)}")
+            results["errors"].append(f"Batch processing error: {str(e)}")
 
         finally:
             processing_time = time.time() - self.progress.start_time
@@ -167,102 +217,289 @@ class BatchProcessor:
 
         # Return data that can be used to create ScrapingResult
         return {
-            "successful_extractions": successful_extractions,
-            "failed_urls": failed_urls,
-            "total_processed": len(urls),
-            "errors": errors,
+            "successful_extractions": results["successful"],
+            "failed_urls": results["failed"],
+            "total_processed": self.progress.urls_completed,
+            "errors": results["errors"],
             "processing_time": processing_time,
         }
 
-    def _process_chunk(
-        self, urls: List[str], offset: int, progress_callback: Optional[Callable] = None
-    ) -> Dict[str, List]:
-        """Process a chunk of URLs with detailed progress tracking."""
-        results = {"successful": [], "failed": [], "errors": []}
-
-        for i, url in enumerate(urls):
-            if self._stop_requested:
-                break
-
-            global_index = offset + i
-
-            try:
-                # Update progress
-                self.progress.current_url = url
-                self.progress.current_operation = f"Scraping {url}"
-                self.progress.memory_usage_mb = (
-                    self.memory_monitor.get_memory_usage_mb()
-                )
-
-                # Calculate time estimate
-                if global_index > 0:
-                    elapsed = time.time() - self.progress.start_time
-                    avg_time_per_url = elapsed / global_index
-                    remaining_urls = self.progress.urls_total - global_index
-                    self.progress.estimated_time_remaining = (
-                        avg_time_per_url * remaining_urls
+    def _process_concurrently(
+        self,
+        urls: List[str],
+        results: Dict[str, List],
+        progress_callback: Optional[Callable] = None,
+        incremental_file_handler=None,
+    ) -> None:
+        """Scrape URLs on a worker pool and handle results in completion order.
+
+        Scheduling, progress reporting and file writing all happen on the
+        calling thread; worker threads only run the scraper.
+        """
+        pending = self._group_by_domain(urls)
+        retries = DeferredRetryQueue()
+        in_flight: Dict[Future, Tuple[str, str]] = {}
+        busy_domains: Set[str] = set()
+        max_workers = min(self.config.max_concurrent_requests, max(len(urls), 1))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while pending or in_flight or retries:
+                if self._stop_requested:
+                    # Let in-flight requests finish but start no new ones
+                    pending.clear()
+                    retries.clear()
+                    if not in_flight:
+                        break
+
+                # Due retries go to the front of their domain's queue
+                for url in retries.pop_due(time.time()):
+                    pending.setdefault(self._extract_domain(url), deque()).appendleft(url)
+
+                while len(in_flight) < max_workers:
+                    ready = self._pop_ready_url(pending, busy_domains)
+                    if ready is None:
+                        break
+                    domain, url = ready
+                    busy_domains.add(domain)
+                    self._notify_started(url, progress_callback)
+                    in_flight[executor.submit(self.scraper.scrape_url, url)] = (domain, url)
+
+                # Wake up on the next completion, when a domain that is
+                # cooling down may be requested again, or when a deferred
+                # retry is due, whichever is sooner
+                timeout = None
+                if len(in_flight) < max_workers:
+                    waits = [
+                        self._time_until_next_ready(pending, busy_domains),
+                        retries.time_until_next(time.time()),
+                    ]
+                    waits = [w for w in waits if w is not None]
+                    timeout = min(waits) if waits else None
+
+                if not in_flight:
+                    if timeout is None:
+                        break
+                    time.sleep(timeout)
+                    continue
+
+                done, _ = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    domain, url = in_flight.pop(future)
+                    busy_domains.discard(domain)
+                    if self._defer_retry(future, url, retries, progress_callback):
+                        continue
+                    self._handle_completed(
+                        future, url, results, progress_callback, incremental_file_handler
                     )
 
-                if progress_callback:
-                    # Enhanced progress message format for batch processing
-                    if self.progress.urls_total > 1:
-                        message = f"Processing {global_index + 1} of {self.progress.urls_total}: {url}"
-                    else:
-                        message = f"Processing {url}"
-
-                    progress_callback(
-                        message, int((global_index / self.progress.urls_total) * 100)
-                    )
+    def _defer_retry(
+        self,
+        future: Future,
+        url: str,
+        retries: DeferredRetryQueue,
+        progress_callback: Optional[Callable] = None,
+    ) -> bool:
+        """Schedule a throttled or failed URL for a later retry.
+
+        Args:
+            future: Finished scrape of the URL
+            url: URL that was scraped
+            retries: Queue of deferred retries
+            progress_callback: Optional callback for progress updates
+
+        Returns:
+            True if the URL was deferred, False if its outcome should be recorded now
+        """
+        error = future.exception()
+        if not isinstance(error, RetryDeferred):
+            return False
+
+        attempts = self._retry_attempts.get(url, 0) + 1
+        if attempts >= self.config.max_retries:
+            return False
+        self._retry_attempts[url] = attempts
+
+        delay = error.delay
+        if delay is None:
+            delay = min(
+                self.config.retry_backoff_base * (2 ** (attempts - 1)),
+                self.config.max_retry_backoff,
+            )
+        retries.push(url, time.time() + delay)
 
-                    # Add time estimation after first URL
-                    if global_index == 0 and self.progress.urls_total > 1:
-                        progress_callback(
-                            "Estimated time remaining: calculating...", None, None
-                        )
-                    elif (
-                        global_index > 0
-                        and self.progress.estimated_time_remaining > 0
-                        and self.progress.urls_total > 1
-                    ):
-                        time_str = (
-                            f"{int(self.progress.estimated_time_remaining)} seconds"
-                        )
-                        progress_callback(
-                            f"Estimated time remaining: {time_str}",
-                            None,
-                            self.progress.estimated_time_remaining,
-                        )
+        if progress_callback:
+            progress_callback(f"Retrying {url} in {delay:.1f}s ({error.reason})")
+        return True
+
+    def _group_by_domain(self, urls: List[str]) -> "OrderedDict[str, Deque[str]]":
+        """Group URLs into per-domain queues, preserving input order."""
+        pending: "OrderedDict[str, Deque[str]]" = OrderedDict()
+        for url in urls:
+            pending.setdefault(self._extract_domain(url), deque()).append(url)
+        return pending
+
+    def _extract_domain(self, url: str) -> str:
+        """Extract the rate limiting domain from a URL."""
+        return urlparse(url).netloc.split(":")[0]
+
+    def _pop_ready_url(
+        self, pending: "OrderedDict[str, Deque[str]]", busy_domains: Set[str]
+    ) -> Optional[Tuple[str, str]]:
+        """Take the next URL whose domain is idle and not cooling down.
+
+        Args:
+            pending: Per-domain URL queues
+            busy_domains: Domains with a request in flight
+
+        Returns:
+            (domain, url) tuple, or None if no domain is ready
+        """
+        for domain, queue in pending.items():
+            if domain in busy_domains:
+                continue
+            if self.rate_limiter.time_until_next_allowed(queue[0]) > 0:
+                continue
+
+            url = queue.popleft()
+            if queue:
+                # Rotate so other domains get the next free worker first
+                pending.move_to_end(domain)
+            else:
+                del pending[domain]
+            return domain, url
+
+        return None
+
+    def _time_until_next_ready(
+        self, pending: "OrderedDict[str, Deque[str]]", busy_domains: Set[str]
+    ) -> Optional[float]:
+        """Get seconds until an idle pending domain may be requested again.
+
+        Returns:
+            Shortest cooldown, or None if every pending domain is busy
+        """
+        cooldowns = [
+            self.rate_limiter.time_until_next_allowed(queue[0])
+            for domain, queue in pending.items()
+            if domain not in busy_domains
+        ]
+        return min(cooldowns) if cooldowns else None
+
+    def _notify_started(self, url: str, progress_callback: Optional[Callable]) -> None:
+        """Update progress and report that scraping of a URL has started."""
+        self.progress.current_url = url
+        self.progress.current_operation = f"Scraping {url}"
+        self.progress.memory_usage_mb = self.memory_monitor.get_memory_usage_mb()
+
+        # Retries were already counted when the URL first started
+        if url in self._retry_attempts:
+            return
+        self._urls_started += 1
+
+        if not progress_callback:
+            return
+
+        total = self.progress.urls_total
+        # Percentage reflects completed work so it never goes backwards
+        percentage = int((self.progress.urls_completed / total) * 100)
+        if total > 1:
+            message = f"Processing {self._urls_started} of {total}: {url}"
+        else:
+            message = f"Processing {url}"
+        progress_callback(message, percentage)
+
+        if total <= 1:
+            return
+        if self.progress.urls_completed == 0:
+            if self._urls_started == 1:
+                progress_callback(
+                    "Estimated time remaining: calculating...", None, None
+                )
+        elif self.progress.estimated_time_remaining > 0:
+            time_str = f"{int(self.progress.estimated_time_remaining)} seconds"
+            progress_callback(
+                f"Estimated time remaining: {time_str}",
+                None,
+                self.progress.estimated_time_remaining,
+            )
 
-                # Extract restaurant data
-                restaurant_data = self.scraper.scrape_url(url)
+    def _update_throughput(self) -> None:
+        """Recompute throughput and time remaining from completed URLs."""
+        elapsed = time.time() - self.progress.start_time
+        completed = self.progress.urls_completed
+        total = self.progress.urls_total
+
+        self.progress.progress_percentage = (completed / total) * 100 if total else 100.0
+        if elapsed > 0 and completed > 0:
+            self.progress.urls_per_second = completed / elapsed
+            self.progress.estimated_time_remaining = (
+                (total - completed) / self.progress.urls_per_second
+            )
 
-                if restaurant_data:
-                    results["successful"].append(restaurant_data)
-                    if progress_callback:
-                        progress_callback(
-                            f"Successfully extracted data for {restaurant_data.name or 'Unknown Restaurant'}"
+    def _handle_completed(
+        self,
+        future: Future,
+        url: str,
+        results: Dict[str, List],
+        progress_callback: Optional[Callable] = None,
+        incremental_file_handler=None,
+    ) -> None:
+        """Record the outcome of a finished URL and stream it to the output file."""
+        try:
+            restaurant_data = future.result()
+
+            if restaurant_data:
+                results["successful"].append(restaurant_data)
+                name = restaurant_data.name or "Unknown Restaurant"
+
+                if incremental_file_handler:
+                    try:
+                        incremental_file_handler.write_restaurant_data(restaurant_data)
+                        if progress_callback:
+                            progress_callback(
+                                f"Successfully extracted and wrote data for {name}"
+                            )
+                    except Exception as write_error:
+                        results["errors"].append(
+                            f"Error writing data for {url}: {str(write_error)}"
                         )
-                else:
-                    results["failed"].append(url)
-                    results["errors"].append(f"No restaurant data found at {url}")
-
-            except Exception as e:
+                        if progress_callback:
+                            progress_callback(
+                                f"Data extracted but write failed for {name}"
+                            )
+                elif progress_callback:
+                    progress_callback(f"Successfully extracted data for {name}")
+            else:
                 results["failed"].append(url)
-                error_msg = f"Error processing {url}: {str(e)}"
-                results["errors"].append(error_msg)
-                self.progress.errors_count += 1
-
-                if progress_callback:
-                    progress_callback(f"Error: {error_msg}")
+                results["errors"].append(f"No restaurant data found at {url}")
 
-            # Memory management during processing
-            if (
-                (global_index + 1) % self.config.gc_frequency == 0
-                and self.config.enable_memory_monitoring
-            ):
-                self.memory_monitor.force_gc_if_needed()
+        except Exception as e:
+            results["failed"].append(url)
+            error_msg = f"Error processing {url}: {str(e)}"
+            results["errors"].append(error_msg)
+            self.progress.errors_count += 1
 
-        return results
+            if progress_callback:
+                progress_callback(f"Error: {error_msg}")
+
+        self.progress.urls_completed += 1
+        self._update_throughput()
+        completed = self.progress.urls_completed
+
+        # Memory management during processing and after each chunk of URLs
+        if self.config.enable_memory_monitoring and (
+            completed % self.config.gc_frequency == 0
+            or completed % self.config.chunk_size == 0
+        ):
+            self.memory_monitor.force_gc_if_needed()
+
+        # Progressive saving notification
+        if (
+            self.config.enable_progressive_saving
+            and completed % self.config.save_frequency == 0
+            and progress_callback
+        ):
+            progress_callback(f"Saving progress... ({completed} URLs processed)", None)
 
     def stop_processing(self):
         """Request to stop batch processing."""
@@ -0,0 +1,387 @@
+"""Persistent Playwright browser pool shared by JavaScript renders."""
+import asyncio
+import atexit
+import threading
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+
+try:
+    from playwright.async_api import async_playwright
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+
+
+@dataclass
+class BrowserPoolStatistics:
+    """Statistics for browser reuse and recovery."""
+
+    browsers_launched: int = 0
+    contexts_created: int = 0
+    pages_created: int = 0
+    pages_recycled: int = 0
+    renders: int = 0
+    failed_renders: int = 0
+    crashes: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "browsers_launched": self.browsers_launched,
+            "contexts_created": self.contexts_created,
+            "pages_created": self.pages_created,
+            "pages_recycled": self.pages_recycled,
+            "renders": self.renders,
+            "failed_renders": self.failed_renders,
+            "crashes": self.crashes,
+        }
+
+
+@dataclass
+class PooledContext:
+    """Browser context with the page currently used for renders."""
+
+    context: Any
+    generation: int
+    page: Any = None
+    renders: int = 0
+
+
+class BrowserPool:
+    """Long-lived browser with a bounded set of reusable contexts.
+
+    The browser, its contexts and pages live on a dedicated event loop
+    thread, so synchronous callers and callers on any other event loop can
+    share them. Each context keeps one page that is replaced after
+    ``pages_per_context`` renders, and a crashed browser is relaunched on
+    the next render.
+    """
+
+    def __init__(
+        self,
+        launcher: Callable[[Any], Awaitable[Any]],
+        context_factory: Callable[[Any], Awaitable[Any]],
+        max_contexts: int = 2,
+        pages_per_context: int = 20,
+        on_crash: Optional[Callable[[], None]] = None,
+        playwright_factory: Optional[Callable[[], Any]] = None,
+    ):
+        """Initialize browser pool.
+
+        Args:
+            launcher: Coroutine function taking the Playwright instance and returning a Browser
+            context_factory: Coroutine function taking a Browser and returning a BrowserContext
+            max_contexts: Maximum number of contexts, i.e. concurrent renders
+            pages_per_context: Renders before a context's page is replaced
+            on_crash: Optional callback invoked when a browser crash is detected
+            playwright_factory: Callable returning an object with an async start(),
+                defaults to playwright's async_playwright
+
+        Raises:
+            ValueError: If max_contexts or pages_per_context is not positive
+        """
+        if max_contexts < 1:
+            raise ValueError("max_contexts must be at least 1")
+        if pages_per_context < 1:
+            raise ValueError("pages_per_context must be at least 1")
+
+        self.launcher = launcher
+        self.context_factory = context_factory
+        self.max_contexts = max_contexts
+        self.pages_per_context = pages_per_context
+        self.on_crash = on_crash
+        self.playwright_factory = playwright_factory
+
+        self.statistics = BrowserPoolStatistics()
+        self.lock = threading.Lock()
+        self._closed = False
+
+        # Pool thread and event loop, started on first use
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+        # State below is only touched from the pool's event loop
+        self._playwright = None
+        self._browser = None
+        self._browser_lock: Optional[asyncio.Lock] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._idle: List[PooledContext] = []
+        self._generation = 0
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the pool's event loop thread if it is not running."""
+        with self.lock:
+            if self._closed:
+                raise RuntimeError("Browser pool is closed")
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="browser-pool", daemon=True
+                )
+                thread.start()
+                self._loop, self._thread = loop, thread
+                atexit.register(self.close)
+            return self._loop
+
+    @property
+    def closed(self) -> bool:
+        """Whether the pool has been shut down."""
+        return self._closed
+
+    def render(
+        self,
+        url: str,
+        render_fn: Callable[[Any], Awaitable[str]],
+        timeout: Optional[float] = None,
+    ) -> Optional[str]:
+        """Render a page from synchronous code.
+
+        Args:
+            url: URL being rendered, for error reporting
+            render_fn: Coroutine function that renders on a pooled page and returns HTML
+            timeout: Maximum seconds to wait for the render
+
+        Returns:
+            Rendered HTML
+        """
+        future = self._submit(url, render_fn)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    async def render_async(
+        self, url: str, render_fn: Callable[[Any], Awaitable[str]]
+    ) -> Optional[str]:
+        """Render a page from any event loop.
+
+        Args:
+            url: URL being rendered, for error reporting
+            render_fn: Coroutine function that renders on a pooled page and returns HTML
+
+        Returns:
+            Rendered HTML
+        """
+        future = self._submit(url, render_fn)
+        return await asyncio.wrap_future(future)
+
+    def _submit(self, url: str, render_fn: Callable[[Any], Awaitable[str]]):
+        """Schedule a render on the pool's event loop."""
+        loop = self._ensure_loop()
+        return asyncio.run_coroutine_threadsafe(self._render(url, render_fn), loop)
+
+    def restart(self) -> None:
+        """Close the browser; the next render launches a fresh one."""
+        if self._loop is None or self._closed:
+            return
+        asyncio.run_coroutine_threadsafe(self._reset_browser(), self._loop).result()
+
+    def close(self) -> None:
+        """Close the browser and stop the pool thread."""
+        with self.lock:
+            if self._closed:
+                return
+            self._closed = True
+            loop, thread = self._loop, self._thread
+        # Drop the exit hook so a closed pool is not kept alive until exit
+        atexit.unregister(self.close)
+
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(timeout=30)
+        except Exception:
+            pass
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
+        if not thread.is_alive():
+            loop.close()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get browser reuse statistics.
+
+        Returns:
+            Dictionary with launch, context, page and render counts
+        """
+        with self.lock:
+            stats = self.statistics.to_dict()
+        stats["idle_contexts"] = len(self._idle)
+        return stats
+
+    def _record(self, counter: str) -> None:
+        """Increment a statistics counter."""
+        with self.lock:
+            setattr(self.statistics, counter, getattr(self.statistics, counter) + 1)
+
+    async def _render(self, url: str, render_fn: Callable[[Any], Awaitable[str]]) -> Optional[str]:
+        """Render on a pooled page, relaunching and retrying once after a crash."""
+        for attempt in range(2):
+            slot = await self._acquire()
+            try:
+                content = await render_fn(slot.page)
+            except Exception:
+                crashed = not self._browser_connected()
+                await self._discard(slot)
+                if crashed:
+                    await self._handle_crash()
+                    if attempt == 0:
+                        continue
+                self._record("failed_renders")
+                raise
+
+            await self._release(slot)
+            self._record("renders")
+            return content
+
+        return None
+
+    async def _acquire(self) -> PooledContext:
+        """Wait for a free context and make sure it has an open page."""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_contexts)
+        await self._slots.acquire()
+
+        try:
+            await self._ensure_browser()
+            if self._idle:
+                slot = self._idle.pop()
+            else:
+                context = await self.context_factory(self._browser)
+                slot = PooledContext(context=context, generation=self._generation)
+                self._record("contexts_created")
+
+            if slot.page is None or slot.page.is_closed():
+                slot.page = await slot.context.new_page()
+                self._record("pages_created")
+            return slot
+        except Exception:
+            self._slots.release()
+            raise
+
+    async def _release(self, slot: PooledContext) -> None:
+        """Return a context to the pool, replacing its page after enough renders."""
+        slot.renders += 1
+        if slot.renders >= self.pages_per_context:
+            await self._close_quietly(slot.page)
+            slot.page = None
+            slot.renders = 0
+            self._record("pages_recycled")
+
+        if slot.generation == self._generation:
+            self._idle.append(slot)
+        else:
+            # The browser was restarted while this context was in use
+            await self._close_quietly(slot.context)
+        self._slots.release()
+
+    async def _discard(self, slot: PooledContext) -> None:
+        """Close a context whose render failed instead of reusing it."""
+        await self._close_quietly(slot.page)
+        await self._close_quietly(slot.context)
+        self._slots.release()
+
+    async def _ensure_browser(self) -> None:
+        """Launch the browser, or relaunch it if it has disconnected."""
+        if self._browser_lock is None:
+            self._browser_lock = asyncio.Lock()
+
+        async with self._browser_lock:
+            if self._browser is not None and self._browser_connected():
+                return
+            if self._browser is not None:
+                await self._handle_crash()
+
+            if self._playwright is None:
+                self._playwright = await self._start_playwright()
+            self._browser = await self.launcher(self._playwright)
+            self._record("browsers_launched")
+
+    async def _start_playwright(self) -> Any:
+        """Start the Playwright driver shared by every browser launch."""
+        if self.playwright_factory is not None:
+            return await self.playwright_factory().start()
+        if not PLAYWRIGHT_AVAILABLE:
+            raise RuntimeError("Playwright is not installed")
+        return await async_playwright().start()
+
+    def _browser_connected(self) -> bool:
+        """Check whether the current browser process is still alive."""
+        try:
+            return self._browser is not None and self._browser.is_connected()
+        except Exception:
+            return False
+
+    async def _handle_crash(self) -> None:
+        """Record a crash and drop the dead browser and its contexts."""
+        self._record("crashes")
+        if self.on_crash:
+            try:
+                self.on_crash()
+            except Exception:
+                pass
+        await self._reset_browser()
+
+    async def _reset_browser(self) -> None:
+        """Close all idle contexts and the browser."""
+        self._generation += 1
+        idle, self._idle = self._idle, []
+        for slot in idle:
+            await self._close_quietly(slot.context)
+
+        browser, self._browser = self._browser, None
+        await self._close_quietly(browser)
+
+    async def _shutdown(self) -> None:
+        """Close the browser and stop Playwright."""
+        await self._reset_browser()
+        playwright, self._playwright = self._playwright, None
+        if playwright is not None:
+            try:
+                await playwright.stop()
+            except Exception:
+                pass
+
+    async def _close_quietly(self, resource: Any) -> None:
+        """Close a page, context or browser, ignoring errors from dead processes."""
+        if resource is None:
+            return
+        try:
+            await resource.close()
+        except Exception:
+            pass
+
+
+_shared_pools: Dict[Hashable, BrowserPool] = {}
+_shared_pools_lock = threading.Lock()
+
+
+def get_shared_browser_pool(key: Hashable, factory: Callable[[], BrowserPool]) -> BrowserPool:
+    """Get the process-wide pool for a browser configuration, creating it on first use.
+
+    Pools outlive the scrapers that use them and are closed at interpreter
+    exit, so repeated scrapes reuse one running browser.
+
+    Args:
+        key: Launch and context settings the pool was built with
+        factory: Builds the pool when no open pool exists for the key
+
+    Returns:
+        The shared pool for the key
+    """
+    with _shared_pools_lock:
+        pool = _shared_pools.get(key)
+        if pool is None or pool.closed:
+            pool = factory()
+            _shared_pools[key] = pool
+        return pool
+
+
+def close_shared_browser_pools() -> None:
+    """Close every process-wide browser pool."""
+    with _shared_pools_lock:
+        pools = list(_shared_pools.values())
+        _shared_pools.clear()
+
+    for pool in pools:
+        pool.close()
@@ -2,6 +2,7 @@
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional, Set, Union
 from src.scraper.multi_strategy_scraper import RestaurantData
+from src.scraper.entity_resolver import BlockedEntityResolver, NAME_KEYS
 import re
 from difflib import SequenceMatcher
 
@@ -176,6 +177,8 @@ class DataAggregator:
             "menu_items": self._merge_menu_items,
             "social_media": self._merge_social_media,
         }
+        self.entity_resolver = BlockedEntityResolver()
+        self.resolution_stats: Dict[str, Dict[str, int]] = {}
 
     def add_page_data(self, page_data: PageData) -> None:
         """Add data from a single page.
@@ -749,11 +752,23 @@ class DataAggregator:
 
         return cross_refs
 
+    def get_resolution_statistics(self) -> Dict[str, Dict[str, int]]:
+        """Get blocking statistics of the last entity grouping and deduplication.
+
+        Returns:
+            Statistics per resolution step, including comparisons saved
+            against comparing all pairs
+        """
+        return {step: dict(stats) for step, stats in self.resolution_stats.items()}
+
     def _group_entities_by_similarity(
         self, entities: List[RestaurantEntity], threshold: float = 0.8
     ) -> List[List[RestaurantEntity]]:
         """Group entities by name similarity.
 
+        Only entities sharing a blocking key (phone, postal code, domain,
+        street or name token) are compared, and matches merge transitively.
+
         Args:
             entities: List of entities to group
             threshold: Similarity threshold for grouping
@@ -761,34 +776,17 @@ class DataAggregator:
         Returns:
             List of entity groups
         """
-        groups = []
-        used = set()
-
-        for i, entity in enumerate(entities):
-            if i in used:
-                continue
-
-            group = [entity]
-            used.add(i)
-
-            for j, other in enumerate(entities[i + 1 :], i + 1):
-                if j in used:
-                    continue
-
-                # Check for exact name match first (higher priority)
-                if entity.name.strip().lower() == other.name.strip().lower():
-                    group.append(other)
-                    used.add(j)
-                else:
-                    # Fall back to similarity calculation
-                    similarity = entity.calculate_similarity(other)
-                    if similarity >= threshold:
-                        group.append(other)
-                        used.add(j)
+        def is_match(entity: RestaurantEntity, other: RestaurantEntity) -> bool:
+            # Check for exact name match first (higher priority)
+            if entity.name.strip().lower() == other.name.strip().lower():
+                return True
+            # Fall back to similarity calculation
+            return entity.calculate_similarity(other) >= threshold
 
-            groups.append(group)
+        groups = self.entity_resolver.resolve(entities, is_match)
+        self.resolution_stats["grouping"] = dict(self.entity_resolver.stats)
 
-        return groups
+        return [[entities[index] for index in group] for group in groups]
 
     def _merge_entity_group(self, entities: List[RestaurantEntity]) -> RestaurantEntity:
         """Merge a group of similar entities.
@@ -877,33 +875,23 @@ class DataAggregator:
         if len(entities) <= 1:
             return entities
 
-        result = []
-        used = set()
-
-        for i, entity in enumerate(entities):
-            if i in used:
-                continue
-
-            similar_entities = [entity]
-            used.add(i)
-
-            for j, other in enumerate(entities[i + 1 :], i + 1):
-                if j in used:
-                    continue
+        def is_match(entity: RestaurantEntity, other: RestaurantEntity) -> bool:
+            # Calculate name similarity only
+            name_sim = SequenceMatcher(
+                None, entity.name.lower(), other.name.lower()
+            ).ratio()
+            return name_sim >= threshold
 
-                # Calculate name similarity only
-                name_sim = SequenceMatcher(
-                    None, entity.name.lower(), other.name.lower()
-                ).ratio()
-                if name_sim >= threshold:
-                    similar_entities.append(other)
-                    used.add(j)
+        groups = self.entity_resolver.resolve(entities, is_match, kinds=NAME_KEYS)
+        self.resolution_stats["deduplication"] = dict(self.entity_resolver.stats)
 
+        result = []
+        for group in groups:
             # Merge similar entities or keep single entity
-            if len(similar_entities) == 1:
-                result.append(similar_entities[0])
+            if len(group) == 1:
+                result.append(entities[group[0]])
             else:
-                merged = self._merge_entity_group(similar_entities)
+                merged = self._merge_entity_group([entities[index] for index in group])
                 result.append(merged)
 
         return result
@@ -5,6 +5,7 @@ from datetime import datetime
 from dataclasses import dataclass
 from bs4 import BeautifulSoup
 from .enhanced_json_ld_extractor import ExtractionContext
+from .parsed_page import ParsedPage
 from .pattern_matchers import (
     PhonePatternMatcher,
     AddressPatternMatcher,
@@ -475,15 +476,32 @@ class HeuristicExtractor:
         if not html_content or not html_content.strip():
             return []
 
-        # Check if this looks like a restaurant page
+        # Check if this looks like a restaurant page before parsing
         if not self._is_restaurant_page(html_content):
             return []
 
         try:
-            soup = BeautifulSoup(html_content, "html.parser")
+            document = ParsedPage(html_content)
         except Exception:
             return []
 
+        return self._extract_from_restaurant_page(document)
+
+    def extract_from_document(
+        self, document: ParsedPage
+    ) -> List[EnhancedHeuristicExtractionResult]:
+        """Extract restaurant data from an already parsed page."""
+        if not self._is_restaurant_page(document.html):
+            return []
+
+        return self._extract_from_restaurant_page(document)
+
+    def _extract_from_restaurant_page(
+        self, document: ParsedPage
+    ) -> List[EnhancedHeuristicExtractionResult]:
+        """Extract restaurant data from a page already known to be restaurant-related."""
+        soup = document.soup
+
         # Extract data using various strategies
         extracted_data = self._extract_all_data(soup)
 
@@ -5,6 +5,7 @@ from datetime import datetime
 from dataclasses import dataclass
 from bs4 import BeautifulSoup
 from .enhanced_json_ld_extractor import ExtractionContext
+from .parsed_page import ParsedPage
 
 
 class DataCorrelator:
@@ -239,15 +240,21 @@ class MicrodataExtractor:
             return []
 
         try:
-            soup = BeautifulSoup(html_content, "html.parser")
+            document = ParsedPage(html_content)
         except Exception:
             return []
 
+        return self.extract_from_document(document)
+
+    def extract_from_document(
+        self, document: ParsedPage
+    ) -> List[EnhancedMicrodataExtractionResult]:
+        """Extract restaurant data from an already parsed page."""
         results = []
         all_extractions = []
 
-        # Find all elements with relevant itemscope and itemtype
-        microdata_elements = soup.find_all(attrs={"itemscope": True, "itemtype": True})
+        # Elements with itemscope and itemtype are indexed when the page is parsed
+        microdata_elements = document.get_microdata_items()
 
         for element in microdata_elements:
             itemtype = element.get("itemtype", "")
@@ -0,0 +1,192 @@
+"""Blocking-based entity resolution for aggregating restaurant entities."""
+import re
+from collections import defaultdict
+from itertools import combinations
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Set, Tuple
+from urllib.parse import urlparse
+
+# Kinds of blocking keys; name-only matching only needs the name keys
+NAME_KEYS = frozenset({"name", "token"})
+ALL_KEYS = frozenset({"name", "token", "phone", "postal", "domain", "street"})
+
+# Words too common in restaurant names to make useful blocks
+NAME_STOPWORDS = {"the", "and", "of", "a", "an", "at", "on", "in", "by"}
+
+# Characters of each name token used as prefix and suffix keys, so a typo
+# at one end of a word still leaves the two names in a shared block
+TOKEN_KEY_LENGTH = 4
+
+# Blocks larger than this (e.g. every listing scraped from one directory
+# domain, or a name token shared by half a city) are not compared all-pairs;
+# their members are sorted by name and compared within a sliding window
+MAX_BLOCK_SIZE = 100
+OVERSIZED_BLOCK_WINDOW = 10
+
+_POSTAL_CODE = re.compile(r"\b(\d{5})(?:-\d{4})?\b")
+_STREET = re.compile(r"\b(\d+[^\W\d_]?)\s+([^\W\d_]+)")
+_NAME_TOKEN = re.compile(r"\w+")
+
+
+def blocking_keys(entity: Any, kinds: Iterable[str] = ALL_KEYS) -> Set[str]:
+    """Get the blocking keys of an entity.
+
+    Args:
+        entity: Entity with ``name``, ``url`` and ``data`` attributes
+        kinds: Kinds of keys to build
+
+    Returns:
+        Set of keys; entities sharing any key are compared
+    """
+    kinds = set(kinds)
+    keys = set()
+    data = entity.data or {}
+
+    if "name" in kinds:
+        keys.add("name:" + entity.name.strip().lower())
+    if "token" in kinds:
+        name = entity.name.casefold().replace("'", "").replace("’", "")
+        for token in _NAME_TOKEN.findall(name):
+            if token in NAME_STOPWORDS:
+                continue
+            keys.add("token:" + token[:TOKEN_KEY_LENGTH])
+            if len(token) > TOKEN_KEY_LENGTH:
+                keys.add("token~" + token[-TOKEN_KEY_LENGTH:])
+    if "phone" in kinds:
+        digits = re.sub(r"\D", "", str(data.get("phone") or ""))
+        if len(digits) >= 7:
+            keys.add("phone:" + digits[-10:])
+    if "domain" in kinds and entity.url:
+        domain = urlparse(entity.url.strip().lower()).netloc.split(":")[0]
+        if domain.startswith("www."):
+            domain = domain[4:]
+        if domain:
+            keys.add("domain:" + domain)
+
+    address = str(data.get("address") or "").lower()
+    if "postal" in kinds:
+        postal = str(data.get("postal_code") or data.get("zip") or "")
+        match = _POSTAL_CODE.search(postal) or _POSTAL_CODE.search(address)
+        if match:
+            keys.add("postal:" + match.group(1))
+    if "street" in kinds:
+        match = _STREET.search(address)
+        if match:
+            keys.add("street:" + " ".join(match.groups()))
+
+    return keys
+
+
+class UnionFind:
+    """Disjoint sets over 0..n-1 whose roots are the lowest member index."""
+
+    def __init__(self, size: int):
+        """Initialize one set per element."""
+        self.parent = list(range(size))
+
+    def find(self, item: int) -> int:
+        """Get the root of an element, halving the path on the way."""
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, first: int, second: int) -> None:
+        """Merge the sets of two elements."""
+        root1, root2 = self.find(first), self.find(second)
+        if root1 != root2:
+            self.parent[max(root1, root2)] = min(root1, root2)
+
+
+class BlockedEntityResolver:
+    """Group matching entities while comparing only entities that share a block.
+
+    Entities are bucketed by normalized phone number, postal code, website
+    domain, street and name-token keys. Only pairs inside a bucket are
+    checked with the match function, each pair at most once, and matches
+    are merged transitively with union-find. Buckets over ``max_block_size``
+    members are sorted by name and each member is compared only with the
+    next ``window`` members.
+    """
+
+    def __init__(self, max_block_size: int = MAX_BLOCK_SIZE,
+                 window: int = OVERSIZED_BLOCK_WINDOW):
+        """Initialize resolver.
+
+        Args:
+            max_block_size: Largest block compared all-pairs
+            window: Neighbours each member of a larger block is compared with
+
+        Raises:
+            ValueError: If max_block_size or window is less than 1
+        """
+        if max_block_size < 1 or window < 1:
+            raise ValueError("max_block_size and window must be at least 1")
+        self.max_block_size = max_block_size
+        self.window = window
+        self.stats: Dict[str, int] = {}
+
+    def resolve(
+        self,
+        entities: List[Any],
+        is_match: Callable[[Any, Any], bool],
+        kinds: Iterable[str] = ALL_KEYS,
+    ) -> List[List[int]]:
+        """Group entities into sets of duplicates.
+
+        Args:
+            entities: Entities to group
+            is_match: Called with (earlier, later) entity to decide a match
+            kinds: Kinds of blocking keys to build
+
+        Returns:
+            Groups of entity indexes, ordered by their first index
+        """
+        blocks: Dict[str, List[int]] = defaultdict(list)
+        for index, entity in enumerate(entities):
+            for key in blocking_keys(entity, kinds):
+                blocks[key].append(index)
+
+        sets = UnionFind(len(entities))
+        seen: Set[Tuple[int, int]] = set()
+        comparisons = 0
+        oversized = 0
+        for members in blocks.values():
+            if len(members) > self.max_block_size:
+                oversized += 1
+            for first, second in self._block_pairs(entities, members):
+                if (first, second) in seen:
+                    continue
+                seen.add((first, second))
+                if sets.find(first) == sets.find(second):
+                    continue
+                comparisons += 1
+                if is_match(entities[first], entities[second]):
+                    sets.union(first, second)
+
+        groups: Dict[int, List[int]] = defaultdict(list)
+        for index in range(len(entities)):
+            groups[sets.find(index)].append(index)
+
+        all_pairs = len(entities) * (len(entities) - 1) // 2
+        self.stats = {
+            "entities": len(entities),
+            "blocks": len(blocks),
+            "oversized_blocks": oversized,
+            "comparisons": comparisons,
+            "all_pairs": all_pairs,
+            "comparisons_saved": all_pairs - comparisons,
+            "groups": len(groups),
+        }
+        return [groups[root] for root in sorted(groups)]
+
+    def _block_pairs(self, entities: List[Any], members: List[int]) -> Iterator[Tuple[int, int]]:
+        """Get the (earlier, later) index pairs to compare within a block."""
+        if len(members) <= self.max_block_size:
+            yield from combinations(members, 2)
+            return
+
+        ordered = sorted(members, key=lambda index: (entities[index].name.casefold(), index))
+        for position, first in enumerate(ordered):
+            for second in ordered[position + 1:position + 1 + self.window]:
+                yield (first, second) if first < second else (second, first)
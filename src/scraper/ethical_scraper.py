@@ -2,85 +2,47 @@
 import requests
 import time
 import re
-from urllib.parse import urljoin, urlparse
-from typing import Optional, Dict, Any
-from .rate_limiter import RateLimiter
-
-
-class RobotsTxtParser:
-    """Parser for robots.txt files."""
-
-    def __init__(self, robots_content: str):
-        """Initialize with robots.txt content."""
-        self.rules = self._parse_robots_txt(robots_content)
-
-    def _parse_robots_txt(self, content: str) -> Dict[str, Dict[str, list]]:
-        """Parse robots.txt content into rules."""
-        rules = {"*": {"allow": [], "disallow": []}}
-        current_user_agent = "*"
-
-        for line in content.split("\n"):
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-
-            if ":" not in line:
-                continue
-
-            key, value = line.split(":", 1)
-            key = key.strip().lower()
-            value = value.strip()
-
-            if key == "user-agent":
-                current_user_agent = value.lower()
-                if current_user_agent not in rules:
-                    rules[current_user_agent] = {"allow": [], "disallow": []}
-            elif key == "allow":
-                if current_user_agent not in rules:
-                    rules[current_user_agent] = {"allow": [], "disallow": []}
-                rules[current_user_agent]["allow"].append(value)
-            elif key == "disallow":
-                if current_user_agent not in rules:
-                    rules[current_user_agent] = {"allow": [], "disallow": []}
-                # Only add non-empty disallow rules (empty disallow means allow all)
-                if value.strip():
-                    rules[current_user_agent]["disallow"].append(value)
-
-        return rules
-
-    def is_allowed(self, path: str, user_agent: str) -> bool:
-        """Check if path is allowed for user agent."""
-        user_agent = user_agent.lower()
-
-        # Check specific user agent rules first
-        if user_agent in self.rules:
-            rules = self.rules[user_agent]
-        else:
-            rules = self.rules.get("*", {"allow": [], "disallow": []})
-
-        # Find the most specific matching rule (longest path match)
-        best_allow_match = ""
-        best_disallow_match = ""
-
-        # Check allow rules
-        for allow_path in rules.get("allow", []):
-            if allow_path and path.startswith(allow_path):
-                if len(allow_path) > len(best_allow_match):
-                    best_allow_match = allow_path
-
-        # Check disallow rules
-        for disallow_path in rules.get("disallow", []):
-            if disallow_path and path.startswith(disallow_path):
-                if len(disallow_path) > len(best_disallow_match):
-                    best_disallow_match = disallow_path
-
-        # If we have both matches, the more specific (longer) one wins
-        if best_allow_match and best_disallow_match:
-            return len(best_allow_match) >= len(best_disallow_match)
-        elif best_disallow_match:
-            return False  # Disallowed
-        else:
-            return True  # No disallow rule or explicit allow
+from typing import Optional, Dict, Any, Union
+from .integrated_rate_limiter import RateLimitStatistics
+from .response_cache import CachedResponse, ResponseCache
+from .robots_cache import (
+    RobotsCache,
+    RobotsTxtParser,
+    get_shared_robots_cache,
+    robots_path_for,
+    robots_url_for,
+)
+from .rate_limiter import (
+    RateLimiter,
+    EnhancedRateLimiter,
+    TokenBucketRateLimiter,
+    parse_retry_after,
+)
+from ..common.http_transport import PooledHttpTransport, get_shared_transport
+
+
+# Responses that mean "try again later" rather than "this page is gone"
+RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# User agent identifying the scraper to the sites it visits
+DEFAULT_USER_AGENT = "RAG_Scraper/1.0 (Ethical Restaurant Data Scraper)"
+
+
+class RetryDeferred(Exception):
+    """Raised instead of sleeping when a fetch should be retried later."""
+
+    def __init__(self, url: str, delay: Optional[float] = None, reason: str = ""):
+        """Initialize deferred retry.
+
+        Args:
+            url: URL to retry
+            delay: Seconds the server asked to wait, or None to use backoff
+            reason: Why the fetch should be retried
+        """
+        super().__init__(f"Retry {url} later: {reason}")
+        self.url = url
+        self.delay = delay
+        self.reason = reason
 
 
 class EthicalScraper:
@@ -90,16 +52,46 @@ class EthicalScraper:
         self,
         delay: float = 2.0,
         timeout: int = 30,
-        user_agent: str = "RAG_Scraper/1.0 (Ethical Restaurant Data Scraper)",
+        user_agent: str = DEFAULT_USER_AGENT,
+        transport: Optional[PooledHttpTransport] = None,
+        rate_limiter: Optional[
+            Union[RateLimiter, EnhancedRateLimiter, TokenBucketRateLimiter]
+        ] = None,
+        defer_retries: bool = False,
+        response_cache: Optional[ResponseCache] = None,
+        robots_cache: Optional[RobotsCache] = None,
     ):
-        """Initialize ethical scraper."""
+        """Initialize ethical scraper.
+
+        Args:
+            delay: Delay between requests to the same domain in seconds
+            timeout: Request timeout in seconds
+            user_agent: User agent sent with every request
+            transport: HTTP transport, defaults to the shared pooled transport
+            rate_limiter: Rate limiter shared with other scrapers; defaults to a
+                per-domain TokenBucketRateLimiter so that requests to different
+                domains never wait on each other
+            defer_retries: Raise RetryDeferred from fetch_page_with_retry instead
+                of sleeping through Retry-After and backoff windows, so the
+                caller can schedule the retry and work on other URLs meanwhile
+            response_cache: On-disk response cache; fresh entries are served
+                without a request or politeness delay and stale ones are
+                revalidated with conditional requests
+            robots_cache: Robots.txt cache, defaults to the process-wide cache
+                so robots.txt is fetched once per site across all scrapers
+        """
         self._validate_configuration(delay, timeout, user_agent)
 
         self.delay = delay
         self.timeout = timeout
         self.user_agent = user_agent
-        self.rate_limiter = RateLimiter(delay)
-        self.robots_cache = {}
+        self.rate_limiter = rate_limiter or TokenBucketRateLimiter(delay)
+        self.defer_retries = defer_retries
+        self.response_cache = response_cache
+        self.statistics = RateLimitStatistics()
+        self.robots_cache = robots_cache or get_shared_robots_cache()
+        self._crawl_delays_applied = set()
+        self.transport = transport or get_shared_transport()
         self._request_headers = self._build_request_headers()
 
     def _validate_configuration(
@@ -127,37 +119,51 @@ class EthicalScraper:
     def is_allowed_by_robots(self, url: str) -> bool:
         """Check if URL is allowed by robots.txt."""
         try:
-            parsed_url = urlparse(url)
-            base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
-            robots_url = urljoin(base_url, "/robots.txt")
-
-            # Check cache first
-            if robots_url in self.robots_cache:
-                parser = self.robots_cache[robots_url]
-            else:
-                # Fetch robots.txt
-                try:
-                    response = requests.get(robots_url, timeout=self.timeout)
-                    if response.status_code == 200:
-                        parser = RobotsTxtParser(response.text)
-                    else:
-                        parser = RobotsTxtParser("")  # Empty = allow all
-                except:
-                    parser = RobotsTxtParser("")  # Error = allow all
-
-                self.robots_cache[robots_url] = parser
-
-            return parser.is_allowed(parsed_url.path, self.user_agent)
+            robots_url = robots_url_for(url)
+            parser = self.robots_cache.get_parser(robots_url, self._fetch_robots_txt)
+
+            # The cache is shared, so pace this scraper's limiter on first sight
+            if robots_url not in self._crawl_delays_applied:
+                self._crawl_delays_applied.add(robots_url)
+                self._apply_crawl_delay(url, parser)
+
+            return parser.is_allowed(robots_path_for(url), self.user_agent)
 
         except Exception:
             return True  # Default to allowing if error
 
+    def _fetch_robots_txt(self, robots_url: str) -> str:
+        """Fetch robots.txt content; a missing file allows everything.
+
+        With a response cache the file is stored alongside the pages, and in
+        offline replay it is served from the cache without a request.
+        """
+        if self.response_cache is not None and self.response_cache.offline:
+            cached = self.response_cache.lookup(robots_url)
+            return cached.body if cached is not None else ""
+
+        response = self.transport.get(
+            robots_url,
+            headers={"User-Agent": self.user_agent},
+            timeout=self.timeout,
+        )
+        if response.status_code != 200:
+            return ""
+        if self.response_cache is not None:
+            self.response_cache.store(robots_url, response)
+        return response.text
+
     def fetch_page(self, url: str) -> Optional[str]:
         """Fetch a single page with rate limiting."""
         return self._make_request(url)
 
     def fetch_page_with_retry(self, url: str, max_retries: int = 3) -> Optional[str]:
         """Fetch page with retry logic for rate limiting and errors."""
+        if self.response_cache is not None and self.response_cache.offline:
+            return self._make_request(url)  # Retrying cannot fill a cache miss
+        if self.defer_retries:
+            return self._fetch_page_or_defer(url)
+
         for attempt in range(max_retries):
             try:
                 response = self._make_request_with_response(url)
@@ -165,7 +171,7 @@ class EthicalScraper:
                     raise Exception("Request failed")
 
                 if response.status_code == 429:  # Too Many Requests
-                    self._handle_rate_limit_response(response)
+                    self._handle_rate_limit_response(response, url)
                     continue
 
                 response.raise_for_status()
@@ -178,6 +184,34 @@ class EthicalScraper:
 
         return None
 
+    def _fetch_page_or_defer(self, url: str) -> Optional[str]:
+        """Fetch a page once, raising RetryDeferred for retryable failures.
+
+        Args:
+            url: URL to fetch
+
+        Returns:
+            HTML content, or None if the page cannot be fetched at all
+
+        Raises:
+            RetryDeferred: If the request failed or the server asked to retry later
+        """
+        response = self._make_request_with_response(url)
+        if response is None:
+            raise RetryDeferred(url, reason="request failed")
+
+        if response.status_code in RETRYABLE_STATUS_CODES:
+            delay = parse_retry_after(response.headers.get("Retry-After"))
+            if delay is not None and isinstance(self.rate_limiter, TokenBucketRateLimiter):
+                delay = self.rate_limiter.apply_retry_after(url, delay)
+            raise RetryDeferred(url, delay, f"HTTP {response.status_code}")
+
+        try:
+            response.raise_for_status()
+        except Exception:
+            return None
+        return response.text
+
     def _make_request(self, url: str) -> Optional[str]:
         """Make a single HTTP request."""
         try:
@@ -191,16 +225,84 @@ class EthicalScraper:
 
     def _make_request_with_response(self, url: str) -> Optional[requests.Response]:
         """Make HTTP request and return response object."""
+        if self.response_cache is not None:
+            return self._make_cached_request(url)
         try:
-            self.rate_limiter.wait_if_needed()
-            return requests.get(
+            self._wait_for_rate_limit(url)
+            return self.transport.get(
                 url, headers=self._request_headers, timeout=self.timeout
             )
         except Exception:
             return None
 
-    def _handle_rate_limit_response(self, response: requests.Response) -> None:
+    def _make_cached_request(self, url: str) -> Optional[requests.Response]:
+        """Serve a URL from the response cache, revalidating or fetching as needed."""
+        fresh = self.response_cache.lookup(url)
+        self.statistics.record_cache_lookup(url, hit=fresh is not None)
+        if fresh is not None:
+            return self._response_from_cache(fresh)
+        if self.response_cache.offline:
+            return None
+
+        cached = self.response_cache.get(url)
+        headers = self._request_headers
+        if cached is not None:
+            headers = {**headers, **cached.conditional_headers()}
+
+        try:
+            self._wait_for_rate_limit(url)
+            response = self.transport.get(url, headers=headers, timeout=self.timeout)
+        except Exception:
+            return None
+
+        if response.status_code == 304 and cached is not None:
+            self.statistics.record_cache_revalidation(url)
+            refreshed = self.response_cache.revalidated(url, response)
+            return self._response_from_cache(refreshed or cached)
+
+        self.response_cache.store(url, response)
+        return response
+
+    @staticmethod
+    def _response_from_cache(entry: CachedResponse) -> requests.Response:
+        """Build a response object from a cached entry."""
+        response = requests.Response()
+        response.status_code = entry.status_code
+        response.headers.update(entry.headers)
+        response.url = entry.final_url or entry.url
+        response.encoding = "utf-8"
+        response._content = entry.body.encode("utf-8")
+        return response
+
+    def _wait_for_rate_limit(self, url: str) -> float:
+        """Wait for the rate limiter before requesting a URL."""
+        if isinstance(self.rate_limiter, RateLimiter):
+            return self.rate_limiter.wait_if_needed()
+        return self.rate_limiter.wait_if_needed(url)
+
+    def _apply_crawl_delay(self, url: str, parser: RobotsTxtParser) -> None:
+        """Pace the URL's domain by its robots.txt Crawl-delay, if any."""
+        crawl_delay = parser.get_crawl_delay(self.user_agent)
+        if crawl_delay is not None and isinstance(self.rate_limiter, TokenBucketRateLimiter):
+            self.rate_limiter.set_crawl_delay(url, crawl_delay)
+
+    def get_transport_statistics(self) -> Dict[str, Any]:
+        """Get connection pooling statistics for the underlying transport."""
+        return self.transport.get_statistics()
+
+    def get_rate_limit_statistics(self) -> RateLimitStatistics:
+        """Get statistics including response cache hits, misses and revalidations."""
+        return self.statistics
+
+    def _handle_rate_limit_response(
+        self, response: requests.Response, url: Optional[str] = None
+    ) -> None:
         """Handle 429 Too Many Requests response."""
-        retry_after = response.headers.get("Retry-After")
-        if retry_after:
-            time.sleep(int(retry_after))
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is None:
+            return
+
+        # Hold back every caller sharing the limiter, not just this retry
+        if url and isinstance(self.rate_limiter, TokenBucketRateLimiter):
+            retry_after = self.rate_limiter.apply_retry_after(url, retry_after)
+        time.sleep(retry_after)
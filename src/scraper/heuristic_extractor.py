@@ -4,6 +4,7 @@ from typing import List, Dict, Any, Optional
 from bs4 import BeautifulSoup
 from dataclasses import dataclass
 from ..common.extraction_base import BaseExtractionResult
+from .parsed_page import ParsedPage
 from .pattern_matchers import (
     PhonePatternMatcher,
     AddressPatternMatcher,
@@ -130,10 +131,21 @@ class HeuristicExtractor:
             return []
 
         try:
-            soup = BeautifulSoup(html_content, "html.parser")
+            document = ParsedPage(html_content, url=url)
         except Exception:
             return []
 
+        return self.extract_from_document(document, url)
+
+    def extract_from_document(self, document: ParsedPage, url: Optional[str] = None) -> List[HeuristicExtractionResult]:
+        """Extract restaurant data from an already parsed page."""
+        html_content = document.html
+        if not html_content.strip():
+            return []
+
+        url = url or document.url
+        soup = document.soup
+
         # Check if this is a WTEG URL and use specialized extractor
         if url and 'mobimag.co/wteg' in url:
             wteg_result = self._extract_with_wteg(html_content, url)
@@ -1,13 +1,20 @@
 """Integrated rate limiter for ethical and consistent scraping."""
 
 import time
-import requests
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass, field
-from urllib.parse import urlparse, urljoin
+from urllib.parse import urlparse
 from collections import defaultdict
 import threading
 
+from .robots_cache import (
+    RobotsTxtParser,
+    get_shared_robots_cache,
+    robots_path_for,
+    robots_url_for,
+)
+from ..common.http_transport import get_shared_transport
+
 
 @dataclass
 class RateLimitStatistics:
@@ -21,6 +28,9 @@ class RateLimitStatistics:
     requests_per_domain: Dict[str, int] = field(default_factory=dict)
     unique_domains: int = 0
     performance_metrics: Dict[str, float] = field(default_factory=dict)
+    cache_hits: int = 0
+    cache_misses: int = 0
+    cache_revalidations: int = 0
     
     @property
     def average_delay_time(self) -> float:
@@ -33,6 +43,13 @@ class RateLimitStatistics:
         total_checks = self.robots_txt_allowed + self.robots_txt_disallowed
         return self.robots_txt_allowed / total_checks if total_checks > 0 else 0.0
     
+    @property
+    def cache_hit_rate(self) -> float:
+        """Get fraction of fetches answered without downloading the body."""
+        total_lookups = self.cache_hits + self.cache_misses
+        served = self.cache_hits + self.cache_revalidations
+        return served / total_lookups if total_lookups > 0 else 0.0
+    
     def record_request(self, url: str):
         """Record a request for statistics."""
         self.total_requests += 1
@@ -57,6 +74,17 @@ class RateLimitStatistics:
         else:
             self.robots_txt_disallowed += 1
     
+    def record_cache_lookup(self, url: str, hit: bool):
+        """Record a response cache lookup."""
+        if hit:
+            self.cache_hits += 1
+        else:
+            self.cache_misses += 1
+    
+    def record_cache_revalidation(self, url: str):
+        """Record a cached response revalidated with a 304 Not Modified."""
+        self.cache_revalidations += 1
+    
     def record_performance_metric(self, metric_name: str, value: float):
         """Record a performance metric."""
         self.performance_metrics[metric_name] = value
@@ -78,7 +106,11 @@ class RateLimitStatistics:
             'robots_txt_compliance_rate': self.robots_txt_compliance_rate,
             'unique_domains': self.unique_domains,
             'requests_per_domain': self.requests_per_domain,
-            'performance_metrics': self.performance_metrics
+            'performance_metrics': self.performance_metrics,
+            'cache_hits': self.cache_hits,
+            'cache_misses': self.cache_misses,
+            'cache_revalidations': self.cache_revalidations,
+            'cache_hit_rate': self.cache_hit_rate
         }
 
 
@@ -186,7 +218,7 @@ class EthicalComplianceChecker:
             user_agent: User agent string to use
         """
         self.user_agent = user_agent or "RAGScraper/1.0 (+https://example.com/bot-info)"
-        self.robots_txt_cache = {}
+        self.robots_txt_cache = get_shared_robots_cache()
         self.request_history = defaultdict(list)
     
     def check_robots_txt(self, url: str) -> Dict[str, Any]:
@@ -198,26 +230,8 @@ class EthicalComplianceChecker:
         Returns:
             Dictionary with compliance information
         """
-        parsed_url = urlparse(url)
-        domain = parsed_url.netloc
-        
-        # Check cache first
-        if domain in self.robots_txt_cache:
-            robots_txt = self.robots_txt_cache[domain]
-        else:
-            robots_txt = self.fetch_robots_txt(urljoin(f"{parsed_url.scheme}://{domain}", "/robots.txt"))
-            self.robots_txt_cache[domain] = robots_txt
-        
-        # Parse robots.txt
-        if robots_txt:
-            return self._parse_robots_txt(robots_txt, url)
-        else:
-            # If no robots.txt, assume allowed
-            return {
-                'allowed': True,
-                'crawl_delay': None,
-                'user_agent_allowed': True
-            }
+        parser = self.robots_txt_cache.get_parser(robots_url_for(url), self.fetch_robots_txt)
+        return self._evaluate_robots_txt(parser, url)
     
     def fetch_robots_txt(self, robots_url: str) -> Optional[str]:
         """Fetch robots.txt content.
@@ -227,75 +241,41 @@ class EthicalComplianceChecker:
             
         Returns:
             Robots.txt content or None if not found
+            
+        Raises:
+            requests.RequestException: If the request fails or the server
+                errors; the robots cache then allows the site only for its
+                short error TTL instead of caching allow-all for a day
         """
-        try:
-            response = requests.get(robots_url, timeout=10)
-            if response.status_code == 200:
-                return response.text
-        except requests.RequestException:
-            pass
+        response = get_shared_transport().get(
+            robots_url, headers={"User-Agent": self.user_agent}, timeout=10
+        )
+        if response.status_code == 200:
+            return response.text
+        if response.status_code >= 500:
+            response.raise_for_status()
         return None
     
-    def _parse_robots_txt(self, robots_txt: str, url: str) -> Dict[str, Any]:
-        """Parse robots.txt content.
+    def _evaluate_robots_txt(self, parser: RobotsTxtParser, url: str) -> Dict[str, Any]:
+        """Evaluate parsed robots.txt rules for a URL.
         
         Args:
-            robots_txt: Robots.txt content
+            parser: Parsed robots.txt shared with EthicalScraper
             url: URL being checked
             
         Returns:
             Dictionary with parsed information
         """
-        parsed_url = urlparse(url)
-        path = parsed_url.path
-        
-        lines = robots_txt.strip().split('\n')
-        current_user_agent = None
-        crawl_delay = None
-        disallowed_paths = []
-        allowed_paths = []
-        
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-            
-            if line.lower().startswith('user-agent:'):
-                current_user_agent = line.split(':', 1)[1].strip()
-            elif line.lower().startswith('disallow:') and current_user_agent == '*':
-                disallowed_path = line.split(':', 1)[1].strip()
-                if disallowed_path:
-                    disallowed_paths.append(disallowed_path)
-            elif line.lower().startswith('allow:') and current_user_agent == '*':
-                allowed_path = line.split(':', 1)[1].strip()
-                if allowed_path:
-                    allowed_paths.append(allowed_path)
-            elif line.lower().startswith('crawl-delay:') and current_user_agent == '*':
-                try:
-                    crawl_delay = float(line.split(':', 1)[1].strip())
-                except ValueError:
-                    crawl_delay = None
-        
-        # Check if path is disallowed
-        for disallowed_path in disallowed_paths:
-            if path.startswith(disallowed_path):
-                return {
-                    'allowed': False,
-                    'crawl_delay': crawl_delay,
-                    'user_agent_allowed': False,
-                    'disallow_reason': "Path explicitly disallowed"
-                }
-        
-        # Check if path is explicitly allowed
-        for allowed_path in allowed_paths:
-            if path.startswith(allowed_path):
-                return {
-                    'allowed': True,
-                    'crawl_delay': crawl_delay,
-                    'user_agent_allowed': True
-                }
-        
-        # Default to allowed if not explicitly disallowed
+        crawl_delay = parser.get_crawl_delay(self.user_agent)
+        
+        if not parser.is_allowed(robots_path_for(url), self.user_agent):
+            return {
+                'allowed': False,
+                'crawl_delay': crawl_delay,
+                'user_agent_allowed': False,
+                'disallow_reason': "Path explicitly disallowed"
+            }
+        
         return {
             'allowed': True,
             'crawl_delay': crawl_delay,
@@ -1,7 +1,10 @@
 """JavaScript rendering and popup handling for restaurant websites."""
-import asyncio
+import threading
 from dataclasses import dataclass
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional
+from urllib.parse import urlparse
+
+from .browser_pool import BrowserPool, get_shared_browser_pool
 
 try:
     from playwright.async_api import async_playwright, Browser, BrowserContext, Page
@@ -10,6 +13,26 @@ except ImportError:
     PLAYWRIGHT_AVAILABLE = False
 
 
+# Resource types the lean render profile never downloads; only DOM text is read
+BLOCKED_RESOURCE_TYPES = ('image', 'media', 'font')
+
+# Third-party analytics and tracking hosts blocked by the lean render profile
+TRACKER_DOMAINS = (
+    'google-analytics.com', 'googletagmanager.com', 'doubleclick.net',
+    'googlesyndication.com', 'facebook.net', 'hotjar.com', 'segment.com',
+    'segment.io', 'mixpanel.com', 'clarity.ms', 'nr-data.net',
+    'newrelic.com', 'fullstory.com', 'optimizely.com', 'quantserve.com',
+    'scorecardresearch.com', 'tiktok.com', 'snap.licdn.com'
+)
+
+# Selectors that show restaurant content has rendered
+DEFAULT_READINESS_SELECTORS = (
+    'script[type="application/ld+json"]', '[itemtype*="Restaurant"]',
+    '#menu', '.menu', '[class*="menu-item"]', '[class*="menu-section"]',
+    'address'
+)
+
+
 @dataclass
 class PopupInfo:
     """Information about detected popup."""
@@ -40,6 +63,18 @@ class JavaScriptHandler:
         self.stealth_mode = True
         self.custom_user_agent = "RAG_Scraper/1.0 Restaurant Data Collection"
         
+        # Persistent browser pool, launched on the first render
+        self.pool_size = 2
+        self.pages_per_context = 20
+        self._browser_pool: Optional[BrowserPool] = None
+        self._pool_lock = threading.Lock()
+        
+        # Render profile: 'full' waits for network idle, 'lean' blocks
+        # images, media, fonts and trackers and stops once content is ready
+        self.render_profile = 'full'
+        self.readiness_selectors = list(DEFAULT_READINESS_SELECTORS)
+        self.readiness_timeout = 5
+        
         # Performance optimizations
         self.cache_enabled = False
         self.cache_size = 100
@@ -57,7 +92,8 @@ class JavaScriptHandler:
         # Performance monitoring
         self.performance_monitoring = False
         self.metrics_collection = False
-        self._metrics = {'render_times': [], 'popup_times': [], 'success_count': 0, 'failure_count': 0}
+        self._metrics = {'render_times': [], 'popup_times': [], 'success_count': 0, 'failure_count': 0,
+                         'blocked_requests': 0, 'early_exits': 0}
         self.popup_patterns = {
             'age_verification': [
                 '.age-gate', '.age-verification', '.age-modal',
@@ -132,8 +168,12 @@ class JavaScriptHandler:
         if self.browser_automation_enabled:
             try:
                 print(f"DEBUG: Attempting browser automation for {url}")
-                # Try browser automation with Playwright
-                result = asyncio.run(self.render_page_async(url, actual_timeout))
+                # Allow for navigation plus a possible browser launch and popup handling
+                result = self._get_browser_pool().render(
+                    url,
+                    lambda page: self._render_on_page(page, url, actual_timeout),
+                    timeout=actual_timeout + self.timeout + 30,
+                )
                 if result:
                     print(f"DEBUG: Browser automation successful, content length: {len(result)}")
                     return result
@@ -158,28 +198,87 @@ class JavaScriptHandler:
             return None
         
         actual_timeout = timeout or self.timeout
-        browser = None
         
         try:
-            async with async_playwright() as p:
-                browser = await self._launch_browser(p)
-                context = await self._setup_context(browser)
-                page = await context.new_page()
-                
-                # Navigate to the page
-                await page.goto(url, timeout=actual_timeout * 1000, wait_until='networkidle')
-                
-                # Handle popups if they exist
-                content = await self._handle_popups_with_browser(page)
-                
-                return content
-                
+            return await self._get_browser_pool().render_async(
+                url, lambda page: self._render_on_page(page, url, actual_timeout)
+            )
         except Exception as e:
             print(f"Browser rendering error for {url}: {e}")
             return None
-        finally:
-            if browser:
-                await browser.close()
+
+    async def _render_on_page(self, page: Page, url: str, timeout: int) -> str:
+        """Navigate a pooled page to the URL and return its content after popups."""
+        if self.render_profile != 'lean':
+            await page.goto(url, timeout=timeout * 1000, wait_until='networkidle')
+            return await self._handle_popups_with_browser(page)
+        
+        # Lean profile: stop as soon as the DOM has the content we extract
+        await page.goto(url, timeout=timeout * 1000, wait_until='domcontentloaded')
+        await self._wait_for_content_ready(page)
+        return await self._handle_popups_with_browser(page, wait_for_network_idle=False)
+
+    async def _wait_for_content_ready(self, page: Page) -> bool:
+        """Wait until any readiness selector is attached to the DOM."""
+        if not self.readiness_selectors:
+            return False
+        try:
+            await page.wait_for_selector(
+                ', '.join(self.readiness_selectors),
+                state='attached',
+                timeout=self.readiness_timeout * 1000
+            )
+            self._metrics['early_exits'] += 1
+            return True
+        except Exception:
+            # No marker appeared; use whatever the DOM has now
+            return False
+
+    def _should_block_request(self, resource_type: str, url: str) -> bool:
+        """Check if the lean render profile should abort a request."""
+        if resource_type in BLOCKED_RESOURCE_TYPES:
+            return True
+        host = (urlparse(url).hostname or '').lower()
+        return any(host == domain or host.endswith('.' + domain) for domain in TRACKER_DOMAINS)
+
+    async def _route_request(self, route):
+        """Abort blocked requests and let everything else through."""
+        request = route.request
+        if self._should_block_request(request.resource_type, request.url):
+            self._metrics['blocked_requests'] += 1
+            await route.abort()
+        else:
+            await route.continue_()
+
+    def _get_browser_pool(self) -> BrowserPool:
+        """Get the shared browser pool for the current settings."""
+        key = (
+            self.browser_type, self.headless, self.timeout, self.stealth_mode,
+            self.custom_user_agent, self.render_profile, self.pool_size,
+            self.pages_per_context,
+        )
+        with self._pool_lock:
+            if self._browser_pool is None or self._browser_pool.closed:
+                self._browser_pool = get_shared_browser_pool(key, lambda: BrowserPool(
+                    launcher=self._launch_browser,
+                    context_factory=self._setup_context,
+                    max_contexts=self.pool_size,
+                    pages_per_context=self.pages_per_context,
+                    on_crash=self._handle_browser_crash,
+                    playwright_factory=lambda: async_playwright(),
+                ))
+            return self._browser_pool
+
+    def get_browser_pool_statistics(self) -> Dict[str, Any]:
+        """Get browser reuse statistics, empty if no browser has been used."""
+        if self._browser_pool is None:
+            return {}
+        return self._browser_pool.get_statistics()
+
+    def close(self):
+        """Release the shared browser pool; it keeps running for other scrapers."""
+        with self._pool_lock:
+            self._browser_pool = None
 
     async def _launch_browser(self, playwright_instance) -> Browser:
         """Launch browser with configured options and fallback."""
@@ -230,6 +329,10 @@ class JavaScriptHandler:
         if self.stealth_mode:
             await self._setup_stealth_mode(context)
         
+        # Routes live on the context, so every pooled page inherits them
+        if self.render_profile == 'lean':
+            await context.route('**/*', self._route_request)
+        
         return context
 
     async def _setup_stealth_mode(self, context: BrowserContext):
@@ -241,11 +344,12 @@ class JavaScriptHandler:
             });
         """)
 
-    async def _handle_popups_with_browser(self, page: Page) -> str:
+    async def _handle_popups_with_browser(self, page: Page, wait_for_network_idle: bool = True) -> str:
         """Handle popups using browser automation."""
         try:
             # Wait for page to stabilize
-            await page.wait_for_load_state('networkidle', timeout=5000)
+            if wait_for_network_idle:
+                await page.wait_for_load_state('networkidle', timeout=5000)
             
             # Detect popups using browser context
             popups = await self._detect_popups_with_browser(page)
@@ -508,6 +612,9 @@ class JavaScriptHandler:
         try:
             # Cleanup any existing resources
             self._cleanup_browser_resources()
+            # The pool launches a fresh browser on the next render
+            if self._browser_pool is not None:
+                self._browser_pool.restart()
             return True
         except Exception:
             return False
@@ -2,9 +2,9 @@
 import json
 import re
 from typing import List, Dict, Any, Optional, Union
-from bs4 import BeautifulSoup
 from dataclasses import dataclass
 from ..common.extraction_base import BaseExtractionResult
+from .parsed_page import ParsedPage
 
 
 @dataclass
@@ -29,14 +29,18 @@ class JSONLDExtractor:
     def extract_from_html(self, html_content: str) -> List[JSONLDExtractionResult]:
         """Extract restaurant data from HTML containing JSON-LD."""
         try:
-            soup = BeautifulSoup(html_content, "html.parser")
+            document = ParsedPage(html_content)
         except Exception:
             return []
 
+        return self.extract_from_document(document)
+
+    def extract_from_document(self, document: ParsedPage) -> List[JSONLDExtractionResult]:
+        """Extract restaurant data from an already parsed page."""
         results = []
 
-        # Find all JSON-LD script tags
-        json_ld_scripts = soup.find_all("script", type="application/ld+json")
+        # JSON-LD script tags are indexed when the page is parsed
+        json_ld_scripts = document.get_scripts("application/ld+json")
 
         for script in json_ld_scripts:
             try:
@@ -1,9 +1,9 @@
 """Microdata extraction engine for restaurant information."""
 import re
 from typing import List, Dict, Any, Optional
-from bs4 import BeautifulSoup
 from dataclasses import dataclass
 from ..common.extraction_base import BaseExtractionResult
+from .parsed_page import ParsedPage
 
 
 @dataclass
@@ -31,14 +31,18 @@ class MicrodataExtractor:
             return []
 
         try:
-            soup = BeautifulSoup(html_content, "html.parser")
+            document = ParsedPage(html_content)
         except Exception:
             return []
 
+        return self.extract_from_document(document)
+
+    def extract_from_document(self, document: ParsedPage) -> List[MicrodataExtractionResult]:
+        """Extract restaurant data from an already parsed page."""
         results = []
 
-        # Find all elements with relevant itemscope and itemtype
-        microdata_elements = soup.find_all(attrs={"itemscope": True, "itemtype": True})
+        # Elements with itemscope and itemtype are indexed when the page is parsed
+        microdata_elements = document.get_microdata_items()
 
         for element in microdata_elements:
             itemtype = element.get("itemtype", "").strip()
@@ -19,6 +19,7 @@ class MultiPageScrapingResult:
     aggregated_data: Optional[RestaurantData] = None
     processing_time: float = 0.0
     data_sources_summary: Dict[str, Any] = field(default_factory=dict)
+    fetch_statistics: Dict[str, Any] = field(default_factory=dict)
 
 
 @dataclass
@@ -90,37 +91,49 @@ class MultiPageResultHandler:
             try:
                 # Process individual page
                 page_result = self.page_processor._fetch_and_process_page(page_url)
-
-                if page_result:
-                    result.successful_pages.append(page_url)
-
-                    # Create PageData from result
-                    page_data = self._create_page_data_from_result(page_url, page_result)
-                    self.data_aggregator.add_page_data(page_data)
-
-                    # Notify success
-                    if progress_callback:
-                        self.progress_notifier.notify_page_complete(
-                            page_url, page_result["page_type"], True, progress_callback
-                        )
-                else:
-                    result.failed_pages.append(page_url)
-
-                    # Notify failure
-                    if progress_callback:
-                        self.progress_notifier.notify_page_complete(
-                            page_url, "unknown", False, progress_callback
-                        )
+                self.record_page_result(result, page_url, page_result, progress_callback)
 
             except Exception as e:
-                result.failed_pages.append(page_url)
-                if progress_callback:
-                    self.progress_notifier.notify_page_complete(
-                        page_url, "unknown", False, progress_callback
-                    )
+                self.record_page_result(result, page_url, None, progress_callback)
 
         return result
 
+    def record_page_result(
+        self,
+        result: PageProcessingResult,
+        page_url: str,
+        page_result: Optional[Dict[str, Any]],
+        progress_callback: Optional[Callable] = None
+    ) -> None:
+        """Record the outcome of processing one page.
+
+        Args:
+            result: PageProcessingResult to update
+            page_url: URL of the processed page
+            page_result: Result from page processing, or None if it failed
+            progress_callback: Optional progress callback
+        """
+        if page_result:
+            result.successful_pages.append(page_url)
+
+            # Create PageData from result
+            page_data = self._create_page_data_from_result(page_url, page_result)
+            self.data_aggregator.add_page_data(page_data)
+
+            # Notify success
+            if progress_callback:
+                self.progress_notifier.notify_page_complete(
+                    page_url, page_result["page_type"], True, progress_callback
+                )
+        else:
+            result.failed_pages.append(page_url)
+
+            # Notify failure
+            if progress_callback:
+                self.progress_notifier.notify_page_complete(
+                    page_url, "unknown", False, progress_callback
+                )
+
     def finalize_scraping_result(
         self,
         result: MultiPageScrapingResult,
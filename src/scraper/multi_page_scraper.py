@@ -12,6 +12,8 @@ from .multi_page_result_handler import (
     PageProcessingResult
 )
 from .data_aggregator import DataAggregator
+from .page_store import PageStore
+from .async_crawler import AsyncCrawlEngine, CrawledPage
 
 # Import the refactored version
 from .multi_page_scraper_refactored import (
@@ -59,6 +61,8 @@ class MultiPageScraper:
                 self.config = None
             self.max_pages = max_pages
             self.enable_ethical_scraping = enable_ethical_scraping
+
+        self.crawl_mode = self.config.crawl_mode if self.config is not None else "sync"
         
         # Initialize the refactored implementation
         self._refactored_scraper = RefactoredMultiPageScraper(
@@ -85,6 +89,7 @@ class MultiPageScraper:
         self.page_processor = PageProcessor(self.multi_strategy_scraper)
         self.result_handler = MultiPageResultHandler(self.progress_notifier, self.data_aggregator, self.page_processor)
         self.page_queue_manager = PageQueueManager()
+        self.page_store: Optional[PageStore] = None
         
         # Call initialize_components for backward compatibility with characterization tests
         if self.config is not None:
@@ -115,9 +120,17 @@ class MultiPageScraper:
         result = self.result_handler.create_scraping_result()
 
         try:
+            # Fresh page store per crawl: discovery, classification and
+            # extraction all read each page from here after a single fetch
+            self.page_store = PageStore()
+            self.page_processor.page_store = self.page_store
+
             # Initialize page discovery for this website
             from .page_discovery import PageDiscovery
-            self.page_discovery = PageDiscovery(url, self.max_pages)
+            self.page_discovery = PageDiscovery(
+                url, self.max_pages, page_store=self.page_store,
+                robots_checker=self.page_processor.is_allowed,
+            )
 
             # Reset data aggregator for this website
             self.data_aggregator = DataAggregator()
@@ -125,6 +138,9 @@ class MultiPageScraper:
             # Update result handler with fresh aggregator
             self.result_handler.data_aggregator = self.data_aggregator
 
+            if self.crawl_mode == "async":
+                return self._scrape_website_async(url, progress_callback, result, start_time)
+
             # Fetch initial page to start discovery
             initial_html = self._fetch_page(url)
             if not initial_html:
@@ -159,6 +175,7 @@ class MultiPageScraper:
             result = self.result_handler.finalize_scraping_result(
                 result, start_time, time.time()
             )
+            result.fetch_statistics = self.page_store.get_statistics()
 
             # Notify completion
             self.result_handler.notify_completion(
@@ -180,6 +197,70 @@ class MultiPageScraper:
 
         return result
 
+    def _scrape_website_async(
+        self,
+        url: str,
+        progress_callback: Optional[Callable],
+        result: MultiPageScrapingResult,
+        start_time: float,
+    ) -> MultiPageScrapingResult:
+        """Crawl a website with the asyncio engine, processing pages as they arrive.
+
+        Args:
+            url: Starting URL of the restaurant website
+            progress_callback: Optional callback for progress updates
+            result: Scraping result to fill in
+            start_time: Time the scrape started
+
+        Returns:
+            MultiPageScrapingResult with aggregated data
+        """
+        engine = AsyncCrawlEngine(
+            self.page_discovery,
+            self.page_processor,
+            max_in_flight_per_site=self.config.max_in_flight_per_site,
+            max_depth=self.config.max_crawl_depth,
+            strategy=self.config.traversal_strategy,
+            request_timeout=self.config.request_timeout or 30,
+        )
+        page_results = PageProcessingResult()
+
+        def on_page(page: CrawledPage):
+            if page.depth == 0:
+                if page.html is None:
+                    return
+                result.restaurant_name = self._extract_restaurant_name(page.html)
+                self.progress_notifier.initialize_restaurant(result.restaurant_name, [url])
+
+            # Pages are discovered while crawling, so the total grows as we go
+            self.progress_notifier.state.total_pages = min(
+                len(self.page_discovery.discovered_pages), self.max_pages
+            )
+            self.result_handler.record_page_result(
+                page_results, page.url, page.page_result, progress_callback
+            )
+
+        crawled = engine.crawl(url, on_page)
+        if not crawled or crawled[0].html is None:
+            result.failed_pages.append(url)
+            return result
+
+        result.pages_processed = [page.url for page in crawled]
+        result.successful_pages = page_results.successful_pages
+        result.failed_pages = page_results.failed_pages
+
+        result = self.result_handler.finalize_scraping_result(
+            result, start_time, time.time()
+        )
+        result.fetch_statistics = self.page_store.get_statistics()
+
+        self.result_handler.notify_completion(
+            len(result.successful_pages),
+            len(result.failed_pages),
+            progress_callback
+        )
+        return result
+
     def _fetch_page(self, url: str) -> Optional[str]:
         """Fetch HTML content from a URL.
 
@@ -8,6 +8,10 @@ from .multi_strategy_scraper import MultiStrategyScraper
 from .page_processor import PageProcessor
 from .multi_page_result_handler import MultiPageResultHandler
 from .page_queue_manager import PageQueueManager
+from .async_crawler import TRAVERSAL_STRATEGIES
+
+
+CRAWL_MODES = ("sync", "async")
 
 
 class MultiPageScraperConfig:
@@ -21,6 +25,9 @@ class MultiPageScraperConfig:
         concurrent_workers: int = 3,
         throttle_delay: float = 0.0,
         request_timeout: Optional[float] = None,
+        crawl_mode: str = "sync",
+        max_in_flight_per_site: int = 4,
+        traversal_strategy: str = "BFS",
     ):
         """Initialize configuration with validation.
         
@@ -31,6 +38,9 @@ class MultiPageScraperConfig:
             concurrent_workers: Number of concurrent workers for parallel processing
             throttle_delay: Delay between requests in seconds
             request_timeout: Timeout for individual requests (None for no timeout)
+            crawl_mode: "sync" for sequential crawling, "async" for the asyncio crawl engine
+            max_in_flight_per_site: Maximum concurrent requests per site in async mode
+            traversal_strategy: Page ordering in async mode ("BFS", "DFS" or "priority")
             
         Raises:
             ValueError: If any configuration value is invalid
@@ -41,6 +51,9 @@ class MultiPageScraperConfig:
             concurrent_workers=concurrent_workers,
             throttle_delay=throttle_delay,
             request_timeout=request_timeout,
+            crawl_mode=crawl_mode,
+            max_in_flight_per_site=max_in_flight_per_site,
+            traversal_strategy=traversal_strategy,
         )
         
         self.max_pages = max_pages
@@ -49,6 +62,9 @@ class MultiPageScraperConfig:
         self.concurrent_workers = concurrent_workers
         self.throttle_delay = throttle_delay
         self.request_timeout = request_timeout
+        self.crawl_mode = crawl_mode
+        self.max_in_flight_per_site = max_in_flight_per_site
+        self.traversal_strategy = traversal_strategy
 
     def _validate_config(
         self,
@@ -57,6 +73,9 @@ class MultiPageScraperConfig:
         concurrent_workers: int,
         throttle_delay: float,
         request_timeout: Optional[float],
+        crawl_mode: str = "sync",
+        max_in_flight_per_site: int = 4,
+        traversal_strategy: str = "BFS",
     ):
         """Validate configuration parameters.
         
@@ -66,6 +85,9 @@ class MultiPageScraperConfig:
             concurrent_workers: Number of concurrent workers
             throttle_delay: Delay between requests in seconds
             request_timeout: Timeout for individual requests
+            crawl_mode: Crawl mode ("sync" or "async")
+            max_in_flight_per_site: Maximum concurrent requests per site
+            traversal_strategy: Async traversal strategy
             
         Raises:
             ValueError: If any configuration value is invalid
@@ -85,6 +107,17 @@ class MultiPageScraperConfig:
         if request_timeout is not None and request_timeout <= 0:
             raise ValueError("request_timeout must be positive when set")
 
+        if crawl_mode not in CRAWL_MODES:
+            raise ValueError(f"crawl_mode must be one of {', '.join(CRAWL_MODES)}")
+
+        if max_in_flight_per_site <= 0:
+            raise ValueError("max_in_flight_per_site must be positive")
+
+        if traversal_strategy not in TRAVERSAL_STRATEGIES:
+            raise ValueError(
+                f"traversal_strategy must be one of {', '.join(TRAVERSAL_STRATEGIES)}"
+            )
+
     def initialize_components(self) -> Dict[str, Any]:
         """Initialize all required components for scraping.
         
@@ -152,6 +185,9 @@ class MultiPageScraperConfig:
             'concurrent_workers': self.concurrent_workers,
             'throttle_delay': self.throttle_delay,
             'request_timeout': self.request_timeout,
+            'crawl_mode': self.crawl_mode,
+            'max_in_flight_per_site': self.max_in_flight_per_site,
+            'traversal_strategy': self.traversal_strategy,
         }
 
     def update_config(self, **kwargs):
@@ -170,6 +206,11 @@ class MultiPageScraperConfig:
             'concurrent_workers': kwargs.get('concurrent_workers', self.concurrent_workers),
             'throttle_delay': kwargs.get('throttle_delay', self.throttle_delay),
             'request_timeout': kwargs.get('request_timeout', self.request_timeout),
+            'crawl_mode': kwargs.get('crawl_mode', self.crawl_mode),
+            'max_in_flight_per_site': kwargs.get(
+                'max_in_flight_per_site', self.max_in_flight_per_site
+            ),
+            'traversal_strategy': kwargs.get('traversal_strategy', self.traversal_strategy),
         }
         
         # Validate new configuration
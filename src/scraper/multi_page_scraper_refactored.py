@@ -12,6 +12,8 @@ import time
 import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from ..common.http_transport import get_shared_transport
+from .page_store import PageStore
 from .multi_page_result_handler import (
     MultiPageResultHandler,
     MultiPageScrapingResult,
@@ -183,6 +185,7 @@ class RefactoredMultiPageScraper:
         self.page_processor = page_processor or SimplifiedPageProcessor()
         self.data_aggregator = data_aggregator or SimplifiedDataAggregator()
         self.page_discovery = page_discovery or SimplifiedPageDiscovery(max_pages)
+        self.page_store: Optional[PageStore] = None
         
         # Simple statistics
         self.stats = {
@@ -207,6 +210,7 @@ class RefactoredMultiPageScraper:
             MultiPageScrapingResult with aggregated data
         """
         self.stats['start_time'] = time.time()
+        self.page_store = PageStore()
         
         try:
             # Fetch initial page
@@ -276,19 +280,25 @@ class RefactoredMultiPageScraper:
     
     def _fetch_page(self, url: str) -> Optional[str]:
         """
-        Fetch a page's HTML content.
+        Fetch a page's HTML content, reusing pages already fetched this crawl.
+        """
+        if self.page_store is not None:
+            return self.page_store.fetch(url, self._download_page)
+        return self._download_page(url)
+    
+    def _download_page(self, url: str) -> Optional[str]:
+        """
+        Download a page's HTML content.
         
-        This is a simplified version - in real implementation would use
-        the existing HTTP client with proper error handling.
+        Requests go through the shared pooled transport so repeated fetches
+        to the same site reuse open connections.
         """
         try:
-            import requests
-            
             # Respect ethical scraping
             if self.enable_ethical_scraping:
                 time.sleep(1)  # Simple rate limiting
             
-            response = requests.get(url, timeout=10)
+            response = get_shared_transport().get(url, timeout=10)
             response.raise_for_status()
             return response.text
             
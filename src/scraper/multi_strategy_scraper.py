@@ -1,14 +1,27 @@
 """Multi-strategy restaurant data scraper combining all extraction methods."""
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
 from .json_ld_extractor import JSONLDExtractor, JSONLDExtractionResult
 from .microdata_extractor import MicrodataExtractor, MicrodataExtractionResult
 from .heuristic_extractor import HeuristicExtractor, HeuristicExtractionResult
+from .parsed_page import ParsedPage
 from .ethical_scraper import EthicalScraper
 from .javascript_handler import JavaScriptHandler, PopupInfo
+from .render_decision_cache import RenderDecisionCache
+from .response_cache import ResponseCache
 from .restaurant_popup_detector import RestaurantPopupDetector
 from ..config.scraping_config import ScrapingConfig
+from ..common.http_transport import get_shared_transport
+
+
+# Fields whose absence justifies paying for a browser render
+KEY_FIELDS = ("name", "address", "menu_items")
+
+# JSON-LD, microdata and heuristic results extracted from one page
+ExtractionResults = Tuple[
+    List[JSONLDExtractionResult], List[MicrodataExtractionResult], List[HeuristicExtractionResult]
+]
 
 
 @dataclass
@@ -27,6 +40,7 @@ class RestaurantData:
     confidence: str = "medium"
     sources: List[str] = None
     ai_analysis: Optional[Dict[str, Any]] = None
+    source_url: str = ""  # Page or site the data was scraped from
 
     def __post_init__(self):
         if self.menu_items is None:
@@ -79,7 +93,9 @@ class MultiStrategyScraper:
         if ethical_scraper:
             self.ethical_scraper = ethical_scraper
         elif enable_ethical_scraping:
-            self.ethical_scraper = EthicalScraper()
+            self.ethical_scraper = EthicalScraper(
+                response_cache=ResponseCache.from_config(config)
+            )
         else:
             self.ethical_scraper = None
 
@@ -98,15 +114,30 @@ class MultiStrategyScraper:
             if should_enable_automation and self.javascript_handler.browser_automation_enabled:
                 self.javascript_handler.browser_type = config.browser_type
                 self.javascript_handler.headless = config.headless_browser
+                self.javascript_handler.pool_size = config.browser_pool_size
+                self.javascript_handler.pages_per_context = config.pages_per_context
+                self.javascript_handler.render_profile = config.render_profile
+                self.javascript_handler.readiness_timeout = config.readiness_timeout
+                if config.readiness_selectors:
+                    self.javascript_handler.readiness_selectors = list(config.readiness_selectors)
                 print(f"DEBUG: Browser configured: type={config.browser_type}, headless={config.headless_browser}")
+            self.render_decisions = RenderDecisionCache.from_config(config)
         else:
             self.javascript_handler = None
+            self.render_decisions = None
 
         if config and config.enable_popup_detection:
             self.popup_detector = RestaurantPopupDetector()
         else:
             self.popup_detector = None
 
+    def close(self):
+        """Release the shared browser and save pending render decisions."""
+        if self.javascript_handler is not None:
+            self.javascript_handler.close()
+        if self.render_decisions is not None:
+            self.render_decisions.flush()
+
     def scrape_url(self, url: str) -> Optional[RestaurantData]:
         """Scrape a single URL using all available strategies."""
         # Check robots.txt if ethical scraping is enabled
@@ -118,32 +149,66 @@ class MultiStrategyScraper:
             html_content = self.ethical_scraper.fetch_page_with_retry(url)
         else:
             # Fallback for testing without rate limiting
-            import requests
-
             try:
-                response = requests.get(url, timeout=30)
+                response = get_shared_transport().get(url, timeout=30)
                 html_content = response.text
             except:
                 html_content = None
 
+        return self.scrape_html(url, html_content)
+
+    def scrape_html(
+        self,
+        url: str,
+        html_content: Optional[str],
+        document: Optional[ParsedPage] = None,
+    ) -> Optional[RestaurantData]:
+        """Extract restaurant data from HTML that has already been fetched.
+
+        Args:
+            url: URL the HTML was fetched from
+            html_content: Page HTML
+            document: Optional already parsed page for the same HTML
+
+        Returns:
+            RestaurantData or None if nothing could be extracted
+        """
         if not html_content:
             return None
 
         # Process JavaScript and handle popups if enabled
-        html_content = self._process_javascript_and_popups(html_content, url)
-
-        # Extract data using all strategies
-        return self._extract_with_all_strategies(html_content, url)
+        processed_content, results = self._process_javascript_and_popups(
+            html_content, url, document
+        )
 
-    def _process_javascript_and_popups(self, html_content: str, url: str) -> str:
-        """Process JavaScript rendering and handle popups."""
+        # A parse of the original HTML is only reusable if processing left it unchanged
+        if processed_content is not html_content:
+            document = None
+
+        # Extract data using all strategies, reusing results from the render decision
+        if results is not None:
+            return self._extract_with_all_strategies(processed_content, url, document, results)
+        if document is not None:
+            return self._extract_with_all_strategies(processed_content, url, document)
+        return self._extract_with_all_strategies(processed_content, url)
+
+    def _process_javascript_and_popups(
+        self, html_content: str, url: str, document: Optional[ParsedPage] = None
+    ) -> Tuple[str, Optional[ExtractionResults]]:
+        """Process JavaScript rendering and handle popups.
+
+        Returns:
+            Processed HTML, and the extraction results for it when the render
+            decision already ran the extractors over that HTML
+        """
+        results = None
+        results_content = None
         try:
             # Check if JavaScript rendering is required and enabled
             if (self.javascript_handler and 
                 self.javascript_handler.is_javascript_required(html_content)):
-                rendered_content = self.javascript_handler.render_page(url)
-                if rendered_content:
-                    html_content = rendered_content
+                html_content, results = self._render_if_useful(html_content, url, document)
+                results_content = html_content
 
             # Detect and handle popups if enabled
             if self.popup_detector:
@@ -155,7 +220,77 @@ class MultiStrategyScraper:
             # Log error but continue with original content
             print(f"JavaScript/popup processing error for {url}: {e}")
 
-        return html_content
+        if results_content is not html_content:
+            results = None
+        return html_content, results
+
+    def _render_if_useful(
+        self, html_content: str, url: str, document: Optional[ParsedPage] = None
+    ) -> Tuple[str, Optional[ExtractionResults]]:
+        """Render the page only if static extraction misses key fields.
+
+        Static extractors run first; the browser is used only when name,
+        address or menu is missing and rendering has not proven useless for
+        the domain. Each render's outcome is recorded per domain.
+
+        Args:
+            html_content: Static page HTML
+            url: Page URL
+            document: Optional already parsed page for the static HTML
+
+        Returns:
+            Rendered HTML, or the static HTML if rendering was skipped or
+            failed, with the extraction results for the returned HTML
+        """
+        static_results = self._run_static_extractors(html_content, url, document)
+        static_missing = self._missing_key_fields(static_results)
+        if not static_missing or not self.render_decisions.should_render(url):
+            self.render_decisions.record_avoided(url)
+            return html_content, static_results
+
+        rendered_content = self.javascript_handler.render_page(url)
+        if not rendered_content:
+            self.render_decisions.record_render(url, improved=False)
+            return html_content, static_results
+
+        rendered_results = self._run_static_extractors(rendered_content, url)
+        rendered_missing = self._missing_key_fields(rendered_results)
+        self.render_decisions.record_render(
+            url, improved=len(rendered_missing) < len(static_missing)
+        )
+        return rendered_content, rendered_results
+
+    def _run_static_extractors(
+        self, html_content: str, url: Optional[str], document: Optional[ParsedPage] = None
+    ) -> Optional[ExtractionResults]:
+        """Run the JSON-LD, microdata and heuristic extractors over one parse of the HTML."""
+        if document is None:
+            try:
+                document = ParsedPage(html_content, url=url)
+            except Exception:
+                return None
+
+        return (
+            self.json_ld_extractor.extract_from_document(document),
+            self.microdata_extractor.extract_from_document(document),
+            self.heuristic_extractor.extract_from_document(document, url),
+        )
+
+    @staticmethod
+    def _missing_key_fields(results: Optional[ExtractionResults]) -> List[str]:
+        """List the key fields that no static extractor found."""
+        if results is None:
+            return list(KEY_FIELDS)
+        return [
+            name for name in KEY_FIELDS
+            if not any(getattr(result, name, None) for group in results for result in group)
+        ]
+
+    def get_render_statistics(self) -> Dict[str, Any]:
+        """Get JavaScript render decision statistics, including renders avoided."""
+        if self.render_decisions is None:
+            return {}
+        return self.render_decisions.get_statistics()
 
     def _handle_detected_popups(self, html_content: str, popups: List[dict]) -> str:
         """Handle detected popups based on configuration."""
@@ -184,14 +319,26 @@ class MultiStrategyScraper:
             
         return html_content
 
-    def _extract_with_all_strategies(self, html_content: str, url: Optional[str] = None) -> Optional[RestaurantData]:
-        """Extract data using all strategies and merge results."""
-        json_ld_results = self.json_ld_extractor.extract_from_html(html_content)
-        microdata_results = self.microdata_extractor.extract_from_html(html_content)
-        heuristic_results = self.heuristic_extractor.extract_from_html(html_content, url)
+    def _extract_with_all_strategies(
+        self,
+        html_content: str,
+        url: Optional[str] = None,
+        document: Optional[ParsedPage] = None,
+        results: Optional[ExtractionResults] = None,
+    ) -> Optional[RestaurantData]:
+        """Extract data using all strategies and merge results.
 
+        The HTML is parsed once and the resulting document is shared by all
+        extractors. Results already extracted from the same HTML are merged
+        without running the extractors again.
+        """
+        if results is None:
+            results = self._run_static_extractors(html_content, url, document)
+            if results is None:
+                return None
 
         # Merge results with priority: JSON-LD > Microdata > Heuristic
+        json_ld_results, microdata_results, heuristic_results = results
         merged_data = self._merge_extraction_results(
             json_ld_results, microdata_results, heuristic_results, url
         )
@@ -262,7 +409,9 @@ class MultiStrategyScraper:
             parsed = urlparse(url)
             website_url = f"{parsed.scheme}://{parsed.netloc}/"
         
-        merged = RestaurantData(name=final_name, sources=sources, website=website_url)
+        merged = RestaurantData(
+            name=final_name, sources=sources, website=website_url, source_url=url or ""
+        )
 
         # Merge fields with priority order
         self._merge_field(merged, all_results, "address")
@@ -1,8 +1,9 @@
 """Page type classification for multi-page restaurant websites."""
 import re
-from typing import Dict, Optional
+from typing import Dict, Optional, Union
 from urllib.parse import urlparse
-from bs4 import BeautifulSoup
+
+from .parsed_page import ParsedPage
 
 
 class PageClassifier:
@@ -138,12 +139,12 @@ class PageClassifier:
         },
     }
 
-    def classify_page(self, url: str, html_content: str) -> str:
+    def classify_page(self, url: str, html_content: Union[str, ParsedPage]) -> str:
         """Classify a page based on its URL and content.
 
         Args:
             url: URL of the page
-            html_content: HTML content of the page
+            html_content: HTML content of the page or an already parsed page
 
         Returns:
             Page type classification ('menu', 'contact', 'about', 'hours', 'home', 'unknown')
@@ -176,58 +177,67 @@ class PageClassifier:
 
         return "unknown"
 
-    def classify_by_content(self, html_content: str) -> str:
+    def classify_by_content(self, html_content: Union[str, ParsedPage]) -> str:
         """Classify page type based on HTML content analysis.
 
         Args:
-            html_content: HTML content to analyze
+            html_content: HTML content to analyze or an already parsed page
 
         Returns:
             Page type or 'unknown' if classification is unclear
         """
-        soup = BeautifulSoup(html_content, "html.parser")
+        type_scores = self._score_page_types(ParsedPage.ensure(html_content))
 
-        # Score each page type based on content indicators
+        # Return the page type with highest score if above threshold
+        max_score = max(type_scores.values()) if type_scores else 0
+        if max_score > 0:
+            # Find page type with highest score
+            for page_type, score in type_scores.items():
+                if score == max_score:
+                    return page_type
+
+        return "unknown"
+
+    def _score_page_types(self, document: ParsedPage) -> Dict[str, int]:
+        """Score each page type based on content indicators.
+
+        Args:
+            document: Parsed page to score
+
+        Returns:
+            Dictionary mapping page types to raw scores
+        """
         type_scores = {}
 
         for page_type, indicators in self.CONTENT_INDICATORS.items():
             score = 0
 
             # Check headings
-            score += self._score_headings(soup, indicators["headings"])
+            score += self._score_headings(document, indicators["headings"])
 
             # Check CSS classes
-            score += self._score_classes(soup, indicators["classes"])
+            score += self._score_classes(document, indicators["classes"])
 
             # Check keyword density
-            score += self._score_keywords(soup, indicators["keywords"])
+            score += self._score_keywords(document, indicators["keywords"])
 
             type_scores[page_type] = score
 
-        # Return the page type with highest score if above threshold
-        max_score = max(type_scores.values()) if type_scores else 0
-        if max_score > 0:
-            # Find page type with highest score
-            for page_type, score in type_scores.items():
-                if score == max_score:
-                    return page_type
-
-        return "unknown"
+        return type_scores
 
-    def _score_headings(self, soup: BeautifulSoup, heading_keywords: list) -> int:
+    def _score_headings(self, document: ParsedPage, heading_keywords: list) -> int:
         """Score page based on heading content.
 
         Args:
-            soup: BeautifulSoup object
+            document: Parsed page
             heading_keywords: List of keywords to look for in headings
 
         Returns:
             Score based on heading matches
         """
         score = 0
-        headings = soup.find_all(["h1", "h2", "h3", "h4", "h5", "h6"])
 
-        for heading in headings:
+        for heading in document.headings:
             heading_text = heading.get_text().lower()
             for keyword in heading_keywords:
                 if keyword in heading_text:
@@ -241,11 +251,11 @@ class PageClassifier:
 
         return score
 
-    def _score_classes(self, soup: BeautifulSoup, class_keywords: list) -> int:
+    def _score_classes(self, document: ParsedPage, class_keywords: list) -> int:
         """Score page based on CSS class names.
 
         Args:
-            soup: BeautifulSoup object
+            document: Parsed page
             class_keywords: List of class keywords to look for
 
         Returns:
@@ -253,28 +263,25 @@ class PageClassifier:
         """
         score = 0
 
-        for element in soup.find_all(class_=True):
-            classes = element.get("class", [])
-            class_text = " ".join(classes).lower()
-
+        for class_text in document.class_strings:
             for keyword in class_keywords:
                 if keyword in class_text:
                     score += 1
 
         return score
 
-    def _score_keywords(self, soup: BeautifulSoup, keywords: list) -> int:
+    def _score_keywords(self, document: ParsedPage, keywords: list) -> int:
         """Score page based on keyword density.
 
         Args:
-            soup: BeautifulSoup object
+            document: Parsed page
             keywords: List of keywords to look for
 
         Returns:
             Score based on keyword density
         """
-        # Get text content
-        text_content = soup.get_text().lower()
+        # Text content is extracted once per page and shared by all page types
+        text_content = document.text_lower
         score = 0
 
         for keyword in keywords:
@@ -285,26 +292,20 @@ class PageClassifier:
 
         return score
 
-    def get_page_confidence(self, url: str, html_content: str) -> Dict[str, float]:
+    def get_page_confidence(
+        self, url: str, html_content: Union[str, ParsedPage]
+    ) -> Dict[str, float]:
         """Get confidence scores for all page types.
 
         Args:
             url: URL of the page
-            html_content: HTML content of the page
+            html_content: HTML content of the page or an already parsed page
 
         Returns:
             Dictionary mapping page types to confidence scores (0-1)
         """
-        soup = BeautifulSoup(html_content, "html.parser")
-
         # Calculate raw scores for each page type
-        raw_scores = {}
-        for page_type, indicators in self.CONTENT_INDICATORS.items():
-            score = 0
-            score += self._score_headings(soup, indicators["headings"])
-            score += self._score_classes(soup, indicators["classes"])
-            score += self._score_keywords(soup, indicators["keywords"])
-            raw_scores[page_type] = score
+        raw_scores = self._score_page_types(ParsedPage.ensure(html_content, url))
 
         # Also consider URL-based classification
         url_classification = self.classify_by_url(url)
@@ -322,17 +323,16 @@ class PageClassifier:
 
         return confidence_scores
 
-    def is_restaurant_related(self, html_content: str) -> bool:
+    def is_restaurant_related(self, html_content: Union[str, ParsedPage]) -> bool:
         """Check if a page appears to be restaurant-related.
 
         Args:
-            html_content: HTML content to analyze
+            html_content: HTML content to analyze or an already parsed page
 
         Returns:
             True if page appears restaurant-related
         """
-        soup = BeautifulSoup(html_content, "html.parser")
-        text_content = soup.get_text().lower()
+        text_content = ParsedPage.ensure(html_content).text_lower
 
         # Restaurant-related keywords
         restaurant_keywords = [
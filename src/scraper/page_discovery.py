@@ -1,8 +1,10 @@
 """Page discovery for multi-page website navigation."""
 import re
-from typing import Set, List, Optional
+from typing import Callable, Set, List, Optional, Union
 from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup
+
+from ..common.http_transport import get_shared_transport
+from .parsed_page import ParsedPage
 
 
 class PageDiscovery:
@@ -70,31 +72,39 @@ class PageDiscovery:
         "food": 3,
     }
 
-    def __init__(self, base_url: str, max_pages: int = 10):
+    def __init__(self, base_url: str, max_pages: int = 10, page_store=None,
+                 robots_checker: Optional[Callable[[str], bool]] = None):
         """Initialize page discovery with base URL and limits.
 
         Args:
             base_url: Base URL of the website
             max_pages: Maximum number of pages to discover
+            page_store: Optional PageStore shared with page processing so
+                pages fetched for link discovery are not downloaded again
+            robots_checker: Optional callable returning whether robots.txt
+                allows fetching a URL; disallowed child pages are not fetched
+                or stored
         """
         self.base_url = base_url.rstrip("/")
         self.max_pages = max_pages
+        self.page_store = page_store
+        self.robots_checker = robots_checker
         self.discovered_pages: Set[str] = set()
 
         # Parse base domain for filtering
         parsed = urlparse(base_url)
         self.base_domain = parsed.netloc
 
-    def discover_navigation_links(self, html_content: str) -> Set[str]:
+    def discover_navigation_links(self, html_content: Union[str, ParsedPage]) -> Set[str]:
         """Discover navigation links from HTML content.
 
         Args:
-            html_content: HTML content to parse
+            html_content: HTML content to parse or an already parsed page
 
         Returns:
             Set of discovered navigation URLs
         """
-        soup = BeautifulSoup(html_content, "html.parser")
+        soup = ParsedPage.ensure(html_content).soup
 
         # Find navigation elements
         nav_selectors = [
@@ -120,20 +130,19 @@ class PageDiscovery:
 
         return links
 
-    def extract_all_internal_links(self, html_content: str) -> Set[str]:
+    def extract_all_internal_links(self, html_content: Union[str, ParsedPage]) -> Set[str]:
         """Extract all internal links from HTML content.
 
         Args:
-            html_content: HTML content to parse
+            html_content: HTML content to parse or an already parsed page
 
         Returns:
             Set of internal URLs
         """
-        soup = BeautifulSoup(html_content, "html.parser")
         links = set()
 
-        # Find all links
-        for link in soup.find_all("a", href=True):
+        # Links are indexed when the page is parsed
+        for link in ParsedPage.ensure(html_content).links:
             href = link.get("href")
             if href:
                 absolute_url = self._normalize_url(href)
@@ -195,22 +204,28 @@ class PageDiscovery:
         Returns:
             List of URLs sorted by priority (highest first)
         """
+        # Sort by priority (descending)
+        return sorted(urls, key=self.get_page_priority, reverse=True)
 
-        def get_priority(url: str) -> int:
-            """Get priority score for a URL."""
-            url_lower = url.lower()
-            path = urlparse(url).path.lower()
+    def get_page_priority(self, url: str) -> int:
+        """Get priority score for a URL.
 
-            # Check for high-priority keywords in path
-            for keyword, priority in self.PAGE_PRIORITIES.items():
-                if keyword in path or keyword in url_lower:
-                    return priority
+        Args:
+            url: URL to score
 
-            # Default priority
-            return 1
+        Returns:
+            Priority from PAGE_PRIORITIES, or 1 for other pages
+        """
+        url_lower = url.lower()
+        path = urlparse(url).path.lower()
 
-        # Sort by priority (descending)
-        return sorted(urls, key=get_priority, reverse=True)
+        # Check for high-priority keywords in path
+        for keyword, priority in self.PAGE_PRIORITIES.items():
+            if keyword in path or keyword in url_lower:
+                return priority
+
+        # Default priority
+        return 1
 
     def discover_all_pages(self, initial_url: str, html_content: str, max_depth: int = 2) -> List[str]:
         """Discover all relevant pages from a website starting point with recursive crawling.
@@ -230,7 +245,9 @@ class PageDiscovery:
         # For recursive crawling, we need to track depth
         if max_depth <= 1:
             # Just do single-level discovery (original behavior)
-            nav_links = self.discover_navigation_links(html_content)
+            nav_links = self.discover_navigation_links(
+                self._get_document(initial_url, html_content)
+            )
             relevant_links = self.filter_relevant_pages(nav_links)
             new_links = self.get_new_pages(relevant_links)
             all_pages.update(new_links)
@@ -245,7 +262,6 @@ class PageDiscovery:
 
     def _discover_pages_recursive(self, initial_url: str, initial_html: str, max_depth: int) -> Set[str]:
         """Recursively discover pages up to max_depth."""
-        import requests
         from collections import deque
         
         discovered = {initial_url}
@@ -258,7 +274,9 @@ class PageDiscovery:
                 continue
                 
             # Find links on current page
-            nav_links = self.discover_navigation_links(current_html)
+            nav_links = self.discover_navigation_links(
+                self._get_document(current_url, current_html)
+            )
             relevant_links = self.filter_relevant_pages(nav_links)
             
             for link in relevant_links:
@@ -269,15 +287,55 @@ class PageDiscovery:
                     if current_depth + 1 < max_depth:
                         try:
                             # Fetch the child page to discover its links
-                            response = requests.get(link, timeout=10)
-                            if response.status_code == 200:
-                                to_process.append((link, response.text, current_depth + 1))
+                            child_html = self._fetch_child_page(link)
+                            if child_html:
+                                to_process.append((link, child_html, current_depth + 1))
                         except Exception:
                             # If we can't fetch the page, still include it in discovered pages
                             pass
         
         return discovered
 
+    def _get_document(self, url: str, html_content: str) -> ParsedPage:
+        """Get the parsed page for fetched HTML, reusing the page store's parse if set.
+
+        Args:
+            url: URL the HTML was fetched from
+            html_content: HTML content of the page
+
+        Returns:
+            ParsedPage for the HTML
+        """
+        if self.page_store is not None:
+            document = self.page_store.get_document(url, html_content)
+            if document is not None:
+                return document
+        return ParsedPage(html_content, url=url)
+
+    def _fetch_child_page(self, url: str) -> Optional[str]:
+        """Fetch a child page for link discovery, reusing the page store if set.
+
+        Args:
+            url: URL of the child page
+
+        Returns:
+            HTML content or None if the page could not be fetched or is
+            disallowed by robots.txt
+        """
+        if self.robots_checker is not None and not self.robots_checker(url):
+            return None
+        if self.page_store is not None:
+            return self.page_store.fetch(url, self._download_child_page)
+
+        response = self._download_child_page(url)
+        if response.status_code == 200:
+            return response.text
+        return None
+
+    def _download_child_page(self, url: str):
+        """Download a child page through the shared transport."""
+        return get_shared_transport().get(url, timeout=10)
+
     def _normalize_url(self, href: str) -> Optional[str]:
         """Normalize a URL href to absolute URL.
 
@@ -1,30 +1,76 @@
 """Page processor for fetching and processing individual pages."""
-from typing import Optional, Dict, Any
-from bs4 import BeautifulSoup
+from typing import Optional, Dict, Any, Union
 
 from .page_classifier import PageClassifier
+from ..common.http_transport import get_shared_transport
 from .multi_strategy_scraper import MultiStrategyScraper, RestaurantData
+from .page_store import PageStore
+from .parsed_page import ParsedPage
 
 
 class PageProcessor:
     """Handles fetching and processing of individual web pages."""
 
-    def __init__(self, enable_ethical_scraping: bool = True):
+    def __init__(self, enable_ethical_scraping: bool = True,
+                 page_store: Optional[PageStore] = None):
         """Initialize PageProcessor with required components.
         
         Args:
             enable_ethical_scraping: Whether to enable ethical scraping features
+            page_store: Optional per-crawl store of already fetched pages
         """
         self.enable_ethical_scraping = enable_ethical_scraping
         self.page_classifier = PageClassifier()
         self.multi_strategy_scraper = MultiStrategyScraper(enable_ethical_scraping)
+        self.page_store = page_store
+
+    def is_allowed(self, url: str) -> bool:
+        """Check whether robots.txt allows fetching a URL.
+
+        Args:
+            url: URL to check
+
+        Returns:
+            True if the URL may be fetched or ethical scraping is disabled
+        """
+        if (
+            self.enable_ethical_scraping
+            and self.multi_strategy_scraper.ethical_scraper
+        ):
+            return self.multi_strategy_scraper.ethical_scraper.is_allowed_by_robots(url)
+        return True
 
     def _fetch_page(self, url: str) -> Optional[str]:
         """Fetch HTML content from a URL.
 
+        When a page store is attached, pages already fetched during this
+        crawl are served from it instead of being downloaded again. The
+        robots.txt check runs first either way, since pages may have been
+        stored by components that do not check it.
+
         Args:
             url: URL to fetch
 
+        Returns:
+            HTML content or None if failed or disallowed by robots.txt
+        """
+        try:
+            if not self.is_allowed(url):
+                return None
+        except Exception:
+            return None
+        if self.page_store is not None:
+            return self.page_store.fetch(url, self._download_page)
+        return self._download_page(url)
+
+    def _download_page(self, url: str) -> Optional[str]:
+        """Download HTML content from a URL.
+
+        Callers check robots.txt first (see ``_fetch_page``).
+
+        Args:
+            url: URL to download
+
         Returns:
             HTML content or None if failed
         """
@@ -34,17 +80,12 @@ class PageProcessor:
                 and self.multi_strategy_scraper.ethical_scraper
             ):
                 # Use ethical scraper with rate limiting
-                html_content = (
-                    self.multi_strategy_scraper.ethical_scraper.fetch_page_with_retry(
-                        url
-                    )
-                )
+                ethical_scraper = self.multi_strategy_scraper.ethical_scraper
+                html_content = ethical_scraper.fetch_page_with_retry(url)
                 return html_content
             else:
                 # Fallback method for testing
-                import requests
-
-                response = requests.get(url, timeout=30)
+                response = get_shared_transport().get(url, timeout=30)
                 response.raise_for_status()
                 return response.text
 
@@ -65,11 +106,28 @@ class PageProcessor:
         if not html_content:
             return None
 
+        return self.process_html(url, html_content)
+
+    def process_html(self, url: str, html_content: str) -> Dict[str, Any]:
+        """Classify and extract data from a page that has already been fetched.
+
+        Args:
+            url: URL the HTML was fetched from
+            html_content: HTML content of the page
+
+        Returns:
+            Dictionary with page_type and extracted data
+        """
+        # Parse once; classification and extraction share the document
+        document = self._get_document(url, html_content)
+
         # Classify page type
-        page_type = self.page_classifier.classify_page(url, html_content)
+        page_type = self.page_classifier.classify_page(url, document)
 
-        # Extract restaurant data using multi-strategy approach
-        restaurant_data = self.multi_strategy_scraper.scrape_url(url)
+        # Extract restaurant data from the HTML already fetched above
+        restaurant_data = self.multi_strategy_scraper.scrape_html(
+            url, html_content, document=document
+        )
 
         if not restaurant_data:
             # If multi-strategy fails, create minimal data
@@ -77,18 +135,33 @@ class PageProcessor:
 
         return {"page_type": page_type, "data": restaurant_data}
 
-    def _extract_restaurant_name(self, html_content: str) -> str:
+    def _get_document(self, url: str, html_content: str) -> ParsedPage:
+        """Get the parsed page for fetched HTML, reusing the page store's parse if set.
+
+        Args:
+            url: URL the HTML was fetched from
+            html_content: HTML content of the page
+
+        Returns:
+            ParsedPage for the HTML
+        """
+        if self.page_store is not None:
+            document = self.page_store.get_document(url, html_content)
+            if document is not None:
+                return document
+        return ParsedPage(html_content, url=url)
+
+    def _extract_restaurant_name(self, html_content: Union[str, ParsedPage]) -> str:
         """Extract restaurant name from HTML content for progress tracking.
 
         Args:
-            html_content: HTML content to analyze
+            html_content: HTML content to analyze or an already parsed page
 
         Returns:
             Restaurant name or default
         """
         try:
-            # Use BeautifulSoup to parse HTML
-            soup = BeautifulSoup(html_content, "html.parser")
+            soup = ParsedPage.ensure(html_content).soup
 
             # Try to find restaurant name in title or h1
             title = soup.find("title")
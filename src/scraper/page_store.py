@@ -0,0 +1,234 @@
+"""Per-crawl store of fetched pages so each page is downloaded only once."""
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional, Callable, Union
+from urllib.parse import urlparse, urlunparse
+
+from .parsed_page import ParsedPage
+
+
+@dataclass
+class FetchedPage:
+    """HTML content and response metadata for a fetched page."""
+
+    url: str
+    html: str
+    status_code: int = 200
+    headers: Dict[str, str] = field(default_factory=dict)
+    final_url: str = ""
+    content_type: str = ""
+    fetched_at: float = field(default_factory=time.time)
+    fetch_time: float = 0.0
+    document: Optional[ParsedPage] = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Initialize derived fields."""
+        if not self.final_url:
+            self.final_url = self.url
+        if not self.content_type:
+            self.content_type = self.headers.get("Content-Type", "")
+
+
+class PageStore:
+    """Thread-safe store of fetched pages keyed by normalized URL."""
+
+    DEFAULT_PORTS = {"http": ":80", "https": ":443"}
+
+    def __init__(self):
+        """Initialize an empty page store."""
+        self.pages: Dict[str, FetchedPage] = {}
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    @classmethod
+    def normalize_url(cls, url: str) -> str:
+        """Normalize a URL for use as a store key.
+
+        Lowercases scheme and host, drops default ports and fragments, and
+        removes trailing slashes from non-root paths.
+
+        Args:
+            url: URL to normalize
+
+        Returns:
+            Normalized URL
+        """
+        parsed = urlparse(url.strip())
+        scheme = parsed.scheme.lower()
+        netloc = parsed.netloc.lower()
+
+        default_port = cls.DEFAULT_PORTS.get(scheme)
+        if default_port and netloc.endswith(default_port):
+            netloc = netloc[: -len(default_port)]
+
+        path = parsed.path or "/"
+        if len(path) > 1:
+            path = path.rstrip("/") or "/"
+
+        return urlunparse((scheme, netloc, path, parsed.params, parsed.query, ""))
+
+    def get(self, url: str) -> Optional[FetchedPage]:
+        """Get a stored page.
+
+        Args:
+            url: URL of the page
+
+        Returns:
+            FetchedPage or None if the page has not been fetched
+        """
+        key = self.normalize_url(url)
+        with self.lock:
+            page = self.pages.get(key)
+            if page is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return page
+
+    def get_html(self, url: str) -> Optional[str]:
+        """Get stored HTML for a URL, or None if not stored."""
+        page = self.get(url)
+        return page.html if page else None
+
+    def get_document(self, url: str, html: Optional[str] = None) -> Optional[ParsedPage]:
+        """Get the parsed document for a stored page, parsing it on first use.
+
+        Args:
+            url: URL of the page
+            html: If given, only return the document when the stored HTML matches
+
+        Returns:
+            ParsedPage or None if the page is not stored
+        """
+        with self.lock:
+            page = self.pages.get(self.normalize_url(url))
+        if page is None or (html is not None and page.html is not html and page.html != html):
+            return None
+
+        # Parsing happens outside the lock; a concurrent first use may parse
+        # twice, but both results are equivalent and one of them is kept
+        if page.document is None:
+            page.document = ParsedPage(page.html, url=page.final_url)
+        return page.document
+
+    def put(
+        self,
+        url: str,
+        html: str,
+        status_code: int = 200,
+        headers: Optional[Dict[str, str]] = None,
+        final_url: str = "",
+        fetch_time: float = 0.0,
+    ) -> FetchedPage:
+        """Store fetched HTML for a URL.
+
+        Args:
+            url: Requested URL
+            html: Fetched HTML content
+            status_code: HTTP status code
+            headers: Response headers
+            final_url: URL after redirects
+            fetch_time: Time spent fetching in seconds
+
+        Returns:
+            The stored FetchedPage
+        """
+        page = FetchedPage(
+            url=url,
+            html=html,
+            status_code=status_code,
+            headers=dict(headers or {}),
+            final_url=final_url,
+            fetch_time=fetch_time,
+        )
+        with self.lock:
+            self.pages[self.normalize_url(url)] = page
+            if page.final_url != url:
+                self.pages.setdefault(self.normalize_url(page.final_url), page)
+        return page
+
+    def put_response(self, url: str, response, fetch_time: float = 0.0) -> FetchedPage:
+        """Store a requests-style response for a URL.
+
+        Args:
+            url: Requested URL
+            response: Response object with text, status_code and headers
+            fetch_time: Time spent fetching in seconds
+
+        Returns:
+            The stored FetchedPage
+        """
+        return self.put(
+            url,
+            response.text,
+            status_code=response.status_code,
+            headers=dict(getattr(response, "headers", None) or {}),
+            final_url=getattr(response, "url", "") or "",
+            fetch_time=fetch_time,
+        )
+
+    def fetch(
+        self, url: str, fetch_func: Callable[[str], Union[str, Any, None]]
+    ) -> Optional[str]:
+        """Get HTML from the store, fetching and storing it on a miss.
+
+        Args:
+            url: URL to fetch
+            fetch_func: Callable returning HTML text or a response object
+
+        Returns:
+            HTML content or None if the fetch failed
+        """
+        page = self.get(url)
+        if page is not None:
+            return page.html
+
+        start_time = time.time()
+        result = fetch_func(url)
+        fetch_time = time.time() - start_time
+
+        if result is None:
+            return None
+        if isinstance(result, str):
+            if not result:
+                return None
+            return self.put(url, result, fetch_time=fetch_time).html
+        if getattr(result, "status_code", 200) != 200:
+            return None
+        return self.put_response(url, result, fetch_time=fetch_time).html
+
+    def __contains__(self, url: str) -> bool:
+        """Check whether a URL has been stored."""
+        with self.lock:
+            return self.normalize_url(url) in self.pages
+
+    def __len__(self) -> int:
+        """Get number of stored entries."""
+        with self.lock:
+            return len(self.pages)
+
+    def clear(self) -> None:
+        """Remove all stored pages and reset counters."""
+        with self.lock:
+            self.pages.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get store statistics.
+
+        Returns:
+            Dictionary with stored page count, hits and misses
+        """
+        with self.lock:
+            # Redirected pages are stored under both URLs; count them once
+            unique_pages = list({id(page): page for page in self.pages.values()}.values())
+            return {
+                "pages_stored": len(unique_pages),
+                "hits": self.hits,
+                "misses": self.misses,
+                "fetches_saved": self.hits,
+                "bytes_stored": sum(len(page.html) for page in unique_pages),
+            }
@@ -0,0 +1,158 @@
+"""Parse-once document model shared by page classification, discovery and extraction."""
+import importlib.util
+from collections import defaultdict
+from typing import Dict, List, Optional, Union
+
+from bs4 import BeautifulSoup
+from bs4.element import Tag
+
+
+HEADING_TAGS = ("h1", "h2", "h3", "h4", "h5", "h6")
+
+# Tree builders in order of preference; the first one installed is used
+PREFERRED_PARSERS = (("lxml", "lxml"), ("html.parser", None))
+
+
+def detect_parser() -> str:
+    """Get the fastest installed BeautifulSoup tree builder.
+
+    Returns:
+        Parser name accepted by BeautifulSoup
+    """
+    for parser, module_name in PREFERRED_PARSERS:
+        if module_name is None or importlib.util.find_spec(module_name) is not None:
+            return parser
+    return "html.parser"
+
+
+DEFAULT_PARSER = detect_parser()
+
+
+class ParsedPage:
+    """HTML parsed once with precomputed element lookups.
+
+    The tree is built a single time and indexed in one pass so that
+    extractors, the page classifier and page discovery can share it instead
+    of re-parsing the same HTML string.
+    """
+
+    def __init__(self, html: str, url: Optional[str] = None, parser: Optional[str] = None):
+        """Parse HTML and build element indexes.
+
+        Args:
+            html: HTML content to parse
+            url: URL the HTML was fetched from
+            parser: BeautifulSoup tree builder, defaults to the fastest installed
+        """
+        self.html = html or ""
+        self.url = url
+        self.parser = parser or DEFAULT_PARSER
+        self.soup = BeautifulSoup(self.html, self.parser)
+
+        self.scripts_by_type: Dict[str, List[Tag]] = defaultdict(list)
+        self.itemscopes: List[Tag] = []
+        self.links: List[Tag] = []
+        self.headings: List[Tag] = []
+        self.class_index: Dict[str, List[Tag]] = defaultdict(list)
+        self.class_strings: List[str] = []
+        self._text: Optional[str] = None
+        self._text_lower: Optional[str] = None
+
+        self._build_indexes()
+
+    @classmethod
+    def ensure(
+        cls, source: Union[str, "ParsedPage"], url: Optional[str] = None
+    ) -> "ParsedPage":
+        """Get a ParsedPage for HTML or an already parsed page.
+
+        Args:
+            source: HTML content or ParsedPage
+            url: URL the HTML was fetched from
+
+        Returns:
+            The given ParsedPage, or a new one parsed from the HTML
+        """
+        if isinstance(source, ParsedPage):
+            return source
+        return cls(source, url=url)
+
+    def _build_indexes(self) -> None:
+        """Index scripts, microdata scopes, links, headings and classes in one pass."""
+        for element in self.soup.find_all(True):
+            name = element.name
+            attrs = element.attrs
+
+            if name == "script":
+                script_type = attrs.get("type", "")
+                if isinstance(script_type, list):
+                    script_type = " ".join(script_type)
+                self.scripts_by_type[script_type.strip().lower()].append(element)
+            elif name == "a" and attrs.get("href"):
+                self.links.append(element)
+            elif name in HEADING_TAGS:
+                self.headings.append(element)
+
+            if "itemscope" in attrs:
+                self.itemscopes.append(element)
+
+            classes = attrs.get("class")
+            if classes:
+                if isinstance(classes, str):
+                    classes = classes.split()
+                self.class_strings.append(" ".join(classes).lower())
+                for class_name in classes:
+                    self.class_index[class_name.lower()].append(element)
+
+    @property
+    def text(self) -> str:
+        """Text content of the page, computed on first use."""
+        if self._text is None:
+            self._text = self.soup.get_text()
+        return self._text
+
+    @property
+    def text_lower(self) -> str:
+        """Lowercased text content of the page."""
+        if self._text_lower is None:
+            self._text_lower = self.text.lower()
+        return self._text_lower
+
+    def get_scripts(self, script_type: str = "") -> List[Tag]:
+        """Get script tags with the given type attribute.
+
+        Args:
+            script_type: Script type, e.g. 'application/ld+json'; '' for untyped scripts
+
+        Returns:
+            Script tags in document order
+        """
+        return self.scripts_by_type.get(script_type.strip().lower(), [])
+
+    def get_headings(self, levels: Optional[List[str]] = None) -> List[Tag]:
+        """Get heading elements, optionally limited to some levels.
+
+        Args:
+            levels: Heading tag names such as ['h1', 'h2']; all levels if None
+
+        Returns:
+            Heading elements in document order
+        """
+        if levels is None:
+            return self.headings
+        return [heading for heading in self.headings if heading.name in levels]
+
+    def get_elements_by_class(self, class_name: str) -> List[Tag]:
+        """Get elements carrying a CSS class.
+
+        Args:
+            class_name: Exact class name (case-insensitive)
+
+        Returns:
+            Matching elements in document order
+        """
+        return self.class_index.get(class_name.lower(), [])
+
+    def get_microdata_items(self) -> List[Tag]:
+        """Get elements with both itemscope and itemtype attributes."""
+        return [element for element in self.itemscopes if element.has_attr("itemtype")]
@@ -1,11 +1,50 @@
 """Rate limiting for ethical web scraping."""
 import time
-from typing import Optional, Dict, Any
+import threading
+from typing import Optional, Dict, Any, Tuple
 from urllib.parse import urlparse
 from email.utils import parsedate_to_datetime
 import datetime
 
 
+def parse_retry_after(retry_after_value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header value.
+
+    Args:
+        retry_after_value: Value from Retry-After header, in seconds or as an HTTP date
+
+    Returns:
+        Optional[float]: Delay in seconds, or None if invalid
+    """
+    if not retry_after_value:
+        return None
+
+    # Try parsing as seconds (integer)
+    try:
+        seconds = int(retry_after_value)
+        if seconds < 0:
+            return None
+        return float(seconds)
+    except ValueError:
+        pass
+
+    # Try parsing as HTTP date
+    try:
+        retry_time = parsedate_to_datetime(retry_after_value)
+        current_time = datetime.datetime.now(datetime.timezone.utc)
+
+        # If retry_time doesn't have timezone info, assume UTC
+        if retry_time.tzinfo is None:
+            retry_time = retry_time.replace(tzinfo=datetime.timezone.utc)
+
+        delay = (retry_time - current_time).total_seconds()
+        return max(0.0, delay)  # Don't return negative delays
+    except (ValueError, TypeError):
+        pass
+
+    return None
+
+
 class RateLimiter:
     """Rate limiter to enforce delays between requests with validation."""
 
@@ -362,33 +401,7 @@ class EnhancedRateLimiter:
         Returns:
             Optional[float]: Delay in seconds, or None if invalid
         """
-        if not retry_after_value:
-            return None
-
-        # Try parsing as seconds (integer)
-        try:
-            seconds = int(retry_after_value)
-            if seconds < 0:
-                return None
-            return float(seconds)
-        except ValueError:
-            pass
-
-        # Try parsing as HTTP date
-        try:
-            retry_time = parsedate_to_datetime(retry_after_value)
-            current_time = datetime.datetime.now(datetime.timezone.utc)
-
-            # If retry_time doesn't have timezone info, assume UTC
-            if retry_time.tzinfo is None:
-                retry_time = retry_time.replace(tzinfo=datetime.timezone.utc)
-
-            delay = (retry_time - current_time).total_seconds()
-            return max(0.0, delay)  # Don't return negative delays
-        except (ValueError, TypeError):
-            pass
-
-        return None
+        return parse_retry_after(retry_after_value)
 
     def apply_retry_after_delay(self, domain: str, retry_after_delay: float) -> float:
         """Apply retry-after delay for a domain.
@@ -494,3 +507,253 @@ class EnhancedRateLimiter:
         )
 
         return base_stats
+
+
+class TokenBucket:
+    """Token bucket pacing requests to a single domain.
+
+    Reservations may be granted for a time in the future; ``updated`` then
+    records the time of the last granted slot so later callers queue behind it.
+    A reservation may take several tokens, e.g. the LLM tokens of a prompt.
+    """
+
+    def __init__(self, interval: float, capacity: int = 1):
+        """Initialize token bucket.
+
+        Args:
+            interval: Seconds to refill one token
+            capacity: Maximum number of tokens, i.e. requests allowed in a burst
+        """
+        self.interval = interval
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.time()
+        self.blocked_until = 0.0
+
+    def _slot_start(self, now: float, amount: float = 1.0) -> Tuple[float, float]:
+        """Get the earliest start time for the next request and the tokens available then."""
+        start = max(now, self.blocked_until, self.updated)
+        if self.interval <= 0:
+            return start, float(self.capacity)
+
+        tokens = min(self.capacity, self.tokens + (start - self.updated) / self.interval)
+        if tokens < amount:
+            start += (amount - tokens) * self.interval
+            tokens = amount
+        return start, tokens
+
+    def reserve(self, now: float, amount: float = 1.0) -> float:
+        """Reserve the next request slot.
+
+        Args:
+            now: Current time
+            amount: Tokens needed; more than capacity waits for a full bucket
+
+        Returns:
+            float: Seconds the caller must wait before sending the request
+        """
+        amount = min(amount, self.capacity)
+        start, tokens = self._slot_start(now, amount)
+        self.tokens = tokens - amount
+        self.updated = start
+        return start - now
+
+    def time_until_available(self, now: float) -> float:
+        """Get seconds until a slot is available without reserving it."""
+        start, _ = self._slot_start(now)
+        return start - now
+
+
+class TokenBucketRateLimiter:
+    """Per-domain token bucket rate limiter.
+
+    Each domain has its own bucket, so requests to different domains never
+    wait on each other. A domain's refill interval is the default delay
+    unless robots.txt asks for a longer ``Crawl-delay``, and a server's
+    ``Retry-After`` holds back every request to that domain until it expires.
+    """
+
+    def __init__(
+        self,
+        default_delay: float = 2.0,
+        burst: int = 1,
+        max_delay: float = 60.0,
+        max_retry_after_delay: float = 300.0,
+    ):
+        """Initialize token bucket rate limiter.
+
+        Args:
+            default_delay: Default seconds between requests to one domain
+            burst: Requests a domain may receive back to back before pacing applies
+            max_delay: Maximum per-domain delay, also caps robots.txt Crawl-delay
+            max_retry_after_delay: Maximum honored Retry-After delay in seconds
+
+        Raises:
+            ValueError: If any configuration value is invalid
+        """
+        if default_delay < 0:
+            raise ValueError("Delay must be non-negative")
+        if max_delay <= 0:
+            raise ValueError("Max delay must be positive")
+        if default_delay > max_delay:
+            raise ValueError("Delay cannot exceed max delay")
+        if burst < 1:
+            raise ValueError("Burst must be at least 1")
+        if max_retry_after_delay <= 0:
+            raise ValueError("Max retry-after delay must be positive")
+
+        self.default_delay = default_delay
+        self.burst = burst
+        self.max_delay = max_delay
+        self.max_retry_after_delay = max_retry_after_delay
+
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.crawl_delays: Dict[str, float] = {}
+        self.domain_statistics: Dict[str, Dict[str, Any]] = {}
+        self.lock = threading.Lock()
+
+    @property
+    def delay(self) -> float:
+        """Default delay between requests to one domain."""
+        return self.default_delay
+
+    def _extract_domain(self, url: str) -> str:
+        """Extract domain from URL without the port."""
+        return urlparse(url).netloc.split(":")[0]
+
+    def _get_bucket(self, domain: str) -> TokenBucket:
+        """Get or create the bucket for a domain; caller must hold the lock."""
+        if domain not in self.buckets:
+            self.buckets[domain] = TokenBucket(self.get_domain_delay(domain), self.burst)
+            self.domain_statistics[domain] = {
+                "total_requests": 0,
+                "total_wait_time": 0.0,
+                "average_wait_time": 0.0,
+                "retry_after_count": 0,
+            }
+        return self.buckets[domain]
+
+    def get_domain_delay(self, domain: str) -> float:
+        """Get the effective delay between requests to a domain.
+
+        Args:
+            domain: Domain name
+
+        Returns:
+            float: Larger of the default delay and the domain's Crawl-delay, capped at max_delay
+        """
+        return min(max(self.default_delay, self.crawl_delays.get(domain, 0.0)), self.max_delay)
+
+    def set_crawl_delay(self, url: str, crawl_delay: float) -> None:
+        """Apply a robots.txt Crawl-delay to the URL's domain.
+
+        Args:
+            url: Any URL on the domain
+            crawl_delay: Crawl-delay in seconds
+        """
+        if crawl_delay < 0:
+            raise ValueError("Crawl delay must be non-negative")
+
+        domain = self._extract_domain(url)
+        with self.lock:
+            self.crawl_delays[domain] = crawl_delay
+            if domain in self.buckets:
+                self.buckets[domain].interval = self.get_domain_delay(domain)
+
+    def apply_retry_after(self, url: str, retry_after: float) -> float:
+        """Hold back requests to the URL's domain until Retry-After expires.
+
+        Args:
+            url: URL that received the Retry-After response
+            retry_after: Requested delay in seconds
+
+        Returns:
+            float: Delay actually applied after capping
+        """
+        delay = min(max(retry_after, 0.0), self.max_retry_after_delay)
+        domain = self._extract_domain(url)
+        with self.lock:
+            bucket = self._get_bucket(domain)
+            bucket.blocked_until = max(bucket.blocked_until, time.time() + delay)
+            self.domain_statistics[domain]["retry_after_count"] += 1
+        return delay
+
+    def reserve(self, url: str) -> float:
+        """Reserve a request slot without sleeping.
+
+        Args:
+            url: URL being requested
+
+        Returns:
+            float: Seconds the caller must wait before sending the request
+        """
+        domain = self._extract_domain(url)
+        with self.lock:
+            wait_time = self._get_bucket(domain).reserve(time.time())
+            stats = self.domain_statistics[domain]
+            stats["total_requests"] += 1
+            stats["total_wait_time"] += wait_time
+            stats["average_wait_time"] = stats["total_wait_time"] / stats["total_requests"]
+        return wait_time
+
+    def wait_if_needed(self, url: str) -> float:
+        """Wait until a request to the URL's domain is allowed.
+
+        Args:
+            url: URL being requested
+
+        Returns:
+            float: Time actually waited in seconds
+        """
+        wait_time = self.reserve(url)
+
+        # Sleep outside the lock so waiting on one domain never blocks another
+        if wait_time > 0:
+            time.sleep(wait_time)
+        return wait_time
+
+    def time_until_next_allowed(self, url: str) -> float:
+        """Calculate time until a request to the URL's domain is allowed.
+
+        Args:
+            url: URL to be requested
+
+        Returns:
+            float: Seconds until next request (0 if allowed now)
+        """
+        domain = self._extract_domain(url)
+        with self.lock:
+            bucket = self.buckets.get(domain)
+            if bucket is None:
+                return 0.0
+            return max(0.0, bucket.time_until_available(time.time()))
+
+    def reset(self) -> None:
+        """Reset all domain buckets; Crawl-delays are kept."""
+        with self.lock:
+            self.buckets.clear()
+            self.domain_statistics.clear()
+
+    def get_domain_statistics(self, domain: str) -> Dict[str, Any]:
+        """Get statistics for a domain.
+
+        Args:
+            domain: Domain name
+
+        Returns:
+            Dict[str, Any]: Domain statistics
+        """
+        with self.lock:
+            stats = dict(
+                self.domain_statistics.get(
+                    domain,
+                    {
+                        "total_requests": 0,
+                        "total_wait_time": 0.0,
+                        "average_wait_time": 0.0,
+                        "retry_after_count": 0,
+                    },
+                )
+            )
+            stats["delay"] = self.get_domain_delay(domain)
+        return stats
@@ -0,0 +1,224 @@
+"""Per-domain memory of whether JavaScript rendering improves extraction."""
+import atexit
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".rag_scraper", "render_decisions.json")
+CACHE_PATH_ENV = "RAG_SCRAPER_RENDER_DECISIONS"
+DEFAULT_REPROBE_INTERVAL = 7 * 24 * 3600
+
+
+@dataclass
+class DomainRenderStats:
+    """Render outcomes for one domain."""
+
+    renders: int = 0
+    improved: int = 0
+    avoided: int = 0
+    last_render: float = 0.0
+
+
+class RenderDecisionCache:
+    """Learns per domain whether browser rendering is worth its cost.
+
+    A domain whose renders never filled in a missing key field is not
+    rendered again once ``min_renders`` renders have been observed, until
+    ``reprobe_interval`` seconds after its last render, when one render
+    probes whether the site has changed. The outcomes can be persisted to
+    a JSON file so the decision survives across runs; writes are batched
+    every ``save_every`` records and flushed on close and at exit.
+    """
+
+    def __init__(
+        self,
+        storage_path: Optional[str] = None,
+        min_renders: int = 3,
+        reprobe_interval: float = DEFAULT_REPROBE_INTERVAL,
+        save_every: int = 20,
+    ):
+        """Initialize render decision cache.
+
+        Args:
+            storage_path: JSON file for persisting decisions, or None to keep them in memory
+            min_renders: Renders without improvement before a domain stops being rendered
+            reprobe_interval: Seconds before a ruled-out domain is rendered again
+            save_every: Records between writes to the storage file
+
+        Raises:
+            ValueError: If min_renders or save_every is not positive, or
+                reprobe_interval is negative
+        """
+        if min_renders < 1:
+            raise ValueError("min_renders must be at least 1")
+        if reprobe_interval < 0:
+            raise ValueError("reprobe_interval cannot be negative")
+        if save_every < 1:
+            raise ValueError("save_every must be at least 1")
+
+        self.storage_path = Path(storage_path) if storage_path else None
+        self.min_renders = min_renders
+        self.reprobe_interval = reprobe_interval
+        self.save_every = save_every
+        self.domains: Dict[str, DomainRenderStats] = {}
+        self.lock = threading.Lock()
+        self._unsaved = 0
+        self._load()
+        if self.storage_path is not None:
+            atexit.register(self.flush)
+
+    @classmethod
+    def from_config(cls, config) -> "RenderDecisionCache":
+        """Create the render decision cache for a scraping configuration.
+
+        Decisions persist to ``config.render_decision_cache_path``, falling
+        back to ``$RAG_SCRAPER_RENDER_DECISIONS`` or
+        ``~/.rag_scraper/render_decisions.json``; ":memory:" disables persistence.
+        Scrapers persisting to the same file share one cache so their
+        records are not lost to each other's writes.
+
+        Args:
+            config: Scraping configuration
+
+        Returns:
+            RenderDecisionCache for the configured path
+        """
+        path = (
+            getattr(config, "render_decision_cache_path", None)
+            or os.environ.get(CACHE_PATH_ENV)
+            or DEFAULT_CACHE_PATH
+        )
+        if path == ":memory:":
+            return cls()
+        return get_shared_render_decision_cache(path)
+
+    @staticmethod
+    def _domain(url: str) -> str:
+        """Get the cache key for a URL."""
+        return urlparse(url).netloc.lower()
+
+    def should_render(self, url: str) -> bool:
+        """Check if rendering has not yet been ruled out for the URL's domain."""
+        with self.lock:
+            stats = self.domains.get(self._domain(url))
+            if stats is None:
+                return True
+            return (
+                stats.improved > 0
+                or stats.renders < self.min_renders
+                or time.time() - stats.last_render >= self.reprobe_interval
+            )
+
+    def record_render(self, url: str, improved: bool) -> None:
+        """Record a render and whether it filled in missing fields."""
+        with self.lock:
+            stats = self.domains.setdefault(self._domain(url), DomainRenderStats())
+            stats.renders += 1
+            stats.last_render = time.time()
+            if improved:
+                stats.improved += 1
+            self._record_change()
+
+    def record_avoided(self, url: str) -> None:
+        """Record a render that was skipped."""
+        with self.lock:
+            stats = self.domains.setdefault(self._domain(url), DomainRenderStats())
+            stats.avoided += 1
+            self._record_change()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get render decision statistics.
+
+        Returns:
+            Dictionary with total renders, improvements, renders avoided and
+            the domains that are no longer rendered
+        """
+        with self.lock:
+            return {
+                "renders": sum(s.renders for s in self.domains.values()),
+                "renders_improved": sum(s.improved for s in self.domains.values()),
+                "renders_avoided": sum(s.avoided for s in self.domains.values()),
+                "domains_skipped": sorted(
+                    domain for domain, s in self.domains.items()
+                    if s.improved == 0 and s.renders >= self.min_renders
+                ),
+            }
+
+    def flush(self) -> None:
+        """Write unsaved records to the storage file."""
+        with self.lock:
+            if self._unsaved:
+                self._save()
+
+    def close(self) -> None:
+        """Flush unsaved records and drop the exit hook."""
+        self.flush()
+        atexit.unregister(self.flush)
+
+    def clear(self) -> None:
+        """Forget all domains."""
+        with self.lock:
+            self.domains.clear()
+            self._save()
+
+    def _load(self) -> None:
+        """Load persisted decisions, ignoring a missing or corrupt file."""
+        if self.storage_path is None or not self.storage_path.exists():
+            return
+        try:
+            with open(self.storage_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self.domains = {
+                domain: DomainRenderStats(**stats) for domain, stats in data.items()
+            }
+        except (OSError, ValueError, TypeError):
+            self.domains = {}
+
+    def _record_change(self) -> None:
+        """Count a record and save once enough have built up; caller holds the lock."""
+        self._unsaved += 1
+        if self._unsaved >= self.save_every:
+            self._save()
+
+    def _save(self) -> None:
+        """Persist decisions atomically; caller holds the lock."""
+        self._unsaved = 0
+        if self.storage_path is None:
+            return
+        try:
+            self.storage_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.storage_path.with_suffix(self.storage_path.suffix + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {domain: asdict(stats) for domain, stats in self.domains.items()}, f
+                )
+            os.replace(tmp_path, self.storage_path)
+        except OSError:
+            pass
+
+
+_shared_caches: Dict[str, RenderDecisionCache] = {}
+_shared_caches_lock = threading.Lock()
+
+
+def get_shared_render_decision_cache(storage_path: str) -> RenderDecisionCache:
+    """Get the process-wide render decision cache for a storage file.
+
+    Args:
+        storage_path: JSON file the decisions persist to
+
+    Returns:
+        The cache shared by every scraper using the file
+    """
+    key = os.path.abspath(os.path.expanduser(storage_path))
+    with _shared_caches_lock:
+        cache = _shared_caches.get(key)
+        if cache is None:
+            cache = RenderDecisionCache(key)
+            _shared_caches[key] = cache
+        return cache
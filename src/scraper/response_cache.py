@@ -0,0 +1,367 @@
+"""Persistent on-disk HTTP response cache with conditional revalidation."""
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .page_store import PageStore
+
+
+_MAX_AGE_PATTERN = re.compile(r"max-age\s*=\s*\"?(\d+)\"?", re.IGNORECASE)
+
+
+@dataclass
+class CachedResponse:
+    """A stored response body with the metadata needed to revalidate it."""
+
+    url: str
+    body: str
+    status_code: int = 200
+    headers: Dict[str, str] = field(default_factory=dict)
+    final_url: str = ""
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float = field(default_factory=time.time)
+    max_age: Optional[float] = None
+    no_cache: bool = False
+
+    @property
+    def size(self) -> int:
+        """Approximate size of the entry in bytes."""
+        return len(self.body.encode("utf-8"))
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        """Check if the entry can be served without contacting the server."""
+        if self.no_cache or self.max_age is None:
+            return False
+        now = time.time() if now is None else now
+        return now - self.fetched_at < self.max_age
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Get If-None-Match / If-Modified-Since headers for revalidation."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def parse_cache_control(headers: Dict[str, str]) -> Dict[str, Any]:
+    """Parse the caching directives this cache honors.
+
+    Args:
+        headers: Response headers
+
+    Returns:
+        Dictionary with ``no_store``, ``no_cache`` and ``max_age`` (seconds or None)
+    """
+    lowered = {key.lower(): value for key, value in headers.items()}
+    cache_control = lowered.get("cache-control", "").lower()
+
+    max_age = None
+    match = _MAX_AGE_PATTERN.search(cache_control)
+    if match:
+        max_age = float(match.group(1))
+    elif "expires" in lowered:
+        try:
+            expires = parsedate_to_datetime(lowered["expires"]).timestamp()
+            max_age = max(0.0, expires - time.time())
+        except (TypeError, ValueError):
+            max_age = 0.0
+
+    return {
+        "no_store": "no-store" in cache_control,
+        "no_cache": "no-cache" in cache_control,
+        "max_age": max_age,
+    }
+
+
+class ResponseCache:
+    """Size-bounded on-disk cache of HTTP responses keyed by normalized URL.
+
+    Each entry is one JSON file in ``cache_dir``. Entries are served directly
+    while their Cache-Control max-age lasts and are otherwise revalidated with
+    If-None-Match / If-Modified-Since so a 304 reuses the stored body. When
+    the cache grows beyond ``max_size_bytes`` the least recently used entries
+    are evicted. In ``offline`` mode only stored entries are served and the
+    network is never used.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_size_bytes: int = 200 * 1024 * 1024,
+        default_ttl: Optional[float] = None,
+        offline: bool = False,
+    ):
+        """Initialize response cache.
+
+        Args:
+            cache_dir: Directory holding cached responses
+            max_size_bytes: Total body size kept on disk before evicting
+            default_ttl: Freshness lifetime in seconds for responses without
+                max-age, or None to always revalidate them
+            offline: Serve only from the cache, never from the network
+
+        Raises:
+            ValueError: If max_size_bytes or default_ttl is invalid
+        """
+        if max_size_bytes <= 0:
+            raise ValueError("max_size_bytes must be positive")
+        if default_ttl is not None and default_ttl < 0:
+            raise ValueError("default_ttl cannot be negative")
+
+        self.cache_dir = Path(cache_dir)
+        self.max_size_bytes = max_size_bytes
+        self.default_ttl = default_ttl
+        self.offline = offline
+
+        # key -> entry size, ordered from least to most recently used
+        self._index: "OrderedDict[str, int]" = OrderedDict()
+        self.total_size = 0
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._load_index()
+
+    @classmethod
+    def from_config(cls, config) -> Optional["ResponseCache"]:
+        """Create a cache from a config's response cache options.
+
+        Args:
+            config: ScrapingConfig or BatchConfig, or None
+
+        Returns:
+            ResponseCache, or None if the config does not enable caching
+        """
+        cache_dir = getattr(config, "response_cache_dir", None)
+        if not cache_dir:
+            return None
+        return cls(
+            cache_dir,
+            max_size_bytes=getattr(config, "response_cache_max_mb", 200) * 1024 * 1024,
+            default_ttl=getattr(config, "response_cache_default_ttl", None),
+            offline=getattr(config, "offline_replay", False),
+        )
+
+    @staticmethod
+    def cache_key(url: str) -> str:
+        """Get the cache key for a URL."""
+        return PageStore.normalize_url(url)
+
+    def _entry_path(self, key: str) -> Path:
+        """Get the file holding an entry."""
+        return self.cache_dir / (hashlib.sha256(key.encode("utf-8")).hexdigest() + ".json")
+
+    def _load_index(self) -> None:
+        """Rebuild the LRU index from the files on disk, oldest first."""
+        entries = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                size = len(data["body"].encode("utf-8"))
+                entries.append((path.stat().st_mtime, self.cache_key(data["url"]), size))
+            except (OSError, ValueError, KeyError, TypeError, AttributeError):
+                continue
+
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self.total_size += size
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """Get the stored response for a URL without counting a lookup.
+
+        Args:
+            url: URL to look up
+
+        Returns:
+            CachedResponse or None if the URL is not cached
+        """
+        key = self.cache_key(url)
+        with self.lock:
+            if key not in self._index:
+                return None
+            entry = self._read_entry(key)
+            if entry is None:
+                self._remove(key)
+                return None
+            self._index.move_to_end(key)
+            return entry
+
+    def lookup(self, url: str) -> Optional[CachedResponse]:
+        """Get a response that can be served without a request.
+
+        Fresh entries, and any entry in offline mode, count as hits. Stale or
+        missing entries count as misses.
+
+        Args:
+            url: URL to look up
+
+        Returns:
+            CachedResponse to serve as-is, or None if a request is needed
+        """
+        entry = self.get(url)
+        with self.lock:
+            if entry is not None and (self.offline or entry.is_fresh()):
+                self.hits += 1
+                return entry
+            self.misses += 1
+            return None
+
+    def store(self, url: str, response) -> Optional[CachedResponse]:
+        """Store a successful requests-style response.
+
+        Args:
+            url: Requested URL
+            response: Response object with text, status_code and headers
+
+        Returns:
+            The stored CachedResponse, or None if the response is not cacheable
+        """
+        if getattr(response, "status_code", None) != 200:
+            return None
+
+        headers = dict(getattr(response, "headers", None) or {})
+        directives = parse_cache_control(headers)
+        if directives["no_store"]:
+            return None
+
+        lowered = {key.lower(): value for key, value in headers.items()}
+        max_age = directives["max_age"]
+        if max_age is None:
+            max_age = self.default_ttl
+
+        entry = CachedResponse(
+            url=url,
+            body=response.text,
+            status_code=response.status_code,
+            headers=headers,
+            final_url=getattr(response, "url", "") or url,
+            etag=lowered.get("etag"),
+            last_modified=lowered.get("last-modified"),
+            max_age=max_age,
+            no_cache=directives["no_cache"],
+        )
+        self._write(entry)
+        return entry
+
+    def revalidated(self, url: str, response) -> Optional[CachedResponse]:
+        """Refresh a stored entry after the server answered 304 Not Modified.
+
+        Args:
+            url: Requested URL
+            response: The 304 response, whose headers may update freshness
+
+        Returns:
+            The refreshed CachedResponse, or None if the entry has gone
+        """
+        entry = self.get(url)
+        if entry is None:
+            return None
+
+        headers = dict(getattr(response, "headers", None) or {})
+        lowered = {key.lower(): value for key, value in headers.items()}
+        directives = parse_cache_control(headers)
+
+        entry.fetched_at = time.time()
+        entry.etag = lowered.get("etag", entry.etag)
+        entry.last_modified = lowered.get("last-modified", entry.last_modified)
+        if directives["max_age"] is not None:
+            entry.max_age = directives["max_age"]
+        if "cache-control" in lowered:
+            entry.no_cache = directives["no_cache"]
+
+        with self.lock:
+            self.revalidations += 1
+        self._write(entry)
+        return entry
+
+    def _read_entry(self, key: str) -> Optional[CachedResponse]:
+        """Read an entry from disk; caller holds the lock."""
+        try:
+            with open(self._entry_path(key), "r", encoding="utf-8") as f:
+                return CachedResponse(**json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def _write(self, entry: CachedResponse) -> None:
+        """Write an entry to disk and evict until the cache fits."""
+        key = self.cache_key(entry.url)
+        path = self._entry_path(key)
+        tmp_path = path.with_suffix(".tmp")
+
+        with self.lock:
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(asdict(entry), f)
+                os.replace(tmp_path, path)
+            except OSError:
+                return
+
+            self.total_size -= self._index.pop(key, 0)
+            self._index[key] = entry.size
+            self.total_size += entry.size
+
+            while self.total_size > self.max_size_bytes and len(self._index) > 1:
+                oldest = next(iter(self._index))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        """Delete an entry; caller holds the lock."""
+        self.total_size -= self._index.pop(key, 0)
+        try:
+            self._entry_path(key).unlink()
+        except OSError:
+            pass
+
+    def __contains__(self, url: str) -> bool:
+        """Check whether a URL is cached."""
+        with self.lock:
+            return self.cache_key(url) in self._index
+
+    def __len__(self) -> int:
+        """Get number of cached entries."""
+        with self.lock:
+            return len(self._index)
+
+    def clear(self) -> None:
+        """Remove every entry and reset counters."""
+        with self.lock:
+            for key in list(self._index):
+                self._remove(key)
+            self.total_size = 0
+            self.hits = 0
+            self.misses = 0
+            self.revalidations = 0
+            self.evictions = 0
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with entry count, size, hits, misses, revalidations and evictions
+        """
+        with self.lock:
+            return {
+                "entries": len(self._index),
+                "size_bytes": self.total_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidations": self.revalidations,
+                "evictions": self.evictions,
+                "offline": self.offline,
+            }
@@ -75,6 +75,10 @@ class RestaurantScraper:
                 memory_limit_mb=512,
                 chunk_size=10,
                 enable_memory_monitoring=True,
+                response_cache_dir=getattr(config, "response_cache_dir", None),
+                response_cache_max_mb=getattr(config, "response_cache_max_mb", 200),
+                response_cache_default_ttl=getattr(config, "response_cache_default_ttl", None),
+                offline_replay=getattr(config, "offline_replay", False),
             )
             self.batch_processor = BatchProcessor(batch_config)
 
@@ -95,7 +99,20 @@ class RestaurantScraper:
             and self.batch_processor
             and (len(urls) > 5 or getattr(config, "force_batch_processing", False))
         ):
-            batch_result = self.batch_processor.process_batch(urls, progress_callback)
+            # Extractions are streamed to the output file as they complete
+            incremental_file_handler = getattr(config, "incremental_file_handler", None)
+            batch_result = self.batch_processor.process_batch(
+                urls, progress_callback, incremental_file_handler
+            )
+
+            if incremental_file_handler:
+                try:
+                    incremental_file_handler.close()
+                except Exception as close_error:
+                    batch_result["errors"].append(
+                        f"Error closing file: {str(close_error)}"
+                    )
+
             # Convert batch processor result to ScrapingResult
             result = ScrapingResult(
                 successful_extractions=batch_result["successful_extractions"],
@@ -165,6 +182,7 @@ class RestaurantScraper:
                     multi_page_results.append(multi_page_result)
                     
                     if multi_page_result.aggregated_data:
+                        multi_page_result.aggregated_data.source_url = url
                         successful_extractions.append(multi_page_result.aggregated_data)
                         
                         # Write to file immediately if incremental handler is provided
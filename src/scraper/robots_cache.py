@@ -0,0 +1,465 @@
+"""Process-wide robots.txt cache shared by every scraper."""
+import json
+import re
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse
+
+
+# Robots.txt may be cached for up to 24 hours (RFC 9309)
+DEFAULT_ROBOTS_TTL = 24 * 60 * 60
+
+
+class RobotsRuleMatcher:
+    """Allow/disallow rules for one user-agent group, compiled for fast lookups.
+
+    Plain path prefixes go into a character trie and rules containing ``*``
+    or ``$`` into a single regex whose alternatives are ordered by priority,
+    so a lookup walks the path once instead of scanning every rule. The most
+    specific (longest) matching rule wins and allow wins ties, as in
+    RFC 9309. Recent verdicts are memoized per path.
+    """
+
+    _TERMINAL = ""  # Trie key holding the rule verdict at a node
+
+    def __init__(self, allow: List[str], disallow: List[str], memo_size: int = 1024):
+        """Compile allow and disallow rules.
+
+        Args:
+            allow: Allow path patterns
+            disallow: Disallow path patterns
+            memo_size: Number of path verdicts remembered
+        """
+        self.memo_size = memo_size
+        self._memo: Dict[str, bool] = {}
+        self._trie: Dict[str, Any] = {}
+
+        wildcard_rules = []
+        for allowed, patterns in ((True, allow), (False, disallow)):
+            for pattern in patterns:
+                if not pattern:
+                    continue
+                if "*" in pattern or "$" in pattern:
+                    wildcard_rules.append((len(pattern), allowed, pattern))
+                else:
+                    self._insert(pattern, allowed)
+
+        # Alternatives are tried in order, so the first one that matches is
+        # the longest rule, with allow ahead of disallow at equal length
+        wildcard_rules.sort(key=lambda rule: (-rule[0], not rule[1]))
+        self._wildcard_rules = [(length, allowed) for length, allowed, _ in wildcard_rules]
+        self._wildcard_regex = (
+            re.compile(
+                "|".join(f"({self._pattern_to_regex(pattern)})" for _, _, pattern in wildcard_rules)
+            )
+            if wildcard_rules
+            else None
+        )
+
+    def _insert(self, prefix: str, allowed: bool) -> None:
+        """Add a plain prefix rule to the trie."""
+        node = self._trie
+        for char in prefix:
+            node = node.setdefault(char, {})
+        # Allow wins if the same prefix is both allowed and disallowed
+        node[self._TERMINAL] = node.get(self._TERMINAL, False) or allowed
+
+    @staticmethod
+    def _pattern_to_regex(pattern: str) -> str:
+        """Translate a robots.txt pattern into a regex anchored at the path start."""
+        anchored = pattern.endswith("$")
+        if anchored:
+            pattern = pattern[:-1]
+        regex = ".*".join(re.escape(part) for part in pattern.split("*"))
+        return regex + ("$" if anchored else "")
+
+    def _match_trie(self, path: str) -> Optional[Tuple[int, bool]]:
+        """Find the longest plain rule that prefixes the path."""
+        best = None
+        node = self._trie
+        if self._TERMINAL in node:
+            best = (0, node[self._TERMINAL])
+        for depth, char in enumerate(path, 1):
+            node = node.get(char)
+            if node is None:
+                break
+            if self._TERMINAL in node:
+                best = (depth, node[self._TERMINAL])
+        return best
+
+    def _match_wildcards(self, path: str) -> Optional[Tuple[int, bool]]:
+        """Find the highest priority wildcard rule matching the path."""
+        if self._wildcard_regex is None:
+            return None
+        match = self._wildcard_regex.match(path)
+        if match is None:
+            return None
+        return self._wildcard_rules[match.lastindex - 1]
+
+    def is_allowed(self, path: str) -> bool:
+        """Check if a path is allowed by the group's rules."""
+        verdict = self._memo.get(path)
+        if verdict is not None:
+            return verdict
+
+        candidates = [
+            match
+            for match in (self._match_trie(path), self._match_wildcards(path))
+            if match is not None
+        ]
+        verdict = max(candidates)[1] if candidates else True
+
+        # Start over when full rather than tracking recency, so concurrent
+        # lookups never need a lock
+        if len(self._memo) >= self.memo_size:
+            self._memo.clear()
+        self._memo[path] = verdict
+        return verdict
+
+
+class RobotsTxtParser:
+    """Parser for robots.txt files."""
+
+    def __init__(self, robots_content: str):
+        """Initialize with robots.txt content."""
+        self.crawl_delays: Dict[str, float] = {}
+        self.rules = self._parse_robots_txt(robots_content)
+        self.matchers = {
+            user_agent: RobotsRuleMatcher(group["allow"], group["disallow"])
+            for user_agent, group in self.rules.items()
+        }
+        self._agent_groups: Dict[str, str] = {}
+
+    def _parse_robots_txt(self, content: str) -> Dict[str, Dict[str, list]]:
+        """Parse robots.txt content into rules.
+
+        Consecutive User-agent lines share the rules that follow them.
+        """
+        rules = {"*": {"allow": [], "disallow": []}}
+        current_user_agents = ["*"]
+        previous_key = None
+
+        for line in content.split("\n"):
+            line = line.split("#", 1)[0].strip()
+            if not line or ":" not in line:
+                continue
+
+            key, value = line.split(":", 1)
+            key = key.strip().lower()
+            value = value.strip()
+
+            if key == "user-agent":
+                user_agent = value.lower()
+                if previous_key == "user-agent":
+                    current_user_agents.append(user_agent)
+                else:
+                    current_user_agents = [user_agent]
+                rules.setdefault(user_agent, {"allow": [], "disallow": []})
+            elif key == "allow":
+                for user_agent in current_user_agents:
+                    rules[user_agent]["allow"].append(value)
+            elif key == "disallow":
+                # Only add non-empty disallow rules (empty disallow means allow all)
+                if value:
+                    for user_agent in current_user_agents:
+                        rules[user_agent]["disallow"].append(value)
+            elif key == "crawl-delay":
+                try:
+                    crawl_delay = float(value)
+                except ValueError:
+                    continue
+                if crawl_delay >= 0:
+                    for user_agent in current_user_agents:
+                        self.crawl_delays[user_agent] = crawl_delay
+            previous_key = key
+
+        return rules
+
+    def _group_for(self, user_agent: str) -> str:
+        """Get the rule group that applies to a user agent, memoized.
+
+        The full user agent is tried first, then its product token (the part
+        before the first ``/`` or space), then ``*``.
+        """
+        group = self._agent_groups.get(user_agent)
+        if group is None:
+            lowered = user_agent.lower()
+            product_token = re.split(r"[/\s]", lowered, 1)[0]
+            if lowered in self.rules:
+                group = lowered
+            elif product_token in self.rules:
+                group = product_token
+            else:
+                group = "*"
+            self._agent_groups[user_agent] = group
+        return group
+
+    def get_crawl_delay(self, user_agent: str) -> Optional[float]:
+        """Get the Crawl-delay for user agent, or None if not set."""
+        return self.crawl_delays.get(self._group_for(user_agent))
+
+    def is_allowed(self, path: str, user_agent: str) -> bool:
+        """Check if path is allowed for user agent."""
+        if path == "/robots.txt":
+            return True  # Always allowed (RFC 9309)
+        return self.matchers[self._group_for(user_agent)].is_allowed(path or "/")
+
+
+def robots_url_for(url: str) -> str:
+    """Get the robots.txt URL governing a page URL."""
+    parsed_url = urlparse(url)
+    return urljoin(f"{parsed_url.scheme}://{parsed_url.netloc}", "/robots.txt")
+
+
+def robots_path_for(url: str) -> str:
+    """Get the path and query of a URL as matched by robots.txt rules."""
+    parsed_url = urlparse(url)
+    path = parsed_url.path or "/"
+    return f"{path}?{parsed_url.query}" if parsed_url.query else path
+
+
+@dataclass
+class RobotsCacheEntry:
+    """A parsed robots.txt file and when it expires."""
+
+    content: str
+    parser: RobotsTxtParser = field(repr=False)
+    fetched_at: float
+    ttl: float
+
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        """Check if the entry is older than its TTL."""
+        now = time.time() if now is None else now
+        return now - self.fetched_at >= self.ttl
+
+
+class RobotsCache:
+    """Thread-safe LRU cache of parsed robots.txt files keyed by robots.txt URL.
+
+    Entries expire after ``ttl`` seconds (24 hours by default). Concurrent
+    lookups for a robots.txt that is not cached trigger a single fetch; the
+    other callers wait for its result. If ``storage_path`` is given the raw
+    files are persisted as JSON and reloaded on startup.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_ROBOTS_TTL,
+        max_entries: int = 1000,
+        storage_path: Optional[str] = None,
+        error_ttl: float = 60 * 60,
+    ):
+        """Initialize robots.txt cache.
+
+        Args:
+            ttl: Seconds a fetched robots.txt stays valid
+            max_entries: Number of robots.txt files kept before evicting the
+                least recently used
+            storage_path: JSON file for persisting robots.txt files, or None
+                to keep them in memory
+            error_ttl: Seconds a failed fetch is remembered as allow-all
+
+        Raises:
+            ValueError: If ttl, error_ttl or max_entries is invalid
+        """
+        if ttl <= 0 or error_ttl <= 0:
+            raise ValueError("ttl and error_ttl must be positive")
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.ttl = ttl
+        self.error_ttl = error_ttl
+        self.max_entries = max_entries
+        self.storage_path = Path(storage_path) if storage_path else None
+
+        self._entries: "OrderedDict[str, RobotsCacheEntry]" = OrderedDict()
+        self._in_flight: Dict[str, threading.Event] = {}
+        self.hits = 0
+        self.misses = 0
+        self.fetches = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+        self._load()
+
+    def get_parser(
+        self, robots_url: str, fetch: Callable[[str], Optional[str]]
+    ) -> RobotsTxtParser:
+        """Get the parsed robots.txt, fetching it if missing or expired.
+
+        Args:
+            robots_url: URL of the robots.txt file
+            fetch: Callable returning the robots.txt content, or None/"" when
+                the site has none; exceptions are treated as allow-all for
+                ``error_ttl`` seconds
+
+        Returns:
+            Parsed robots.txt rules
+        """
+        while True:
+            with self.lock:
+                entry = self._entries.get(robots_url)
+                if entry is not None and not entry.is_expired():
+                    self._entries.move_to_end(robots_url)
+                    self.hits += 1
+                    return entry.parser
+
+                in_flight = self._in_flight.get(robots_url)
+                if in_flight is None:
+                    self._in_flight[robots_url] = threading.Event()
+                    self.misses += 1
+                    break
+
+            # Another caller is fetching this robots.txt; use its result
+            in_flight.wait()
+
+        try:
+            return self._fetch_and_store(robots_url, fetch)
+        finally:
+            with self.lock:
+                self._in_flight.pop(robots_url).set()
+
+    def _fetch_and_store(
+        self, robots_url: str, fetch: Callable[[str], Optional[str]]
+    ) -> RobotsTxtParser:
+        """Fetch, parse and cache a robots.txt file."""
+        ttl = self.ttl
+        try:
+            content = fetch(robots_url) or ""
+        except Exception:
+            content = ""
+            ttl = self.error_ttl
+
+        entry = RobotsCacheEntry(
+            content=content,
+            parser=RobotsTxtParser(content),
+            fetched_at=time.time(),
+            ttl=ttl,
+        )
+        with self.lock:
+            self.fetches += 1
+            self._entries[robots_url] = entry
+            self._entries.move_to_end(robots_url)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            self._save()
+        return entry.parser
+
+    def invalidate(self, robots_url: str) -> None:
+        """Forget a cached robots.txt so the next lookup refetches it."""
+        with self.lock:
+            self._entries.pop(robots_url, None)
+            self._save()
+
+    def __contains__(self, robots_url: str) -> bool:
+        """Check whether an unexpired robots.txt is cached."""
+        with self.lock:
+            entry = self._entries.get(robots_url)
+            return entry is not None and not entry.is_expired()
+
+    def __len__(self) -> int:
+        """Get number of cached robots.txt files."""
+        with self.lock:
+            return len(self._entries)
+
+    def clear(self) -> None:
+        """Remove all entries and reset counters."""
+        with self.lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.fetches = 0
+            self.evictions = 0
+            self._save()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with entry count, hits, misses, fetches and evictions
+        """
+        with self.lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "fetches": self.fetches,
+                "evictions": self.evictions,
+            }
+
+    def _load(self) -> None:
+        """Load persisted robots.txt files, skipping expired or corrupt entries."""
+        if self.storage_path is None or not self.storage_path.exists():
+            return
+        try:
+            with open(self.storage_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            stored = sorted(data.items(), key=lambda item: item[1]["fetched_at"])
+            for robots_url, item in stored:
+                entry = RobotsCacheEntry(
+                    content=item["content"],
+                    parser=RobotsTxtParser(item["content"]),
+                    fetched_at=float(item["fetched_at"]),
+                    ttl=float(item["ttl"]),
+                )
+                if not entry.is_expired():
+                    self._entries[robots_url] = entry
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            self._entries.clear()
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _save(self) -> None:
+        """Persist entries atomically; caller holds the lock."""
+        if self.storage_path is None:
+            return
+        data = {
+            robots_url: {
+                "content": entry.content,
+                "fetched_at": entry.fetched_at,
+                "ttl": entry.ttl,
+            }
+            for robots_url, entry in self._entries.items()
+        }
+        try:
+            self.storage_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.storage_path.with_suffix(self.storage_path.suffix + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.storage_path)
+        except OSError:
+            pass
+
+
+_shared_robots_cache: Optional[RobotsCache] = None
+_shared_robots_cache_lock = threading.Lock()
+
+
+def get_shared_robots_cache() -> RobotsCache:
+    """Get the process-wide robots.txt cache, creating it on first use."""
+    global _shared_robots_cache
+    with _shared_robots_cache_lock:
+        if _shared_robots_cache is None:
+            _shared_robots_cache = RobotsCache()
+        return _shared_robots_cache
+
+
+def configure_shared_robots_cache(**kwargs) -> RobotsCache:
+    """Replace the process-wide robots.txt cache with a newly configured one.
+
+    Args:
+        **kwargs: Arguments passed to RobotsCache
+
+    Returns:
+        The new shared cache
+    """
+    global _shared_robots_cache
+    with _shared_robots_cache_lock:
+        _shared_robots_cache = RobotsCache(**kwargs)
+        return _shared_robots_cache
@@ -5,5 +5,6 @@ from .chunk_optimizer import ChunkOptimizer, ChunkBoundary
 from .metadata_enricher import MetadataEnricher
 from .relationship_mapper import RelationshipMapper
 from .export_manager import ExportManager
+from .token_chunking import ChunkSpan, TokenChunker, TokenCounter
 
-__all__ = ['SemanticStructurer', 'SemanticResult', 'ChunkOptimizer', 'ChunkBoundary', 'MetadataEnricher', 'RelationshipMapper', 'ExportManager']
\ No newline at end of file
+__all__ = ['SemanticStructurer', 'SemanticResult', 'ChunkOptimizer', 'ChunkBoundary', 'MetadataEnricher', 'RelationshipMapper', 'ExportManager', 'ChunkSpan', 'TokenChunker', 'TokenCounter']
\ No newline at end of file
@@ -4,6 +4,8 @@ import re
 from typing import Dict, List, Any, Optional, Union
 from dataclasses import dataclass
 
+from .token_chunking import MODEL_TOKENIZER, TokenChunker, TokenCounter
+
 
 @dataclass
 class ChunkBoundary:
@@ -46,11 +48,15 @@ class ChunkOptimizer:
         self.min_chunk_size = self.config.get('min_chunk_size', 50)
         self.overlap_size = self.config.get('overlap_size', 50)
         self.preserve_sentences = self.config.get('preserve_sentences', True)
+        # Chunk sizes are counted in model tokens by default; "words" does not
+        # keep chunks within a model's token limit
+        self.token_counter = TokenCounter(self.config.get('tokenizer') or MODEL_TOKENIZER)
         
         # Compile regex patterns for efficiency
         self.sentence_pattern = re.compile(r'[.!?]+\s+')
         self.paragraph_pattern = re.compile(r'\n\s*\n')
         self.word_pattern = re.compile(r'\s+')
+        self.token_pattern = re.compile(r'\S+')
     
     def optimize_chunks(self, chunks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Optimize existing chunks for better semantic coherence."""
@@ -58,9 +64,9 @@ class ChunkOptimizer:
         
         for chunk in chunks:
             content = chunk["content"]
-            word_count = len(content.split())
+            token_count = self.token_counter.count(content)
             
-            if word_count > self.max_chunk_size:
+            if token_count > self.max_chunk_size:
                 # Split large chunks
                 split_chunks = self._split_chunk(chunk)
                 optimized.extend(split_chunks)
@@ -78,146 +84,75 @@ class ChunkOptimizer:
         return optimized
     
     def _split_chunk(self, chunk: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Split a large chunk into smaller ones."""
-        content = chunk["content"]
-        base_id = chunk["id"]
-        
-        # Find optimal boundaries
-        boundaries = self.find_optimal_boundaries(content, self.max_chunk_size)
-        
-        if not boundaries:
-            # Fallback to simple word-based splitting
-            return self._split_by_words(chunk)
-        
-        # Create chunks based on boundaries
-        split_chunks = []
-        last_pos = 0
-        
-        for i, boundary in enumerate(boundaries):
-            boundary_pos = boundary.position if isinstance(boundary, ChunkBoundary) else boundary["position"]
-            
-            chunk_content = content[last_pos:boundary_pos].strip()
-            if chunk_content:
-                new_chunk = {
-                    "id": f"{base_id}_split_{i+1}",
-                    "content": chunk_content,
-                    "type": chunk.get("type", "text"),
-                    "metadata": {
-                        **chunk.get("metadata", {}),
-                        "split_from": base_id,
-                        "split_index": i + 1,
-                        "boundary_type": boundary.boundary_type if isinstance(boundary, ChunkBoundary) else boundary["boundary_type"]
-                    }
-                }
-                split_chunks.append(new_chunk)
-            
-            last_pos = boundary_pos
-        
-        # Add final chunk if there's remaining content
-        remaining_content = content[last_pos:].strip()
-        if remaining_content:
-            final_chunk = {
-                "id": f"{base_id}_split_{len(boundaries)+1}",
-                "content": remaining_content,
-                "type": chunk.get("type", "text"),
-                "metadata": {
-                    **chunk.get("metadata", {}),
-                    "split_from": base_id,
-                    "split_index": len(boundaries) + 1,
-                    "boundary_type": "end"
-                }
-            }
-            split_chunks.append(final_chunk)
-        
-        return split_chunks
-    
-    def _split_by_words(self, chunk: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Fallback word-based splitting."""
+        """Split a large chunk into pieces packed up to the token budget."""
         content = chunk["content"]
-        words = content.split()
         base_id = chunk["id"]
+        chunker = TokenChunker(self.max_chunk_size, counter=self.token_counter)
         
         split_chunks = []
-        chunk_num = 1
-        
-        for i in range(0, len(words), self.max_chunk_size):
-            chunk_words = words[i:i + self.max_chunk_size]
-            chunk_content = ' '.join(chunk_words)
-            
-            new_chunk = {
-                "id": f"{base_id}_word_{chunk_num}",
-                "content": chunk_content,
+        for span in chunker.chunk(content):
+            split_chunks.append({
+                "id": f"{base_id}_split_{span.index + 1}",
+                "content": span.text(content),
                 "type": chunk.get("type", "text"),
                 "metadata": {
                     **chunk.get("metadata", {}),
                     "split_from": base_id,
-                    "split_method": "word_based",
-                    "word_count": len(chunk_words)
+                    "split_index": span.index + 1,
+                    "boundary_type": span.boundary_type,
+                    "start_offset": span.start,
+                    "end_offset": span.end,
+                    "token_count": span.token_count
                 }
-            }
-            split_chunks.append(new_chunk)
-            chunk_num += 1
+            })
         
         return split_chunks
     
     def find_optimal_boundaries(self, text: str, max_size: int) -> List[ChunkBoundary]:
-        """Find optimal boundaries for chunking."""
-        boundaries = []
-        words = text.split()
+        """Find optimal boundaries for chunking.
+
+        Word offsets are recorded in one pass over the text, and the words
+        before each candidate boundary are counted by advancing through those
+        offsets, so the whole search is linear in the length of the text.
+        """
+        boundaries = {}
+        word_spans = [match.span() for match in self.token_pattern.finditer(text)]
+        word_starts = [start for start, _ in word_spans]
         
         # Always find boundaries, even for short text (for testing and flexibility)
         # Real chunking decisions happen at higher levels
-        
-        # Find paragraph boundaries (highest priority)
-        for match in self.paragraph_pattern.finditer(text):
-            pos = match.end()
-            words_before = len(text[:pos].split())
-            if 1 <= words_before <= max_size:  # Allow smaller chunks for natural boundaries
-                boundaries.append(ChunkBoundary(
-                    position=pos,
-                    boundary_type="paragraph",
-                    confidence=0.9
-                ))
-        
-        # Find sentence boundaries (medium priority)
-        for match in self.sentence_pattern.finditer(text):
-            pos = match.end()
-            words_before = len(text[:pos].split())
-            if 1 <= words_before <= max_size:  # Allow smaller chunks for natural boundaries
-                boundaries.append(ChunkBoundary(
-                    position=pos,
-                    boundary_type="sentence", 
-                    confidence=0.7
-                ))
-        
-        # If no good boundaries found, create word boundaries
+        candidates = [
+            (self.paragraph_pattern, "paragraph", 0.9),  # Highest priority
+            (self.sentence_pattern, "sentence", 0.7),    # Medium priority
+        ]
+        for pattern, boundary_type, confidence in candidates:
+            positions = [match.end() for match in pattern.finditer(text)]
+            for pos, words_before in zip(positions, self._count_words_before(word_starts, positions)):
+                if 1 <= words_before <= max_size:  # Allow smaller chunks for natural boundaries
+                    boundary = ChunkBoundary(position=pos, boundary_type=boundary_type, confidence=confidence)
+                    boundaries.setdefault(boundary, boundary)
+        
+        # If no good boundaries found, create word boundaries at the start of
+        # the word following every max_size words (never at the end)
         if not boundaries:
-            current_pos = 0
-            word_count = 0
-            
-            for i, word in enumerate(words):
-                word_count += 1
-                # Find word position more reliably
-                word_start = text.find(word, current_pos)
-                current_pos = word_start + len(word)
-                
-                if word_count >= max_size and i < len(words) - 1:  # Don't add boundary at end
-                    # Find next space after the word
-                    space_pos = text.find(' ', current_pos)
-                    if space_pos > 0:
-                        current_pos = space_pos + 1
-                    
-                    boundaries.append(ChunkBoundary(
-                        position=current_pos,
-                        boundary_type="word",
-                        confidence=0.3
-                    ))
-                    word_count = 0
+            step = max(max_size, 1)
+            for index in range(step, len(word_spans), step):
+                boundary = ChunkBoundary(position=word_starts[index], boundary_type="word", confidence=0.3)
+                boundaries.setdefault(boundary, boundary)
         
-        # Sort boundaries by position and remove duplicates
-        boundaries = sorted(list(set(boundaries)), key=lambda b: b.position)
-        
-        return boundaries
+        # Sort boundaries by position
+        return sorted(boundaries, key=lambda b: b.position)
+    
+    @staticmethod
+    def _count_words_before(word_starts: List[int], positions: List[int]) -> List[int]:
+        """Count the words starting before each of a sorted list of positions."""
+        counts = []
+        index = 0
+        for pos in positions:
+            while index < len(word_starts) and word_starts[index] < pos:
+                index += 1
+            counts.append(index)
+        return counts
     
     def calculate_semantic_coherence(self, text: str) -> float:
         """Calculate semantic coherence score for text."""
@@ -271,21 +206,23 @@ class ChunkOptimizer:
             
             while i < len(current_chunks):
                 chunk = current_chunks[i]
-                word_count = len(chunk["content"].split())
+                token_count = self.token_counter.count(chunk["content"])
                 
-                if word_count < self.min_chunk_size:
+                if token_count < self.min_chunk_size:
                     # Try to merge with next chunk
                     merge_group = [chunk]
+                    combined_tokens = token_count
                     j = i + 1
                     
                     while j < len(current_chunks):
                         next_chunk = current_chunks[j]
-                        combined_words = len(" ".join([c["content"] for c in merge_group + [next_chunk]]).split())
+                        next_tokens = combined_tokens + self.token_counter.count(next_chunk["content"])
                         
-                        if combined_words <= self.max_chunk_size:
+                        if next_tokens <= self.max_chunk_size:
                             merge_group.append(next_chunk)
+                            combined_tokens = next_tokens
                             j += 1
-                            if combined_words >= self.min_chunk_size:
+                            if combined_tokens >= self.min_chunk_size:
                                 break  # We have enough words now
                         else:
                             break  # Would exceed max size
@@ -338,9 +275,9 @@ class ChunkOptimizer:
         result = []
         
         for chunk in chunks:
-            word_count = len(chunk["content"].split())
+            token_count = self.token_counter.count(chunk["content"])
             
-            if word_count > self.max_chunk_size:
+            if token_count > self.max_chunk_size:
                 split_chunks = self._split_chunk(chunk)
                 result.extend(split_chunks)
             else:
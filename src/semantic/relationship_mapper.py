@@ -1,11 +1,15 @@
 """RelationshipMapper for creating relationships between semantic chunks."""
 
-import re
 import math
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timezone
 from collections import defaultdict
 
+from .similarity_index import MinHashLSH, jaccard, tokenize
+
+# Boost applied to the similarity of chunks from related fields
+RELATED_FIELD_BOOST = 1.2
+
 
 class RelationshipMapper:
     """Creates and manages relationships between semantic chunks."""
@@ -17,6 +21,11 @@ class RelationshipMapper:
         self.create_semantic = self.config.get('create_semantic', True)
         self.create_temporal = self.config.get('create_temporal', False)
         self.confidence_threshold = self.config.get('confidence_threshold', 0.5)
+        # Below this many chunks every pair is compared exactly
+        self.lsh_min_chunks = self.config.get('lsh_min_chunks', 500)
+        self.minhash_permutations = self.config.get('minhash_permutations', 128)
+        self.lsh_recall = self.config.get('lsh_recall', 0.95)
+        self.semantic_stats: Dict[str, Any] = {}
         
         # Field hierarchy definitions
         self.field_hierarchy = {
@@ -117,25 +126,58 @@ class RelationshipMapper:
         return relationships
     
     def create_semantic_relationships(self, chunks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Create semantic similarity relationships."""
+        """Create semantic similarity relationships.
+
+        Each chunk is tokenized once. Small inputs compare every pair; from
+        ``lsh_min_chunks`` chunks on, MinHash LSH proposes candidate pairs
+        and only those are verified with the exact similarity.
+        """
         relationships = []
+        token_sets = [tokenize(chunk.get("content", "")) for chunk in chunks]
         
-        # Compare each pair of chunks for semantic similarity
-        for i, chunk1 in enumerate(chunks):
-            for j, chunk2 in enumerate(chunks[i+1:], i+1):
-                similarity = self.calculate_semantic_similarity(chunk1, chunk2)
-                
-                if similarity > self.confidence_threshold:
-                    relationships.append({
-                        "from": chunk1["id"],
-                        "to": chunk2["id"],
-                        "type": "semantically_related",
-                        "confidence": similarity,
-                        "bidirectional": True
-                    })
-        
+        for i, j in self._semantic_candidate_pairs(token_sets):
+            similarity = self._similarity_from_tokens(chunks[i], chunks[j], token_sets[i], token_sets[j])
+            
+            if similarity > self.confidence_threshold:
+                relationships.append({
+                    "from": chunks[i]["id"],
+                    "to": chunks[j]["id"],
+                    "type": "semantically_related",
+                    "confidence": similarity,
+                    "bidirectional": True
+                })
+        
+        self.semantic_stats["relationships"] = len(relationships)
         return relationships
     
+    def _semantic_candidate_pairs(self, token_sets: List[frozenset]) -> List[Tuple[int, int]]:
+        """Get the chunk index pairs worth scoring, in (i, j) order with i < j."""
+        count = len(token_sets)
+        # Related fields boost the Jaccard score, so weaker overlaps can still qualify
+        min_jaccard = self.confidence_threshold / RELATED_FIELD_BOOST
+        
+        if count < self.lsh_min_chunks or min_jaccard <= 0:
+            pairs = [
+                (i, j) for i in range(count) if token_sets[i]
+                for j in range(i + 1, count) if token_sets[j]
+            ]
+            method = "exact"
+        else:
+            index = MinHashLSH(min(min_jaccard, 1.0), num_perm=self.minhash_permutations,
+                               recall=self.lsh_recall)
+            for position, tokens in enumerate(token_sets):
+                index.add(position, tokens)
+            pairs = sorted(index.candidate_pairs())
+            method = "minhash_lsh"
+        
+        self.semantic_stats = {
+            "method": method,
+            "chunks": count,
+            "candidate_pairs": len(pairs),
+            "all_pairs": count * (count - 1) // 2,
+        }
+        return pairs
+    
     def create_temporal_relationships(self, chunks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Create temporal relationships for time-sensitive content."""
         relationships = []
@@ -177,30 +219,25 @@ class RelationshipMapper:
     def calculate_semantic_similarity(self, chunk1: Dict[str, Any], 
                                     chunk2: Dict[str, Any]) -> float:
         """Calculate semantic similarity between two chunks."""
-        content1 = chunk1.get("content", "").lower()
-        content2 = chunk2.get("content", "").lower()
-        
-        if not content1 or not content2:
-            return 0.0
-        
+        return self._similarity_from_tokens(
+            chunk1, chunk2,
+            tokenize(chunk1.get("content", "")), tokenize(chunk2.get("content", ""))
+        )
+    
+    def _similarity_from_tokens(self, chunk1: Dict[str, Any], chunk2: Dict[str, Any],
+                                words1: frozenset, words2: frozenset) -> float:
+        """Score two chunks from their already tokenized contents."""
         # Simple word-based similarity (Jaccard similarity)
-        words1 = set(re.findall(r'\b\w+\b', content1))
-        words2 = set(re.findall(r'\b\w+\b', content2))
-        
-        if not words1 or not words2:
+        jaccard_similarity = jaccard(words1, words2)
+        if jaccard_similarity == 0.0:
             return 0.0
         
-        intersection = len(words1.intersection(words2))
-        union = len(words1.union(words2))
-        
-        jaccard_similarity = intersection / union if union > 0 else 0.0
-        
         # Boost similarity for related fields
         field1 = chunk1.get("source_field", "")
         field2 = chunk2.get("source_field", "")
         
         if self._are_fields_related(field1, field2):
-            jaccard_similarity *= 1.2  # 20% boost for related fields
+            jaccard_similarity *= RELATED_FIELD_BOOST  # 20% boost for related fields
         
         return min(jaccard_similarity, 1.0)
     
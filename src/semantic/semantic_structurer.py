@@ -8,6 +8,8 @@ from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
 from enum import Enum
 
+from .token_chunking import ChunkSpan, TokenChunker, TokenCounter
+
 
 # Constants for Clean Code
 class SemanticConstants:
@@ -57,6 +59,7 @@ class ChunkingConfig:
     chunk_size: int = SemanticConstants.DEFAULT_CHUNK_SIZE
     overlap_size: int = SemanticConstants.DEFAULT_OVERLAP_SIZE
     enable_summaries: bool = True
+    tokenizer: Optional[str] = None  # Chunk sizes are in this tokenizer's tokens; words by default, which ignores model limits ("model" enforces them)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -195,6 +198,7 @@ class SemanticStructurer:
         self.config = self._create_config(config)
         self.content_processor = ContentProcessor(self.config)
         self.chunk_factory = ChunkFactory()
+        self.token_counter = TokenCounter(self.config.tokenizer)
         
         # Backward compatibility attributes
         self.chunk_size = self.config.chunk_size
@@ -209,7 +213,8 @@ class SemanticStructurer:
         return ChunkingConfig(
             chunk_size=config_dict.get('chunk_size', SemanticConstants.DEFAULT_CHUNK_SIZE),
             overlap_size=config_dict.get('overlap_size', SemanticConstants.DEFAULT_OVERLAP_SIZE),
-            enable_summaries=config_dict.get('enable_summaries', True)
+            enable_summaries=config_dict.get('enable_summaries', True),
+            tokenizer=config_dict.get('tokenizer')
         )
     
     def structure_for_rag(self, data: Dict[str, Any], 
@@ -252,7 +257,7 @@ class SemanticStructurer:
                 continue
                 
             new_chunks, chunk_id_counter = self._process_field(
-                key, value, config.chunk_size, chunk_id_counter
+                key, value, config, chunk_id_counter
             )
             chunks.extend(new_chunks)
         
@@ -262,15 +267,15 @@ class SemanticStructurer:
         """Check if field should be skipped during processing."""
         return key.startswith('_')
     
-    def _process_field(self, key: str, value: Any, chunk_size: int, 
+    def _process_field(self, key: str, value: Any, config: ChunkingConfig, 
                       chunk_id_counter: int) -> Tuple[List[Dict[str, Any]], int]:
         """Process a single field based on its value type."""
         if isinstance(value, str):
-            chunks = self._create_text_chunks(value, key, chunk_size, chunk_id_counter)
+            chunks = self._create_text_chunks(value, key, config, chunk_id_counter)
         elif isinstance(value, dict):
-            chunks = self._create_nested_chunks(value, key, chunk_size, chunk_id_counter)
+            chunks = self._create_nested_chunks(value, key, config.chunk_size, chunk_id_counter)
         elif isinstance(value, list):
-            chunks = self._create_list_chunks(value, key, chunk_size, chunk_id_counter)
+            chunks = self._create_list_chunks(value, key, config.chunk_size, chunk_id_counter)
         else:
             chunks = []
         
@@ -310,21 +315,17 @@ class SemanticStructurer:
         }
     
     def _create_text_chunks(self, text: str, field_name: str, 
-                           chunk_size: int, start_id: int) -> List[Dict[str, Any]]:
+                           config: ChunkingConfig, start_id: int) -> List[Dict[str, Any]]:
         """Create chunks from text content."""
-        words = self.content_processor.split_into_words(text)
+        token_count = self.token_counter.count(text)
         
-        if self._is_single_chunk(words, chunk_size):
-            return self._create_single_text_chunk(text, field_name, words, start_id)
+        if token_count <= config.chunk_size:
+            return self._create_single_text_chunk(text, field_name, token_count, start_id)
         else:
-            return self._create_multiple_text_chunks(words, field_name, chunk_size, start_id)
-    
-    def _is_single_chunk(self, words: List[str], chunk_size: int) -> bool:
-        """Check if content fits in a single chunk."""
-        return len(words) <= chunk_size
+            return self._create_multiple_text_chunks(text, field_name, config, start_id)
     
     def _create_single_text_chunk(self, text: str, field_name: str, 
-                                 words: List[str], start_id: int) -> List[Dict[str, Any]]:
+                                 token_count: int, start_id: int) -> List[Dict[str, Any]]:
         """Create a single text chunk."""
         content = self.content_processor.ensure_sentence_termination(text)
         
@@ -333,52 +334,48 @@ class SemanticStructurer:
             content=content,
             source_field=field_name,
             metadata={
-                "word_count": len(words),
+                "word_count": len(content.split()),
+                "token_count": token_count,
                 "chunk_type": field_name
             }
         )
         
         return [chunk]
     
-    def _create_multiple_text_chunks(self, words: List[str], field_name: str,
-                                    chunk_size: int, start_id: int) -> List[Dict[str, Any]]:
-        """Create multiple text chunks from long content."""
+    def _create_multiple_text_chunks(self, text: str, field_name: str,
+                                    config: ChunkingConfig, start_id: int) -> List[Dict[str, Any]]:
+        """Create multiple text chunks from long content, packed to the token budget."""
+        chunker = TokenChunker(config.chunk_size, config.overlap_size, counter=self.token_counter)
         chunks = []
-        chunk_num = 0
         
-        for i in range(0, len(words), chunk_size):
-            chunk_words = self._get_chunk_words(words, i, chunk_size)
-            content = ' '.join(chunk_words)
+        for span in chunker.chunk(text):
+            content = span.text(text)
             
             chunk = self.chunk_factory.create_text_chunk(
-                chunk_id=f"chunk_{start_id + chunk_num}",
+                chunk_id=f"chunk_{start_id + span.index}",
                 content=content,
                 source_field=field_name,
                 metadata={
-                    "word_count": len(chunk_words),
+                    **self._span_metadata(span),
+                    "word_count": len(content.split()),
                     "chunk_type": field_name,
-                    "chunk_index": chunk_num
+                    "chunk_index": span.index
                 }
             )
             
             chunks.append(chunk)
-            chunk_num += 1
         
         return chunks
     
-    def _get_chunk_words(self, words: List[str], start_index: int, chunk_size: int) -> List[str]:
-        """Get words for a chunk, respecting sentence boundaries."""
-        chunk_words = words[start_index:start_index + chunk_size]
-        
-        # Don't break mid-sentence if not at end
-        if (start_index + chunk_size < len(words) and 
-            not chunk_words[-1].endswith(SemanticConstants.SENTENCE_TERMINATORS)):
-            
-            boundary = self.content_processor.find_sentence_boundary(chunk_words, 0)
-            if boundary < len(chunk_words):
-                chunk_words = chunk_words[:boundary]
-        
-        return chunk_words
+    @staticmethod
+    def _span_metadata(span: ChunkSpan) -> Dict[str, Any]:
+        """Offsets and size of a chunk within its source field."""
+        return {
+            "start_offset": span.start,
+            "end_offset": span.end,
+            "token_count": span.token_count,
+            "boundary_type": span.boundary_type
+        }
     
     def _create_nested_chunks(self, nested_data: Dict[str, Any], 
                              parent_field: str, chunk_size: int, 
@@ -546,7 +543,7 @@ class SemanticStructurer:
     
     def chunk_intelligently(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Apply intelligent chunking that respects natural boundaries."""
-        intelligent_chunker = IntelligentChunker(self.config)
+        intelligent_chunker = IntelligentChunker(self.config, self.token_counter)
         return intelligent_chunker.process(data)
     
     def generate_summary(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -825,9 +822,10 @@ class MultiModalProcessor:
 class IntelligentChunker:
     """Applies intelligent chunking respecting natural boundaries."""
     
-    def __init__(self, config: ChunkingConfig):
+    def __init__(self, config: ChunkingConfig, token_counter: Optional[TokenCounter] = None):
         self.config = config
         self.content_processor = ContentProcessor(config)
+        self.token_counter = token_counter or TokenCounter(config.tokenizer)
     
     def process(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Apply intelligent chunking to data."""
@@ -841,82 +839,26 @@ class IntelligentChunker:
         return {"chunks": chunks}
     
     def _chunk_text_intelligently(self, text: str, key: str) -> List[Dict[str, Any]]:
-        """Chunk text respecting paragraph and sentence boundaries."""
-        paragraphs = text.split('\n\n')
-        chunks = []
-        chunk_id = len(chunks) + 1
+        """Chunk text respecting paragraph and sentence boundaries.
         
-        for para in paragraphs:
-            para = para.strip()
-            if not para:
-                continue
-            
-            chunks.extend(self._process_paragraph(para, key, chunk_id))
-            chunk_id = len(chunks) + 1
+        Paragraphs are packed together up to the token budget; only
+        paragraphs over the budget are split, at sentence boundaries first.
+        """
+        chunker = TokenChunker(self.config.chunk_size, self.config.overlap_size,
+                               counter=self.token_counter)
         
-        return chunks
-    
-    def _process_paragraph(self, paragraph: str, key: str, chunk_id: int) -> List[Dict[str, Any]]:
-        """Process a single paragraph into chunks."""
-        words = self.content_processor.split_into_words(paragraph)
-        
-        if len(words) <= self.config.chunk_size:
-            return self._create_paragraph_chunk(paragraph, key, chunk_id)
-        else:
-            return self._split_large_paragraph(paragraph, key, chunk_id)
-    
-    def _create_paragraph_chunk(self, paragraph: str, key: str, chunk_id: int) -> List[Dict[str, Any]]:
-        """Create a single chunk for a paragraph."""
-        chunk = {
-            "id": f"chunk_{chunk_id}",
-            "content": paragraph,
-            "type": ChunkType.TEXT.value,
-            "metadata": {
-                "chunk_type": key,
-                "boundary_type": "paragraph"
-            }
-        }
-        return [chunk]
-    
-    def _split_large_paragraph(self, paragraph: str, key: str, chunk_id: int) -> List[Dict[str, Any]]:
-        """Split large paragraph at sentence boundaries."""
-        sentences = self.content_processor.split_into_sentences(paragraph)
-        chunks = []
-        current_chunk = []
-        current_size = 0
-        
-        for sentence in sentences:
-            sentence_words = self.content_processor.split_into_words(sentence)
-            
-            if current_size + len(sentence_words) <= self.config.chunk_size:
-                current_chunk.append(sentence)
-                current_size += len(sentence_words)
-            else:
-                if current_chunk:
-                    chunks.append(self._create_sentence_chunk(current_chunk, key, chunk_id))
-                    chunk_id += 1
-                
-                current_chunk = [sentence]
-                current_size = len(sentence_words)
-        
-        # Add final chunk
-        if current_chunk:
-            chunks.append(self._create_sentence_chunk(current_chunk, key, chunk_id))
-        
-        return chunks
-    
-    def _create_sentence_chunk(self, sentences: List[str], key: str, chunk_id: int) -> Dict[str, Any]:
-        """Create a chunk from sentences."""
-        content = ' '.join(sentences)
-        return {
-            "id": f"chunk_{chunk_id}",
-            "content": content,
-            "type": ChunkType.TEXT.value,
-            "metadata": {
-                "chunk_type": key,
-                "boundary_type": "sentence"
+        return [
+            {
+                "id": f"chunk_{span.index + 1}",
+                "content": span.text(text),
+                "type": ChunkType.TEXT.value,
+                "metadata": {
+                    "chunk_type": key,
+                    **SemanticStructurer._span_metadata(span)
+                }
             }
-        }
+            for span in chunker.chunk(text)
+        ]
     
     def _add_overlap_metadata(self, chunks: List[Dict[str, Any]]):
         """Add overlap metadata for context continuity."""
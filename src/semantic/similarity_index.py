@@ -0,0 +1,158 @@
+"""MinHash signatures and locality-sensitive hashing for near-duplicate chunks."""
+
+import hashlib
+import random
+import re
+from collections import defaultdict
+from typing import Dict, FrozenSet, Hashable, Iterable, List, Set, Tuple
+
+# Mersenne prime 2**61 - 1, the modulus of the universal hash family
+_MERSENNE_PRIME = (1 << 61) - 1
+_WORD_PATTERN = re.compile(r'\b\w+\b')
+
+
+def tokenize(text: str) -> FrozenSet[str]:
+    """Get the set of lowercase words in a text.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        Frozen set of words
+    """
+    return frozenset(_WORD_PATTERN.findall(text.lower()))
+
+
+def jaccard(tokens1: FrozenSet[str], tokens2: FrozenSet[str]) -> float:
+    """Calculate the exact Jaccard similarity of two token sets.
+
+    Args:
+        tokens1: First token set
+        tokens2: Second token set
+
+    Returns:
+        Similarity between 0.0 and 1.0; 0.0 if either set is empty
+    """
+    if not tokens1 or not tokens2:
+        return 0.0
+    intersection = len(tokens1 & tokens2)
+    return intersection / (len(tokens1) + len(tokens2) - intersection)
+
+
+def choose_band_layout(threshold: float, num_perm: int, recall: float) -> Tuple[int, int]:
+    """Pick the LSH band layout for a similarity threshold.
+
+    A pair with Jaccard similarity ``s`` shares at least one band with
+    probability ``1 - (1 - s**rows)**bands``. The layout with the most rows
+    per band (fewest false candidates) that still reaches ``recall`` at the
+    threshold is chosen.
+
+    Args:
+        threshold: Lowest Jaccard similarity that must be found
+        num_perm: Number of MinHash permutations
+        recall: Required probability of finding a pair at the threshold
+
+    Returns:
+        Tuple of (bands, rows)
+    """
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        if 1 - (1 - threshold ** rows) ** bands >= recall:
+            best = (bands, rows)
+        else:
+            break
+    return best
+
+
+class MinHashLSH:
+    """Index token sets by MinHash band so similar sets can be paired quickly.
+
+    Each set is hashed once into a signature of ``num_perm`` minimum hash
+    values and bucketed by band. Only sets sharing a bucket become candidate
+    pairs, so indexing and pairing run in roughly linear time instead of
+    comparing every pair. Candidates are approximate; callers verify them
+    with ``jaccard``.
+    """
+
+    def __init__(self, threshold: float, num_perm: int = 128, recall: float = 0.95, seed: int = 1):
+        """Initialize MinHash LSH index.
+
+        Args:
+            threshold: Jaccard similarity the index is tuned to find
+            num_perm: Number of MinHash permutations
+            recall: Probability of finding a pair exactly at the threshold
+            seed: Seed for the hash permutations
+
+        Raises:
+            ValueError: If threshold is not between 0 and 1 or num_perm is not positive
+        """
+        if not (0.0 < threshold <= 1.0):
+            raise ValueError("threshold must be in (0.0, 1.0]")
+        if num_perm < 1:
+            raise ValueError("num_perm must be at least 1")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands, self.rows = choose_band_layout(threshold, num_perm, recall)
+
+        rng = random.Random(seed)
+        self._permutations = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+        self._buckets: List[Dict[Tuple[int, ...], List[Hashable]]] = [
+            defaultdict(list) for _ in range(self.bands)
+        ]
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Number of indexed sets."""
+        return self._size
+
+    def signature(self, tokens: Iterable[str]) -> Tuple[int, ...]:
+        """Compute the MinHash signature of a token set.
+
+        Args:
+            tokens: Tokens to hash
+
+        Returns:
+            Tuple of ``num_perm`` minimum hash values
+        """
+        # CRC-style hashes are too regular here and correlate the permutations
+        hashes = [
+            int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest(), 'big')
+            for token in tokens
+        ]
+        return tuple(
+            min((a * value + b) % _MERSENNE_PRIME for value in hashes)
+            for a, b in self._permutations
+        )
+
+    def add(self, key: Hashable, tokens: FrozenSet[str]) -> None:
+        """Index a token set under a key; empty sets are ignored.
+
+        Args:
+            key: Identifier returned in candidate pairs
+            tokens: Tokens of the item
+        """
+        if not tokens:
+            return
+        signature = self.signature(tokens)
+        for band, buckets in enumerate(self._buckets):
+            start = band * self.rows
+            buckets[signature[start:start + self.rows]].append(key)
+        self._size += 1
+
+    def candidate_pairs(self) -> Set[Tuple[Hashable, Hashable]]:
+        """Get every pair of keys that share at least one band bucket.
+
+        Returns:
+            Set of (key1, key2) tuples with key1 indexed before key2
+        """
+        pairs: Set[Tuple[Hashable, Hashable]] = set()
+        for buckets in self._buckets:
+            for keys in buckets.values():
+                for i, first in enumerate(keys):
+                    for second in keys[i + 1:]:
+                        pairs.add((first, second))
+        return pairs
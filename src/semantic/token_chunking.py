@@ -0,0 +1,329 @@
+"""Token-aware chunking shared by the semantic structurer, optimizer and file chunkers."""
+
+import logging
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Pattern, Tuple, Union
+
+# Try to import an offline BPE tokenizer
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_SIZE = 8192
+
+# Tokenizer for chunks that must fit a model's context: BPE when tiktoken is
+# installed, otherwise the word-piece approximation. Word counts undercount
+# model tokens, so "words" does not keep chunks within a model's limit.
+MODEL_TOKENIZER = "model"
+
+_PARAGRAPH_BREAK = re.compile(r'\n\s*\n')
+_SENTENCE_BREAK = re.compile(r'(?<=[.!?])\s+')
+_WORD = re.compile(r'\S+')
+_WORD_PIECE = re.compile(r'\w+|[^\w\s]')
+
+
+class WordTokenizer:
+    """Count whitespace-separated words, the historical chunk size unit."""
+
+    name = "words"
+
+    def count(self, text: str) -> int:
+        """Count words in text."""
+        return len(text.split())
+
+
+class WordPieceTokenizer:
+    """Approximate subword tokenizers without a vocabulary.
+
+    Words cost one token per ``chars_per_token`` characters (rounded up) and
+    every punctuation mark costs one token, which tracks BPE and WordPiece
+    counts for English menu text closely enough to size chunks.
+    """
+
+    name = "wordpiece"
+
+    def __init__(self, chars_per_token: int = 4):
+        """Initialize word-piece approximation.
+
+        Args:
+            chars_per_token: Average characters per subword token
+        """
+        self.chars_per_token = chars_per_token
+
+    def count(self, text: str) -> int:
+        """Estimate the number of subword tokens in text."""
+        return sum(
+            1 + (len(piece) - 1) // self.chars_per_token
+            for piece in _WORD_PIECE.findall(text)
+        )
+
+
+class TiktokenTokenizer:
+    """Count tokens with a tiktoken BPE encoding."""
+
+    def __init__(self, encoding_name: str = "cl100k_base"):
+        """Initialize BPE tokenizer.
+
+        Args:
+            encoding_name: tiktoken encoding to load
+
+        Raises:
+            ImportError: If tiktoken is not installed
+        """
+        if tiktoken is None:
+            raise ImportError("tiktoken is not installed")
+        self.name = f"tiktoken:{encoding_name}"
+        self._encoding = tiktoken.get_encoding(encoding_name)
+
+    def count(self, text: str) -> int:
+        """Count BPE tokens in text."""
+        return len(self._encoding.encode(text, disallowed_special=()))
+
+
+def get_tokenizer(spec: Union[str, Any, None] = None) -> Any:
+    """Resolve a tokenizer from a name or instance.
+
+    Args:
+        spec: None or "words" for word counts, "wordpiece" for the subword
+            approximation, "tiktoken" or "tiktoken:<encoding>" for BPE, "model"
+            for BPE when tiktoken is installed and word pieces otherwise, or
+            any object with a ``count(text)`` method
+
+    Returns:
+        Tokenizer with a ``count(text)`` method
+
+    Raises:
+        ValueError: If the tokenizer name is unknown
+    """
+    if spec is None or spec == "words":
+        return WordTokenizer()
+    if not isinstance(spec, str):
+        return spec
+    if spec == "wordpiece":
+        return WordPieceTokenizer()
+    if spec == MODEL_TOKENIZER:
+        return get_tokenizer("tiktoken") if tiktoken is not None else WordPieceTokenizer()
+    if spec == "tiktoken" or spec.startswith("tiktoken:"):
+        encoding_name = spec.partition(":")[2] or "cl100k_base"
+        try:
+            return TiktokenTokenizer(encoding_name)
+        except Exception as e:
+            logger.warning(f"BPE tokenizer unavailable ({e}), using word-piece approximation")
+            return WordPieceTokenizer()
+    raise ValueError(f"Unknown tokenizer: {spec}")
+
+
+class TokenCounter:
+    """Count tokens with a tokenizer, caching the count of every segment seen.
+
+    Menus repeat the same headings, dishes and footers across pages and
+    chunking passes, so counts are memoized per distinct string.
+    """
+
+    def __init__(self, tokenizer: Union[str, Any, None] = None,
+                 cache_size: int = DEFAULT_CACHE_SIZE):
+        """Initialize token counter.
+
+        Args:
+            tokenizer: Tokenizer name or instance (see ``get_tokenizer``)
+            cache_size: Number of distinct strings whose counts are kept
+        """
+        self.tokenizer = get_tokenizer(tokenizer)
+        self._count = lru_cache(maxsize=cache_size)(self.tokenizer.count)
+
+    def count(self, text: str) -> int:
+        """Count tokens in text."""
+        return self._count(text)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        info = self._count.cache_info()
+        return {
+            "tokenizer": getattr(self.tokenizer, "name", type(self.tokenizer).__name__),
+            "cache_hits": info.hits,
+            "cache_misses": info.misses,
+            "cached_segments": info.currsize,
+        }
+
+
+@dataclass
+class Segment:
+    """Smallest unit packed into chunks: a paragraph, sentence or word run."""
+    start: int
+    end: int
+    tokens: int
+    boundary_type: str
+
+
+@dataclass
+class ChunkSpan:
+    """A chunk as character offsets into its source text."""
+    start: int
+    end: int
+    token_count: int
+    boundary_type: str
+    index: int = 0
+
+    def text(self, source: str) -> str:
+        """Slice the chunk out of its source text."""
+        return source[self.start:self.end]
+
+
+class TokenChunker:
+    """Split text into chunks that fill a token budget.
+
+    Text is segmented into paragraphs; paragraphs over the budget are split
+    into sentences, and sentences over the budget into runs of words. The
+    segments are then packed greedily into chunks of at most ``max_tokens``
+    tokens, each chunk repeating up to ``overlap_tokens`` tokens of trailing
+    segments from the previous one. Chunk token counts are the sum of their
+    segment counts.
+    """
+
+    def __init__(self, max_tokens: int = 512, overlap_tokens: int = 0,
+                 tokenizer: Union[str, Any, None] = None,
+                 counter: Optional[TokenCounter] = None):
+        """Initialize token chunker.
+
+        Args:
+            max_tokens: Token budget per chunk
+            overlap_tokens: Tokens of context carried over between chunks
+            tokenizer: Tokenizer name or instance, used when no counter is given
+            counter: Shared token counter
+
+        Raises:
+            ValueError: If max_tokens is not positive or overlap_tokens is negative
+        """
+        if max_tokens < 1:
+            raise ValueError("max_tokens must be at least 1")
+        if overlap_tokens < 0:
+            raise ValueError("overlap_tokens must not be negative")
+        self.max_tokens = max_tokens
+        self.overlap_tokens = overlap_tokens
+        self.counter = counter or TokenCounter(tokenizer)
+
+    def chunk(self, text: str) -> List[ChunkSpan]:
+        """Chunk text into spans within the token budget.
+
+        Args:
+            text: Text to chunk
+
+        Returns:
+            Chunk spans in document order
+        """
+        return self.pack(self.segment(text))
+
+    def segment(self, text: str) -> List[Segment]:
+        """Split text into segments no larger than the budget where possible.
+
+        Args:
+            text: Text to segment
+
+        Returns:
+            Segments in document order; a single word over the budget stays whole
+        """
+        segments: List[Segment] = []
+        for start, end in _spans(text, _PARAGRAPH_BREAK, 0, len(text)):
+            tokens = self.counter.count(text[start:end])
+            if tokens <= self.max_tokens:
+                segments.append(Segment(start, end, tokens, "paragraph"))
+                continue
+            for sentence_start, sentence_end in _spans(text, _SENTENCE_BREAK, start, end):
+                self._segment_sentence(text, sentence_start, sentence_end, segments)
+            segments[-1].boundary_type = "paragraph"
+        return segments
+
+    def pack(self, segments: List[Segment]) -> List[ChunkSpan]:
+        """Pack segments greedily into chunks with overlap.
+
+        Args:
+            segments: Segments in document order
+
+        Returns:
+            Chunk spans in document order
+        """
+        chunks: List[ChunkSpan] = []
+        current: List[Segment] = []
+        total = 0
+
+        for segment in segments:
+            if current and total + segment.tokens > self.max_tokens:
+                chunks.append(self._span(current, total, len(chunks)))
+                current, total = self._overlap(current, segment.tokens)
+            current.append(segment)
+            total += segment.tokens
+
+        if current:
+            chunks.append(self._span(current, total, len(chunks)))
+        return chunks
+
+    def _segment_sentence(self, text: str, start: int, end: int,
+                          segments: List[Segment]) -> None:
+        """Add a sentence, or runs of its words if it is over the budget."""
+        tokens = self.counter.count(text[start:end])
+        if tokens <= self.max_tokens:
+            segments.append(Segment(start, end, tokens, "sentence"))
+            return
+
+        run_start = run_end = None
+        run_tokens = 0
+        for match in _WORD.finditer(text, start, end):
+            word_tokens = self.counter.count(match.group())
+            if run_start is not None and run_tokens + word_tokens > self.max_tokens:
+                segments.append(Segment(run_start, run_end, run_tokens, "word"))
+                run_start = None
+            if run_start is None:
+                run_start, run_tokens = match.start(), 0
+            run_end = match.end()
+            run_tokens += word_tokens
+        if run_start is not None:
+            segments.append(Segment(run_start, run_end, run_tokens, "sentence"))
+
+    def _overlap(self, chunk: List[Segment], next_tokens: int) -> Tuple[List[Segment], int]:
+        """Get the trailing segments of a chunk to repeat before the next segment."""
+        carried: List[Segment] = []
+        carried_tokens = 0
+        for segment in reversed(chunk):
+            tokens = carried_tokens + segment.tokens
+            if tokens > self.overlap_tokens or tokens + next_tokens > self.max_tokens:
+                break
+            carried.insert(0, segment)
+            carried_tokens = tokens
+        return carried, carried_tokens
+
+    @staticmethod
+    def _span(segments: List[Segment], tokens: int, index: int) -> ChunkSpan:
+        """Build the span covering a run of segments."""
+        return ChunkSpan(
+            start=segments[0].start,
+            end=segments[-1].end,
+            token_count=tokens,
+            boundary_type=segments[-1].boundary_type,
+            index=index,
+        )
+
+
+def _spans(text: str, separator: Pattern, start: int, end: int) -> List[Tuple[int, int]]:
+    """Get the whitespace-trimmed pieces of text[start:end] between separators."""
+    spans = []
+    piece_start = start
+    for match in separator.finditer(text, start, end):
+        spans.append((piece_start, match.start()))
+        piece_start = match.end()
+    spans.append((piece_start, end))
+
+    trimmed = []
+    for piece_start, piece_end in spans:
+        while piece_start < piece_end and text[piece_start].isspace():
+            piece_start += 1
+        while piece_end > piece_start and text[piece_end - 1].isspace():
+            piece_end -= 1
+        if piece_start < piece_end:
+            trimmed.append((piece_start, piece_end))
+    return trimmed
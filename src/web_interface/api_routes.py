@@ -38,7 +38,8 @@ def register_api_routes(app, advanced_monitor, file_generator_service):
     scraping_handler = ScrapingRequestHandler(
         validation_handler=validation_handler,
         file_generation_handler=file_generation_handler,
-        upload_folder=app.config["UPLOAD_FOLDER"]
+        upload_folder=app.config["UPLOAD_FOLDER"],
+        progress_monitor=advanced_monitor
     )
     
     # Global scraper instance for progress tracking
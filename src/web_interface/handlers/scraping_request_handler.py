@@ -55,12 +55,15 @@ class ScrapingRequestHandler:
     def __init__(self, 
                  validation_handler: ValidationHandler,
                  file_generation_handler: FileGenerationHandler,
-                 upload_folder: str):
+                 upload_folder: str,
+                 progress_monitor=None):
         self.validation_handler = validation_handler
         self.file_generation_handler = file_generation_handler
         self.upload_folder = upload_folder
         self.active_scraper = None
         self.ai_config_manager = AIConfigManager()
+        # Receives streamed AI analysis fields as completion events
+        self.progress_monitor = progress_monitor
     
     def handle_scraping_request(self, data: Dict[str, Any]) -> ScrapingResponse:
         """Process complete scraping request.
@@ -348,8 +351,10 @@ class ScrapingRequestHandler:
             
             # Import AI analyzer
             from src.ai.content_analyzer import AIContentAnalyzer
+            from src.ai.streaming import progress_field_callback
             
-            # Create analyzer with the API key from the config
+            # Create analyzer with the API key from the config; provider rate
+            # limits are enforced by the process-wide request scheduler
             analyzer = AIContentAnalyzer(api_key=api_key)
             # Store AI config for model selection
             analyzer._current_ai_config = ai_config
@@ -377,11 +382,41 @@ class ScrapingRequestHandler:
                 'default_provider': provider,
                 'multimodal_enabled': ai_config.get('features', {}).get('multimodal_analysis', False),
                 'pattern_learning_enabled': ai_config.get('features', {}).get('pattern_learning', False),
-                'dynamic_prompts_enabled': ai_config.get('features', {}).get('dynamic_prompts', False)
+                'dynamic_prompts_enabled': ai_config.get('features', {}).get('dynamic_prompts', False),
+                # Stream by default when there is a monitor to report fields to
+                'streaming_enabled': ai_config.get('stream_responses', self.progress_monitor is not None)
             })
+            if self.progress_monitor is not None:
+                # Streamed fields are reported against the page being analysed
+                monitor = self.progress_monitor
+                analyzer.page_field_callback = lambda url: progress_field_callback(monitor, url)
             
             # Analyze successful extractions and attach results to RestaurantData objects
             analysis_results = {}
+            
+            # Get custom questions from AI config
+            custom_questions = ai_config.get('custom_questions', [])
+            logger.debug(f"Custom questions extracted: {custom_questions}")
+            print(f"DEBUG: Custom questions for AI analysis: {custom_questions}")
+            
+            def record_error(i, extraction, extraction_error):
+                # Log error but continue with other extractions
+                error_analysis = {
+                    'error': str(extraction_error),
+                    'fallback_used': True,
+                    'confidence_score': 0.0,
+                    'provider_used': ai_config.get('llm_provider', 'openai'),
+                    'analysis_timestamp': datetime.now().isoformat()
+                }
+                
+                # Attach error information to RestaurantData object
+                extraction.ai_analysis = error_analysis
+                
+                # Store for summary reporting
+                analysis_results[f'extraction_{i}'] = error_analysis
+            
+            # Prepare every extraction first so the pages can be analyzed as one batch
+            pages = []
             for i, extraction in enumerate(result.successful_extractions):
                 try:
                     # Prepare content for analysis
@@ -431,18 +466,28 @@ class ScrapingRequestHandler:
                     
                     logger.debug(f"Menu items list for AI analysis: {menu_items_list}")
                     
-                    # Get custom questions from AI config
-                    custom_questions = ai_config.get('custom_questions', [])
-                    logger.debug(f"Custom questions extracted: {custom_questions}")
-                    print(f"DEBUG: Custom questions for AI analysis: {custom_questions}")
-                    
-                    # Perform AI analysis
-                    ai_result = analyzer.analyze_content(
-                        content=content,
-                        menu_items=menu_items_list,
-                        analysis_type='nutritional',
-                        custom_questions=custom_questions
-                    )
+                    pages.append({
+                        'index': i,
+                        'extraction': extraction,
+                        'content': content,
+                        'menu_items': menu_items_list,
+                        # Failed URLs leave gaps, so the page comes from the extraction itself
+                        'url': getattr(extraction, 'source_url', '') or getattr(extraction, 'website', '')
+                    })
+                except Exception as extraction_error:
+                    record_error(i, extraction, extraction_error)
+            
+            # Perform AI analysis, packing pages into concurrent provider requests
+            ai_results = analyzer.batch_analyze(
+                [{'content': page['content'], 'menu_items': page['menu_items'], 'url': page['url']}
+                 for page in pages],
+                custom_questions=custom_questions
+            )
+            
+            for page, ai_result in zip(pages, ai_results):
+                i, extraction = page['index'], page['extraction']
+                try:
+                    ai_result.pop('url', None)
                     confidence = analyzer.calculate_integrated_confidence(ai_result)
                     
                     print(f"DEBUG: AI analyzer returned result keys: {list(ai_result.keys())}")
@@ -499,20 +544,7 @@ class ScrapingRequestHandler:
                     }
                     
                 except Exception as extraction_error:
-                    # Log error but continue with other extractions
-                    error_analysis = {
-                        'error': str(extraction_error),
-                        'fallback_used': True,
-                        'confidence_score': 0.0,
-                        'provider_used': ai_config.get('llm_provider', 'openai'),
-                        'analysis_timestamp': datetime.now().isoformat()
-                    }
-                    
-                    # Attach error information to RestaurantData object
-                    extraction.ai_analysis = error_analysis
-                    
-                    # Store for summary reporting
-                    analysis_results[f'extraction_{i}'] = error_analysis
+                    record_error(i, extraction, extraction_error)
             
             return {
                 'total_analyzed': len(result.successful_extractions),
@@ -561,7 +593,7 @@ class ScrapingRequestHandler:
         avg_time_per_url = total_time / num_urls if num_urls > 0 else 1.0
         
         for i, extraction in enumerate(result.successful_extractions):
-            url = urls[i] if i < len(urls) else 'Unknown URL'
+            url = getattr(extraction, 'source_url', '') or (urls[i] if i < len(urls) else 'Unknown URL')
             processing_time = round(avg_time_per_url * (0.9 + (i % 3) * 0.1), 1)
             
             # Count menu items from extraction
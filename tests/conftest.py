@@ -20,12 +20,53 @@ def setup_test_environment():
 
     # Set environment variable for testing
     os.environ["TESTING"] = "1"
+    # Keep cached LLM responses out of the user's persistent cache
+    os.environ["RAG_SCRAPER_LLM_CACHE"] = ":memory:"
+    os.environ["RAG_SCRAPER_RENDER_DECISIONS"] = ":memory:"
 
     yield
 
     # Cleanup
     if "TESTING" in os.environ:
         del os.environ["TESTING"]
+    os.environ.pop("RAG_SCRAPER_LLM_CACHE", None)
+    os.environ.pop("RAG_SCRAPER_RENDER_DECISIONS", None)
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_robots_cache():
+    """Give each test an empty process-wide robots.txt cache."""
+    robots_cache = sys.modules.get("src.scraper.robots_cache")
+    if robots_cache is not None:
+        robots_cache.configure_shared_robots_cache()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_llm_cache():
+    """Give each test an empty in-memory LLM response cache."""
+    llm_cache = sys.modules.get("src.ai.llm_cache")
+    if llm_cache is not None:
+        llm_cache.configure_shared_llm_cache()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_request_scheduler():
+    """Give each test a fresh process-wide AI request scheduler."""
+    request_scheduler = sys.modules.get("src.ai.request_scheduler")
+    if request_scheduler is not None:
+        request_scheduler.configure_shared_request_scheduler()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_browser_pools():
+    """Close process-wide browser pools so tests never share a browser."""
+    yield
+    browser_pool = sys.modules.get("src.scraper.browser_pool")
+    if browser_pool is not None:
+        browser_pool.close_shared_browser_pools()
 
 
 @pytest.fixture
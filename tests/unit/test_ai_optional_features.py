@@ -20,7 +20,7 @@ class TestClaudeExtractor:
         assert claude_extractor.api_key == "test-key"
         assert claude_extractor.default_model == "claude-3-opus-20240229"
 
-    @patch('src.ai.claude_extractor.requests.post')
+    @patch('src.common.http_transport.PooledHttpTransport.post')
     def test_claude_extraction_success(self, mock_post, claude_extractor):
         """Test successful Claude extraction."""
         mock_response = Mock()
@@ -60,8 +60,8 @@ class TestOllamaExtractor:
         assert ollama_extractor.endpoint == "http://localhost:11434"
         assert ollama_extractor.default_model == "llama2"
 
-    @patch('src.ai.ollama_extractor.requests.get')
-    @patch('src.ai.ollama_extractor.requests.post')
+    @patch('src.common.http_transport.PooledHttpTransport.get')
+    @patch('src.common.http_transport.PooledHttpTransport.post')
     def test_ollama_extraction_success(self, mock_post, mock_get, ollama_extractor):
         """Test successful Ollama extraction."""
         # Mock status check
@@ -85,7 +85,7 @@ class TestOllamaExtractor:
         assert "menu_items" in result
         assert len(result["menu_items"]) >= 0
 
-    @patch('src.ai.ollama_extractor.requests.get')
+    @patch('src.common.http_transport.PooledHttpTransport.get')
     def test_ollama_service_unavailable(self, mock_get, ollama_extractor):
         """Test Ollama service unavailable."""
         mock_get.side_effect = Exception("Connection refused")
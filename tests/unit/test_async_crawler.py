@@ -0,0 +1,286 @@
+"""Unit tests for the asyncio crawl engine."""
+import asyncio
+import time
+import pytest
+from unittest.mock import patch
+
+from src.scraper.async_crawler import (
+    AsyncCrawlEngine,
+    AsyncHttpClient,
+    AsyncResponse,
+    TransportAsyncClient,
+)
+from src.scraper.ethical_scraper import DEFAULT_USER_AGENT
+from src.scraper.page_discovery import PageDiscovery
+from src.scraper.page_processor import PageProcessor
+from src.scraper.page_store import PageStore
+from src.scraper.rate_limiter import TokenBucketRateLimiter
+
+
+BASE_URL = "http://restaurant.com"
+CHILD_PATHS = ["menu", "contact", "about", "hours", "location",
+               "dining", "food", "story", "reservations"]
+
+
+def _page(title, links=()):
+    nav = "".join(f'<a href="/{link}">{link}</a>' for link in links)
+    return f"<html><head><title>{title}</title></head><body><nav>{nav}</nav><h1>{title}</h1></body></html>"
+
+
+class FakeClient(AsyncHttpClient):
+    """Async client serving canned pages with per-URL latency."""
+
+    def __init__(self, pages, delays=None):
+        self.pages = pages
+        self.delays = delays or {}
+        self.requested = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.closed = 0
+
+    async def get(self, url, timeout=30):
+        self.requested.append(url)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.get(url, 0.01))
+        finally:
+            self.in_flight -= 1
+        if url not in self.pages:
+            return AsyncResponse(url=url, status_code=404, text="")
+        return AsyncResponse(url=url, status_code=200, text=self.pages[url])
+
+    async def close(self):
+        self.closed += 1
+
+
+def _site():
+    pages = {BASE_URL: _page("Cafe Async", CHILD_PATHS)}
+    for path in CHILD_PATHS:
+        pages[f"{BASE_URL}/{path}"] = _page(f"Cafe Async {path}")
+    return pages
+
+
+def _engine(client, max_pages=10, **kwargs):
+    store = PageStore()
+    processor = PageProcessor(enable_ethical_scraping=False, page_store=store)
+    discovery = PageDiscovery(BASE_URL, max_pages, page_store=store)
+    return AsyncCrawlEngine(discovery, processor, client=client, **kwargs)
+
+
+class TestAsyncCrawlEngine:
+    """Test the asyncio crawl engine."""
+
+    def test_rejects_invalid_configuration(self):
+        """Test that invalid in-flight limits and strategies are rejected."""
+        with pytest.raises(ValueError):
+            _engine(FakeClient({}), max_in_flight_per_site=0)
+        with pytest.raises(ValueError):
+            _engine(FakeClient({}), strategy="random")
+
+    def test_ten_page_site_takes_about_the_slowest_page(self):
+        """Test that child pages are fetched concurrently."""
+        delays = {url: 0.1 for url in _site()}
+        delays[f"{BASE_URL}/menu"] = 0.3
+        client = FakeClient(_site(), delays)
+        engine = _engine(client, max_in_flight_per_site=10)
+
+        start = time.time()
+        crawled = engine.crawl(BASE_URL)
+        elapsed = time.time() - start
+
+        assert len(crawled) == 10
+        assert all(page.success for page in crawled)
+        # Sequential fetching would take 1.2s: start page plus the slowest child
+        assert elapsed < 0.8
+        assert client.closed == 1
+
+    def test_in_flight_requests_are_bounded(self):
+        """Test that no more than max_in_flight_per_site requests overlap."""
+        client = FakeClient(_site())
+        engine = _engine(client, max_in_flight_per_site=3)
+
+        engine.crawl(BASE_URL)
+
+        assert client.max_in_flight == 3
+
+    def test_max_pages_bounds_the_frontier(self):
+        """Test that the crawl stops at max_pages."""
+        client = FakeClient(_site())
+        engine = _engine(client, max_pages=4)
+
+        crawled = engine.crawl(BASE_URL)
+
+        assert len(crawled) == 4
+        assert len(client.requested) == 4
+
+    def test_priority_strategy_fetches_most_relevant_pages_first(self):
+        """Test that priority ordering follows PageDiscovery priorities."""
+        client = FakeClient(_site())
+        engine = _engine(client, max_in_flight_per_site=1, strategy="priority")
+
+        engine.crawl(BASE_URL)
+
+        assert client.requested[:4] == [
+            BASE_URL, f"{BASE_URL}/menu", f"{BASE_URL}/contact", f"{BASE_URL}/about"
+        ]
+
+    def test_max_depth_limits_link_following(self):
+        """Test that links are not followed from pages at max depth."""
+        client = FakeClient(_site())
+        engine = _engine(client, max_depth=0)
+
+        crawled = engine.crawl(BASE_URL)
+
+        assert [page.url for page in crawled] == [BASE_URL]
+
+    def test_failed_pages_are_reported(self):
+        """Test that fetch failures produce unsuccessful pages."""
+        pages = _site()
+        del pages[f"{BASE_URL}/menu"]
+        engine = _engine(FakeClient(pages))
+
+        crawled = {page.url: page for page in engine.crawl(BASE_URL)}
+
+        assert not crawled[f"{BASE_URL}/menu"].success
+        assert crawled[f"{BASE_URL}/menu"].error == "Fetch failed"
+        assert crawled[f"{BASE_URL}/contact"].success
+
+    def test_crawl_works_inside_running_event_loop(self):
+        """Test that the sync wrapper can be called from async code."""
+        engine = _engine(FakeClient(_site()))
+
+        async def run():
+            return engine.crawl(BASE_URL)
+
+        assert len(asyncio.run(run())) == 10
+
+    def test_transport_client_uses_pooled_transport(self):
+        """Test that the default client wraps a requests-style transport."""
+
+        class Response:
+            status_code = 200
+            text = "<html></html>"
+            headers = {"Content-Type": "text/html"}
+            url = "http://example.com/final"
+
+        class Transport:
+            def get(self, url, timeout=None, headers=None):
+                return Response()
+
+        response = asyncio.run(TransportAsyncClient(Transport()).get("http://example.com"))
+
+        assert response.status_code == 200
+        assert response.url == "http://example.com/final"
+        assert response.headers["Content-Type"] == "text/html"
+
+    def test_client_interface_is_abstract(self):
+        """Test that a client must implement get()."""
+        with pytest.raises(TypeError):
+            AsyncHttpClient()
+
+    def test_transport_client_sends_user_agent_and_paces_requests(self):
+        """Test that requests identify the scraper and wait for the domain's slot."""
+        calls = []
+
+        class Transport:
+            def get(self, url, timeout=None, headers=None):
+                calls.append((url, headers))
+                return AsyncResponse(url=url, status_code=200, text="ok")
+
+        limiter = TokenBucketRateLimiter(default_delay=0.05)
+        client = TransportAsyncClient(Transport(), rate_limiter=limiter)
+
+        async def run():
+            return await asyncio.gather(*(client.get(f"{BASE_URL}/{n}") for n in range(3)))
+
+        start = time.time()
+        asyncio.run(run())
+
+        assert time.time() - start >= 0.09
+        assert [headers["User-Agent"] for _, headers in calls] == [DEFAULT_USER_AGENT] * 3
+        assert limiter.domain_statistics["restaurant.com"]["total_requests"] == 3
+
+    def test_transport_client_retries_after_retry_after(self):
+        """Test that Retry-After holds back the domain before the retry."""
+        responses = [
+            AsyncResponse(url=BASE_URL, status_code=503, text="", headers={"Retry-After": "5"}),
+            AsyncResponse(url=BASE_URL, status_code=200, text="ok"),
+        ]
+
+        class Transport:
+            def get(self, url, timeout=None, headers=None):
+                return responses.pop(0)
+
+        limiter = TokenBucketRateLimiter(default_delay=0, max_retry_after_delay=0.1)
+        client = TransportAsyncClient(Transport(), rate_limiter=limiter)
+
+        start = time.time()
+        response = asyncio.run(client.get(BASE_URL))
+
+        assert response.status_code == 200
+        assert time.time() - start >= 0.09
+        assert limiter.domain_statistics["restaurant.com"]["retry_after_count"] == 1
+
+    def test_default_client_shares_ethical_scraper_settings(self):
+        """Test that the engine's default client reuses the scraper's UA and limiter."""
+        processor = PageProcessor(enable_ethical_scraping=True)
+        ethical_scraper = processor.multi_strategy_scraper.ethical_scraper
+        engine = AsyncCrawlEngine(PageDiscovery(BASE_URL, max_pages=1), processor)
+
+        assert engine.client.user_agent == ethical_scraper.user_agent
+        assert engine.client.rate_limiter is ethical_scraper.rate_limiter
+
+
+class TestMultiPageScraperAsyncMode:
+    """Test async crawl mode in MultiPageScraper."""
+
+    def test_async_mode_returns_scraping_result(self):
+        """Test that async mode keeps the scrape_website result type."""
+        from src.scraper.multi_page_scraper import MultiPageScraper
+        from src.scraper.multi_page_result_handler import MultiPageScrapingResult
+
+        scraper = MultiPageScraper(
+            max_pages=10, enable_ethical_scraping=False,
+            crawl_mode="async", max_in_flight_per_site=5,
+        )
+        client = FakeClient(_site())
+        messages = []
+
+        with patch("src.scraper.async_crawler.TransportAsyncClient", return_value=client):
+            result = scraper.scrape_website(BASE_URL, lambda *args: messages.append(args[0]))
+
+        assert isinstance(result, MultiPageScrapingResult)
+        assert result.restaurant_name == "Cafe Async"
+        assert len(result.successful_pages) == 10
+        assert result.pages_processed[0] == BASE_URL
+        assert result.aggregated_data is not None
+        assert result.fetch_statistics["pages_stored"] == 10
+        assert any("Completed" in message for message in messages)
+
+    def test_async_mode_reports_failed_start_page(self):
+        """Test that an unreachable start page fails the website."""
+        from src.scraper.multi_page_scraper import MultiPageScraper
+
+        scraper = MultiPageScraper(enable_ethical_scraping=False, crawl_mode="async")
+
+        with patch("src.scraper.async_crawler.TransportAsyncClient", return_value=FakeClient({})):
+            result = scraper.scrape_website(BASE_URL)
+
+        assert result.failed_pages == [BASE_URL]
+        assert result.successful_pages == []
+
+    def test_config_validates_crawl_mode(self):
+        """Test crawl mode configuration validation."""
+        from src.scraper.multi_page_scraper_config import MultiPageScraperConfig
+
+        with pytest.raises(ValueError):
+            MultiPageScraperConfig(crawl_mode="threads")
+        with pytest.raises(ValueError):
+            MultiPageScraperConfig(max_in_flight_per_site=0)
+        with pytest.raises(ValueError):
+            MultiPageScraperConfig(traversal_strategy="random")
+
+        summary = MultiPageScraperConfig(crawl_mode="async").get_config_summary()
+        assert summary["crawl_mode"] == "async"
+        assert summary["traversal_strategy"] == "BFS"
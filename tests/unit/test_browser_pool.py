@@ -0,0 +1,411 @@
+"""Unit tests for the persistent browser pool."""
+import asyncio
+import threading
+import time
+import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from src.scraper.browser_pool import (
+    BrowserPool,
+    close_shared_browser_pools,
+    get_shared_browser_pool,
+)
+
+
+class FakePage:
+    """Page that records navigation and can simulate a crash."""
+
+    def __init__(self, browser):
+        self.browser = browser
+        self.closed = False
+
+    def is_closed(self):
+        return self.closed
+
+    async def goto(self, url, **kwargs):
+        if self.browser.crash_next:
+            self.browser.crash_next = False
+            self.browser.connected = False
+            raise Exception("Target page, context or browser has been closed")
+        self.url = url
+
+    async def content(self):
+        return f"<html>{self.url}</html>"
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    """Browser context creating fake pages."""
+
+    def __init__(self, browser):
+        self.browser = browser
+        self.pages = []
+        self.closed = False
+
+    async def new_page(self):
+        page = FakePage(self.browser)
+        self.pages.append(page)
+        return page
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    """Browser whose connection state can be toggled."""
+
+    def __init__(self):
+        self.connected = True
+        self.crash_next = False
+        self.contexts = []
+
+    def is_connected(self):
+        return self.connected
+
+    async def close(self):
+        self.connected = False
+
+
+class FakePlaywright:
+    """Stand-in for the async_playwright() context manager."""
+
+    def __init__(self):
+        self.started = 0
+        self.stopped = 0
+
+    async def start(self):
+        self.started += 1
+        return self
+
+    async def stop(self):
+        self.stopped += 1
+
+
+class Harness:
+    """Fake launcher and context factory recording what the pool creates."""
+
+    def __init__(self):
+        self.playwright = FakePlaywright()
+        self.browsers = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    async def launch(self, playwright):
+        browser = FakeBrowser()
+        self.browsers.append(browser)
+        return browser
+
+    async def new_context(self, browser):
+        context = FakeContext(browser)
+        browser.contexts.append(context)
+        return context
+
+    def pool(self, **kwargs):
+        return BrowserPool(
+            self.launch,
+            self.new_context,
+            playwright_factory=lambda: self.playwright,
+            **kwargs,
+        )
+
+    def render_fn(self, url, delay=0.0):
+        async def render(page):
+            with self.lock:
+                self.active += 1
+                self.max_active = max(self.max_active, self.active)
+            try:
+                await page.goto(url)
+                await asyncio.sleep(delay)
+                return await page.content()
+            finally:
+                with self.lock:
+                    self.active -= 1
+        return render
+
+
+class TestBrowserPool:
+    """Test browser reuse, recycling and crash recovery."""
+
+    def test_rejects_invalid_configuration(self):
+        """Test that pool sizes must be positive."""
+        harness = Harness()
+        with pytest.raises(ValueError):
+            harness.pool(max_contexts=0)
+        with pytest.raises(ValueError):
+            harness.pool(pages_per_context=0)
+
+    def test_browser_is_launched_once_for_many_renders(self):
+        """Test that sequential renders reuse one browser and context."""
+        harness = Harness()
+        pool = harness.pool()
+
+        try:
+            for i in range(5):
+                url = f"http://a.com/{i}"
+                assert pool.render(url, harness.render_fn(url)) == f"<html>{url}</html>"
+        finally:
+            pool.close()
+
+        stats = pool.get_statistics()
+        assert len(harness.browsers) == 1
+        assert harness.playwright.started == 1
+        assert harness.playwright.stopped == 1
+        assert stats["renders"] == 5
+        assert stats["contexts_created"] == 1
+
+    def test_page_is_recycled_after_k_renders(self):
+        """Test that a context's page is replaced after pages_per_context renders."""
+        harness = Harness()
+        pool = harness.pool(max_contexts=1, pages_per_context=2)
+
+        try:
+            for i in range(5):
+                pool.render("http://a.com/", harness.render_fn("http://a.com/"))
+        finally:
+            pool.close()
+
+        context = harness.browsers[0].contexts[0]
+        assert len(context.pages) == 3
+        assert [page.closed for page in context.pages[:2]] == [True, True]
+        assert pool.get_statistics()["pages_recycled"] == 2
+
+    def test_crashed_browser_is_restarted_and_render_retried(self):
+        """Test that a render survives a browser crash."""
+        harness = Harness()
+        crashes = []
+        pool = harness.pool(on_crash=lambda: crashes.append(True))
+
+        try:
+            pool.render("http://a.com/1", harness.render_fn("http://a.com/1"))
+            harness.browsers[0].crash_next = True
+            result = pool.render("http://a.com/2", harness.render_fn("http://a.com/2"))
+        finally:
+            pool.close()
+
+        assert result == "<html>http://a.com/2</html>"
+        assert len(harness.browsers) == 2
+        assert crashes == [True]
+        assert pool.get_statistics()["crashes"] == 1
+
+    def test_render_errors_without_crash_are_raised(self):
+        """Test that ordinary render errors are not retried."""
+        harness = Harness()
+        pool = harness.pool()
+
+        async def failing(page):
+            raise ValueError("navigation timeout")
+
+        try:
+            with pytest.raises(ValueError):
+                pool.render("http://a.com/", failing)
+        finally:
+            pool.close()
+
+        assert len(harness.browsers) == 1
+        assert pool.get_statistics()["failed_renders"] == 1
+
+    def test_concurrent_renders_are_bounded_by_pool_size(self):
+        """Test that threads share at most max_contexts contexts."""
+        harness = Harness()
+        pool = harness.pool(max_contexts=2)
+        results = []
+
+        def render(i):
+            url = f"http://a.com/{i}"
+            results.append(pool.render(url, harness.render_fn(url, delay=0.05)))
+
+        threads = [threading.Thread(target=render, args=(i,)) for i in range(6)]
+        try:
+            start = time.time()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            elapsed = time.time() - start
+        finally:
+            pool.close()
+
+        assert len(results) == 6
+        assert harness.max_active == 2
+        assert pool.get_statistics()["contexts_created"] == 2
+        # Six 50ms renders over two contexts
+        assert elapsed < 0.3
+
+    def test_render_async_from_another_event_loop(self):
+        """Test that async callers can share the pool."""
+        harness = Harness()
+        pool = harness.pool(max_contexts=3)
+
+        async def run():
+            urls = [f"http://a.com/{i}" for i in range(3)]
+            return await asyncio.gather(
+                *(pool.render_async(url, harness.render_fn(url)) for url in urls)
+            )
+
+        try:
+            first = asyncio.run(run())
+            second = asyncio.run(run())
+        finally:
+            pool.close()
+
+        assert first == second
+        assert len(harness.browsers) == 1
+
+    def test_closed_pool_rejects_renders(self):
+        """Test that renders after close fail fast."""
+        harness = Harness()
+        pool = harness.pool()
+        pool.close()
+
+        with pytest.raises(RuntimeError):
+            pool.render("http://a.com/", harness.render_fn("http://a.com/"))
+
+    def test_close_stops_thread_and_drops_exit_hook(self):
+        """Test that a closed pool does not wait for interpreter exit."""
+        harness = Harness()
+        pool = harness.pool()
+
+        with patch("src.scraper.browser_pool.atexit") as mock_atexit:
+            pool.render("http://a.com/", harness.render_fn("http://a.com/"))
+            thread = pool._thread
+            pool.close()
+
+        mock_atexit.register.assert_called_once_with(pool.close)
+        mock_atexit.unregister.assert_called_once_with(pool.close)
+        assert not thread.is_alive()
+        assert not harness.browsers[0].connected
+
+
+class TestSharedBrowserPools:
+    """Test the process-wide browser pool registry."""
+
+    def test_same_key_returns_same_pool(self):
+        """Test that one pool is built per configuration."""
+        harness = Harness()
+        factory = Mock(side_effect=harness.pool)
+
+        first = get_shared_browser_pool("chromium", factory)
+        second = get_shared_browser_pool("chromium", factory)
+        other = get_shared_browser_pool("firefox", factory)
+
+        assert first is second
+        assert other is not first
+        assert factory.call_count == 2
+
+    def test_closed_pool_is_replaced(self):
+        """Test that a pool closed elsewhere is rebuilt on next use."""
+        harness = Harness()
+        first = get_shared_browser_pool("chromium", harness.pool)
+        first.close()
+
+        second = get_shared_browser_pool("chromium", harness.pool)
+
+        assert second is not first
+        assert not second.closed
+
+    def test_close_shared_browser_pools(self):
+        """Test that closing the registry shuts every pool down."""
+        harness = Harness()
+        pool = get_shared_browser_pool("chromium", harness.pool)
+        pool.render("http://a.com/", harness.render_fn("http://a.com/"))
+
+        close_shared_browser_pools()
+
+        assert pool.closed
+        assert not harness.browsers[0].connected
+        assert get_shared_browser_pool("chromium", harness.pool) is not pool
+
+
+class TestJavaScriptHandlerBrowserPool:
+    """Test JavaScriptHandler rendering through the pool."""
+
+    def test_render_page_reuses_browser(self):
+        """Test that repeated render_page calls launch one browser."""
+        from src.scraper.javascript_handler import JavaScriptHandler
+
+        harness = Harness()
+        handler = JavaScriptHandler(timeout=5, enable_browser_automation=True)
+        handler.browser_automation_enabled = True
+        handler._launch_browser = harness.launch
+        handler._setup_context = harness.new_context
+
+        async def no_popups(page):
+            return await page.content()
+
+        handler._handle_popups_with_browser = no_popups
+
+        with patch("src.scraper.javascript_handler.async_playwright",
+                   return_value=harness.playwright):
+            try:
+                first = handler.render_page("http://a.com/1")
+                second = handler.render_page("http://a.com/2")
+            finally:
+                handler.close()
+
+        assert first == "<html>http://a.com/1</html>"
+        assert second == "<html>http://a.com/2</html>"
+        assert len(harness.browsers) == 1
+        assert handler.get_browser_pool_statistics() == {}
+
+    def test_scrapers_share_one_browser(self):
+        """Test that per-request scrapers reuse the running browser."""
+        from src.scraper.javascript_handler import JavaScriptHandler
+
+        harness = Harness()
+
+        async def no_popups(page):
+            return await page.content()
+
+        def make_handler():
+            handler = JavaScriptHandler(timeout=5, enable_browser_automation=True)
+            handler.browser_automation_enabled = True
+            handler._launch_browser = harness.launch
+            handler._setup_context = harness.new_context
+            handler._handle_popups_with_browser = no_popups
+            return handler
+
+        with patch("src.scraper.javascript_handler.async_playwright",
+                   return_value=harness.playwright):
+            first = make_handler()
+            first.render_page("http://a.com/1")
+            first.close()
+
+            second = make_handler()
+            second.render_page("http://a.com/2")
+            stats = second.get_browser_pool_statistics()
+
+        assert len(harness.browsers) == 1
+        assert harness.browsers[0].connected
+        assert stats["renders"] == 2
+
+    def test_scrape_leaves_shared_browser_running(self):
+        """Test that finishing a scrape does not shut the browser down."""
+        from src.scraper.restaurant_scraper import RestaurantScraper
+
+        config = SimpleNamespace(urls=["http://a.com/"])
+        scraper = RestaurantScraper(enable_batch_processing=False, enable_multi_page=False)
+        scraper.multi_scraper.config = config
+        handler = Mock()
+        scraper.multi_scraper.javascript_handler = handler
+        scraper.multi_scraper.scrape_url = Mock(side_effect=RuntimeError("boom"))
+
+        result = scraper.scrape_restaurants(config)
+
+        assert result.failed_urls == ["http://a.com/"]
+        handler.close.assert_not_called()
+
+    def test_config_validates_pool_settings(self):
+        """Test browser pool configuration validation."""
+        from src.config.javascript_config import JavaScriptConfig
+
+        with pytest.raises(ValueError):
+            JavaScriptConfig(browser_pool_size=0)
+        with pytest.raises(ValueError):
+            JavaScriptConfig(pages_per_context=0)
+
+        options = JavaScriptConfig(browser_pool_size=4).get_browser_options()
+        assert options["browser_pool_size"] == 4
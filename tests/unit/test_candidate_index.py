@@ -0,0 +1,134 @@
+"""Unit tests for candidate indexes used by fuzzy matching."""
+import pytest
+from unittest.mock import patch
+
+from src.knowledge.candidate_index import BKTree, CandidateIndex, levenshtein_distance
+from src.knowledge.fuzzy_matcher import FuzzyMatcher
+
+
+AMENITIES = ["Parking", "parking lot", "Vegetarian", "vegan", "Outdoor Seating",
+             "wifi", "Wheelchair Access", "PARKING"]
+
+
+class TestLevenshteinDistance:
+    """Test the edit distance used by the index."""
+
+    @pytest.mark.parametrize("s1,s2,expected", [
+        ("", "", 0),
+        ("", "vegan", 5),
+        ("kitten", "sitting", 3),
+        ("vegitarian", "vegetarian", 1),
+        ("patio", "patio", 0),
+        ("a" * 80 + "b", "b" + "a" * 80, 2),
+    ])
+    def test_pure_python_distance(self, s1, s2, expected):
+        """Test the fallback used when no C backend is installed."""
+        with patch("src.knowledge.candidate_index._levenshtein_backend", None):
+            assert levenshtein_distance(s1, s2) == expected
+            assert levenshtein_distance(s2, s1) == expected
+
+    def test_uses_c_backend_when_installed(self):
+        """Test that an installed backend replaces the pure Python loop."""
+        with patch("src.knowledge.candidate_index._levenshtein_backend") as backend:
+            backend.distance.return_value = 4
+            assert levenshtein_distance("wifi", "wi-fi") == 4
+            backend.distance.assert_called_once_with("wifi", "wi-fi")
+
+
+class TestBKTree:
+    """Test edit-distance search."""
+
+    def test_search_returns_terms_within_radius(self):
+        """Test that only terms within the radius are found."""
+        tree = BKTree()
+        for term in ["book", "books", "cake", "boo", "cape", "cart", "boon"]:
+            tree.add(term)
+        tree.add("book")
+
+        assert len(tree) == 7
+        assert sorted(tree.search("bo", 2)) == [(1, "boo"), (2, "book"), (2, "boon")]
+        assert tree.search("xyzzy", 1) == []
+
+
+class TestCandidateIndex:
+    """Test exact, substring and distance lookups."""
+
+    def test_exact_hit_keeps_first_candidate(self):
+        """Test that case-insensitive duplicates resolve to the first one."""
+        index = CandidateIndex(AMENITIES)
+
+        assert index.exact("parking") == "Parking"
+        assert index.positions("parking") == [0, 7]
+        assert index.exact("valet") is None
+
+    def test_substring_lookups(self):
+        """Test finding terms containing or contained in the query."""
+        index = CandidateIndex(AMENITIES)
+
+        assert index.containing("PARK") == {"parking", "parking lot"}
+        assert index.containing("an") == {"vegan", "vegetarian"}
+        assert index.contained_in("free wifi and parking") == {"wifi", "parking"}
+
+    def test_repr_does_not_list_candidates(self):
+        """Test that cache keys built from the index stay short."""
+        index = CandidateIndex(AMENITIES * 100)
+
+        assert len(repr(index)) < 80
+        assert index.fingerprint == CandidateIndex(AMENITIES * 100).fingerprint
+
+
+class TestIndexedFuzzyMatcher:
+    """Test that FuzzyMatcher looks candidates up through the index."""
+
+    def test_index_is_built_once_per_candidate_list(self):
+        """Test that batch queries reuse one index."""
+        matcher = FuzzyMatcher(enable_cache=False)
+
+        results = matcher.find_matches_batch(["vegitarian", "parkng", "wifi"], AMENITIES)
+        index = matcher.build_index(AMENITIES)
+
+        assert matcher.build_index(list(AMENITIES)) is index
+        assert matcher.build_index(index) is index
+        assert len(matcher._indexes) == 1
+        assert results["vegitarian"]["matched_term"] == "Vegetarian"
+        assert results["parkng"]["matched_term"] == "Parking"
+        assert results["wifi"]["match_type"] == "exact"
+
+    def test_only_reachable_candidates_are_scored(self):
+        """Test that distant candidates are skipped for Levenshtein matching."""
+        matcher = FuzzyMatcher(similarity_threshold=0.8, enable_cache=False)
+        candidates = AMENITIES + [f"menu item {n}" for n in range(200)]
+
+        with patch.object(matcher, "calculate_similarity",
+                          wraps=matcher.calculate_similarity) as mock_calc:
+            result = matcher.find_match("vegetarain", candidates)
+
+        assert result["matched_term"] == "Vegetarian"
+        assert mock_calc.call_count < 5
+
+    @pytest.mark.parametrize("algorithm", ["levenshtein", "jaro_winkler", "soundex"])
+    @pytest.mark.parametrize("threshold", [0.5, 0.7, 0.9])
+    def test_results_match_full_scan(self, algorithm, threshold):
+        """Test that the shortlist never changes the result of a full scan."""
+        matcher = FuzzyMatcher(similarity_threshold=threshold, algorithm=algorithm,
+                               enable_cache=False)
+        candidates = AMENITIES + ["park", "veg", "seating", "outdoor", "wi"]
+
+        for query in ["parkin", "vegeterian", "lot", "seatng outdoor", "w", "wheelchair"]:
+            with patch.object(matcher, "_shortlist",
+                              side_effect=lambda q, index, t: list(range(len(index)))):
+                expected = (matcher.find_match(query, candidates),
+                            matcher.find_multiple_matches(query, candidates, 20),
+                            matcher.suggest_corrections(query, candidates))
+
+            assert matcher.find_match(query, candidates) == expected[0]
+            assert matcher.find_multiple_matches(query, candidates, 20) == expected[1]
+            assert matcher.suggest_corrections(query, candidates) == expected[2]
+
+    def test_cache_does_not_leak_between_matchers(self):
+        """Test that cached results are keyed by matcher settings."""
+        strict = FuzzyMatcher(similarity_threshold=0.95)
+        loose = FuzzyMatcher(similarity_threshold=0.5)
+
+        assert strict.find_match("vegn", AMENITIES) is None
+        assert loose.find_match("vegn", AMENITIES)["matched_term"] == "vegan"
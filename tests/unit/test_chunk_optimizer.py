@@ -318,4 +318,62 @@ class TestChunkBoundary:
         if hasattr(boundary1, '__lt__'):
             boundaries = [boundary2, boundary1]
             sorted_boundaries = sorted(boundaries)
-            assert sorted_boundaries[0].position <= sorted_boundaries[1].position
\ No newline at end of file
+            assert sorted_boundaries[0].position <= sorted_boundaries[1].position
+
+class TestLinearBoundaryFinder:
+    """Test the single-pass boundary search on long documents."""
+
+    MENU_PAGE = (
+        "Antipasti\n\nBruschetta with tomato and basil. Fried calamari, lemon aioli! "
+        "Burrata with roasted peppers?  Caprese salad.\n\n"
+        "Pasta\n\nSpaghetti carbonara with guanciale. Rigatoni alla vodka. "
+        "Lasagna bolognese baked daily.\n\n"
+    )
+
+    @staticmethod
+    def quadratic_word_counts(text, pattern):
+        """Count words before each match the way the original search did."""
+        return [len(text[:match.end()].split()) for match in pattern.finditer(text)]
+
+    def test_word_counts_match_prefix_splitting(self):
+        """Test that counted positions agree with re-splitting every prefix."""
+        optimizer = ChunkOptimizer()
+        text = self.MENU_PAGE * 20
+
+        boundaries = optimizer.find_optimal_boundaries(text, max_size=150)
+
+        expected = {
+            (match.end(), boundary_type)
+            for pattern, boundary_type in (
+                (optimizer.paragraph_pattern, "paragraph"), (optimizer.sentence_pattern, "sentence")
+            )
+            for match, words in zip(pattern.finditer(text), self.quadratic_word_counts(text, pattern))
+            if 1 <= words <= 150
+        }
+        assert {(b.position, b.boundary_type) for b in boundaries} == expected
+        assert [b.position for b in boundaries] == sorted(b.position for b in boundaries)
+
+    def test_word_fallback_splits_every_max_size_words(self):
+        """Test that text without sentences is cut before every max_size-th word."""
+        optimizer = ChunkOptimizer()
+        text = "\n".join(f"item{n}  $9" for n in range(10))
+
+        boundaries = optimizer.find_optimal_boundaries(text, max_size=6)
+
+        assert [b.boundary_type for b in boundaries] == ["word"] * 3
+        assert [text[b.position:].split()[0] for b in boundaries] == ["item3", "item6", "item9"]
+
+    @pytest.mark.slow
+    def test_one_megabyte_menu_benchmark(self):
+        """Test that boundaries for 1 MB of menu text are found in linear time."""
+        import time
+
+        optimizer = ChunkOptimizer()
+        text = self.MENU_PAGE * (1_000_000 // len(self.MENU_PAGE))
+
+        started = time.perf_counter()
+        boundaries = optimizer.find_optimal_boundaries(text, max_size=512)
+        elapsed = time.perf_counter() - started
+
+        assert boundaries and all(b.position < 10_000 for b in boundaries)
+        assert elapsed < 2.0
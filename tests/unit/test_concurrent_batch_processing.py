@@ -0,0 +1,237 @@
+"""Unit tests for concurrent batch processing with per-domain politeness."""
+import threading
+import time
+import pytest
+from unittest.mock import Mock, patch
+
+from src.scraper.batch_processor import BatchProcessor, BatchConfig
+from src.scraper.multi_strategy_scraper import RestaurantData
+
+
+def _restaurant(url):
+    return RestaurantData(name=url.split("//")[1].split("/")[0], sources=["mock"])
+
+
+class TestConcurrentBatchProcessing:
+    """Test the concurrent batch engine."""
+
+    def test_rejects_invalid_concurrency(self):
+        """Test that at least one worker is required."""
+        with pytest.raises(ValueError):
+            BatchProcessor(BatchConfig(max_concurrent_requests=0))
+
+    def test_different_domains_are_fetched_in_parallel(self):
+        """Test that URLs on different domains overlap in time."""
+        urls = [f"http://restaurant{i}.com" for i in range(6)]
+        processor = BatchProcessor(BatchConfig(max_concurrent_requests=3))
+
+        def slow_scrape(url):
+            time.sleep(0.2)
+            return _restaurant(url)
+
+        with patch.object(processor.scraper, "scrape_url", side_effect=slow_scrape):
+            start = time.time()
+            result = processor.process_batch(urls)
+            elapsed = time.time() - start
+
+        assert len(result["successful_extractions"]) == 6
+        assert result["total_processed"] == 6
+        # Sequential processing would take 1.2s
+        assert elapsed < 0.9
+
+    def test_same_domain_requests_never_overlap_and_keep_delay(self):
+        """Test that one domain sees sequential, delayed requests."""
+        urls = [f"http://same.com/page{i}" for i in range(3)] + ["http://other.com/"]
+        processor = BatchProcessor(
+            BatchConfig(max_concurrent_requests=3, per_domain_delay=0.2)
+        )
+        active = {"same.com": 0}
+        max_active = {"same.com": 0}
+        request_times = []
+        lock = threading.Lock()
+
+        def polite_scrape(url):
+            processor.rate_limiter.wait_if_needed(url)
+            if "same.com" in url:
+                with lock:
+                    request_times.append(time.time())
+                    active["same.com"] += 1
+                    max_active["same.com"] = max(max_active["same.com"], active["same.com"])
+                time.sleep(0.05)
+                with lock:
+                    active["same.com"] -= 1
+            return _restaurant(url)
+
+        with patch.object(processor.scraper, "scrape_url", side_effect=polite_scrape):
+            result = processor.process_batch(urls)
+
+        assert len(result["successful_extractions"]) == 4
+        assert max_active["same.com"] == 1
+        gaps = [b - a for a, b in zip(request_times, request_times[1:])]
+        assert all(gap >= 0.19 for gap in gaps)
+
+    def test_results_stream_to_file_handler_in_completion_order(self):
+        """Test that the incremental file handler receives results as they finish."""
+        urls = ["http://slow.com", "http://fast.com"]
+        processor = BatchProcessor(BatchConfig(max_concurrent_requests=2))
+        handler = Mock()
+
+        def scrape(url):
+            time.sleep(0.3 if "slow" in url else 0.01)
+            return _restaurant(url)
+
+        with patch.object(processor.scraper, "scrape_url", side_effect=scrape):
+            processor.process_batch(urls, incremental_file_handler=handler)
+
+        written = [call.args[0].name for call in handler.write_restaurant_data.call_args_list]
+        assert written == ["fast.com", "slow.com"]
+
+    def test_write_failures_are_reported_without_losing_results(self):
+        """Test that a failing file write is recorded as an error."""
+        processor = BatchProcessor()
+        handler = Mock()
+        handler.write_restaurant_data.side_effect = RuntimeError("disk full")
+
+        with patch.object(processor.scraper, "scrape_url", side_effect=_restaurant):
+            result = processor.process_batch(["http://a.com"], incremental_file_handler=handler)
+
+        assert len(result["successful_extractions"]) == 1
+        assert "disk full" in result["errors"][0]
+
+    def test_eta_is_based_on_measured_throughput(self):
+        """Test that throughput and time remaining come from completed URLs."""
+        urls = [f"http://r{i}.com" for i in range(4)]
+        processor = BatchProcessor(BatchConfig(max_concurrent_requests=1))
+        estimates = []
+
+        def progress_callback(message, percentage=None, time_estimate=None):
+            if time_estimate is not None:
+                estimates.append(time_estimate)
+
+        def scrape(url):
+            time.sleep(0.05)
+            return _restaurant(url)
+
+        with patch.object(processor.scraper, "scrape_url", side_effect=scrape):
+            processor.process_batch(urls, progress_callback)
+
+        progress = processor.get_current_progress()
+        assert progress.urls_completed == 4
+        assert progress.urls_per_second > 0
+        assert estimates and estimates[0] == pytest.approx(0.15, abs=0.1)
+
+
+class TestEthicalScraperDomainRateLimiting:
+    """Test per-domain rate limiting in the ethical scraper."""
+
+    def test_enhanced_rate_limiter_is_called_with_url(self):
+        """Test that an injected per-domain limiter receives the request URL."""
+        from src.scraper.ethical_scraper import EthicalScraper
+        from src.scraper.rate_limiter import EnhancedRateLimiter
+
+        limiter = EnhancedRateLimiter(default_delay=0.0)
+        scraper = EthicalScraper(rate_limiter=limiter)
+
+        with patch.object(limiter, "wait_if_needed", return_value=0.0) as mock_wait, \
+             patch.object(scraper.transport, "get", return_value=Mock(status_code=200, text="ok")):
+            scraper.fetch_page("http://example.com/menu")
+
+        mock_wait.assert_called_once_with("http://example.com/menu")
+
+
+class TestDeferredRetries:
+    """Test non-blocking Retry-After and backoff handling."""
+
+    def test_throttled_url_does_not_block_other_domains(self):
+        """Test that a 429 defers its URL while other domains keep going."""
+        from src.scraper.ethical_scraper import RetryDeferred
+
+        urls = ["http://throttled.com", "http://b.com", "http://c.com"]
+        processor = BatchProcessor(BatchConfig(max_concurrent_requests=1))
+        calls = []
+        completed = []
+
+        def scrape(url):
+            calls.append(url)
+            if url == "http://throttled.com" and calls.count(url) == 1:
+                raise RetryDeferred(url, 0.3, "HTTP 429")
+            completed.append((url, time.time()))
+            return _restaurant(url)
+
+        with patch.object(processor.scraper, "scrape_url", side_effect=scrape):
+            start = time.time()
+            result = processor.process_batch(urls)
+            elapsed = time.time() - start
+
+        assert [url for url, _ in completed] == ["http://b.com", "http://c.com", "http://throttled.com"]
+        assert completed[-1][1] - start >= 0.29
+        assert elapsed < 1.0
+        assert len(result["successful_extractions"]) == 3
+        assert result["total_processed"] == 3
+
+    def test_retries_use_backoff_and_give_up(self):
+        """Test that a URL fails after max_retries deferred attempts."""
+        from src.scraper.ethical_scraper import RetryDeferred
+
+        processor = BatchProcessor(
+            BatchConfig(max_retries=3, retry_backoff_base=0.05)
+        )
+        attempt_times = []
+
+        def scrape(url):
+            attempt_times.append(time.time())
+            raise RetryDeferred(url, None, "HTTP 503")
+
+        messages = []
+        with patch.object(processor.scraper, "scrape_url", side_effect=scrape):
+            result = processor.process_batch(
+                ["http://down.com"], lambda message, *args: messages.append(message)
+            )
+
+        assert len(attempt_times) == 3
+        gaps = [b - a for a, b in zip(attempt_times, attempt_times[1:])]
+        assert gaps[0] >= 0.045 and gaps[1] >= 0.095
+        assert result["failed_urls"] == ["http://down.com"]
+        assert result["total_processed"] == 1
+        assert sum("Retrying http://down.com" in m for m in messages) == 2
+
+    def test_retry_queue_orders_by_wake_time(self):
+        """Test that due retries come out earliest first."""
+        from src.scraper.batch_processor import DeferredRetryQueue
+
+        queue = DeferredRetryQueue()
+        queue.push("http://late.com", 20.0)
+        queue.push("http://early.com", 10.0)
+
+        assert queue.time_until_next(5.0) == 5.0
+        assert queue.pop_due(15.0) == ["http://early.com"]
+        assert len(queue) == 1
+        assert queue.pop_due(25.0) == ["http://late.com"]
+        assert queue.time_until_next(25.0) is None
+
+    def test_ethical_scraper_defers_instead_of_sleeping(self):
+        """Test that defer mode raises with the parsed Retry-After delay."""
+        from src.scraper.ethical_scraper import EthicalScraper, RetryDeferred
+
+        scraper = EthicalScraper(delay=0.0, defer_retries=True)
+        throttled = Mock(status_code=503, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+
+        with patch.object(scraper.transport, "get", return_value=throttled), \
+             patch("time.sleep") as mock_sleep:
+            with pytest.raises(RetryDeferred) as excinfo:
+                scraper.fetch_page_with_retry("http://a.com/")
+
+        assert excinfo.value.delay == 0.0
+        assert excinfo.value.reason == "HTTP 503"
+        mock_sleep.assert_not_called()
+
+    def test_ethical_scraper_defer_mode_returns_none_for_missing_pages(self):
+        """Test that non-retryable errors are not deferred."""
+        from src.scraper.ethical_scraper import EthicalScraper
+
+        scraper = EthicalScraper(delay=0.0, defer_retries=True)
+        missing = Mock(status_code=404)
+        missing.raise_for_status.side_effect = Exception("404")
+
+        with patch.object(scraper.transport, "get", return_value=missing):
+            assert scraper.fetch_page_with_retry("http://a.com/gone") is None
@@ -0,0 +1,131 @@
+"""Unit tests for the LLM content reducer."""
+import pytest
+
+from src.ai.content_reducer import ContentReducer, estimate_tokens
+
+
+PAGE = """
+<html>
+<head><title>Bistro</title><style>body { color: red; }</style></head>
+<body>
+  <nav><a href="/">Home</a><a href="/menu">Menu</a></nav>
+  <script>var tracking = "lots of javascript";</script>
+  <h1>Bistro   Central</h1>
+  <p>Order online</p>
+  <div class="menu">
+    <h2>Dinner Menu</h2>
+    <ul>
+      <li>Steak Frites   $28</li>
+      <li>Roast Chicken $22</li>
+    </ul>
+    <p>Chocolate tart 9.50</p>
+  </div>
+  <p>Order online</p>
+  <footer>Copyright 2024 Bistro</footer>
+</body>
+</html>
+"""
+
+
+class TestContentReducer:
+    """Test boilerplate removal, annotation and relevance ranking."""
+
+    @pytest.fixture
+    def reducer(self):
+        """Create a content reducer."""
+        return ContentReducer(max_chunk_tokens=50)
+
+    def test_rejects_invalid_budget(self):
+        """Test that the chunk budget must be positive."""
+        with pytest.raises(ValueError):
+            ContentReducer(max_chunk_tokens=0)
+
+    def test_strips_boilerplate_and_annotates_structure(self, reducer):
+        """Test that scripts, nav and footer go and structure is kept."""
+        reduced = reducer.reduce(PAGE)
+
+        assert reduced.text.splitlines() == [
+            "# Bistro Central",
+            "Order online",
+            "## Dinner Menu",
+            "- Steak Frites $28",
+            "- Roast Chicken $22",
+            "Chocolate tart 9.50",
+        ]
+        assert [block.kind for block in reduced.blocks][-1] == "price"
+        assert reduced.duplicates_removed == 1
+
+    def test_items_sharing_a_price_keep_it(self, reducer):
+        """Test that lines repeated under different headings are not dropped."""
+        html = (
+            "<div><h3>Burger</h3><p>$12</p><p>Served with fries</p></div>"
+            "<div><h3>Pizza</h3><p>$12</p><p>Served with fries</p></div>"
+        )
+
+        reduced = reducer.reduce(html)
+
+        assert reduced.text.splitlines() == [
+            "### Burger", "$12", "Served with fries",
+            "### Pizza", "$12", "Served with fries",
+        ]
+        assert reduced.duplicates_removed == 0
+
+    def test_duplicated_menu_is_emitted_once(self, reducer):
+        """Test that a whole repeated section is still deduplicated."""
+        menu = "<div><h2>Dinner Menu</h2><ul><li>Soup $5</li><li>Bread $3</li></ul></div>"
+
+        reduced = reducer.reduce(f"<body>{menu}{menu}</body>")
+
+        assert reduced.text.splitlines() == ["## Dinner Menu", "- Soup $5", "- Bread $3"]
+        assert reduced.duplicates_removed == 3
+
+    def test_reports_tokens_before_and_after(self, reducer):
+        """Test that token accounting reflects the reduction."""
+        stats = reducer.reduce(PAGE).get_statistics()
+
+        assert stats["original_tokens"] == estimate_tokens(PAGE)
+        assert stats["reduced_tokens"] < stats["original_tokens"]
+        assert 0 < stats["reduction_ratio"] < 1
+
+    def test_plain_text_and_empty_input(self, reducer):
+        """Test that text without markup passes through line by line."""
+        assert reducer.reduce("Soup  $5\n\nBread").text == "Soup $5\nBread"
+        assert reducer.reduce("   ").blocks == []
+
+    def test_chunks_repeat_section_heading(self):
+        """Test that a section split across chunks keeps its heading."""
+        reducer = ContentReducer(max_chunk_tokens=12)
+        reduced = reducer.reduce("<h2>Mains</h2><ul>" + "".join(
+            f"<li>Dish number {i} $1{i}</li>" for i in range(4)
+        ) + "</ul>")
+
+        chunks = reducer.chunk(reduced)
+
+        assert len(chunks) > 1
+        assert all(chunk.startswith("## Mains") for chunk in chunks)
+
+    def test_selects_relevant_chunks_not_first_ones(self):
+        """Test that menu content late in the page is picked for menu extraction."""
+        reducer = ContentReducer(max_chunk_tokens=20)
+        html = (
+            "<h2>About</h2><p>" + "We are a family business with a long history. " * 3 + "</p>"
+            "<h2>Hours</h2><p>Open Monday to Friday 11am to 9pm</p>"
+            "<h2>Menu</h2><ul><li>Burger $12</li><li>Pizza $15</li><li>Salad $9</li></ul>"
+        )
+        reduced = reducer.reduce(html)
+
+        selected = reducer.select_chunks(reduced, ["Menu Items"], max_chunks=1)
+
+        assert len(selected) == 1
+        assert "Burger $12" in selected[0]
+        assert "Open Monday" in reducer.select_chunks(reduced, ["hours"], max_chunks=1)[0]
+
+    def test_reduce_for_prompt_respects_budget(self):
+        """Test that prompt text stays within the token budget."""
+        reducer = ContentReducer()
+        html = "<p>" + "filler text " * 400 + "</p><h2>Menu</h2><ul><li>Tacos $8</li></ul>"
+
+        text = reducer.reduce_for_prompt(html, ["menu"], max_tokens=100)
+
+        assert estimate_tokens(text) <= 110
+        assert "Tacos $8" in text
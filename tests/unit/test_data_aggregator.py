@@ -861,6 +861,131 @@ class TestEnhancedDataAggregator:
         )
 
 
+class TestBlockedEntityResolution:
+    """Test that entity grouping compares only entities sharing a block."""
+
+    @staticmethod
+    def entity(entity_id, name, url, **data):
+        """Create a restaurant entity."""
+        from src.scraper.data_aggregator import RestaurantEntity
+
+        return RestaurantEntity(
+            entity_id=entity_id, name=name, url=url, entity_type="restaurant", data=data
+        )
+
+    def test_blocking_keys_normalize_contact_fields(self):
+        """Test that phone, postal code and domain are normalized into keys."""
+        from src.scraper.entity_resolver import blocking_keys
+
+        keys = blocking_keys(self.entity(
+            "a", "The Golden Dragon", "https://www.golden-dragon.com:443/menu",
+            phone="(312) 555-0199", address="42 Clark St, Chicago, IL 60610-1234",
+        ))
+
+        assert {"phone:3125550199", "postal:60610", "domain:golden-dragon.com",
+                "street:42 clark", "token:gold", "token~lden"} <= keys
+        assert "token:the" not in keys
+
+    def test_unrelated_entities_are_not_compared(self):
+        """Test that entities without a shared key are never compared."""
+        from src.scraper.data_aggregator import DataAggregator
+
+        aggregator = DataAggregator()
+        entities = [
+            self.entity(f"e{n}", name, f"https://site{n}.com")
+            for n, name in enumerate(["Sushi Zen", "Taco Loco", "Burger Barn", "Pho Saigon"])
+        ]
+
+        with patch(
+            "src.scraper.data_aggregator.RestaurantEntity.calculate_similarity",
+            return_value=1.0,
+        ) as mock_similarity:
+            groups = aggregator._group_entities_by_similarity(entities)
+
+        mock_similarity.assert_not_called()
+        assert [len(group) for group in groups] == [1, 1, 1, 1]
+        stats = aggregator.get_resolution_statistics()["grouping"]
+        assert stats["comparisons"] == 0
+        assert stats["comparisons_saved"] == 6
+
+    def test_matches_found_through_shared_phone(self):
+        """Test that differently named listings with one phone are merged."""
+        from src.scraper.data_aggregator import DataAggregator
+
+        aggregator = DataAggregator()
+        entities = [
+            self.entity("a", "Joe's", "https://joes.com", phone="555-123-4567",
+                        address="10 Oak Ave"),
+            self.entity("b", "Noodle House", "https://noodles.com", phone="555-999-0000"),
+            self.entity("c", "Joes Diner & Grill", "https://joes.com/",
+                        phone="+1 (555) 123-4567", address="10 Oak Ave"),
+        ]
+
+        groups = aggregator._group_entities_by_similarity(entities, threshold=0.6)
+
+        assert [[e.entity_id for e in group] for group in groups] == [["a", "c"], ["b"]]
+
+    def test_one_directory_domain_does_not_compare_all_pairs(self):
+        """Test that a block shared by a whole batch is windowed, not all-pairs."""
+        from src.scraper.data_aggregator import DataAggregator
+
+        aggregator = DataAggregator()
+        first_words = ["Golden", "Blue", "Red", "Happy", "Lucky", "Royal", "Urban", "Green",
+                       "Silver", "Little", "Grand", "Old", "Sunny", "Wild", "Hidden", "Iron",
+                       "Spicy", "Sweet", "Salty", "Smoky"]
+        second_words = ["Dragon", "Lagoon", "Lantern", "Garden", "Kitchen", "Table", "Fork",
+                        "Spoon", "Oven", "Grill", "Harbor", "Barrel", "Tavern", "Bowl",
+                        "Noodle", "Taco", "Curry", "Bagel", "Waffle", "Dumpling", "Cellar",
+                        "Pantry", "Skillet", "Ladle", "Bistro"]
+        entities = [
+            self.entity(f"e{n}", f"{first} {second}",
+                        f"https://city-directory.com/listing/{n}")
+            for n, (first, second) in enumerate(
+                (first, second) for first in first_words for second in second_words
+            )
+        ]
+
+        groups = aggregator._group_entities_by_similarity(entities)
+
+        stats = aggregator.get_resolution_statistics()["grouping"]
+        assert len(groups) == len(entities) == 500
+        assert stats["oversized_blocks"] >= 1
+        assert stats["comparisons"] < stats["all_pairs"] // 10
+
+    def test_non_latin_names_still_block(self):
+        """Test that names without ASCII letters produce token keys."""
+        from src.scraper.data_aggregator import DataAggregator
+
+        aggregator = DataAggregator()
+        entities = [
+            self.entity("a", "北京饭店", "https://a.example"),
+            self.entity("b", "北京饭店餐厅", "https://b.example"),
+        ]
+
+        result = aggregator._deduplicate_by_name_similarity(entities, threshold=0.8)
+
+        assert len(result) == 1
+        assert aggregator.get_resolution_statistics()["deduplication"]["comparisons"] == 1
+
+    def test_name_deduplication_merges_transitively(self):
+        """Test that chains of near-identical names end up in one entity."""
+        from src.scraper.data_aggregator import DataAggregator
+
+        aggregator = DataAggregator()
+        entities = [
+            self.entity("a", "Golden Dragon Restaurant", "https://a.com"),
+            self.entity("b", "Golden Dragon Restaurants", "https://b.com"),
+            self.entity("c", "Golden Dragons Restaurants", "https://c.com"),
+            self.entity("d", "Blue Lagoon Bar", "https://d.com"),
+        ]
+
+        result = aggregator._deduplicate_by_name_similarity(entities, threshold=0.97)
+
+        assert len(result) == 2
+        assert result[1].entity_id == "d"
+        stats = aggregator.get_resolution_statistics()["deduplication"]
+        assert stats["comparisons"] < stats["all_pairs"]
+
 class TestHierarchicalNode:
     """Test HierarchicalNode functionality."""
 
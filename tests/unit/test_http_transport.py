@@ -0,0 +1,126 @@
+"""Unit tests for the shared pooled HTTP transport."""
+import gzip
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    """Minimal HTTP/1.1 handler that keeps connections open."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"<html><body>Pooled</body></html>"
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body)
+            self.send_response(200)
+            self.send_header("Content-Encoding", "gzip")
+        else:
+            self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    """Start a local keep-alive HTTP server."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestPooledHttpTransport:
+    """Test connection pooling and statistics."""
+
+    def test_transport_validates_pool_configuration(self):
+        """Test that invalid pool sizes are rejected."""
+        from src.common.http_transport import PooledHttpTransport
+
+        with pytest.raises(ValueError):
+            PooledHttpTransport(pool_connections=0)
+        with pytest.raises(ValueError):
+            PooledHttpTransport(pool_maxsize=0)
+
+    def test_transport_reuses_connections_to_same_host(self, local_server):
+        """Test that repeated requests to one host reuse a single connection."""
+        from src.common.http_transport import PooledHttpTransport
+
+        transport = PooledHttpTransport()
+        for i in range(5):
+            response = transport.get(f"{local_server}/page{i}", timeout=5)
+            assert response.status_code == 200
+            assert "Pooled" in response.text
+
+        stats = transport.get_statistics()
+        assert stats["total_requests"] == 5
+        assert stats["connections_opened"] == 1
+        assert stats["connections_reused"] == 4
+        assert stats["handshakes_saved"] == 4
+        assert stats["requests_per_host"]["127.0.0.1"] == 5
+        transport.close()
+
+    def test_transport_requests_compressed_responses(self, local_server):
+        """Test that compression is negotiated and decoded transparently."""
+        from src.common.http_transport import PooledHttpTransport
+
+        transport = PooledHttpTransport(enable_compression=True)
+        response = transport.get(local_server, timeout=5)
+
+        assert response.text == "<html><body>Pooled</body></html>"
+        assert transport.get_statistics()["compressed_responses"] == 1
+        transport.close()
+
+    def test_transport_can_disable_compression(self, local_server):
+        """Test that compression can be turned off."""
+        from src.common.http_transport import PooledHttpTransport
+
+        transport = PooledHttpTransport(enable_compression=False)
+        transport.get(local_server, timeout=5)
+
+        assert transport.session.headers["Accept-Encoding"] == "identity"
+        assert transport.get_statistics()["compressed_responses"] == 0
+        transport.close()
+
+    def test_failed_requests_are_counted(self):
+        """Test that connection failures are recorded and re-raised."""
+        from src.common.http_transport import PooledHttpTransport
+
+        transport = PooledHttpTransport()
+        with pytest.raises(Exception):
+            transport.get("http://127.0.0.1:1/unreachable", timeout=1)
+
+        assert transport.get_statistics()["failed_requests"] == 1
+
+    def test_shared_transport_is_process_wide(self):
+        """Test that the shared transport is a single instance until reconfigured."""
+        from src.common.http_transport import (
+            get_shared_transport,
+            configure_shared_transport,
+        )
+
+        first = get_shared_transport()
+        assert get_shared_transport() is first
+
+        configured = configure_shared_transport(pool_maxsize=4)
+        assert configured is not first
+        assert configured.pool_maxsize == 4
+        assert get_shared_transport() is configured
+
+    def test_ethical_scraper_uses_shared_transport(self):
+        """Test that EthicalScraper routes requests through the shared transport."""
+        from src.common.http_transport import get_shared_transport
+        from src.scraper.ethical_scraper import EthicalScraper
+
+        scraper = EthicalScraper()
+        assert scraper.transport is get_shared_transport()
+        assert "total_requests" in scraper.get_transport_statistics()
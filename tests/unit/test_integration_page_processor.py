@@ -14,7 +14,7 @@ class TestPageProcessorIntegration:
         """Test that PageProcessor can be used standalone."""
         processor = PageProcessor(enable_ethical_scraping=False)
         
-        with patch('requests.get') as mock_get:
+        with patch('src.common.http_transport.PooledHttpTransport.get') as mock_get:
             mock_response = Mock()
             mock_response.text = "<html><head><title>Test Restaurant</title></head></html>"
             mock_response.raise_for_status.return_value = None
@@ -162,4 +162,78 @@ class TestRenderingOptimization:
         '''
         
         # Should require JavaScript rendering
-        assert handler.is_javascript_required(spa_html) is True
\ No newline at end of file
+        assert handler.is_javascript_required(spa_html) is True
+
+class TestLeanRenderProfile:
+    """Test the resource-blocking, early-exit render profile."""
+
+    @pytest.fixture
+    def handler(self):
+        """Create JavaScript handler using the lean profile."""
+        handler = JavaScriptHandler(timeout=30)
+        handler.render_profile = 'lean'
+        return handler
+
+    def test_blocks_heavy_assets_and_trackers(self, handler):
+        """Test which requests the lean profile aborts."""
+        assert handler._should_block_request('image', 'https://restaurant.com/hero.jpg')
+        assert handler._should_block_request('font', 'https://fonts.gstatic.com/a.woff2')
+        assert handler._should_block_request('script', 'https://www.google-analytics.com/analytics.js')
+        assert not handler._should_block_request('script', 'https://restaurant.com/menu.js')
+        assert not handler._should_block_request('xhr', 'https://api.restaurant.com/menu')
+        assert not handler._should_block_request('document', 'https://notgoogle-analytics.com/')
+
+    @pytest.mark.asyncio
+    async def test_route_aborts_blocked_requests(self, handler):
+        """Test that route interception aborts or continues requests."""
+        from unittest.mock import AsyncMock
+
+        blocked = Mock(request=Mock(resource_type='image', url='https://a.com/x.png'),
+                       abort=AsyncMock(), continue_=AsyncMock())
+        allowed = Mock(request=Mock(resource_type='document', url='https://a.com/'),
+                       abort=AsyncMock(), continue_=AsyncMock())
+
+        await handler._route_request(blocked)
+        await handler._route_request(allowed)
+
+        blocked.abort.assert_awaited_once()
+        allowed.continue_.assert_awaited_once()
+        assert handler._metrics['blocked_requests'] == 1
+
+    @pytest.mark.asyncio
+    async def test_lean_render_skips_network_idle(self, handler):
+        """Test that lean renders return once a readiness selector appears."""
+        from unittest.mock import AsyncMock
+
+        page = AsyncMock()
+        page.content = AsyncMock(return_value='<html><div class="menu"></div></html>')
+        page.query_selector = AsyncMock(return_value=None)
+
+        content = await handler._render_on_page(page, 'https://restaurant.com', 10)
+
+        assert 'menu' in content
+        assert page.goto.await_args.kwargs['wait_until'] == 'domcontentloaded'
+        assert page.wait_for_selector.await_args.kwargs['state'] == 'attached'
+        page.wait_for_load_state.assert_not_awaited()
+        assert handler._metrics['early_exits'] == 1
+
+    @pytest.mark.asyncio
+    async def test_lean_context_installs_route(self, handler):
+        """Test that lean contexts intercept requests."""
+        from unittest.mock import AsyncMock
+
+        browser = AsyncMock()
+        context = await handler._setup_context(browser)
+
+        context.route.assert_awaited_once_with('**/*', handler._route_request)
+
+    def test_config_validates_render_profile(self):
+        """Test render profile configuration validation."""
+        from src.config.javascript_config import JavaScriptConfig
+
+        with pytest.raises(ValueError):
+            JavaScriptConfig(render_profile='fast')
+        with pytest.raises(ValueError):
+            JavaScriptConfig(readiness_timeout=0)
+
+        assert JavaScriptConfig(render_profile='lean').get_browser_options()['render_profile'] == 'lean'
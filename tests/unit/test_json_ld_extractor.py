@@ -470,12 +470,12 @@ class TestJSONLDErrorHandling:
 
         assert result is None  # Should handle gracefully
 
-    @patch("src.scraper.json_ld_extractor.BeautifulSoup")
+    @patch("src.scraper.json_ld_extractor.ParsedPage")
     def test_handle_html_parsing_errors(self, mock_soup):
         """Test handling of HTML parsing errors."""
         from src.scraper.json_ld_extractor import JSONLDExtractor
 
-        # Mock BeautifulSoup to raise an exception
+        # Mock the page parser to raise an exception
         mock_soup.side_effect = Exception("HTML parsing failed")
 
         extractor = JSONLDExtractor()
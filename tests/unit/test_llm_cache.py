@@ -0,0 +1,284 @@
+"""Unit tests for the shared LLM response cache."""
+import threading
+import time
+import pytest
+from unittest.mock import Mock, patch
+
+from src.ai.llm_cache import (
+    LLMResponseCache,
+    estimate_cost,
+    get_shared_llm_cache,
+    usage_from_response,
+)
+
+
+CLAUDE_RESPONSE = {
+    "content": [{"text": '{"menu_items": []}'}],
+    "usage": {"input_tokens": 1000, "output_tokens": 500},
+}
+
+
+class TestPricing:
+    """Test token and cost helpers."""
+
+    def test_usage_from_each_provider_format(self):
+        """Test that OpenAI, Anthropic and Ollama usage fields are read."""
+        assert usage_from_response({"usage": {"prompt_tokens": 3, "completion_tokens": 4}}) == (3, 4)
+        assert usage_from_response(CLAUDE_RESPONSE) == (1000, 500)
+        assert usage_from_response({"prompt_eval_count": 7, "eval_count": 8}) == (7, 8)
+        assert usage_from_response({"usage": {"prompt_tokens": Mock()}}) == (0, 0)
+
+    def test_cost_uses_longest_model_prefix(self):
+        """Test that dated model names map to their family price."""
+        assert estimate_cost("claude-3-opus-20240229", 1000, 1000) == pytest.approx(0.09)
+        assert estimate_cost("gpt-4o-mini", 1000, 0) == pytest.approx(0.00015)
+        assert estimate_cost("llama2", 1000, 1000) == 0.0
+
+
+class TestLLMResponseCache:
+    """Test keying, expiry, eviction, persistence and single-flight."""
+
+    def test_rejects_invalid_configuration(self):
+        """Test that bounds are validated."""
+        with pytest.raises(ValueError):
+            LLMResponseCache(ttl=0)
+        with pytest.raises(ValueError):
+            LLMResponseCache(max_entries=0)
+
+    def test_key_covers_provider_model_prompt_and_params(self):
+        """Test that any difference in the request changes the key."""
+        key = LLMResponseCache.make_key("openai", "gpt-4", "prompt")
+
+        assert key == LLMResponseCache.make_key("openai", "gpt-4", "prompt")
+        assert key != LLMResponseCache.make_key("claude", "gpt-4", "prompt")
+        assert key != LLMResponseCache.make_key("openai", "gpt-3.5-turbo", "prompt")
+        assert key != LLMResponseCache.make_key("openai", "gpt-4", "prompt!")
+        assert key != LLMResponseCache.make_key("openai", "gpt-4", "prompt", {"max_tokens": 10})
+
+    def test_hit_reports_tokens_and_dollars_saved(self):
+        """Test that a hit skips the call and records the savings."""
+        cache = LLMResponseCache()
+        compute = Mock(return_value=CLAUDE_RESPONSE)
+
+        first, first_hit = cache.get_or_compute("claude", "claude-3-opus", "p", compute)
+        second, second_hit = cache.get_or_compute("claude", "claude-3-opus", "p", compute)
+
+        assert (first_hit, second_hit) == (False, True)
+        assert second == first
+        compute.assert_called_once()
+        stats = cache.get_statistics()
+        assert stats["hit_rate"] == 0.5
+        assert stats["tokens_saved"] == 1500
+        assert stats["dollars_saved"] == pytest.approx(0.0525)
+
+    def test_track_usage_totals_calls_and_hits(self):
+        """Test that tracked usage covers stored responses and cache hits."""
+        cache = LLMResponseCache()
+        compute = Mock(return_value=CLAUDE_RESPONSE)
+
+        with cache.track_usage() as usage:
+            cache.get_or_compute("claude", "claude-3-opus", "p", compute)
+            cache.get_or_compute("claude", "claude-3-opus", "p", compute)
+        cache.get_or_compute("claude", "claude-3-opus", "p", compute)
+
+        assert (usage.prompt_tokens, usage.completion_tokens) == (2000, 1000)
+        assert usage.cost == pytest.approx(0.105)
+
+    def test_uncacheable_results_are_not_stored(self):
+        """Test the cacheable predicate and non-JSON values."""
+        cache = LLMResponseCache()
+
+        cache.get_or_compute("openai", "m", "a", lambda: {"error": "x"}, cacheable=lambda v: "error" not in v)
+        cache.get_or_compute("openai", "m", "b", lambda: {"value": Mock()})
+
+        assert len(cache) == 0
+
+    def test_expired_entries_are_misses(self):
+        """Test that entries older than the TTL are recomputed."""
+        cache = LLMResponseCache(ttl=10)
+        cache.put("openai", "m", "p", {"v": 1})
+
+        with patch("src.ai.llm_cache.time.time", return_value=time.time() + 11):
+            assert cache.get("openai", "m", "p") is None
+
+        assert len(cache) == 0
+
+    def test_least_recently_used_entries_are_evicted(self):
+        """Test that the cache keeps at most max_entries responses."""
+        cache = LLMResponseCache(max_entries=2)
+        cache.put("openai", "m", "a", 1)
+        time.sleep(0.01)
+        cache.put("openai", "m", "b", 2)
+        time.sleep(0.01)
+        cache.get("openai", "m", "a")
+        cache.put("openai", "m", "c", 3)
+
+        assert cache.get("openai", "m", "a") == 1
+        assert cache.get("openai", "m", "b") is None
+        assert cache.get_statistics()["evictions"] == 1
+
+    def test_entries_persist_across_instances(self, tmp_path):
+        """Test that a new cache over the same file sees stored responses."""
+        path = str(tmp_path / "llm.sqlite3")
+        LLMResponseCache(path).put("ollama", "llama2", "p", {"response": "ok"})
+
+        reloaded = LLMResponseCache(path)
+
+        assert len(reloaded) == 1
+        assert reloaded.get("ollama", "llama2", "p") == {"response": "ok"}
+
+    def test_concurrent_misses_trigger_one_call(self):
+        """Test that identical in-flight requests share a single API call."""
+        cache = LLMResponseCache()
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_call():
+            started.set()
+            release.wait(5)
+            return {"v": 1}
+
+        compute = Mock(side_effect=slow_call)
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(cache.get_or_compute("openai", "m", "p", compute)[0])
+            )
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        started.wait(5)
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert compute.call_count == 1
+        assert results == [{"v": 1}] * 5
+
+
+class TestProvidersShareCache:
+    """Test that extractors read and write the process-wide cache."""
+
+    def test_claude_responses_are_cached(self):
+        """Test that a repeated Claude prompt does not call the API again."""
+        from src.ai.claude_extractor import ClaudeExtractor
+
+        extractor = ClaudeExtractor(api_key="key")
+        response = Mock(status_code=200)
+        response.json.return_value = CLAUDE_RESPONSE
+
+        with patch.object(extractor.transport, "post", return_value=response) as mock_post:
+            extractor._call_claude_api("prompt", "claude-3-opus-20240229")
+            extractor._call_claude_api("prompt", "claude-3-opus-20240229")
+
+        mock_post.assert_called_once()
+        assert extractor.llm_cache is get_shared_llm_cache()
+        assert get_shared_llm_cache().get_statistics()["tokens_saved"] == 1500
+
+    def test_caching_llm_service_restores_extraction_result(self):
+        """Test that cached OpenAI extractions come back as ExtractionResult hits."""
+        from src.ai.llm_extractor_refactored import CachingLLMService, ExtractionResult
+
+        service = Mock(model="gpt-3.5-turbo")
+        service.extract_content.return_value = ExtractionResult(
+            success=True,
+            extractions=[{"category": "menu"}],
+            token_usage={"total_tokens": 30, "prompt_tokens": 20, "completion_tokens": 10},
+        )
+        caching = CachingLLMService(service)
+
+        first = caching.extract_content("prompt")
+        second = caching.extract_content("prompt")
+
+        assert first.cache_hit is False
+        assert second.cache_hit is True
+        assert second.extractions == [{"category": "menu"}]
+        service.extract_content.assert_called_once()
+        assert caching.get_cache_statistics()["tokens_saved"] == 30
+
+
+class TestAnalyzerCaching:
+    """Test which content analyses are written to the cache."""
+
+    MENU = [{"name": "Margherita"}]
+    ANSWER = {"menu_enhancements": [{"item_name": "Margherita"}]}
+
+    def test_fallback_structure_is_not_cached(self):
+        """Test that a failed LLM call does not poison later runs."""
+        from src.ai.content_analyzer import AIContentAnalyzer
+
+        analyzer = AIContentAnalyzer()
+        analyzer.llm_extractor.extract = Mock(side_effect=[{"error": "timeout"}, self.ANSWER])
+
+        first = analyzer.analyze_content("Pizza place", self.MENU, "nutritional")
+        second = analyzer.analyze_content("Pizza place", self.MENU, "nutritional")
+        third = analyzer.analyze_content("Pizza place", self.MENU, "nutritional")
+
+        assert first["fallback"] is True
+        assert second == third == self.ANSWER
+        assert analyzer.llm_extractor.extract.call_count == 2
+
+    def test_answer_is_keyed_by_provider_that_answered(self):
+        """Test that a fallback provider's answer is not stored as the configured one's."""
+        from src.ai.content_analyzer import AIContentAnalyzer
+
+        analyzer = AIContentAnalyzer()
+        analyzer.config["default_provider"] = "claude"
+        analyzer.config["providers"]["claude"].update(enabled=True, api_key="key")
+        analyzer.llm_extractor.extract = Mock(return_value=self.ANSWER)
+
+        with patch.object(analyzer, "extract_with_claude", side_effect=Exception("overloaded")):
+            result = analyzer.analyze_content("Pizza place", self.MENU, "nutritional")
+
+        def cached(provider):
+            return analyzer.llm_cache.get(*analyzer._analysis_cache_key(
+                "Pizza place", self.MENU, "nutritional", None, provider
+            ))
+
+        assert result == self.ANSWER
+        assert cached("claude") is None
+        assert cached("openai") == self.ANSWER
+
+    def test_analysis_hit_reports_completion_savings(self):
+        """Test that an analysis served from the cache counts its completion's tokens."""
+        from src.ai.content_analyzer import AIContentAnalyzer
+        from src.ai.claude_extractor import ClaudeExtractor
+
+        analyzer = AIContentAnalyzer()
+        analyzer.config["default_provider"] = "claude"
+        analyzer.config["providers"]["claude"].update(enabled=True, api_key="key")
+
+        with patch.object(ClaudeExtractor, "_post_claude_request", return_value=CLAUDE_RESPONSE) as post:
+            analyzer.analyze_content("Pizza place", self.MENU, "nutritional")
+            analyzer.analyze_content("Pizza place", self.MENU, "nutritional")
+
+        post.assert_called_once()
+        stats = analyzer.get_cache_statistics()
+        assert stats["tokens_saved"] == 1500
+        assert stats["dollars_saved"] == pytest.approx(0.0525)
+
+    def test_batch_analysis_shares_packed_request_usage(self):
+        """Test that pages answered by one packed request split its tokens."""
+        import json
+        from src.ai.content_analyzer import AIContentAnalyzer
+
+        analyzer = AIContentAnalyzer(api_key="key")
+        pages = [
+            {"url": f"http://a.com/{i}", "content": f"Page {i}", "menu_items": [{"name": f"Dish {i}"}]}
+            for i in range(3)
+        ]
+        packed_answer = json.dumps({"results": {str(i + 1): self.ANSWER for i in range(3)}})
+
+        def completion(prompt, model, **kwargs):
+            # Stands in for the cached OpenAI call
+            analyzer.llm_cache.put("openai", model, prompt, {"content": packed_answer},
+                                   prompt_tokens=300, completion_tokens=90)
+            return packed_answer
+
+        with patch.object(analyzer, "_openai_completion", side_effect=completion):
+            analyzer.batch_analyze(pages, custom_questions=["Is there parking?"])
+            analyzer.batch_analyze(pages, custom_questions=["Is there parking?"])
+
+        assert analyzer.get_cache_statistics()["tokens_saved"] == 390
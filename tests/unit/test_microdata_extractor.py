@@ -394,12 +394,12 @@ class TestMicrodataExtractor:
         results = extractor.extract_from_html("<html></html>")
         assert results == []
 
-    @patch("src.scraper.microdata_extractor.BeautifulSoup")
+    @patch("src.scraper.microdata_extractor.ParsedPage")
     def test_handle_html_parsing_errors(self, mock_soup):
         """Test handling of HTML parsing errors."""
         from src.scraper.microdata_extractor import MicrodataExtractor
 
-        # Mock BeautifulSoup to raise an exception
+        # Mock the page parser to raise an exception
         mock_soup.side_effect = Exception("HTML parsing failed")
 
         extractor = MicrodataExtractor()
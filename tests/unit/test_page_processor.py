@@ -32,7 +32,7 @@ class TestPageProcessor:
         """Test _fetch_page method without ethical scraping."""
         processor = PageProcessor(enable_ethical_scraping=False)
         
-        with patch('requests.get') as mock_get:
+        with patch('src.common.http_transport.PooledHttpTransport.get') as mock_get:
             mock_response = Mock()
             mock_response.text = "<html>content</html>"
             mock_response.raise_for_status.return_value = None
@@ -46,7 +46,7 @@ class TestPageProcessor:
         """Test _fetch_page method handles network errors gracefully."""
         processor = PageProcessor(enable_ethical_scraping=False)
         
-        with patch('requests.get') as mock_get:
+        with patch('src.common.http_transport.PooledHttpTransport.get') as mock_get:
             mock_get.side_effect = Exception("Network error")
             
             result = processor._fetch_page("http://example.com")
@@ -66,7 +66,7 @@ class TestPageProcessor:
                 name="Test Restaurant",
                 sources=["json-ld"]
             )
-            mock_scraper.scrape_url.return_value = mock_restaurant_data
+            mock_scraper.scrape_html.return_value = mock_restaurant_data
             
             result = processor._fetch_and_process_page("http://example.com/menu")
             
@@ -94,7 +94,7 @@ class TestPageProcessor:
             
             mock_fetch.return_value = "<html>restaurant content</html>"
             mock_classifier.classify_page.return_value = "menu"
-            mock_scraper.scrape_url.return_value = None
+            mock_scraper.scrape_html.return_value = None
             
             result = processor._fetch_and_process_page("http://example.com/menu")
             
@@ -144,7 +144,7 @@ class TestPageProcessor:
         processor = PageProcessor()
         
         # Mock BeautifulSoup to raise an exception
-        with patch('src.scraper.page_processor.BeautifulSoup') as mock_soup:
+        with patch('src.scraper.parsed_page.BeautifulSoup') as mock_soup:
             mock_soup.side_effect = Exception("Parsing error")
             
             result = processor._extract_restaurant_name("<html>content</html>")
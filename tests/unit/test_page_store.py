@@ -0,0 +1,172 @@
+"""Unit tests for the per-crawl page store."""
+import pytest
+from unittest.mock import Mock, patch
+
+from src.scraper.page_store import PageStore, FetchedPage
+
+
+class TestPageStore:
+    """Test fetch-once page storage."""
+
+    def test_normalize_url_canonicalizes_equivalent_urls(self):
+        """Test that equivalent URLs share one store key."""
+        assert PageStore.normalize_url("HTTP://Example.com:80/menu/") == "http://example.com/menu"
+        assert PageStore.normalize_url("https://example.com:443") == "https://example.com/"
+        assert PageStore.normalize_url("https://example.com/menu#dinner") == "https://example.com/menu"
+        assert PageStore.normalize_url("https://example.com/menu?x=1") == "https://example.com/menu?x=1"
+
+    def test_put_and_get_round_trip_with_metadata(self):
+        """Test that stored pages keep HTML and response metadata."""
+        store = PageStore()
+        store.put(
+            "http://example.com/menu",
+            "<html>Menu</html>",
+            headers={"Content-Type": "text/html"},
+            fetch_time=0.25,
+        )
+
+        page = store.get("http://example.com/menu/")
+        assert isinstance(page, FetchedPage)
+        assert page.html == "<html>Menu</html>"
+        assert page.status_code == 200
+        assert page.content_type == "text/html"
+        assert page.fetch_time == 0.25
+
+    def test_fetch_only_calls_fetcher_once_per_url(self):
+        """Test that repeated fetches are served from the store."""
+        store = PageStore()
+        fetcher = Mock(return_value="<html>About</html>")
+
+        first = store.fetch("http://example.com/about", fetcher)
+        second = store.fetch("http://example.com/about/", fetcher)
+
+        assert first == second == "<html>About</html>"
+        fetcher.assert_called_once_with("http://example.com/about")
+        stats = store.get_statistics()
+        assert stats["pages_stored"] == 1
+        assert stats["fetches_saved"] == 1
+
+    def test_fetch_stores_response_objects(self):
+        """Test that response objects are stored with status and headers."""
+        store = PageStore()
+        response = Mock(
+            status_code=200,
+            text="<html>Contact</html>",
+            headers={"Content-Type": "text/html"},
+            url="http://example.com/contact-us",
+        )
+
+        html = store.fetch("http://example.com/contact", lambda url: response)
+
+        assert html == "<html>Contact</html>"
+        assert "http://example.com/contact-us" in store
+        assert store.get("http://example.com/contact").final_url == "http://example.com/contact-us"
+        assert store.get_statistics()["pages_stored"] == 1
+
+    def test_fetch_failures_are_not_stored(self):
+        """Test that failed fetches are retried rather than cached."""
+        store = PageStore()
+
+        assert store.fetch("http://example.com/a", lambda url: None) is None
+        assert store.fetch("http://example.com/b", lambda url: Mock(status_code=404)) is None
+        assert len(store) == 0
+
+
+class TestPageStoreIntegration:
+    """Test that crawl components share one fetch per page."""
+
+    def test_page_processor_reuses_stored_page_for_extraction(self):
+        """Test that processing a stored page does not fetch it again."""
+        from src.scraper.page_processor import PageProcessor
+
+        store = PageStore()
+        store.put("http://example.com/menu", "<html><title>Cafe</title></html>")
+        processor = PageProcessor(enable_ethical_scraping=True, page_store=store)
+
+        with patch.object(processor, "is_allowed", return_value=True), \
+             patch.object(processor, "_download_page") as mock_download, \
+             patch.object(processor.multi_strategy_scraper, "scrape_html") as mock_scrape_html, \
+             patch.object(processor.multi_strategy_scraper, "scrape_url") as mock_scrape_url:
+            mock_scrape_html.return_value = None
+
+            result = processor._fetch_and_process_page("http://example.com/menu")
+
+            assert result is not None
+            mock_download.assert_not_called()
+            mock_scrape_url.assert_not_called()
+            mock_scrape_html.assert_called_once()
+            assert mock_scrape_html.call_args[0] == (
+                "http://example.com/menu", "<html><title>Cafe</title></html>"
+            )
+
+    def test_stored_page_disallowed_by_robots_is_not_served(self):
+        """Test that robots.txt is checked before the store is consulted."""
+        from src.scraper.page_processor import PageProcessor
+
+        store = PageStore()
+        store.put("http://example.com/private/menu", "<html><title>Cafe</title></html>")
+        processor = PageProcessor(enable_ethical_scraping=True, page_store=store)
+        ethical_scraper = processor.multi_strategy_scraper.ethical_scraper
+
+        with patch.object(ethical_scraper, "is_allowed_by_robots", return_value=False) as mock_robots, \
+             patch.object(processor.multi_strategy_scraper, "scrape_html") as mock_scrape_html:
+            result = processor._fetch_and_process_page("http://example.com/private/menu")
+
+        mock_robots.assert_called_with("http://example.com/private/menu")
+        mock_scrape_html.assert_not_called()
+        assert result is None
+
+    def test_page_discovery_skips_disallowed_child_pages(self):
+        """Test that discovery neither fetches nor stores disallowed pages."""
+        from src.scraper.page_discovery import PageDiscovery
+
+        store = PageStore()
+        discovery = PageDiscovery(
+            "http://example.com", max_pages=10, page_store=store,
+            robots_checker=lambda url: "/private" not in url,
+        )
+
+        with patch.object(discovery, "_download_child_page") as mock_download:
+            mock_download.return_value = Mock(status_code=200, text="<html></html>", headers={})
+            discovery.discover_all_pages(
+                "http://example.com",
+                '<nav><a href="/private/menu">Menu</a><a href="/about">About</a></nav>',
+                max_depth=2,
+            )
+
+        mock_download.assert_called_once_with("http://example.com/about")
+        assert "http://example.com/private/menu" not in store
+
+    def test_page_discovery_reads_child_pages_from_store(self):
+        """Test that discovery uses pages already in the store."""
+        from src.scraper.page_discovery import PageDiscovery
+
+        store = PageStore()
+        store.put("http://example.com/about", '<nav><a href="/menu">Menu</a></nav>')
+        discovery = PageDiscovery("http://example.com", max_pages=10, page_store=store)
+
+        with patch.object(discovery, "_download_child_page") as mock_download:
+            pages = discovery.discover_all_pages(
+                "http://example.com", '<nav><a href="/about">About</a></nav>', max_depth=2
+            )
+
+        mock_download.assert_not_called()
+        assert "http://example.com/menu" in pages
+
+    def test_multi_strategy_scraper_scrape_html_does_not_fetch(self):
+        """Test that scrape_html extracts from supplied HTML only."""
+        from src.scraper.multi_strategy_scraper import MultiStrategyScraper
+
+        scraper = MultiStrategyScraper(enable_ethical_scraping=True)
+        html = """
+        <html><head><script type="application/ld+json">
+        {"@type": "Restaurant", "name": "Store Bistro", "telephone": "(503) 555-0100"}
+        </script></head><body></body></html>
+        """
+
+        with patch.object(scraper.ethical_scraper, "fetch_page_with_retry") as mock_fetch:
+            result = scraper.scrape_html("http://example.com", html)
+
+        mock_fetch.assert_not_called()
+        assert result is not None
+        assert result.name == "Store Bistro"
@@ -0,0 +1,164 @@
+"""Unit tests for parallel PDF text extraction."""
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.file_processing.parallel_pdf_extractor import ParallelPDFExtractor, PageText
+from src.file_processing.parallel_pdf_extractor import _extract_page_range as _real_extract
+from src.file_processing.pdf_text_extractor import PDFTextExtractor
+
+
+# Page texts per file; empty strings stand for scanned pages
+DOCUMENTS = {
+    "menu.pdf": [f"Menu page {n} with dishes and prices" for n in range(10)],
+    "flyer.pdf": ["Catering flyer front page text", "", "Catering flyer back page text"],
+}
+
+
+def fake_pymupdf():
+    """Build a stand-in for the pymupdf module serving DOCUMENTS."""
+    module = MagicMock()
+
+    def open_document(file_path):
+        texts = DOCUMENTS[file_path]
+        doc = MagicMock()
+        doc.page_count = len(texts)
+        doc.__enter__.return_value = doc
+        doc.__getitem__.side_effect = lambda number: MagicMock(
+            **{"get_text.return_value": texts[number]}
+        )
+        return doc
+
+    module.open.side_effect = open_document
+    return module
+
+
+def fake_pdfplumber(texts):
+    """Build a stand-in for pdfplumber returning the given page texts."""
+    module = MagicMock()
+    pdf = MagicMock()
+    pdf.pages = [MagicMock(**{"extract_text.return_value": text}) for text in texts]
+    module.open.return_value = pdf
+    return module
+
+
+@pytest.fixture
+def patched_libraries():
+    """Patch the PDF libraries seen by the parallel extractor."""
+    with patch("src.file_processing.parallel_pdf_extractor.pymupdf", fake_pymupdf()), \
+         patch("src.file_processing.parallel_pdf_extractor.pdfplumber",
+               fake_pdfplumber(["", "Plumber found this text", ""])):
+        yield
+
+
+class TestParallelPDFExtractor:
+    """Test page-range splitting, ordering and escalation."""
+
+    def test_rejects_invalid_settings(self):
+        """Test that task sizes are validated."""
+        with pytest.raises(ValueError):
+            ParallelPDFExtractor(pages_per_task=0)
+        with pytest.raises(ValueError):
+            ParallelPDFExtractor(max_workers=0)
+
+    def test_pages_merge_in_order_across_workers(self, patched_libraries):
+        """Test that ranges finishing out of order come back in page order."""
+        extractor = ParallelPDFExtractor(
+            max_workers=3, pages_per_task=3, executor_class=ThreadPoolExecutor
+        )
+        progress = []
+
+        def slow_first_range(file_path, start, *args):
+            if start == 0:
+                time.sleep(0.05)
+            return _real_extract(file_path, start, *args)
+
+        with patch("src.file_processing.parallel_pdf_extractor._extract_page_range",
+                   side_effect=slow_first_range):
+            pages = extractor.extract_pages("menu.pdf", lambda pct, msg: progress.append(pct))
+
+        assert [page.page_number for page in pages] == list(range(10))
+        assert pages[7].text == "Menu page 7 with dishes and prices"
+        assert progress[-1] == 100 and len(progress) == 4
+
+    def test_only_text_less_pages_escalate(self, patched_libraries):
+        """Test that pdfplumber is tried only for pages PyMuPDF left empty."""
+        extractor = ParallelPDFExtractor(max_workers=1, methods=("pymupdf", "pdfplumber"))
+
+        pages = extractor.extract_pages("flyer.pdf")
+
+        assert [page.method for page in pages] == ["pymupdf", "pdfplumber", "pymupdf"]
+        assert pages[1].text == "Plumber found this text"
+
+    def test_batch_shares_one_pool(self, patched_libraries):
+        """Test that several files are split into tasks on the same executor."""
+        pools = []
+
+        class CountingExecutor(ThreadPoolExecutor):
+            def __init__(self, max_workers):
+                pools.append(max_workers)
+                super().__init__(max_workers=max_workers)
+
+        extractor = ParallelPDFExtractor(
+            max_workers=2, pages_per_task=4, methods=("pymupdf",), executor_class=CountingExecutor
+        )
+
+        menu, flyer = extractor.extract_pages_batch(["menu.pdf", "flyer.pdf"])
+
+        assert pools == [2]
+        assert len(menu) == 10 and len(flyer) == 3
+        assert flyer[1] == PageText(1, "", "pymupdf")
+
+
+class TestPDFTextExtractorParallelPath:
+    """Test that large PDFs are routed through the parallel extractor."""
+
+    def test_large_pdf_uses_parallel_extractor(self, patched_libraries):
+        """Test that plain extraction of a long PDF skips the serial path."""
+        extractor = PDFTextExtractor(
+            parallel_extractor=ParallelPDFExtractor(max_workers=1, methods=("pymupdf",)),
+            parallel_min_pages=8,
+        )
+
+        result = extractor.extract_text("menu.pdf")
+
+        assert result.success is True
+        assert result.page_count == 10
+        assert result.method_used == "pymupdf"
+        assert result.metadata["parallel"] is True
+        assert result.text.index("Menu page 2") < result.text.index("Menu page 9")
+
+    def test_text_less_pages_use_the_configured_ocr_processor(self, patched_libraries):
+        """Test that workers run only fallback_libraries and OCR happens through ocr_processor."""
+        ocr_processor = MagicMock(tesseract_available=True)
+        ocr_processor.extract_text_from_pages.return_value = ["Catering flyer inside page, scanned"]
+        extractor = PDFTextExtractor(
+            ocr_processor=ocr_processor,
+            fallback_libraries=["pymupdf"],
+            parallel_extractor=ParallelPDFExtractor(max_workers=1),
+            parallel_min_pages=2,
+        )
+
+        with patch("src.file_processing.parallel_pdf_extractor._ocr_page") as worker_ocr:
+            result = extractor.extract_text("flyer.pdf")
+
+        worker_ocr.assert_not_called()
+        ocr_processor.extract_text_from_pages.assert_called_once_with("flyer.pdf", [1])
+        assert result.metadata["page_methods"] == {"pymupdf": 2, "ocr": 1}
+        assert result.metadata["escalated_pages"] == [2]
+        assert "scanned" in result.text
+
+    def test_batch_keeps_small_files_in_process(self, patched_libraries):
+        """Test that only files over the page threshold use the pool."""
+        extractor = PDFTextExtractor(
+            parallel_extractor=ParallelPDFExtractor(max_workers=1, methods=("pymupdf",)),
+            parallel_min_pages=8,
+        )
+
+        with patch.object(extractor, "extract_text") as mock_serial:
+            results = extractor.extract_text_batch(["menu.pdf", "flyer.pdf"])
+
+        mock_serial.assert_called_once_with("flyer.pdf")
+        assert results[0].page_count == 10
+
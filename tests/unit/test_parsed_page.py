@@ -0,0 +1,176 @@
+"""Unit tests for the parse-once document model."""
+import pytest
+from unittest.mock import patch
+
+from src.scraper.parsed_page import ParsedPage, detect_parser
+
+
+SAMPLE_HTML = """
+<html>
+<head>
+    <title>Cafe Parse | Portland</title>
+    <script type="application/ld+json">
+    {"@type": "Restaurant", "name": "Cafe Parse", "telephone": "(503) 555-0101"}
+    </script>
+    <script>var x = 1;</script>
+</head>
+<body>
+    <nav class="Main-Nav primary"><a href="/menu">Menu</a><a href="/contact">Contact</a></nav>
+    <h1>Cafe Parse</h1>
+    <h3>Our Menu</h3>
+    <div itemscope itemtype="http://schema.org/Restaurant">
+        <span itemprop="name">Cafe Parse</span>
+        <span itemprop="telephone">(503) 555-0101</span>
+    </div>
+    <div itemscope><span itemprop="name">Untyped</span></div>
+    <a>No href</a>
+</body>
+</html>
+"""
+
+
+class TestParsedPage:
+    """Test precomputed lookups on a parsed page."""
+
+    def test_detect_parser_returns_installed_builder(self):
+        """Test that the detected parser can build a tree."""
+        parser = detect_parser()
+        assert parser in ("lxml", "html.parser")
+        assert ParsedPage("<p>x</p>", parser=parser).soup.find("p") is not None
+
+    def test_scripts_are_indexed_by_type(self):
+        """Test that script tags are grouped by their type attribute."""
+        document = ParsedPage(SAMPLE_HTML)
+
+        json_ld = document.get_scripts("application/ld+json")
+        assert len(json_ld) == 1
+        assert "Cafe Parse" in json_ld[0].string
+        assert len(document.get_scripts("")) == 1
+        assert document.get_scripts("text/template") == []
+
+    def test_links_headings_and_microdata_are_indexed(self):
+        """Test link, heading and itemscope lookups."""
+        document = ParsedPage(SAMPLE_HTML)
+
+        assert [link["href"] for link in document.links] == ["/menu", "/contact"]
+        assert [heading.name for heading in document.headings] == ["h1", "h3"]
+        assert [h.name for h in document.get_headings(["h1", "h2"])] == ["h1"]
+        assert len(document.itemscopes) == 2
+        assert len(document.get_microdata_items()) == 1
+
+    def test_class_index_is_case_insensitive(self):
+        """Test that elements can be looked up by class name."""
+        document = ParsedPage(SAMPLE_HTML)
+
+        assert [el.name for el in document.get_elements_by_class("main-nav")] == ["nav"]
+        assert "main-nav primary" in document.class_strings
+
+    def test_text_is_computed_once(self):
+        """Test that text content is cached after first access."""
+        document = ParsedPage(SAMPLE_HTML)
+
+        with patch.object(document.soup, "get_text", wraps=document.soup.get_text) as mock_text:
+            assert "cafe parse" in document.text_lower
+            assert "Cafe Parse" in document.text
+            mock_text.assert_called_once()
+
+    def test_ensure_reuses_parsed_page(self):
+        """Test that ensure does not reparse an existing document."""
+        document = ParsedPage(SAMPLE_HTML)
+        assert ParsedPage.ensure(document) is document
+        assert isinstance(ParsedPage.ensure(SAMPLE_HTML), ParsedPage)
+
+
+class TestParseOnceExtraction:
+    """Test that extraction and classification share one parse."""
+
+    def test_extractors_accept_document(self):
+        """Test extract_from_document on each extraction strategy."""
+        from src.scraper.json_ld_extractor import JSONLDExtractor
+        from src.scraper.microdata_extractor import MicrodataExtractor
+        from src.scraper.heuristic_extractor import HeuristicExtractor
+
+        document = ParsedPage(SAMPLE_HTML, url="http://example.com")
+
+        json_ld = JSONLDExtractor().extract_from_document(document)
+        microdata = MicrodataExtractor().extract_from_document(document)
+        heuristic = HeuristicExtractor().extract_from_document(document)
+
+        assert json_ld[0].name == "Cafe Parse"
+        assert microdata[0].name == "Cafe Parse"
+        assert heuristic and heuristic[0].name
+
+    def test_document_and_html_extraction_agree(self):
+        """Test that document-based extraction matches HTML-based extraction."""
+        from src.scraper.enhanced_json_ld_extractor import JSONLDExtractor
+        from src.scraper.enhanced_microdata_extractor import MicrodataExtractor
+        from src.scraper.enhanced_heuristic_extractor import HeuristicExtractor
+
+        document = ParsedPage(SAMPLE_HTML)
+        for extractor in (JSONLDExtractor(), MicrodataExtractor(), HeuristicExtractor()):
+            from_html = extractor.extract_from_html(SAMPLE_HTML)
+            from_document = extractor.extract_from_document(document)
+            assert [r.name for r in from_html] == [r.name for r in from_document]
+
+    def test_restaurant_page_check_runs_once(self):
+        """Test that HTML extraction checks for a restaurant page only once."""
+        from src.scraper.enhanced_heuristic_extractor import HeuristicExtractor
+
+        extractor = HeuristicExtractor()
+        with patch.object(extractor, "_is_restaurant_page",
+                          wraps=extractor._is_restaurant_page) as mock_check:
+            extractor.extract_from_html(SAMPLE_HTML)
+
+        mock_check.assert_called_once()
+
+    def test_multi_strategy_scraper_parses_html_once(self):
+        """Test that all strategies run against a single parse."""
+        from src.scraper.multi_strategy_scraper import MultiStrategyScraper
+
+        scraper = MultiStrategyScraper(enable_ethical_scraping=False)
+        with patch("src.scraper.multi_strategy_scraper.ParsedPage", wraps=ParsedPage) as mock_parse:
+            result = scraper._extract_with_all_strategies(SAMPLE_HTML, "http://example.com")
+
+        mock_parse.assert_called_once()
+        assert result.name == "Cafe Parse"
+
+    def test_page_processor_shares_store_document(self):
+        """Test that classification and extraction reuse the stored parse."""
+        from src.scraper.page_processor import PageProcessor
+        from src.scraper.page_store import PageStore
+
+        store = PageStore()
+        store.put("http://example.com/menu", SAMPLE_HTML)
+        processor = PageProcessor(enable_ethical_scraping=True, page_store=store)
+
+        with patch.object(processor.page_classifier, "classify_page", return_value="menu") as mock_classify, \
+             patch.object(processor.multi_strategy_scraper, "scrape_html", return_value=None) as mock_scrape:
+            processor._fetch_and_process_page("http://example.com/menu")
+
+        document = store.get_document("http://example.com/menu")
+        assert mock_classify.call_args[0][1] is document
+        assert mock_scrape.call_args[1]["document"] is document
+
+    def test_page_store_document_requires_matching_html(self):
+        """Test that a stored parse is not returned for different HTML."""
+        from src.scraper.page_store import PageStore
+
+        store = PageStore()
+        store.put("http://example.com/", SAMPLE_HTML)
+
+        document = store.get_document("http://example.com/")
+        assert store.get_document("http://example.com/", SAMPLE_HTML) is document
+        assert store.get_document("http://example.com/", "<html></html>") is None
+        assert store.get_document("http://example.com/other") is None
+
+    def test_classifier_accepts_document(self):
+        """Test that page classification works from a parsed page."""
+        from src.scraper.page_classifier import PageClassifier
+
+        classifier = PageClassifier()
+        document = ParsedPage(SAMPLE_HTML)
+
+        assert classifier.classify_by_content(document) == classifier.classify_by_content(SAMPLE_HTML)
+        assert classifier.is_restaurant_related(document)
+        assert classifier.get_page_confidence("http://example.com/", document) == \
+            classifier.get_page_confidence("http://example.com/", SAMPLE_HTML)
@@ -5,6 +5,7 @@ import tempfile
 import time
 import os
 import hashlib
+import json
 from unittest.mock import Mock, patch, mock_open
 from pathlib import Path
 
@@ -428,4 +429,96 @@ class TestPDFCacheManager:
         content2 = pdf_cache_manager.get_cached_content(cache_key2)
         
         assert content1 == mock_pdf_content
-        assert content2 == mock_pdf_content + b'_v2'
\ No newline at end of file
+        assert content2 == mock_pdf_content + b'_v2'
+
+class TestIndexedPDFCache:
+    """Test LRU ordering, byte accounting and persisted metadata."""
+
+    @pytest.fixture
+    def temp_cache_dir(self):
+        """Create temporary cache directory for testing."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yield temp_dir
+
+    def test_batch_eviction_reaches_low_water_mark(self, temp_cache_dir):
+        """Test that one insert evicts the LRU entries down to the low-water mark."""
+        cache_manager = PDFCacheManager(temp_cache_dir, max_cache_size_mb=1, low_water_ratio=0.5)
+        block = b'%PDF-' + b'x' * (200 * 1024)
+        keys = [f"pdf_{i}" for i in range(4)]
+        for key in keys:
+            cache_manager.cache_pdf(key, block)
+        cache_manager.get_cached_content(keys[0])
+
+        cache_manager.cache_pdf("pdf_new", block)
+
+        stats = cache_manager.get_cache_stats()
+        assert stats.evictions_performed == 3
+        assert [cache_manager.is_cached(key) for key in keys] == [True, False, False, False]
+        assert stats.current_size_mb * 1024 * 1024 == 2 * len(block)
+
+    def test_streamed_content_is_hashed_while_written(self, temp_cache_dir):
+        """Test that chunked caching stores the same file and checksum."""
+        cache_manager = PDFCacheManager(temp_cache_dir)
+        chunks = [b'%PDF-1.4\n', b'body' * 100, b'%%EOF']
+
+        assert cache_manager.cache_pdf_stream("pdf_stream", iter(chunks)) is True
+
+        content = b''.join(chunks)
+        assert cache_manager.get_cached_content("pdf_stream") == content
+        assert cache_manager.get_cache_metadata("pdf_stream")['checksum'] == hashlib.md5(content).hexdigest()
+        assert cache_manager.validate_cache_integrity("pdf_stream") is True
+        assert not [name for name in os.listdir(temp_cache_dir) if '.tmp' in name]
+
+    def test_metadata_and_lru_order_persist(self, temp_cache_dir):
+        """Test that a new manager reloads entries, sizes and access order."""
+        cache_manager = PDFCacheManager(temp_cache_dir, max_cache_size_mb=1, low_water_ratio=0.9)
+        block = b'%PDF-' + b'y' * (400 * 1024)
+        cache_manager.cache_pdf("pdf_a", block, metadata={'source_url': 'https://a.com/menu.pdf'})
+        cache_manager.cache_pdf("pdf_b", block)
+        cache_manager.get_cached_content("pdf_a")
+
+        reloaded = PDFCacheManager(temp_cache_dir, max_cache_size_mb=1, low_water_ratio=0.9)
+        reloaded.cache_pdf("pdf_c", block)
+
+        assert reloaded.get_cache_metadata("pdf_a")['source_url'] == 'https://a.com/menu.pdf'
+        assert reloaded.is_cached("pdf_a") is True
+        assert reloaded.is_cached("pdf_b") is False
+
+    def test_legacy_json_metadata_is_imported(self, temp_cache_dir):
+        """Test that metadata written by older versions is migrated."""
+        content = b'%PDF-1.4 legacy'
+        Path(temp_cache_dir, "pdf_old.pdf").write_bytes(content)
+        Path(temp_cache_dir, "cache_metadata.json").write_text(json.dumps({
+            "pdf_old": {
+                'cache_time': time.time(), 'access_time': time.time(),
+                'expiry_time': time.time() + 3600,
+                'checksum': hashlib.md5(content).hexdigest(), 'file_size': len(content),
+            }
+        }))
+
+        cache_manager = PDFCacheManager(temp_cache_dir)
+
+        assert cache_manager.get_cached_content("pdf_old") == content
+        assert not Path(temp_cache_dir, "cache_metadata.json").exists()
+
+    def test_partial_lock_is_shared_across_managers(self, temp_cache_dir):
+        """Test that managers on one directory serialize a key's partial download."""
+        import threading
+
+        first = PDFCacheManager(temp_cache_dir)
+        second = PDFCacheManager(temp_cache_dir)
+        acquired = threading.Event()
+
+        def hold_second():
+            with second.partial_lock("pdf_a"):
+                acquired.set()
+
+        with first.partial_lock("pdf_a"):
+            with second.partial_lock("pdf_b"):
+                pass
+            waiter = threading.Thread(target=hold_second)
+            waiter.start()
+            assert not acquired.wait(0.05)
+
+        waiter.join(1)
+        assert acquired.is_set()
@@ -3,6 +3,7 @@
 import pytest
 import tempfile
 import time
+import hashlib
 import requests
 from unittest.mock import Mock, patch, MagicMock, mock_open
 from pathlib import Path
@@ -70,12 +71,12 @@ class TestPDFDownloader:
 
         url = "https://mobimag.co/wteg/portland/restaurant_guide.pdf"
         
-        with patch('requests.Session') as mock_session:
+        with patch.object(pdf_downloader, 'transport') as mock_transport:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.content = mock_pdf_content
             mock_response.headers = {'content-type': 'application/pdf', 'content-length': str(len(mock_pdf_content))}
-            mock_session.return_value.get.return_value = mock_response
+            mock_transport.get.return_value = mock_response
             
             result = pdf_downloader.download_pdf(url)
             
@@ -93,11 +94,11 @@ class TestPDFDownloader:
 
         url = "https://mobimag.co/wteg/restricted/guide.pdf"
         
-        with patch('requests.Session') as mock_session:
+        with patch.object(pdf_downloader, 'transport') as mock_transport:
             mock_response = Mock()
             mock_response.status_code = 401
             mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("401 Unauthorized")
-            mock_session.return_value.get.return_value = mock_response
+            mock_transport.get.return_value = mock_response
             
             with pytest.raises(AuthenticationError) as exc_info:
                 pdf_downloader.download_pdf(url)
@@ -112,7 +113,7 @@ class TestPDFDownloader:
 
         url = "https://mobimag.co/wteg/portland/restaurant_guide.pdf"
         
-        with patch('requests.Session') as mock_session, \
+        with patch.object(pdf_downloader, 'transport') as mock_transport, \
              patch('time.sleep') as mock_sleep:  # Speed up test
             
             # First two attempts fail, third succeeds
@@ -122,7 +123,7 @@ class TestPDFDownloader:
                 Mock(status_code=200, content=mock_pdf_content, 
                      headers={'content-type': 'application/pdf'})
             ]
-            mock_session.return_value.get.side_effect = side_effects
+            mock_transport.get.side_effect = side_effects
             
             result = pdf_downloader.download_pdf(url)
             
@@ -138,15 +139,15 @@ class TestPDFDownloader:
 
         url = "https://mobimag.co/wteg/portland/restaurant_guide.pdf"
         
-        with patch('requests.Session') as mock_session:
+        with patch.object(pdf_downloader, 'transport') as mock_transport:
             # All attempts fail
-            mock_session.return_value.get.side_effect = requests.exceptions.ConnectionError("Network error")
+            mock_transport.get.side_effect = requests.exceptions.ConnectionError("Network error")
             
             with pytest.raises(NetworkError) as exc_info:
                 pdf_downloader.download_pdf(url)
             
             assert "max retries" in str(exc_info.value).lower()
-            assert mock_session.return_value.get.call_count == pdf_downloader.max_retries + 1
+            assert mock_transport.get.call_count == pdf_downloader.max_retries + 1
 
     def test_download_pdf_timeout_handling(self, pdf_downloader):
         """Test PDF download timeout handling."""
@@ -155,8 +156,8 @@ class TestPDFDownloader:
 
         url = "https://mobimag.co/wteg/portland/slow_server.pdf"
         
-        with patch('requests.Session') as mock_session:
-            mock_session.return_value.get.side_effect = requests.exceptions.Timeout("Request timeout")
+        with patch.object(pdf_downloader, 'transport') as mock_transport:
+            mock_transport.get.side_effect = requests.exceptions.Timeout("Request timeout")
             
             with pytest.raises(NetworkError) as exc_info:
                 pdf_downloader.download_pdf(url)
@@ -164,28 +165,27 @@ class TestPDFDownloader:
             assert "timeout" in str(exc_info.value).lower()
 
     def test_download_pdf_with_session_management(self, pdf_downloader, mock_pdf_content):
-        """Test PDF download with proper session management."""
+        """Test PDF download goes through the pooled transport with auth headers."""
         if PDFDownloader is None:
             pytest.fail("PDFDownloader not implemented yet - TDD RED phase")
 
         url = "https://mobimag.co/wteg/portland/restaurant_guide.pdf"
         
-        with patch('requests.Session') as mock_session_class:
-            mock_session = Mock()
-            mock_session_class.return_value = mock_session
-            
+        with patch.object(pdf_downloader, 'transport') as mock_transport:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.content = mock_pdf_content
             mock_response.headers = {'content-type': 'application/pdf'}
-            mock_session.get.return_value = mock_response
+            mock_transport.get.return_value = mock_response
             
             result = pdf_downloader.download_pdf(url)
             
-            # Verify session was created and configured
-            mock_session_class.assert_called_once()
-            assert mock_session.headers.update.called  # Auth headers should be set
-            mock_session.get.assert_called_once_with(url, timeout=pdf_downloader.timeout)
+            # Auth headers are sent per request on the shared connection pool
+            mock_transport.get.assert_called_once_with(
+                url,
+                headers=pdf_downloader._get_auth_headers(),
+                timeout=pdf_downloader.timeout
+            )
 
     def test_download_pdf_content_type_validation(self, pdf_downloader):
         """Test PDF download validates content type."""
@@ -194,12 +194,12 @@ class TestPDFDownloader:
 
         url = "https://mobimag.co/wteg/portland/not_a_pdf.html"
         
-        with patch('requests.Session') as mock_session:
+        with patch.object(pdf_downloader, 'transport') as mock_transport:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.content = b'<html><body>Not a PDF</body></html>'
             mock_response.headers = {'content-type': 'text/html'}
-            mock_session.return_value.get.return_value = mock_response
+            mock_transport.get.return_value = mock_response
             
             with pytest.raises(ValueError) as exc_info:
                 pdf_downloader.download_pdf(url)
@@ -214,7 +214,7 @@ class TestPDFDownloader:
 
         url = "https://mobimag.co/wteg/portland/huge_file.pdf"
         
-        with patch('requests.Session') as mock_session:
+        with patch.object(pdf_downloader, 'transport') as mock_transport:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.content = b'x' * (100 * 1024 * 1024)  # 100MB file
@@ -222,7 +222,7 @@ class TestPDFDownloader:
                 'content-type': 'application/pdf',
                 'content-length': str(100 * 1024 * 1024)
             }
-            mock_session.return_value.get.return_value = mock_response
+            mock_transport.get.return_value = mock_response
             
             # Assuming max file size is 50MB
             with pytest.raises(ValueError) as exc_info:
@@ -241,12 +241,12 @@ class TestPDFDownloader:
             "https://mobimag.co/wteg/portland/guide3.pdf"
         ]
         
-        with patch('requests.Session') as mock_session:
+        with patch.object(pdf_downloader, 'transport') as mock_transport:
             mock_response = Mock()
             mock_response.status_code = 200
-            mock_response.content = mock_pdf_content
+            mock_response.iter_content.return_value = [mock_pdf_content]
             mock_response.headers = {'content-type': 'application/pdf'}
-            mock_session.return_value.get.return_value = mock_response
+            mock_transport.get.return_value = mock_response
             
             results = pdf_downloader.download_pdfs_concurrent(urls, max_workers=2)
             
@@ -255,6 +255,8 @@ class TestPDFDownloader:
                 assert result.success is True
                 assert result.authenticated is True
                 assert result.independent is True
+                assert Path(result.file_path).read_bytes() == mock_pdf_content
+            assert mock_transport.get.call_args.kwargs['stream'] is True
 
     def test_authentication_header_configuration(self, pdf_downloader):
         """Test authentication headers are properly configured."""
@@ -347,15 +349,164 @@ class TestPDFDownloader:
         def progress_callback(message):
             progress_calls.append(message)
         
-        with patch('requests.Session') as mock_session:
+        with patch.object(pdf_downloader, 'transport') as mock_transport:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.content = mock_pdf_content
             mock_response.headers = {'content-type': 'application/pdf'}
-            mock_session.return_value.get.return_value = mock_response
+            mock_transport.get.return_value = mock_response
             
             result = pdf_downloader.download_pdf(url, progress_callback=progress_callback)
             
             assert len(progress_calls) > 0
             assert any("downloading" in call.lower() for call in progress_calls)
-            assert any("authenticating" in call.lower() for call in progress_calls)
\ No newline at end of file
+            assert any("authenticating" in call.lower() for call in progress_calls)
+
+class StreamingResponse:
+    """Minimal streamed HTTP response for download tests."""
+
+    def __init__(self, chunks, status_code=200, headers=None, fail_after=None):
+        self.chunks = chunks
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.fail_after = fail_after
+        self.error = requests.exceptions.ConnectionError("connection reset")
+        self.closed = False
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} error")
+
+    def iter_content(self, chunk_size=1):
+        for index, chunk in enumerate(self.chunks):
+            if self.fail_after is not None and index >= self.fail_after:
+                raise self.error
+            yield chunk
+
+    def close(self):
+        self.closed = True
+
+
+class TestStreamingDownload:
+    """Test chunked downloads straight into the PDF cache."""
+
+    PDF = b'%PDF-1.4\n' + b'0123456789' * 500 + b'\ntrailer\n%%EOF'
+
+    @pytest.fixture
+    def pdf_downloader(self):
+        """Create PDF downloader with a temporary cache."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yield PDFDownloader(cache_dir=temp_dir, max_retries=2)
+
+    def chunks(self, data, size=1000):
+        """Split data into fixed-size chunks."""
+        return [data[i:i + size] for i in range(0, len(data), size)]
+
+    def test_streams_into_cache_file(self, pdf_downloader):
+        """Test that the body is written and hashed chunk by chunk."""
+        url = "https://example.com/menu.pdf"
+        response = StreamingResponse(self.chunks(self.PDF), headers={'ETag': '"v1"'})
+
+        with patch.object(pdf_downloader, 'transport') as mock_transport:
+            mock_transport.get.return_value = response
+            result = pdf_downloader.download_pdf_to_file(url, memory_map=True)
+            again = pdf_downloader.download_pdf_to_file(url)
+
+        assert mock_transport.get.call_args.kwargs['stream'] is True
+        assert response.closed
+        assert result.content[:] == self.PDF
+        result.content.close()
+        assert Path(result.file_path).read_bytes() == self.PDF
+        assert result.size_bytes == len(self.PDF)
+        key = pdf_downloader.cache_manager.get_cache_key(url)
+        assert pdf_downloader.cache_manager.validate_cache_integrity(key)
+        assert again.cache_hit is True and again.file_path == result.file_path
+        assert mock_transport.get.call_count == 1
+
+    def test_concurrent_downloads_of_one_url_share_the_file(self, pdf_downloader):
+        """Test that a second download of a URL waits and is served from the cache."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        url = "https://example.com/menu.pdf"
+
+        def slow_get(*args, **kwargs):
+            time.sleep(0.05)
+            return StreamingResponse(self.chunks(self.PDF), headers={'ETag': '"v1"'})
+
+        with patch.object(pdf_downloader, 'transport') as mock_transport:
+            mock_transport.get.side_effect = slow_get
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                results = list(executor.map(pdf_downloader.download_pdf_to_file, [url, url]))
+
+        assert mock_transport.get.call_count == 1
+        assert sorted(result.cache_hit for result in results) == [False, True]
+        assert all(Path(result.file_path).read_bytes() == self.PDF for result in results)
+
+    def test_rejects_non_pdf_from_first_bytes(self, pdf_downloader):
+        """Test that the magic number is checked before the rest is read."""
+        response = StreamingResponse([b'<html>', b'x' * 100])
+
+        with patch.object(pdf_downloader, 'transport') as mock_transport:
+            mock_transport.get.return_value = response
+            with pytest.raises(ValueError, match="content type"):
+                pdf_downloader.download_pdf_to_file("https://example.com/page.pdf")
+
+        assert not list(Path(pdf_downloader.cache_dir).glob("*.part"))
+
+    def test_size_limit_enforced_while_streaming(self, pdf_downloader):
+        """Test that oversized bodies are cut off mid-stream."""
+        response = StreamingResponse(self.chunks(self.PDF))
+
+        with patch.object(pdf_downloader, 'transport') as mock_transport, \
+             patch('src.pdf_processing.pdf_downloader.MAX_PDF_SIZE', 2000):
+            mock_transport.get.return_value = response
+            with pytest.raises(ValueError, match="file size"):
+                pdf_downloader.download_pdf_to_file("https://example.com/huge.pdf")
+
+    def test_interrupted_download_resumes_with_range(self, pdf_downloader):
+        """Test that a retry requests only the missing bytes."""
+        chunks = self.chunks(self.PDF)
+        first = StreamingResponse(chunks, headers={'ETag': '"v1"'}, fail_after=3)
+        rest = StreamingResponse(chunks[3:], status_code=206)
+
+        with patch.object(pdf_downloader, 'transport') as mock_transport, patch('time.sleep'):
+            mock_transport.get.side_effect = [first, rest]
+            result = pdf_downloader.download_pdf_to_file("https://example.com/menu.pdf")
+
+        resume_headers = mock_transport.get.call_args_list[1].kwargs['headers']
+        assert resume_headers['Range'] == 'bytes=3000-'
+        assert resume_headers['If-Range'] == '"v1"'
+        assert result.resumed is True
+        assert Path(result.file_path).read_bytes() == self.PDF
+        key = pdf_downloader.cache_manager.get_cache_key("https://example.com/menu.pdf")
+        assert pdf_downloader.cache_manager.get_cache_metadata(key)['checksum'] == hashlib.md5(self.PDF).hexdigest()
+
+    def test_truncated_chunked_body_resumes_with_range(self, pdf_downloader):
+        """Test that a dropped chunked transfer is retried from the partial file."""
+        chunks = self.chunks(self.PDF)
+        first = StreamingResponse(chunks, headers={'ETag': '"v1"'}, fail_after=2)
+        first.error = requests.exceptions.ChunkedEncodingError("Connection broken")
+        rest = StreamingResponse(chunks[2:], status_code=206)
+
+        with patch.object(pdf_downloader, 'transport') as mock_transport, patch('time.sleep'):
+            mock_transport.get.side_effect = [first, rest]
+            result = pdf_downloader.download_pdf_to_file("https://example.com/menu.pdf")
+
+        assert mock_transport.get.call_args_list[1].kwargs['headers']['Range'] == 'bytes=2000-'
+        assert result.resumed is True
+        assert result.retry_info['retries_attempted'] == 1
+        assert Path(result.file_path).read_bytes() == self.PDF
+
+    def test_client_errors_are_not_retried(self, pdf_downloader):
+        """Test that a missing PDF fails without backing off and retrying."""
+        error = requests.exceptions.HTTPError("404 error", response=Mock(status_code=404))
+
+        with patch.object(pdf_downloader, 'transport') as mock_transport, \
+             patch('time.sleep') as mock_sleep:
+            mock_transport.get.return_value.raise_for_status.side_effect = error
+            mock_transport.get.return_value.status_code = 404
+            with pytest.raises(NetworkError, match="404"):
+                pdf_downloader.download_pdf_to_file("https://example.com/gone.pdf")
+
+        assert mock_transport.get.call_count == 1
+        mock_sleep.assert_not_called()
@@ -393,6 +393,43 @@ class TestPDFTextExtractor:
         assert "OCR extracted: Restaurant Menu" not in result.text  # Should fail - we don't want hardcoded text
         assert result.text != "OCR extracted: Restaurant Menu\nSteak - $25.99"  # Should fail - no hardcoded text
 
+    @patch('src.file_processing.pdf_text_extractor.pymupdf')
+    def test_pdf_ocr_runs_through_image_ocr(self, mock_pymupdf):
+        """Test that every page image goes through extract_text_from_image in order."""
+        pages = []
+        for number in range(3):
+            page = Mock()
+            page.get_pixmap.return_value.tobytes.return_value = f"png{number}".encode()
+            pages.append(page)
+        mock_pymupdf.open.return_value.__iter__ = Mock(return_value=iter(pages))
+
+        ocr_processor = OCRProcessor(max_workers=2)
+        ocr_processor.tesseract_available = True
+        ocr_processor.extract_text_from_image = Mock(side_effect=lambda data: data.decode().upper())
+
+        text = ocr_processor.extract_text_from_pdf("scanned.pdf")
+
+        assert text == "PNG0\n\nPNG1\n\nPNG2"
+        assert ocr_processor.extract_text_from_image.call_count == 3
+        mock_pymupdf.open.return_value.close.assert_called_once()
+
+    @patch('src.file_processing.pdf_text_extractor.pymupdf')
+    def test_selected_pages_run_through_image_ocr(self, mock_pymupdf):
+        """Test that only the requested pages are rendered and OCR'd, in order."""
+        doc = mock_pymupdf.open.return_value
+        doc.__getitem__ = Mock(side_effect=lambda number: Mock(**{
+            "get_pixmap.return_value.tobytes.return_value": f"png{number}".encode()
+        }))
+
+        ocr_processor = OCRProcessor(max_workers=2)
+        ocr_processor.tesseract_available = True
+        ocr_processor.extract_text_from_image = Mock(side_effect=lambda data: data.decode().upper())
+
+        texts = ocr_processor.extract_text_from_pages("scanned.pdf", [4, 1])
+
+        assert texts == ["PNG4", "PNG1"]
+        doc.close.assert_called_once()
+
     def test_tesseract_availability_detection(self):
         """Test that OCR processor correctly detects Tesseract availability."""
         from src.file_processing.pdf_text_extractor import OCRProcessor
@@ -89,7 +89,7 @@ class TestEthicalScraper:
         scraper = EthicalScraper()
 
         # Mock robots.txt that allows scraping
-        with patch("src.scraper.ethical_scraper.requests.get") as mock_get:
+        with patch.object(scraper.transport, "get") as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.text = """
@@ -111,7 +111,7 @@ Allow: /
         scraper = EthicalScraper()
 
         # Mock robots.txt that disallows scraping
-        with patch("src.scraper.ethical_scraper.requests.get") as mock_get:
+        with patch.object(scraper.transport, "get") as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.text = """
@@ -133,7 +133,7 @@ Disallow: /
         scraper = EthicalScraper()
 
         # Mock robots.txt request failure
-        with patch("src.scraper.ethical_scraper.requests.get") as mock_get:
+        with patch.object(scraper.transport, "get") as mock_get:
             mock_get.side_effect = Exception("Network error")
 
             # Should default to allowing if robots.txt can't be fetched
@@ -146,7 +146,7 @@ Disallow: /
 
         scraper = EthicalScraper(user_agent="RAG_Scraper/1.0")
 
-        with patch("src.scraper.ethical_scraper.requests.get") as mock_get:
+        with patch.object(scraper.transport, "get") as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.text = "<html><body>Test</body></html>"
@@ -166,7 +166,7 @@ Disallow: /
 
         scraper = EthicalScraper(delay=0.1)
 
-        with patch("src.scraper.ethical_scraper.requests.get") as mock_get:
+        with patch.object(scraper.transport, "get") as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.text = "<html><body>Test</body></html>"
@@ -190,7 +190,7 @@ Disallow: /
 
         scraper = EthicalScraper()
 
-        with patch("src.scraper.ethical_scraper.requests.get") as mock_get:
+        with patch.object(scraper.transport, "get") as mock_get:
             mock_response = Mock()
             mock_response.status_code = 404
             mock_response.raise_for_status.side_effect = Exception("404 Not Found")
@@ -206,7 +206,7 @@ Disallow: /
 
         scraper = EthicalScraper(timeout=1)
 
-        with patch("src.scraper.ethical_scraper.requests.get") as mock_get:
+        with patch.object(scraper.transport, "get") as mock_get:
             mock_get.side_effect = Exception("Timeout")
 
             result = scraper.fetch_page("http://example.com/slow")
@@ -219,8 +219,8 @@ Disallow: /
 
         scraper = EthicalScraper()
 
-        with patch(
-            "src.scraper.ethical_scraper.requests.get"
+        with patch.object(
+            scraper.transport, "get"
         ) as mock_get, patch.object(
             scraper.rate_limiter, "wait_if_needed"
         ) as mock_rate_limiter:
@@ -249,7 +249,7 @@ Disallow: /
 
         scraper = EthicalScraper()
 
-        with patch("src.scraper.ethical_scraper.requests.get") as mock_get:
+        with patch.object(scraper.transport, "get") as mock_get:
             # First two calls fail, third succeeds
             mock_get.side_effect = [
                 Exception("Network error"),
@@ -268,7 +268,7 @@ Disallow: /
 
         scraper = EthicalScraper()
 
-        with patch("src.scraper.ethical_scraper.requests.get") as mock_get:
+        with patch.object(scraper.transport, "get") as mock_get:
             mock_get.side_effect = Exception("Persistent error")
 
             result = scraper.fetch_page_with_retry("http://example.com", max_retries=2)
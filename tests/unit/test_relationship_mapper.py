@@ -332,4 +332,58 @@ class TestRelationshipMapper:
         
         relationships_invalid = mapper.create_relationships(invalid_chunks, {})
         # Should not crash and return empty or minimal relationships
-        assert isinstance(relationships_invalid, list)
\ No newline at end of file
+        assert isinstance(relationships_invalid, list)
+
+class TestSemanticSimilarityIndex:
+    """Test MinHash LSH candidate generation for semantic relationships."""
+
+    @staticmethod
+    def make_chunks(count):
+        """Build chunks where every tenth one is a light rewrite of the previous."""
+        chunks = []
+        for n in range(count):
+            if n % 10 == 1:
+                words = chunks[-1]["content"].split()
+                words[-1] = f"special{n}"
+                content = " ".join(words)
+            else:
+                content = " ".join(f"word{n}x{k}" for k in range(12)) + " restaurant menu"
+            chunks.append({"id": f"chunk_{n}", "content": content, "source_field": "menu"})
+        return chunks
+
+    def test_lsh_matches_exact_pairwise_output(self):
+        """Test that the LSH path finds the same relationships as comparing every pair."""
+        chunks = self.make_chunks(300)
+        exact = RelationshipMapper(config={'lsh_min_chunks': 10_000})
+        indexed = RelationshipMapper(config={'lsh_min_chunks': 50})
+
+        expected = exact.create_semantic_relationships(chunks)
+        actual = indexed.create_semantic_relationships(chunks)
+
+        assert actual == expected
+        assert len(actual) == 30
+        assert exact.semantic_stats["method"] == "exact"
+        assert indexed.semantic_stats["method"] == "minhash_lsh"
+        assert indexed.semantic_stats["candidate_pairs"] < indexed.semantic_stats["all_pairs"] // 100
+
+    def test_low_threshold_compares_every_pair(self):
+        """Test that a zero threshold falls back to exact comparison."""
+        mapper = RelationshipMapper(config={'confidence_threshold': 0.0, 'lsh_min_chunks': 2})
+
+        relationships = mapper.create_semantic_relationships(self.make_chunks(4))
+
+        assert mapper.semantic_stats["method"] == "exact"
+        assert len(relationships) == 6
+
+    def test_minhash_signature_estimates_jaccard(self):
+        """Test that signature agreement approximates the exact similarity."""
+        from src.semantic.similarity_index import MinHashLSH, jaccard, tokenize
+
+        index = MinHashLSH(threshold=0.5, num_perm=256)
+        first = tokenize(" ".join(f"w{k}" for k in range(60)))
+        second = tokenize(" ".join(f"w{k}" for k in range(20, 80)))
+
+        agreement = sum(a == b for a, b in zip(index.signature(first), index.signature(second))) / 256
+
+        assert jaccard(first, second) == pytest.approx(0.5)
+        assert agreement == pytest.approx(0.5, abs=0.1)
@@ -0,0 +1,187 @@
+"""Unit tests for per-domain JavaScript render decisions."""
+import json
+import pytest
+from unittest.mock import Mock, patch
+
+from src.config.scraping_config import ScrapingConfig
+from src.scraper.multi_strategy_scraper import MultiStrategyScraper
+from src.scraper.parsed_page import ParsedPage
+from src.scraper.render_decision_cache import RenderDecisionCache
+
+
+COMPLETE_JSON_LD = """
+<html><head><script type="application/ld+json">
+{"@type": "Restaurant", "name": "Casa Blanca",
+ "address": {"streetAddress": "1 Main St", "addressLocality": "Portland"},
+ "hasMenu": {"hasMenuSection": [{"name": "Mains", "hasMenuItem": [{"name": "Paella"}]}]}}
+</script></head>
+<body><div id="root" data-react></div></body></html>
+"""
+
+EMPTY_SHELL = '<html><body><div id="root" data-react></div></body></html>'
+
+
+class TestRenderDecisionCache:
+    """Test learning and persisting render decisions."""
+
+    def test_rejects_invalid_configuration(self):
+        """Test that min_renders must be positive."""
+        with pytest.raises(ValueError):
+            RenderDecisionCache(min_renders=0)
+        with pytest.raises(ValueError):
+            RenderDecisionCache(reprobe_interval=-1)
+        with pytest.raises(ValueError):
+            RenderDecisionCache(save_every=0)
+
+    def test_domain_is_skipped_after_renders_never_help(self):
+        """Test that unhelpful renders rule a domain out."""
+        cache = RenderDecisionCache(min_renders=2)
+
+        cache.record_render("http://a.com/1", improved=False)
+        assert cache.should_render("http://a.com/2")
+        cache.record_render("http://a.com/2", improved=False)
+
+        assert not cache.should_render("http://a.com/3")
+        assert cache.should_render("http://b.com/")
+        assert cache.get_statistics()["domains_skipped"] == ["a.com"]
+
+    def test_one_improvement_keeps_domain_rendered(self):
+        """Test that a domain where rendering helped keeps being rendered."""
+        cache = RenderDecisionCache(min_renders=1)
+
+        cache.record_render("http://a.com/1", improved=True)
+        cache.record_render("http://a.com/2", improved=False)
+
+        assert cache.should_render("http://a.com/3")
+
+    def test_decisions_persist_across_instances(self, tmp_path):
+        """Test that decisions are reloaded from the storage file."""
+        path = tmp_path / "render_decisions.json"
+        cache = RenderDecisionCache(str(path), min_renders=1)
+        cache.record_render("http://a.com/", improved=False)
+        cache.record_avoided("http://a.com/menu")
+        cache.close()
+
+        reloaded = RenderDecisionCache(str(path), min_renders=1)
+
+        assert not reloaded.should_render("http://a.com/contact")
+        assert reloaded.get_statistics()["renders_avoided"] == 1
+        assert json.loads(path.read_text())["a.com"]["renders"] == 1
+
+    def test_ruled_out_domain_is_probed_again_after_interval(self):
+        """Test that a skipped domain gets one render per reprobe interval."""
+        cache = RenderDecisionCache(min_renders=1, reprobe_interval=60)
+
+        with patch("src.scraper.render_decision_cache.time.time", return_value=1000.0):
+            cache.record_render("http://a.com/1", improved=False)
+        with patch("src.scraper.render_decision_cache.time.time", return_value=1059.0):
+            assert not cache.should_render("http://a.com/2")
+        with patch("src.scraper.render_decision_cache.time.time", return_value=1060.0):
+            assert cache.should_render("http://a.com/2")
+            cache.record_render("http://a.com/2", improved=False)
+            assert not cache.should_render("http://a.com/3")
+
+    def test_writes_are_batched(self, tmp_path):
+        """Test that the file is written every save_every records and on flush."""
+        path = tmp_path / "render_decisions.json"
+        cache = RenderDecisionCache(str(path), save_every=3)
+
+        cache.record_render("http://a.com/", improved=False)
+        cache.record_avoided("http://a.com/")
+        assert not path.exists()
+
+        cache.record_avoided("http://b.com/")
+        assert set(json.loads(path.read_text())) == {"a.com", "b.com"}
+
+        cache.record_avoided("http://c.com/")
+        assert "c.com" not in json.loads(path.read_text())
+        cache.flush()
+        assert "c.com" in json.loads(path.read_text())
+        cache.close()
+
+    def test_scrapers_share_cache_per_path(self, tmp_path):
+        """Test that configs persisting to one file share one cache."""
+        first = ScrapingConfig(urls=["https://test.com"])
+        first.render_decision_cache_path = str(tmp_path / "shared.json")
+        second = ScrapingConfig(urls=["https://test.com"])
+        second.render_decision_cache_path = str(tmp_path / "shared.json")
+
+        cache = RenderDecisionCache.from_config(first)
+
+        assert RenderDecisionCache.from_config(second) is cache
+        assert RenderDecisionCache.from_config(ScrapingConfig(urls=["https://test.com"])) is not cache
+
+    def test_corrupt_storage_file_is_ignored(self, tmp_path):
+        """Test that an unreadable file starts an empty cache."""
+        path = tmp_path / "render_decisions.json"
+        path.write_text("not json")
+
+        assert RenderDecisionCache(str(path)).should_render("http://a.com/")
+
+    def test_from_config_uses_default_persistent_path(self, tmp_path, monkeypatch):
+        """Test the configured, environment and default storage paths."""
+        default = tmp_path / "default.json"
+        monkeypatch.setattr("src.scraper.render_decision_cache.DEFAULT_CACHE_PATH", str(default))
+        monkeypatch.delenv("RAG_SCRAPER_RENDER_DECISIONS", raising=False)
+        config = ScrapingConfig(urls=["https://test.com"])
+
+        assert RenderDecisionCache.from_config(config).storage_path == default
+
+        monkeypatch.setenv("RAG_SCRAPER_RENDER_DECISIONS", ":memory:")
+        assert RenderDecisionCache.from_config(config).storage_path is None
+
+        config.render_decision_cache_path = str(tmp_path / "configured.json")
+        assert RenderDecisionCache.from_config(config).storage_path == tmp_path / "configured.json"
+
+
+class TestMultiStrategyScraperRenderDecisions:
+    """Test that MultiStrategyScraper renders only when it can help."""
+
+    @pytest.fixture
+    def scraper(self):
+        """Create scraper with JavaScript rendering enabled."""
+        config = ScrapingConfig(urls=["https://test.com"])
+        config.enable_javascript_rendering = True
+        config.enable_popup_detection = False
+        scraper = MultiStrategyScraper(enable_ethical_scraping=False, config=config)
+        scraper.javascript_handler.render_page = Mock(return_value=COMPLETE_JSON_LD)
+        return scraper
+
+    def test_complete_static_page_is_not_rendered(self, scraper):
+        """Test that JSON-LD with all key fields avoids the render."""
+        result = scraper.scrape_html("http://a.com/", COMPLETE_JSON_LD)
+
+        assert result.name == "Casa Blanca"
+        scraper.javascript_handler.render_page.assert_not_called()
+        assert scraper.get_render_statistics()["renders_avoided"] == 1
+
+    def test_incomplete_page_is_rendered_and_improvement_recorded(self, scraper):
+        """Test that a JS shell is rendered and the gain is learned."""
+        result = scraper.scrape_html("http://a.com/", EMPTY_SHELL)
+
+        assert result.name == "Casa Blanca"
+        scraper.javascript_handler.render_page.assert_called_once_with("http://a.com/")
+        stats = scraper.get_render_statistics()
+        assert stats["renders"] == 1
+        assert stats["renders_improved"] == 1
+
+    def test_domain_where_rendering_never_helps_stops_rendering(self, scraper):
+        """Test that renders stop once they have proven useless for a domain."""
+        scraper.javascript_handler.render_page = Mock(return_value=EMPTY_SHELL)
+
+        for i in range(5):
+            scraper.scrape_html(f"http://a.com/{i}", EMPTY_SHELL)
+
+        assert scraper.javascript_handler.render_page.call_count == scraper.render_decisions.min_renders
+        assert scraper.get_render_statistics()["renders_avoided"] == 5 - scraper.render_decisions.min_renders
+
+    def test_static_page_is_parsed_and_extracted_once(self, scraper):
+        """Test that the render decision's extraction is reused for the result."""
+        with patch("src.scraper.multi_strategy_scraper.ParsedPage", wraps=ParsedPage) as parse:
+            with patch.object(scraper.json_ld_extractor, "extract_from_document",
+                              wraps=scraper.json_ld_extractor.extract_from_document) as extract:
+                result = scraper.scrape_html("http://a.com/", COMPLETE_JSON_LD)
+
+        assert result.name == "Casa Blanca"
+        assert parse.call_count == 1
+        assert extract.call_count == 1
@@ -0,0 +1,253 @@
+"""Unit tests for the AI request scheduler."""
+import json
+import threading
+import time
+import pytest
+from unittest.mock import Mock, patch
+
+from src.ai.request_scheduler import (
+    AIRequestScheduler,
+    configure_shared_request_scheduler,
+    get_shared_request_scheduler,
+    pack_prompts,
+    split_packed_response,
+)
+from src.scraper.rate_limiter import TokenBucket
+
+
+class TestPacking:
+    """Test multi-page prompt packing and response splitting."""
+
+    def test_pack_prompts_delimits_each_task(self):
+        """Test that every prompt is wrapped in numbered markers."""
+        packed = pack_prompts(["first page", "second page"])
+
+        assert "=== TASK 1 ===\nfirst page\n=== END TASK 1 ===" in packed
+        assert "=== TASK 2 ===\nsecond page\n=== END TASK 2 ===" in packed
+        assert '"results"' in packed
+
+    def test_split_packed_response(self):
+        """Test that answers are matched back to their tasks."""
+        text = '```json\n{"results": {"1": {"a": 1}, "3": "plain"}}\n```'
+
+        assert split_packed_response(text, 3) == ['{"a": 1}', None, "plain"]
+        assert split_packed_response("not json", 2) == [None, None]
+
+    def test_groups_respect_token_and_count_limits(self):
+        """Test that prompts are packed in order within the batch limits."""
+        scheduler = AIRequestScheduler(max_batch_tokens=10, max_prompts_per_batch=2)
+
+        groups = scheduler.pack(["a" * 8, "b" * 8, "c" * 8, "d" * 40, "e" * 4])
+
+        assert groups == [[0, 1], [2], [3], [4]]
+
+
+class TestTokenReservations:
+    """Test reserving several tokens at once from the scraper's token bucket."""
+
+    def test_reservations_queue_when_empty(self):
+        """Test that an empty bucket makes callers wait for refill."""
+        bucket = TokenBucket(interval=0.1, capacity=10)
+        now = time.time()
+
+        assert bucket.reserve(now, 10) == 0
+        assert bucket.reserve(now, 5) == pytest.approx(0.5)
+        assert bucket.reserve(now, 5) == pytest.approx(1.0)
+        assert bucket.reserve(now, 50) == pytest.approx(2.0)
+
+
+class TestAIRequestScheduler:
+    """Test batched, concurrent execution."""
+
+    def test_analyzers_share_the_process_wide_scheduler(self):
+        """Test that rate limits hold across analyzers built per request."""
+        from src.ai.content_analyzer import AIContentAnalyzer
+
+        scheduler = configure_shared_request_scheduler(max_concurrency=2)
+
+        assert get_shared_request_scheduler() is scheduler
+        assert AIContentAnalyzer(api_key="a").request_scheduler is scheduler
+        assert AIContentAnalyzer(api_key="b").request_scheduler is scheduler
+
+    def test_rejects_invalid_limits(self):
+        """Test that limits are validated."""
+        with pytest.raises(ValueError):
+            AIRequestScheduler(max_concurrency=0)
+        with pytest.raises(ValueError):
+            AIRequestScheduler(tokens_per_minute=0)
+
+    def test_packed_answers_are_split_out(self):
+        """Test that several small prompts cost one request."""
+        scheduler = AIRequestScheduler(max_prompts_per_batch=3)
+        call = Mock(return_value='{"results": {"1": {"n": 1}, "2": {"n": 2}, "3": {"n": 3}}}')
+
+        answers = scheduler.run(["p1", "p2", "p3"], call)
+
+        assert [json.loads(answer) for answer in answers] == [{"n": 1}, {"n": 2}, {"n": 3}]
+        call.assert_called_once()
+        assert scheduler.get_statistics()["batched_requests"] == 1
+
+    def test_missing_answers_fall_back_to_single_calls(self):
+        """Test that pages dropped from a batch are retried alone."""
+        scheduler = AIRequestScheduler()
+
+        def call(prompt):
+            if "=== TASK" in prompt:
+                return '{"results": {"1": "one"}}'
+            return "single:" + prompt
+
+        answers = scheduler.run(["p1", "p2"], call)
+
+        assert answers == ["one", "single:p2"]
+        assert scheduler.get_statistics()["fallback_requests"] == 1
+
+    def test_failed_calls_return_none(self):
+        """Test that provider errors do not raise."""
+        scheduler = AIRequestScheduler(max_prompts_per_batch=1)
+
+        assert scheduler.run(["p1"], Mock(side_effect=RuntimeError("down"))) == [None]
+        assert scheduler.get_statistics()["failed_requests"] == 1
+
+    def test_requests_run_concurrently_up_to_limit(self):
+        """Test that at most max_concurrency calls are in flight."""
+        scheduler = AIRequestScheduler(max_concurrency=2, max_prompts_per_batch=1, requests_per_minute=6000)
+        in_flight = []
+        peak = []
+        lock = threading.Lock()
+
+        def call(prompt):
+            with lock:
+                in_flight.append(prompt)
+                peak.append(len(in_flight))
+            time.sleep(0.05)
+            with lock:
+                in_flight.remove(prompt)
+            return prompt
+
+        answers = scheduler.run([f"p{i}" for i in range(4)], call)
+
+        assert answers == ["p0", "p1", "p2", "p3"]
+        assert max(peak) == 2
+
+
+class TestBatchAnalyze:
+    """Test AIContentAnalyzer batch analysis through the scheduler."""
+
+    @pytest.fixture
+    def analyzer(self):
+        """Create an analyzer with an API key."""
+        from src.ai.content_analyzer import AIContentAnalyzer
+
+        return AIContentAnalyzer(api_key="test-key")
+
+    def test_pages_are_packed_into_one_request(self, analyzer):
+        """Test that small pages share one OpenAI call and are cached per page."""
+        pages = [
+            {"url": f"http://a.com/{i}", "content": f"<p>Page {i}</p>", "menu_items": [{"name": f"Dish {i}"}]}
+            for i in range(3)
+        ]
+        packed_answer = json.dumps({
+            "results": {str(i + 1): {"menu_enhancements": [{"item_name": f"Dish {i}"}]} for i in range(3)}
+        })
+
+        with patch.object(analyzer, "_openai_completion", return_value=packed_answer) as mock_call:
+            results = analyzer.batch_analyze(pages, custom_questions=["Is there parking?"])
+            again = analyzer.batch_analyze(pages, custom_questions=["Is there parking?"])
+
+        mock_call.assert_called_once()
+        assert [result["menu_enhancements"][0]["item_name"] for result in results] == ["Dish 0", "Dish 1", "Dish 2"]
+        assert [result["url"] for result in again] == [page["url"] for page in pages]
+
+    def test_pages_without_menu_items_skip_the_llm(self, analyzer):
+        """Test that pages with nothing to enrich are analyzed locally."""
+        with patch.object(analyzer, "_openai_completion") as mock_call:
+            results = analyzer.batch_analyze([{"url": "u", "content": "c"}])
+
+        mock_call.assert_not_called()
+        assert results[0]["nutritional_context"] == []
+
+    def test_streamed_fields_are_labelled_with_page_url(self, analyzer):
+        """Test that pages sent on their own stream fields under their own URL."""
+        from src.ai.request_scheduler import AIRequestScheduler
+
+        analyzer.request_scheduler = AIRequestScheduler(max_prompts_per_batch=1, requests_per_minute=6000)
+        analyzer.update_configuration({"streaming_enabled": True})
+        events = []
+        analyzer.page_field_callback = lambda url: lambda path, value: events.append((url, path))
+        pages = [
+            {"url": f"http://a.com/{i}", "content": f"<p>Page {i}</p>", "menu_items": [{"name": f"Dish {i}"}]}
+            for i in range(2)
+        ]
+
+        def stream(prompt, model, required_fields=None, on_field=None):
+            on_field("menu_enhancements", [])
+            return json.dumps({"menu_enhancements": []})
+
+        with patch.object(analyzer, "_stream_openai_completion", side_effect=stream) as mock_stream:
+            analyzer.batch_analyze(pages, custom_questions=["Is there parking?"])
+
+        assert mock_stream.call_count == 2
+        assert sorted(events) == [("http://a.com/0", "menu_enhancements"),
+                                  ("http://a.com/1", "menu_enhancements")]
+
+    def test_packed_answers_report_fields_per_page(self, analyzer):
+        """Test that fields split out of a packed answer are reported per page URL."""
+        analyzer.update_configuration({"streaming_enabled": True})
+        events = []
+        analyzer.page_field_callback = lambda url: lambda path, value: events.append((url, path))
+        pages = [
+            {"url": f"http://a.com/{i}", "content": f"<p>Page {i}</p>", "menu_items": [{"name": f"Dish {i}"}]}
+            for i in range(2)
+        ]
+        packed_answer = json.dumps({
+            "results": {str(i + 1): {"cuisine_type": f"Cuisine {i}"} for i in range(2)}
+        })
+
+        with patch.object(analyzer, "_openai_completion", return_value=packed_answer):
+            analyzer.batch_analyze(pages, custom_questions=["Is there parking?"])
+
+        assert events == [("http://a.com/0", "cuisine_type"), ("http://a.com/1", "cuisine_type")]
+
+    def test_batch_prompt_matches_single_page_prompt(self, analyzer):
+        """Test that a page sent alone gets the prompt analyze_content would send."""
+        from src.ai.request_scheduler import AIRequestScheduler
+
+        analyzer.request_scheduler = AIRequestScheduler(max_prompts_per_batch=1)
+        page = {"url": "http://a.com/", "content": "<p>Pad Thai $12</p>", "menu_items": [{"name": "Pad Thai"}]}
+        questions = ["Is there parking?"]
+        answer = json.dumps({"menu_enhancements": []})
+
+        with patch.object(analyzer, "_openai_completion", return_value=answer) as mock_call:
+            analyzer.analyze_content(page["content"], page["menu_items"], "nutritional",
+                                     custom_questions=questions)
+            analyzer.llm_cache.clear()
+            analyzer.batch_analyze([page], custom_questions=questions)
+
+        single_prompt, batch_prompt = (call.args[0] for call in mock_call.call_args_list)
+        assert batch_prompt == single_prompt
+
+    def test_pages_without_custom_questions_use_the_single_page_path(self, analyzer):
+        """Test that only prompts the single-page path would build are packed."""
+        from src.ai.request_scheduler import AIRequestScheduler
+
+        analyzer.request_scheduler = AIRequestScheduler(requests_per_minute=6000)
+        pages = [{"url": f"http://a.com/{i}", "content": "c", "menu_items": [{"name": "Dish"}]} for i in range(2)]
+
+        with patch.object(analyzer, "_openai_completion") as mock_call, \
+             patch.object(analyzer, "analyze_content", side_effect=lambda **kwargs: {}) as mock_analyze:
+            results = analyzer.batch_analyze(pages)
+
+        mock_call.assert_not_called()
+        assert mock_analyze.call_count == 2
+        assert [result["url"] for result in results] == ["http://a.com/0", "http://a.com/1"]
+
+    def test_single_page_fallback_is_rate_limited(self, analyzer):
+        """Test that pages analyzed on their own wait for the provider limits."""
+        pages = [{"url": f"http://a.com/{i}", "content": "c", "menu_items": [{"name": "Dish"}]} for i in range(2)]
+        pages.append({"url": "http://a.com/empty", "content": "c"})
+
+        with patch.object(analyzer.request_scheduler, "throttle", return_value=0.0) as mock_throttle, \
+             patch.object(analyzer, "analyze_content", side_effect=lambda **kwargs: {}):
+            analyzer.batch_analyze(pages)
+
+        assert mock_throttle.call_count == 2
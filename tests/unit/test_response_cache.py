@@ -0,0 +1,189 @@
+"""Unit tests for the persistent HTTP response cache."""
+import pytest
+from unittest.mock import Mock
+
+from src.scraper.response_cache import ResponseCache, parse_cache_control
+from src.scraper.ethical_scraper import EthicalScraper
+from src.scraper.robots_cache import RobotsCache
+
+
+def _response(text="<html>Menu</html>", status_code=200, headers=None, url="http://example.com/menu"):
+    """Create a requests-style response mock."""
+    return Mock(text=text, status_code=status_code, headers=headers or {}, url=url)
+
+
+class TestParseCacheControl:
+    """Test Cache-Control parsing."""
+
+    def test_max_age_and_directives(self):
+        """Test that max-age, no-cache and no-store are recognized."""
+        directives = parse_cache_control({"Cache-Control": "public, max-age=600, no-cache"})
+        assert directives == {"no_store": False, "no_cache": True, "max_age": 600.0}
+
+        assert parse_cache_control({"cache-control": "no-store"})["no_store"] is True
+        assert parse_cache_control({})["max_age"] is None
+
+
+class TestResponseCache:
+    """Test on-disk caching, freshness and eviction."""
+
+    def test_rejects_invalid_configuration(self, tmp_path):
+        """Test that size and TTL are validated."""
+        with pytest.raises(ValueError):
+            ResponseCache(str(tmp_path), max_size_bytes=0)
+        with pytest.raises(ValueError):
+            ResponseCache(str(tmp_path), default_ttl=-1)
+
+    def test_fresh_entry_is_a_hit_and_stale_entry_is_a_miss(self, tmp_path):
+        """Test that max-age decides whether a request is needed."""
+        cache = ResponseCache(str(tmp_path))
+        cache.store("http://example.com/menu", _response(headers={"Cache-Control": "max-age=60"}))
+        cache.store("http://example.com/about", _response(headers={"ETag": '"v1"'}))
+
+        assert cache.lookup("http://example.com/menu/").body == "<html>Menu</html>"
+        assert cache.lookup("http://example.com/about") is None
+        assert cache.get("http://example.com/about").conditional_headers() == {"If-None-Match": '"v1"'}
+        stats = cache.get_statistics()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_no_store_and_errors_are_not_cached(self, tmp_path):
+        """Test that uncacheable responses are skipped."""
+        cache = ResponseCache(str(tmp_path))
+
+        assert cache.store("http://example.com/a", _response(headers={"Cache-Control": "no-store"})) is None
+        assert cache.store("http://example.com/b", _response(status_code=500)) is None
+        assert len(cache) == 0
+
+    def test_entries_persist_across_instances(self, tmp_path):
+        """Test that a new cache over the same directory sees stored entries."""
+        ResponseCache(str(tmp_path)).store("http://example.com/menu", _response())
+
+        reloaded = ResponseCache(str(tmp_path))
+
+        assert "http://example.com/menu" in reloaded
+        assert reloaded.get("http://example.com/menu").body == "<html>Menu</html>"
+
+    def test_revalidation_refreshes_entry(self, tmp_path):
+        """Test that a 304 refreshes fetch time and freshness."""
+        cache = ResponseCache(str(tmp_path))
+        cache.store("http://example.com/menu", _response(headers={"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}))
+
+        refreshed = cache.revalidated(
+            "http://example.com/menu", _response("", 304, {"Cache-Control": "max-age=60"})
+        )
+
+        assert refreshed.body == "<html>Menu</html>"
+        assert refreshed.is_fresh()
+        assert cache.get_statistics()["revalidations"] == 1
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path):
+        """Test that the cache stays within its size bound."""
+        cache = ResponseCache(str(tmp_path), max_size_bytes=25)
+        cache.store("http://example.com/a", _response("a" * 10))
+        cache.store("http://example.com/b", _response("b" * 10))
+        cache.get("http://example.com/a")
+        cache.store("http://example.com/c", _response("c" * 10))
+
+        assert "http://example.com/a" in cache
+        assert "http://example.com/b" not in cache
+        assert cache.get_statistics()["size_bytes"] <= 25
+        assert len(list(tmp_path.glob("*.json"))) == 2
+
+    def test_offline_mode_serves_stale_entries(self, tmp_path):
+        """Test that offline replay serves any stored entry."""
+        ResponseCache(str(tmp_path)).store("http://example.com/menu", _response())
+
+        cache = ResponseCache(str(tmp_path), offline=True)
+
+        assert cache.lookup("http://example.com/menu").body == "<html>Menu</html>"
+        assert cache.lookup("http://example.com/missing") is None
+
+    def test_from_config_requires_cache_dir(self, tmp_path):
+        """Test that caching is only enabled when a directory is configured."""
+        assert ResponseCache.from_config(None) is None
+        config = Mock(response_cache_dir=str(tmp_path), response_cache_max_mb=1,
+                      response_cache_default_ttl=None, offline_replay=True)
+
+        cache = ResponseCache.from_config(config)
+
+        assert cache.max_size_bytes == 1024 * 1024
+        assert cache.offline is True
+
+    def test_from_config_sets_default_ttl(self, tmp_path):
+        """Test that responses without max-age stay fresh for the configured TTL."""
+        config = Mock(response_cache_dir=str(tmp_path), response_cache_max_mb=1,
+                      response_cache_default_ttl=600, offline_replay=False)
+        cache = ResponseCache.from_config(config)
+
+        cache.store("http://example.com/menu", _response())
+
+        assert cache.default_ttl == 600
+        assert cache.lookup("http://example.com/menu").body == "<html>Menu</html>"
+
+
+class TestEthicalScraperResponseCache:
+    """Test the cached fetch path in EthicalScraper."""
+
+    @pytest.fixture
+    def transport(self):
+        """Create a transport mock."""
+        return Mock()
+
+    def _scraper(self, transport, cache):
+        return EthicalScraper(delay=0, transport=transport, response_cache=cache)
+
+    def test_fresh_entry_skips_request(self, tmp_path, transport):
+        """Test that a fresh cached page is served without touching the network."""
+        transport.get.return_value = _response(headers={"Cache-Control": "max-age=600"})
+        scraper = self._scraper(transport, ResponseCache(str(tmp_path)))
+
+        assert scraper.fetch_page("http://example.com/menu") == "<html>Menu</html>"
+        assert scraper.fetch_page("http://example.com/menu") == "<html>Menu</html>"
+
+        assert transport.get.call_count == 1
+        stats = scraper.get_rate_limit_statistics()
+        assert stats.cache_hits == 1
+        assert stats.cache_misses == 1
+
+    def test_stale_entry_is_revalidated_with_conditional_headers(self, tmp_path, transport):
+        """Test that a 304 reuses the cached body."""
+        transport.get.side_effect = [
+            _response(headers={"ETag": '"v1"'}),
+            _response("", 304),
+        ]
+        scraper = self._scraper(transport, ResponseCache(str(tmp_path)))
+
+        scraper.fetch_page("http://example.com/menu")
+        html = scraper.fetch_page("http://example.com/menu")
+
+        assert html == "<html>Menu</html>"
+        assert transport.get.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+        assert scraper.get_rate_limit_statistics().to_json()["cache_revalidations"] == 1
+
+    def test_offline_replay_never_uses_network(self, tmp_path, transport):
+        """Test that offline mode serves cached pages and fails fast on misses."""
+        ResponseCache(str(tmp_path)).store("http://example.com/menu", _response())
+        scraper = self._scraper(transport, ResponseCache(str(tmp_path), offline=True))
+
+        assert scraper.fetch_page_with_retry("http://example.com/menu") == "<html>Menu</html>"
+        assert scraper.fetch_page_with_retry("http://example.com/missing") is None
+        transport.get.assert_not_called()
+
+    def test_offline_replay_serves_robots_txt_from_cache(self, tmp_path, transport):
+        """Test that robots.txt stored while online is replayed without a request."""
+        transport.get.return_value = _response(
+            "User-agent: *\nDisallow: /private", url="http://example.com/robots.txt"
+        )
+        online = self._scraper(transport, ResponseCache(str(tmp_path)))
+        assert not online.is_allowed_by_robots("http://example.com/private")
+        transport.get.reset_mock()
+
+        offline = EthicalScraper(
+            delay=0, transport=transport, robots_cache=RobotsCache(),
+            response_cache=ResponseCache(str(tmp_path), offline=True),
+        )
+
+        assert not offline.is_allowed_by_robots("http://example.com/private")
+        assert offline.is_allowed_by_robots("http://example.com/menu")
+        transport.get.assert_not_called()
@@ -0,0 +1,242 @@
+"""Unit tests for the shared robots.txt cache."""
+import threading
+import time
+import pytest
+import requests
+from unittest.mock import Mock, patch
+
+from src.scraper.robots_cache import (
+    RobotsCache,
+    RobotsRuleMatcher,
+    RobotsTxtParser,
+    get_shared_robots_cache,
+    robots_path_for,
+    robots_url_for,
+)
+
+
+ROBOTS_TXT = "User-agent: *\nDisallow: /admin\nCrawl-delay: 3\n"
+
+
+class TestRobotsRuleMatcher:
+    """Test compiled longest-match rule evaluation."""
+
+    def test_longest_match_wins_and_allow_wins_ties(self):
+        """Test RFC 9309 precedence between allow and disallow."""
+        matcher = RobotsRuleMatcher(allow=["/shop/public", "/dup"], disallow=["/shop", "/dup"])
+
+        assert matcher.is_allowed("/shop/public/item")
+        assert not matcher.is_allowed("/shop/cart")
+        assert matcher.is_allowed("/dup")
+        assert matcher.is_allowed("/other")
+
+    def test_wildcard_and_end_anchor_patterns(self):
+        """Test that * and $ patterns are honored."""
+        matcher = RobotsRuleMatcher(
+            allow=["/p$", "/search/public"],
+            disallow=["/*.pdf$", "/search*q=", "/p"],
+        )
+
+        assert not matcher.is_allowed("/files/menu.pdf")
+        assert matcher.is_allowed("/files/menu.pdf?download=1")
+        assert not matcher.is_allowed("/search?q=pizza")
+        assert matcher.is_allowed("/search/public?q=pizza")
+        assert matcher.is_allowed("/p")
+        assert not matcher.is_allowed("/page")
+
+    def test_verdicts_are_memoized(self):
+        """Test that repeated lookups reuse the stored verdict."""
+        matcher = RobotsRuleMatcher(allow=[], disallow=["/admin"], memo_size=2)
+
+        assert not matcher.is_allowed("/admin")
+        assert matcher._memo == {"/admin": False}
+        matcher.is_allowed("/a")
+        matcher.is_allowed("/b")
+
+        assert len(matcher._memo) <= 2
+
+
+class TestRobotsTxtParserGroups:
+    """Test user-agent group selection."""
+
+    def test_product_token_and_shared_groups(self):
+        """Test that full user agents match their product token group."""
+        parser = RobotsTxtParser(
+            "User-agent: rag_scraper\nUser-agent: otherbot\nDisallow: /private # staff only\n"
+            "\nUser-agent: *\nDisallow: /\n"
+        )
+
+        assert not parser.is_allowed("/private/menu", "RAG_Scraper/1.0 (Ethical Restaurant Data Scraper)")
+        assert parser.is_allowed("/menu", "RAG_Scraper/1.0")
+        assert not parser.is_allowed("/private", "OtherBot")
+        assert not parser.is_allowed("/menu", "SomeBot")
+        assert parser.is_allowed("/robots.txt", "SomeBot")
+
+    def test_robots_path_includes_query(self):
+        """Test that query strings take part in matching."""
+        assert robots_path_for("http://a.com/search?q=1") == "/search?q=1"
+        assert robots_path_for("http://a.com") == "/"
+
+
+class TestRobotsCache:
+    """Test TTL, LRU bounds, persistence and single-flight fetching."""
+
+    def test_rejects_invalid_configuration(self):
+        """Test that TTL and size bounds are validated."""
+        with pytest.raises(ValueError):
+            RobotsCache(ttl=0)
+        with pytest.raises(ValueError):
+            RobotsCache(max_entries=0)
+
+    def test_robots_url_for_page(self):
+        """Test that page URLs map to their site's robots.txt."""
+        assert robots_url_for("https://a.com/menu?x=1") == "https://a.com/robots.txt"
+
+    def test_parser_is_fetched_once_and_reused(self):
+        """Test that repeated lookups are served from the cache."""
+        cache = RobotsCache()
+        fetch = Mock(return_value=ROBOTS_TXT)
+
+        first = cache.get_parser("http://a.com/robots.txt", fetch)
+        second = cache.get_parser("http://a.com/robots.txt", fetch)
+
+        assert first is second
+        assert not first.is_allowed("/admin/users", "bot")
+        fetch.assert_called_once_with("http://a.com/robots.txt")
+        assert cache.get_statistics()["hits"] == 1
+
+    def test_expired_entries_are_refetched(self):
+        """Test that entries older than the TTL are fetched again."""
+        cache = RobotsCache(ttl=10)
+        fetch = Mock(return_value=ROBOTS_TXT)
+        cache.get_parser("http://a.com/robots.txt", fetch)
+
+        with patch("src.scraper.robots_cache.time.time", return_value=time.time() + 11):
+            cache.get_parser("http://a.com/robots.txt", fetch)
+
+        assert fetch.call_count == 2
+
+    def test_fetch_errors_allow_everything_for_error_ttl(self):
+        """Test that a failed fetch is cached as allow-all with the shorter TTL."""
+        cache = RobotsCache(error_ttl=5)
+
+        parser = cache.get_parser("http://a.com/robots.txt", Mock(side_effect=OSError("down")))
+
+        assert parser.is_allowed("/admin", "bot")
+        assert cache._entries["http://a.com/robots.txt"].ttl == 5
+
+    def test_least_recently_used_entries_are_evicted(self):
+        """Test that the cache keeps at most max_entries files."""
+        cache = RobotsCache(max_entries=2)
+        fetch = Mock(return_value="")
+        cache.get_parser("http://a.com/robots.txt", fetch)
+        cache.get_parser("http://b.com/robots.txt", fetch)
+        cache.get_parser("http://a.com/robots.txt", fetch)
+        cache.get_parser("http://c.com/robots.txt", fetch)
+
+        assert "http://a.com/robots.txt" in cache
+        assert "http://b.com/robots.txt" not in cache
+        assert cache.get_statistics()["evictions"] == 1
+
+    def test_entries_persist_across_instances(self, tmp_path):
+        """Test that robots.txt files are reloaded from the storage file."""
+        path = tmp_path / "robots.json"
+        RobotsCache(storage_path=str(path)).get_parser(
+            "http://a.com/robots.txt", Mock(return_value=ROBOTS_TXT)
+        )
+
+        fetch = Mock()
+        parser = RobotsCache(storage_path=str(path)).get_parser("http://a.com/robots.txt", fetch)
+
+        assert parser.get_crawl_delay("bot") == 3.0
+        fetch.assert_not_called()
+
+    def test_concurrent_lookups_trigger_one_fetch(self):
+        """Test that workers hitting a new domain share a single fetch."""
+        cache = RobotsCache()
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_fetch(robots_url):
+            started.set()
+            release.wait(5)
+            return ROBOTS_TXT
+
+        fetch = Mock(side_effect=slow_fetch)
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(cache.get_parser("http://a.com/robots.txt", fetch))
+            )
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        started.wait(5)
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert fetch.call_count == 1
+        assert len(results) == 5
+        assert all(parser is results[0] for parser in results)
+
+
+class TestSharedRobotsCache:
+    """Test that scrapers and the compliance checker share robots.txt."""
+
+    def test_ethical_scrapers_share_one_fetch(self):
+        """Test that a second scraper does not refetch robots.txt."""
+        from src.scraper.ethical_scraper import EthicalScraper
+
+        first = EthicalScraper(delay=1.0)
+        second = EthicalScraper(delay=1.0)
+        robots = Mock(status_code=200, text=ROBOTS_TXT)
+
+        with patch.object(first.transport, "get", return_value=robots) as mock_get:
+            assert first.is_allowed_by_robots("http://a.com/menu")
+            assert not second.is_allowed_by_robots("http://a.com/admin")
+
+        mock_get.assert_called_once()
+        assert second.rate_limiter.get_domain_delay("a.com") == 3.0
+
+    def test_compliance_checker_uses_shared_parser(self):
+        """Test that EthicalComplianceChecker reads the scraper's cached rules."""
+        from src.scraper.ethical_scraper import EthicalScraper
+        from src.scraper.integrated_rate_limiter import EthicalComplianceChecker
+
+        scraper = EthicalScraper()
+        with patch.object(scraper.transport, "get", return_value=Mock(status_code=200, text=ROBOTS_TXT)):
+            scraper.is_allowed_by_robots("http://a.com/")
+
+        checker = EthicalComplianceChecker()
+        with patch.object(checker, "fetch_robots_txt") as mock_fetch:
+            result = checker.check_robots_txt("http://a.com/admin")
+
+        mock_fetch.assert_not_called()
+        assert result["allowed"] is False
+        assert result["crawl_delay"] == 3.0
+        assert checker.robots_txt_cache is get_shared_robots_cache()
+
+    @pytest.mark.parametrize("outcome", [
+        requests.exceptions.ConnectionError("unreachable"),
+        Mock(status_code=503, raise_for_status=Mock(side_effect=requests.exceptions.HTTPError("503"))),
+    ])
+    def test_compliance_checker_failures_use_error_ttl(self, outcome):
+        """Test that a failed robots.txt fetch is not cached as allow-all for a day."""
+        from src.scraper.integrated_rate_limiter import EthicalComplianceChecker
+
+        checker = EthicalComplianceChecker()
+        transport = Mock()
+        transport.get.side_effect = [outcome, Mock(status_code=200, text=ROBOTS_TXT)]
+
+        with patch("src.scraper.integrated_rate_limiter.get_shared_transport", return_value=transport):
+            assert checker.check_robots_txt("http://a.com/admin")["allowed"] is True
+            entry = checker.robots_txt_cache._entries["http://a.com/robots.txt"]
+            assert entry.ttl == checker.robots_txt_cache.error_ttl
+
+            entry.fetched_at -= entry.ttl
+            assert checker.check_robots_txt("http://a.com/admin")["allowed"] is False
+
+        assert transport.get.call_args.kwargs["headers"]["User-Agent"] == checker.user_agent
@@ -0,0 +1,118 @@
+"""Unit tests for AI analysis in the scraping request handler."""
+import json
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from src.ai.content_analyzer import AIContentAnalyzer
+from src.web_interface.handlers.scraping_request_handler import ScrapingRequestHandler
+
+
+ANSWER = json.dumps({
+    "menu_enhancements": [],
+    "restaurant_characteristics": {"ambiance": "casual"},
+    "customer_amenities": {"parking": "street"},
+    "custom_questions": {"Do you have highchairs?": "Yes"},
+})
+
+
+def make_extraction(name, source_url="http://a.com/"):
+    """Create a scraped restaurant with content and a menu."""
+    return SimpleNamespace(
+        name=name,
+        source_url=source_url,
+        raw_content=f"{name} serves tacos",
+        menu_items={"Mains": ["Tacos"]},
+        sources=["json_ld"],
+    )
+
+
+def make_request(**ai_settings):
+    """Create request data with AI enhancement enabled."""
+    ai_config = {
+        "ai_enhancement_enabled": True,
+        "llm_provider": "openai",
+        "api_key": "test-key",
+        "custom_questions": ["Do you have highchairs?"],
+        **ai_settings,
+    }
+    return {"urls": ["http://a.com/", "http://b.com/"], "ai_config": ai_config}
+
+
+class TestScrapingRequestHandlerStreaming:
+    """Test that streamed AI fields reach the progress monitor."""
+
+    def make_handler(self, progress_monitor=None):
+        """Create a handler with stub validation and file generation."""
+        return ScrapingRequestHandler(Mock(), Mock(), "/tmp", progress_monitor=progress_monitor)
+
+    def stream_answer(self, calls):
+        """Build a completion stub that streams one field of the answer."""
+        def completion(analyzer, prompt, model="gpt-3.5-turbo", stream=False,
+                       required_fields=None, on_field=None):
+            calls.append(stream)
+            if stream and on_field is not None:
+                on_field("restaurant_characteristics", {"ambiance": "casual"})
+            return ANSWER
+        return completion
+
+    def test_fields_are_streamed_to_attached_monitor(self):
+        """Test that a monitor turns streaming on without a UI setting."""
+        monitor = Mock()
+        handler = self.make_handler(progress_monitor=monitor)
+        result = SimpleNamespace(successful_extractions=[make_extraction("Casa")])
+        calls = []
+
+        with patch.object(AIContentAnalyzer, "_openai_completion", self.stream_answer(calls)):
+            analysis = handler._perform_ai_analysis(result, make_request())
+
+        assert calls == [True]
+        assert analysis["successful_analyses"] == 1
+        monitor.add_completion_event.assert_any_call(
+            "ai_field_received", "http://a.com/", {"field": "restaurant_characteristics"}
+        )
+
+    def test_stream_responses_setting_turns_streaming_off(self):
+        """Test that the AI settings can disable streaming."""
+        monitor = Mock()
+        handler = self.make_handler(progress_monitor=monitor)
+        result = SimpleNamespace(successful_extractions=[make_extraction("Casa")])
+        calls = []
+
+        with patch.object(AIContentAnalyzer, "_openai_completion", self.stream_answer(calls)):
+            handler._perform_ai_analysis(result, make_request(stream_responses=False))
+
+        assert calls == [False]
+        monitor.add_completion_event.assert_not_called()
+
+    def test_no_streaming_without_monitor(self):
+        """Test that nothing is streamed when no monitor is attached."""
+        handler = self.make_handler()
+        result = SimpleNamespace(successful_extractions=[make_extraction("Casa")])
+        calls = []
+
+        with patch.object(AIContentAnalyzer, "_openai_completion", self.stream_answer(calls)):
+            handler._perform_ai_analysis(result, make_request())
+
+        assert calls == [False]
+
+
+class TestScrapingRequestHandlerPageUrls:
+    """Test that AI analyses are labelled with the page they came from."""
+
+    def test_fields_are_labelled_with_extraction_url_after_a_failure(self):
+        """Test that a failed first URL does not shift the labels."""
+        monitor = Mock()
+        handler = ScrapingRequestHandler(Mock(), Mock(), "/tmp", progress_monitor=monitor)
+        # http://a.com/ failed, so the only extraction is from http://b.com/
+        result = SimpleNamespace(successful_extractions=[make_extraction("Casa", "http://b.com/")])
+
+        def completion(prompt, model="gpt-3.5-turbo", stream=False, required_fields=None, on_field=None):
+            on_field("restaurant_characteristics", {})
+            return ANSWER
+
+        with patch.object(AIContentAnalyzer, "_openai_completion", side_effect=completion):
+            handler._perform_ai_analysis(result, make_request())
+
+        monitor.add_completion_event.assert_called_once_with(
+            "ai_field_received", "http://b.com/", {"field": "restaurant_characteristics"}
+        )
@@ -0,0 +1,201 @@
+"""Unit tests for streamed LLM responses and incremental JSON parsing."""
+import json
+import pytest
+from unittest.mock import Mock, patch
+
+from src.ai.streaming import (
+    FieldStream,
+    IncrementalJSONParser,
+    progress_field_callback,
+    stream_anthropic,
+    stream_ollama,
+)
+
+
+RESPONSE = json.dumps({
+    "menu_items": [{"name": "Pad Thai, large", "price": "$12"}, {"name": "Curry \"red\""}],
+    "cuisine_type": "Thai",
+    "price_range": "$$",
+    "confidence": 0.9,
+})
+
+
+def anthropic_lines(text, size=7):
+    """Build an Anthropic event stream delivering text in small deltas."""
+    yield 'data: {"type": "message_start", "message": {"usage": {"input_tokens": 120}}}'
+    for start in range(0, len(text), size):
+        delta = {"type": "content_block_delta", "delta": {"type": "text_delta", "text": text[start:start + size]}}
+        yield ""
+        yield "event: content_block_delta"
+        yield "data: " + json.dumps(delta)
+    yield 'data: {"type": "message_delta", "usage": {"output_tokens": 45}}'
+    yield 'data: {"type": "message_stop"}'
+
+
+class TestIncrementalJSONParser:
+    """Test field-by-field parsing of partial JSON."""
+
+    def test_fields_and_array_items_surface_in_order(self):
+        """Test that every field is reported once, whatever the chunking."""
+        parser = IncrementalJSONParser()
+        events = []
+        for start in range(0, len(RESPONSE), 3):
+            events.extend(parser.feed(RESPONSE[start:start + 3]))
+
+        assert [path for path, _ in events] == [
+            "menu_items[0]", "menu_items[1]", "menu_items", "cuisine_type", "price_range", "confidence",
+        ]
+        assert events[1][1] == {"name": 'Curry "red"'}
+        assert parser.complete
+        assert parser.result() == json.loads(RESPONSE)
+
+    def test_field_is_reported_before_the_object_closes(self):
+        """Test that a scalar field arrives as soon as its delimiter does."""
+        parser = IncrementalJSONParser()
+
+        assert parser.feed('```json\n{"cuisine_type": "Thai"') == [("cuisine_type", "Thai")]
+        assert parser.feed(', "confidence": 0.') == []
+        assert parser.feed("8}\n```") == [("confidence", 0.8)]
+        assert parser.result() == {"cuisine_type": "Thai", "confidence": 0.8}
+
+    def test_incomplete_object_has_no_result(self):
+        """Test that a truncated stream keeps the completed fields only."""
+        parser = IncrementalJSONParser()
+        parser.feed('{"a": 1, "b": [1, 2')
+
+        assert parser.fields == {"a": 1}
+        assert parser.result() is None
+
+
+class TestFieldStream:
+    """Test callbacks and early cancellation."""
+
+    def test_stops_once_required_fields_arrive(self):
+        """Test that the stream asks to stop and rebuilds parseable JSON."""
+        received = []
+        stream = FieldStream(lambda path, value: received.append(path), ["menu_items", "cuisine_type"])
+
+        result = stream_anthropic(anthropic_lines(RESPONSE), stream)
+
+        assert result.cancelled
+        assert "cuisine_type" in received and "confidence" not in received
+        assert json.loads(result.json_text) == {
+            "menu_items": json.loads(RESPONSE)["menu_items"],
+            "cuisine_type": "Thai",
+        }
+
+    def test_complete_stream_keeps_usage(self):
+        """Test that a full stream reports token usage and the raw text."""
+        result = stream_anthropic(anthropic_lines(RESPONSE), FieldStream())
+
+        assert result.complete and not result.cancelled
+        assert result.text == RESPONSE
+        assert (result.prompt_tokens, result.completion_tokens) == (120, 45)
+
+    def test_callback_errors_do_not_break_the_stream(self):
+        """Test that a failing consumer does not lose the response."""
+        stream = FieldStream(Mock(side_effect=RuntimeError("ui gone")))
+
+        assert stream.feed(RESPONSE) is False
+        assert stream.result().complete
+
+    def test_ollama_ndjson_stream(self):
+        """Test that Ollama deltas and final counts are read."""
+        lines = [json.dumps({"response": RESPONSE[:20], "done": False}).encode()]
+        lines.append(json.dumps({
+            "response": RESPONSE[20:], "done": True, "prompt_eval_count": 9, "eval_count": 4,
+        }).encode())
+
+        result = stream_ollama(lines, FieldStream())
+
+        assert result.text == RESPONSE
+        assert (result.prompt_tokens, result.completion_tokens) == (9, 4)
+
+    def test_progress_monitor_receives_top_level_fields(self):
+        """Test that only whole fields become completion events."""
+        monitor = Mock()
+        FieldStream(progress_field_callback(monitor, "http://a.com")).feed(RESPONSE)
+
+        events = [call.args for call in monitor.add_completion_event.call_args_list]
+        assert events[0] == ("ai_field_received", "http://a.com", {"field": "menu_items", "items": 2})
+        assert len(events) == 4
+
+
+class TestStreamingExtractors:
+    """Test streaming through the provider extractors."""
+
+    @pytest.fixture
+    def streamed_response(self):
+        """Create a streaming HTTP response for the Claude API."""
+        response = Mock(status_code=200)
+        response.iter_lines.return_value = anthropic_lines(RESPONSE)
+        return response
+
+    def test_claude_stream_reports_fields_and_caches(self, streamed_response):
+        """Test that a full stream is processed like a normal response and cached."""
+        from src.ai.claude_extractor import ClaudeExtractor
+
+        extractor = ClaudeExtractor(api_key="key")
+        fields = []
+
+        with patch.object(extractor.transport, "post", return_value=streamed_response) as mock_post:
+            result = extractor.extract("<p>Pad Thai $12</p>", stream=True, on_field=lambda p, v: fields.append(p))
+            again = extractor.extract("<p>Pad Thai $12</p>", stream=True, on_field=lambda p, v: fields.append(p))
+
+        mock_post.assert_called_once()
+        assert mock_post.call_args.kwargs["stream"] is True
+        assert mock_post.call_args.kwargs["json"]["stream"] is True
+        streamed_response.close.assert_called_once()
+        assert result["cuisine_type"] == again["cuisine_type"] == "Thai"
+        assert fields.count("cuisine_type") == 2
+
+    def test_cancelled_claude_stream_is_not_cached(self, streamed_response):
+        """Test that a response cut short is usable but never cached."""
+        from src.ai.claude_extractor import ClaudeExtractor
+
+        extractor = ClaudeExtractor(api_key="key")
+
+        with patch.object(extractor.transport, "post", return_value=streamed_response):
+            result = extractor.extract("menu", stream=True, required_fields=["menu_items"])
+
+        assert [item["name"] for item in result["menu_items"]] == ["Pad Thai, large", 'Curry "red"']
+        assert "confidence" not in result
+        assert len(extractor.llm_cache) == 0
+
+    def test_analyzer_streams_when_enabled(self):
+        """Test that the analyzer streams OpenAI completions to its field callback."""
+        from src.ai.content_analyzer import ANALYSIS_FIELDS, AIContentAnalyzer
+
+        analyzer = AIContentAnalyzer(api_key="test-key")
+        analyzer.update_configuration({"streaming_enabled": True})
+        analyzer.field_callback = Mock()
+        analysis = {name: {} for name in ANALYSIS_FIELDS}
+
+        with patch.object(analyzer, "_stream_openai_completion", return_value=json.dumps(analysis)) as mock_stream:
+            result = analyzer._call_openai_direct("prompt", "gpt-4", required_fields=ANALYSIS_FIELDS)
+
+        mock_stream.assert_called_once_with("prompt", "gpt-4", ANALYSIS_FIELDS, None)
+        assert result == analysis
+
+    @pytest.mark.parametrize("provider", ["claude", "ollama"])
+    def test_analyzer_streams_other_providers(self, provider):
+        """Test that Claude and Ollama analyses are streamed to the page's callback."""
+        from src.ai.content_analyzer import AIContentAnalyzer
+
+        analyzer = AIContentAnalyzer(api_key="test-key")
+        analyzer.update_configuration({
+            "streaming_enabled": True,
+            "default_provider": provider,
+            "providers": {provider: {"enabled": True, "api_key": "key", "endpoint": "http://localhost:11434"}},
+        })
+        extractor = Mock()
+        extractor.extract.return_value = {"cuisine_type": "Thai"}
+        setattr(analyzer, f"{provider}_extractor", extractor)
+        on_field = Mock()
+
+        result = analyzer.analyze_content("<p>Pad Thai</p>", [{"name": "Pad Thai"}], "nutritional",
+                                          on_field=on_field)
+
+        assert result["provider_used"] == provider
+        assert extractor.extract.call_args.kwargs["stream"] is True
+        assert extractor.extract.call_args.kwargs["on_field"] is on_field
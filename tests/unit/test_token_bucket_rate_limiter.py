@@ -0,0 +1,159 @@
+"""Unit tests for per-domain token bucket rate limiting."""
+import threading
+import time
+import pytest
+from unittest.mock import Mock, patch
+
+from src.scraper.rate_limiter import TokenBucketRateLimiter, parse_retry_after
+
+
+class TestTokenBucketRateLimiter:
+    """Test the per-domain token bucket rate limiter."""
+
+    def test_rejects_invalid_configuration(self):
+        """Test configuration validation."""
+        with pytest.raises(ValueError):
+            TokenBucketRateLimiter(default_delay=-1)
+        with pytest.raises(ValueError):
+            TokenBucketRateLimiter(default_delay=10, max_delay=5)
+        with pytest.raises(ValueError):
+            TokenBucketRateLimiter(burst=0)
+
+    def test_same_domain_requests_are_spaced(self):
+        """Test that a domain receives one request per delay."""
+        limiter = TokenBucketRateLimiter(default_delay=0.1)
+
+        assert limiter.wait_if_needed("http://a.com/1") == 0.0
+        start = time.time()
+        limiter.wait_if_needed("http://a.com/2")
+
+        assert time.time() - start >= 0.09
+
+    def test_different_domains_do_not_wait(self):
+        """Test that each domain has its own bucket."""
+        limiter = TokenBucketRateLimiter(default_delay=5.0)
+
+        for i in range(5):
+            assert limiter.wait_if_needed(f"http://site{i}.com/") == 0.0
+
+    def test_reservations_queue_concurrent_callers(self):
+        """Test that concurrent callers on one domain get successive slots."""
+        limiter = TokenBucketRateLimiter(default_delay=1.0)
+
+        waits = sorted(limiter.reserve("http://a.com/") for _ in range(3))
+
+        assert waits[0] == pytest.approx(0.0, abs=0.01)
+        assert waits[1] == pytest.approx(1.0, abs=0.01)
+        assert waits[2] == pytest.approx(2.0, abs=0.01)
+
+    def test_burst_allows_back_to_back_requests(self):
+        """Test that burst capacity is spent before pacing applies."""
+        limiter = TokenBucketRateLimiter(default_delay=1.0, burst=3)
+
+        waits = [limiter.reserve("http://a.com/") for _ in range(4)]
+
+        assert waits[:3] == [0.0, 0.0, 0.0]
+        assert waits[3] == pytest.approx(1.0, abs=0.01)
+
+    def test_crawl_delay_slows_only_its_domain(self):
+        """Test that a robots.txt Crawl-delay raises the domain's interval."""
+        limiter = TokenBucketRateLimiter(default_delay=1.0, max_delay=30.0)
+        limiter.set_crawl_delay("http://slow.com/robots.txt", 10.0)
+
+        limiter.reserve("http://slow.com/")
+        limiter.reserve("http://fast.com/")
+
+        assert limiter.time_until_next_allowed("http://slow.com/") == pytest.approx(10.0, abs=0.05)
+        assert limiter.time_until_next_allowed("http://fast.com/") == pytest.approx(1.0, abs=0.05)
+        assert limiter.get_domain_statistics("slow.com")["delay"] == 10.0
+
+    def test_crawl_delay_is_capped(self):
+        """Test that Crawl-delay cannot exceed max_delay."""
+        limiter = TokenBucketRateLimiter(default_delay=1.0, max_delay=5.0)
+        limiter.set_crawl_delay("http://a.com/", 3600)
+
+        assert limiter.get_domain_delay("a.com") == 5.0
+
+    def test_retry_after_blocks_domain(self):
+        """Test that Retry-After holds back every request to the domain."""
+        limiter = TokenBucketRateLimiter(default_delay=0.0, max_retry_after_delay=60)
+
+        applied = limiter.apply_retry_after("http://a.com/menu", 120)
+
+        assert applied == 60
+        assert limiter.reserve("http://a.com/other") == pytest.approx(60, abs=0.05)
+        assert limiter.reserve("http://b.com/") == 0.0
+        assert limiter.get_domain_statistics("a.com")["retry_after_count"] == 1
+
+    def test_parse_retry_after(self):
+        """Test Retry-After parsing for seconds and invalid values."""
+        assert parse_retry_after("3") == 3.0
+        assert parse_retry_after("-1") is None
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    def test_throughput_scales_with_distinct_domains(self):
+        """Test that threads on different domains proceed in parallel."""
+        limiter = TokenBucketRateLimiter(default_delay=0.2)
+        urls = [f"http://site{i}.com/page{j}" for i in range(4) for j in range(2)]
+
+        def fetch(url):
+            limiter.wait_if_needed(url)
+
+        threads = [threading.Thread(target=fetch, args=(url,)) for url in urls]
+        start = time.time()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # One global 0.2s delay would need 1.4s for 8 requests
+        assert time.time() - start < 0.5
+
+
+class TestEthicalScraperTokenBucket:
+    """Test EthicalScraper integration with the token bucket limiter."""
+
+    def test_default_rate_limiter_is_per_domain(self):
+        """Test that EthicalScraper paces domains independently by default."""
+        from src.scraper.ethical_scraper import EthicalScraper
+
+        scraper = EthicalScraper(delay=5.0)
+        assert isinstance(scraper.rate_limiter, TokenBucketRateLimiter)
+
+        with patch.object(scraper.transport, "get", return_value=Mock(status_code=200, text="ok")):
+            start = time.time()
+            scraper.fetch_page("http://a.com/")
+            scraper.fetch_page("http://b.com/")
+
+        assert time.time() - start < 1.0
+
+    def test_robots_crawl_delay_is_applied(self):
+        """Test that Crawl-delay from robots.txt paces the domain."""
+        from src.scraper.ethical_scraper import EthicalScraper, RobotsTxtParser
+
+        scraper = EthicalScraper(delay=1.0)
+        robots = Mock(status_code=200, text="User-agent: *\nCrawl-delay: 7\nDisallow: /admin\n")
+
+        with patch.object(scraper.transport, "get", return_value=robots):
+            assert scraper.is_allowed_by_robots("http://a.com/menu")
+
+        assert RobotsTxtParser(robots.text).get_crawl_delay("RAG_Scraper") == 7.0
+        assert scraper.rate_limiter.get_domain_delay("a.com") == 7.0
+
+    def test_retry_after_is_shared_with_other_callers(self):
+        """Test that a 429 Retry-After is recorded for the whole domain."""
+        from src.scraper.ethical_scraper import EthicalScraper
+
+        scraper = EthicalScraper(delay=0.0)
+        throttled = Mock(status_code=429, headers={"Retry-After": "30"})
+        ok = Mock(status_code=200, text="ok")
+
+        with patch.object(scraper.transport, "get", side_effect=[throttled, ok]), \
+             patch("time.sleep") as mock_sleep:
+            assert scraper.fetch_page_with_retry("http://a.com/") == "ok"
+
+        assert mock_sleep.call_args_list[0].args == (30.0,)
+        assert scraper.rate_limiter.time_until_next_allowed("http://a.com/") > 25
+        assert scraper.rate_limiter.time_until_next_allowed("http://b.com/") == 0.0
@@ -0,0 +1,162 @@
+"""Unit tests for token-aware chunking."""
+import pytest
+from unittest.mock import Mock
+
+from src.semantic.token_chunking import (
+    MODEL_TOKENIZER,
+    TokenChunker,
+    TokenCounter,
+    WordPieceTokenizer,
+    WordTokenizer,
+    get_tokenizer,
+)
+
+
+MENU = (
+    "Antipasti\n\n"
+    "Bruschetta with tomato and basil. Fried calamari with lemon aioli.\n\n"
+    "Pasta\n\n"
+    "Spaghetti carbonara with guanciale. Rigatoni alla vodka. Lasagna bolognese baked daily."
+)
+
+
+class TestTokenizers:
+    """Test tokenizer selection and counting."""
+
+    def test_default_tokenizer_counts_words(self):
+        """Test that sizes stay in words unless a tokenizer is chosen."""
+        assert isinstance(get_tokenizer(None), WordTokenizer)
+        assert get_tokenizer("words").count("Pad Thai, large") == 3
+
+    def test_wordpiece_approximation(self):
+        """Test that long words and punctuation cost extra tokens."""
+        tokenizer = get_tokenizer("wordpiece")
+
+        assert isinstance(tokenizer, WordPieceTokenizer)
+        assert tokenizer.count("Pad Thai") == 2
+        assert tokenizer.count("guanciale, $12") == 6
+
+    def test_missing_bpe_falls_back_to_wordpiece(self):
+        """Test that tiktoken is optional."""
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setattr("src.semantic.token_chunking.tiktoken", None)
+            assert isinstance(get_tokenizer("tiktoken:cl100k_base"), WordPieceTokenizer)
+
+    def test_model_tokenizer_prefers_bpe(self):
+        """Test that "model" uses BPE when installed and word pieces otherwise."""
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setattr("src.semantic.token_chunking.tiktoken", None)
+            assert isinstance(get_tokenizer(MODEL_TOKENIZER), WordPieceTokenizer)
+
+            encoding = Mock(encode=Mock(return_value=[1, 2, 3]))
+            monkeypatch.setattr("src.semantic.token_chunking.tiktoken",
+                                Mock(get_encoding=Mock(return_value=encoding)))
+            assert get_tokenizer(MODEL_TOKENIZER).count("Pad Thai") == 3
+
+    def test_unknown_tokenizer_is_rejected(self):
+        """Test that typos in the tokenizer name are reported."""
+        with pytest.raises(ValueError):
+            get_tokenizer("sentencepiece")
+
+    def test_counts_are_cached_per_segment(self):
+        """Test that repeated segments are tokenized once."""
+        tokenizer = Mock(count=Mock(return_value=7))
+        counter = TokenCounter(tokenizer)
+
+        assert counter.count("Tiramisu") == counter.count("Tiramisu") == 7
+        tokenizer.count.assert_called_once_with("Tiramisu")
+        assert counter.get_statistics()["cache_hits"] == 1
+
+
+class TestTokenChunker:
+    """Test segmentation and greedy packing."""
+
+    def test_small_paragraphs_are_packed_together(self):
+        """Test that chunks fill the budget instead of holding one paragraph each."""
+        spans = TokenChunker(max_tokens=14).chunk(MENU)
+
+        assert [span.text(MENU) for span in spans] == [
+            "Antipasti\n\nBruschetta with tomato and basil. Fried calamari with lemon aioli.\n\nPasta",
+            "Spaghetti carbonara with guanciale. Rigatoni alla vodka. Lasagna bolognese baked daily.",
+        ]
+        assert [span.token_count for span in spans] == [12, 11]
+        assert [(span.start, span.end) for span in spans] == [(0, 84), (86, len(MENU))]
+
+    def test_overlap_repeats_trailing_segments(self):
+        """Test that the next chunk starts with the end of the previous one."""
+        spans = TokenChunker(max_tokens=10, overlap_tokens=4).chunk(MENU)
+        texts = [span.text(MENU) for span in spans]
+
+        assert texts[2] == "Pasta\n\nSpaghetti carbonara with guanciale. Rigatoni alla vodka."
+        assert texts[3] == "Rigatoni alla vodka. Lasagna bolognese baked daily."
+        assert [span.boundary_type for span in spans] == ["paragraph", "paragraph", "sentence", "paragraph"]
+        assert all(span.token_count <= 10 for span in spans)
+
+    def test_long_sentences_split_into_word_runs(self):
+        """Test that text without punctuation is never truncated."""
+        text = " ".join(f"dish{n}" for n in range(25))
+
+        spans = TokenChunker(max_tokens=10).chunk(text)
+
+        assert [span.token_count for span in spans] == [10, 10, 5]
+        assert " ".join(span.text(text) for span in spans) == text
+
+    def test_budget_is_in_tokenizer_units(self):
+        """Test that a subword tokenizer yields smaller chunks than word counts."""
+        words = TokenChunker(max_tokens=12).chunk(MENU)
+        pieces = TokenChunker(max_tokens=12, tokenizer="wordpiece").chunk(MENU)
+
+        assert len(pieces) > len(words)
+        counter = TokenCounter("wordpiece")
+        assert all(counter.count(span.text(MENU)) <= 12 for span in pieces)
+
+    def test_invalid_budget(self):
+        """Test that budgets are validated."""
+        with pytest.raises(ValueError):
+            TokenChunker(max_tokens=0)
+        with pytest.raises(ValueError):
+            TokenChunker(overlap_tokens=-1)
+
+
+class TestSharedChunkingCore:
+    """Test that the chunkers size content with the shared core."""
+
+    def test_structurer_reports_offsets_and_keeps_every_word(self):
+        """Test that long fields are split without dropping words."""
+        from src.semantic.semantic_structurer import SemanticStructurer
+
+        description = " ".join(f"word{n}" for n in range(40)) + ". Last sentence here."
+        structurer = SemanticStructurer(config={"chunk_size": 15, "overlap_size": 0})
+
+        chunks = structurer.structure_for_rag({"description": description})["chunks"]
+
+        assert " ".join(chunk["content"] for chunk in chunks) == description
+        for chunk in chunks:
+            metadata = chunk["metadata"]
+            assert description[metadata["start_offset"]:metadata["end_offset"]] == chunk["content"]
+            assert metadata["token_count"] <= 15
+
+    def test_optimizer_uses_configured_tokenizer(self):
+        """Test that ChunkOptimizer splits by token budget."""
+        from src.semantic.chunk_optimizer import ChunkOptimizer
+
+        optimizer = ChunkOptimizer(config={"max_chunk_size": 12, "tokenizer": "wordpiece"})
+
+        pieces = optimizer.split_large_chunks([{"id": "menu", "content": MENU}])
+
+        assert len(pieces) > 1
+        assert all(piece["metadata"]["token_count"] <= 12 for piece in pieces)
+        assert pieces[0]["metadata"]["split_from"] == "menu"
+
+    def test_chunkers_default_to_model_tokens(self):
+        """Test that chunk budgets enforce model token limits by default."""
+        from src.semantic.chunk_optimizer import ChunkOptimizer
+        from src.file_generator.semantic_chunker import SemanticChunker
+
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setattr("src.semantic.token_chunking.tiktoken", None)
+            optimizer = ChunkOptimizer()
+            chunker = SemanticChunker()
+
+        assert isinstance(optimizer.token_counter.tokenizer, WordPieceTokenizer)
+        assert isinstance(chunker.token_chunker.counter.tokenizer, WordPieceTokenizer)